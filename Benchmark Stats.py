@@ -0,0 +1,166 @@
+import argparse
+import random
+import string
+import time
+from collections import defaultdict
+
+from film_table import FilmTable
+from list_criteria import STAT_FIELDS
+from stats_accumulator import StatsAccumulator
+
+# Film counts to fill a stats bucket with; 5000 is the size of the Rating/Popular 5000 lists
+DEFAULT_SIZES = (5000, 50000)
+# Films accepted by a full New Popular V2 run
+DEFAULT_RUN_FILMS = 7000
+# The lists a New Popular V2 film can join, with how many films each one counts
+RUN_LISTS = {
+    **{category: 250 for category in ('90_Minutes_or_Less', '120_Minutes_or_Less')},
+    '180_Minutes_or_Greater': 75, '240_Minutes_or_Greater': 5,
+    **{rating: 250 for rating in ('G', 'PG', 'PG-13', 'R', 'NC-17', 'NR')},
+    **{continent: 250 for continent in ('Africa', 'Asia', 'Europe', 'North America', 'Oceania', 'South America')},
+    'Top 2500': 2500,
+}
+
+def make_films(count: int, seed: int = 0):
+    """Return count distinct (title, year) pairs, with some titles shared across years as on Letterboxd."""
+    rng = random.Random(seed)
+    films = []
+    seen = set()
+    while len(films) < count:
+        title = ''.join(rng.choices(string.ascii_letters + ' ', k=rng.randint(4, 30))).strip() or 'Untitled'
+        for year in rng.sample(range(1920, 2025), rng.randint(1, 2)):
+            if (title, str(year)) not in seen and len(films) < count:
+                seen.add((title, str(year)))
+                films.append((title, str(year)))
+    return films
+
+def fill_scanned(films):
+    """Fill a bucket the old way: a linear scan of film_data before every append."""
+    bucket = {'film_data': []}
+    for film_title, release_year in films:
+        if any(movie['Title'] == film_title and movie['Year'] == release_year
+               for movie in bucket['film_data']):
+            continue
+        bucket['film_data'].append({'Title': film_title, 'Year': release_year, 'tmdbID': None})
+    return bucket
+
+def fill_indexed(films):
+    """Fill a bucket the way the add_to_*_stats functions do now, checking the film_keys set."""
+    bucket = {'film_data': [], 'film_keys': set()}
+    for film_title, release_year in films:
+        if (film_title, release_year) in bucket['film_keys']:
+            continue
+        bucket['film_data'].append({'Title': film_title, 'Year': release_year, 'tmdbID': None})
+        bucket['film_keys'].add((film_title, release_year))
+    return bucket
+
+def time_fill(fill, films):
+    start = time.perf_counter()
+    bucket = fill(films)
+    return time.perf_counter() - start, len(bucket['film_data'])
+
+def bench_membership(sizes, duplicates: float):
+    print("Stats bucket membership (every film checked before it is appended)")
+    print(f"{'Films':>8} {'List scan':>12} {'Set index':>12} {'Speed-up':>10}")
+    for size in sizes:
+        films = make_films(size)
+        # Re-offer a share of the films, as the page loop does for titles seen on an earlier page
+        films += random.Random(1).sample(films, int(size * duplicates))
+        scanned_seconds, scanned_count = time_fill(fill_scanned, films)
+        indexed_seconds, indexed_count = time_fill(fill_indexed, films)
+        if scanned_count != indexed_count:
+            raise AssertionError(f"list scan kept {scanned_count} films but the set index kept {indexed_count}")
+        print(f"{size:>8} {scanned_seconds:>11.3f}s {indexed_seconds:>11.4f}s {scanned_seconds / indexed_seconds:>9.0f}x")
+
+def make_run(count: int, seed: int = 0):
+    """Return (whitelist record, list names) for count accepted films, shaped like a New Popular V2 run."""
+    rng = random.Random(seed)
+    pools = {'Directors': 3000, 'Actors': 40000, 'Genres': 19, 'Studios': 2500, 'Languages': 60, 'Countries': 80}
+    sizes = {'Directors': (1, 2), 'Actors': (5, 40), 'Genres': (1, 4), 'Studios': (0, 4), 'Languages': (1, 3), 'Countries': (1, 3)}
+    runtime_lists = list(RUN_LISTS)[:4]
+    ratings = list(RUN_LISTS)[4:10]
+    continents = list(RUN_LISTS)[10:16]
+    run = []
+    for index in range(count):
+        info = {field: [f"{field[:-1]} {int(rng.paretovariate(1.2)) % pool}" for _ in range(rng.randint(*sizes[field]))]
+                for field, pool in pools.items()}
+        info['Decade'] = rng.choice(range(1920, 2030, 10))
+        lists = [rng.choice(ratings), rng.choice(continents)] + rng.sample(runtime_lists, rng.randint(0, 2))
+        if index < RUN_LISTS['Top 2500']:
+            lists.append('Top 2500')
+        run.append((info, lists))
+    return run
+
+def run_loops(run):
+    """The per-list defaultdict loops and full sorts the scrapers used before StatsAccumulator."""
+    buckets = {name: {category: defaultdict(int) for category in STAT_FIELDS} for name in RUN_LISTS}
+    counted = dict.fromkeys(RUN_LISTS, 0)
+    for info, lists in run:
+        for name in lists:
+            if counted[name] < RUN_LISTS[name]:
+                counted[name] += 1
+                for category, field in STAT_FIELDS.items():
+                    if field == 'Decade':
+                        if info.get(field):
+                            buckets[name][category][info[field]] += 1
+                    else:
+                        for value in info.get(field, []):
+                            buckets[name][category][value] += 1
+    return {name: {category: sorted(counts.items(), key=lambda item: item[1], reverse=True)[:10]
+                   for category, counts in bucket.items()} for name, bucket in buckets.items()}
+
+def run_incremental(run):
+    accumulators = {name: StatsAccumulator() for name in RUN_LISTS}
+    counted = dict.fromkeys(RUN_LISTS, 0)
+    for info, lists in run:
+        for name in lists:
+            if counted[name] < RUN_LISTS[name]:
+                counted[name] += 1
+                accumulators[name].add(info)
+    return {name: dict(accumulator.top_all(10)) for name, accumulator in accumulators.items()}
+
+def run_table(run):
+    table = FilmTable()
+    stats = {name: table.stats_for(name) for name in RUN_LISTS}
+    counted = dict.fromkeys(RUN_LISTS, 0)
+    for info, lists in run:
+        for name in lists:
+            if counted[name] < RUN_LISTS[name]:
+                counted[name] += 1
+                stats[name].add(info)
+    return {name: dict(table_stats.top_all(10)) for name, table_stats in stats.items()}
+
+def bench_run_stats(count: int, repeat: int):
+    print(f"List statistics for a {count}-film run ({len(RUN_LISTS)} lists, best of {repeat})")
+    run = make_run(count)
+    results = {}
+    for label, counter in (('Per-list loops and full sorts', run_loops), ('Incremental (StatsAccumulator)', run_incremental),
+                           ('End of run (FilmTable)', run_table)):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            results[label] = counter(run)
+            seconds = time.perf_counter() - start
+            best = seconds if best is None else min(best, seconds)
+        print(f"{label:<32} {best * 1000:>9.1f} ms")
+    loops, incremental, table = results.values()
+    if not loops == incremental == table:
+        raise AssertionError("the three ways of counting produced different top tens")
+    print("All three produce the same top tens.")
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the stats bookkeeping the list scrapers do.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES), help="Film counts to time")
+    parser.add_argument('--duplicates', type=float, default=0.1, help="Share of films offered a second time")
+    parser.add_argument('--run-films', type=int, default=DEFAULT_RUN_FILMS, help="Accepted films in the simulated run")
+    parser.add_argument('--repeat', type=int, default=5, help="Times to repeat the run statistics timing")
+    parser.add_argument('--only', choices=('membership', 'stats'), help="Run just one of the benchmarks")
+    args = parser.parse_args()
+
+    if args.only != 'stats':
+        bench_membership(args.sizes, args.duplicates)
+    if args.only != 'membership':
+        bench_run_stats(args.run_films, args.repeat)
+
+if __name__ == "__main__":
+    main()
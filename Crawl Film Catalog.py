@@ -0,0 +1,312 @@
+# Import necessary libraries
+import os
+import time
+from selenium import webdriver
+from selenium.webdriver.firefox.service import Service
+from selenium.webdriver.firefox.options import Options
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from typing import List, Tuple
+from credentials_loader import get_os_specific_paths, load_credentials
+from film_catalog import CATALOG_FILENAME, LISTING_URLS, FilmCatalog
+from film_events import FilmEventLog, events_path_for
+from film_fetcher import FilmFetcher, create_film_session
+from film_page_parser import FilmPage, FilmPageParser
+from film_pipeline import FilmPagePipeline
+from film_store import FilmStore, STORE_FILENAME
+from http_cache import HTTP_CACHE_FILENAME, HttpCache
+from list_criteria import MIN_RATING_COUNT, MIN_RUNTIME
+from list_derivation import ListDeriver, derive_all
+from rate_controller import RateControlledSession, controller_for, report_rates
+from tmdb_cache import CACHE_FILENAME, TmdbCache
+from tmdb_prefetch import TmdbPrefetcher
+from webdriver_pool import WebDriverPool
+from output_log import output_log
+from script_profiler import run_profiled
+
+# Get OS-specific paths
+paths = get_os_specific_paths()
+LIST_DIR = paths['base_dir']
+BASE_DIR = os.path.join(LIST_DIR, 'Outputs')
+
+# Define a custom print function
+def print_to_csv(message: str):
+    """Prints a message to the terminal and appends it to All_Outputs.csv."""
+    print(message)  # Print to terminal
+    output_log(os.path.join(BASE_DIR, 'All_Outputs.csv')).write(message)  # Queued and appended to the file in batches
+
+# Configure settings
+CRAWL_TARGET = 7000  # Films per listing that pass the page checks before that listing's crawl stops
+CATALOG_MAX_AGE_DAYS = 14  # Films scraped more recently than this are not fetched again
+TOP_SIZE = 5000  # Size of the derived popular and rating top lists
+FILM_FETCH_CONCURRENCY = 8  # Film pages requested at once ahead of the crawl loop
+DRIVER_POOL_SIZE = 3  # Headless Firefox instances for film pages that need a browser
+DRIVER_RECYCLE_AFTER = 200  # Film pages a pooled browser loads before it is restarted
+PAGE_RETRIES = 20
+SHORT_PAGE_RETRIES = 3  # Reloads of a page with fewer than 72 posters before it is taken as the listing's last page
+FILM_RETRIES = 5
+FILMS_PER_PAGE = 72
+
+# File paths
+WHITELIST_PATH = os.path.join(LIST_DIR, 'whitelist.xlsx')
+BLACKLIST_PATH = os.path.join(LIST_DIR, 'blacklist.xlsx')
+CATALOG_PATH = os.path.join(LIST_DIR, CATALOG_FILENAME)
+FILM_STORE_PATH = os.path.join(LIST_DIR, STORE_FILENAME)
+HTTP_CACHE_PATH = os.path.join(LIST_DIR, HTTP_CACHE_FILENAME)
+HTTP_CACHE_MAX_AGE = 0  # Seconds a stored Letterboxd page is reused without revalidating it
+TMDB_CACHE_PATH = os.path.join(LIST_DIR, CACHE_FILENAME)
+TMDB_CACHE_TTL_DAYS = 90  # Refetch TMDB keywords and genres older than this
+TMDB_WORKERS = 4  # TMDB lookups run at once while the crawl continues
+EVENTS_PATH = events_path_for(BASE_DIR, 'Crawl Film Catalog')  # One JSON line per film; summarize with film_events.py
+
+credentials = load_credentials()
+TMDB_API_KEY = credentials['TMDB_API_KEY']
+
+# Stage timings and whether each film was scraped, reused from the catalog or failed
+film_events = FilmEventLog(EVENTS_PATH, 'Crawl Film Catalog')
+
+def setup_webdriver() -> webdriver.Firefox:
+    options = Options()
+    options.headless = True
+    options.set_preference("permissions.default.image", 2)  # Disable images
+    options.set_preference("dom.ipc.plugins.enabled.libflashplayer.so", "false")
+    options.set_preference("browser.display.use_document_fonts", 0)
+    options.set_preference("browser.display.document_color_use", 2)
+    options.set_preference("browser.download.folderList", 2)  # Use custom download location
+    options.set_preference("browser.download.dir", os.path.join(BASE_DIR, "downloads"))  # Set download directory
+    options.set_preference("browser.helperApps.neverAsk.saveToDisk", "text/html,text/plain")  # Don't ask to save HTML files
+    options.set_preference("network.http.connection-timeout", 30)  # Reduce timeout
+    options.set_preference("browser.cache.disk.enable", True)  # Enable disk cache
+    options.set_preference("browser.cache.memory.enable", True)  # Enable memory cache
+
+    service = Service()
+    return webdriver.Firefox(service=service, options=options)
+
+def format_time(seconds):
+    """Format seconds into hours, minutes, seconds string"""
+    hours = int(seconds // 3600)
+    minutes = int((seconds % 3600) // 60)
+    seconds = int(seconds % 60)
+
+    if hours > 0:
+        return f"{hours}h {minutes}m {seconds}s"
+    elif minutes > 0:
+        return f"{minutes}m {seconds}s"
+    else:
+        return f"{seconds}s"
+
+def passes_page_checks(rating_count, runtime, tmdb_id) -> bool:
+    """The checks the scrapers make before asking TMDB about a film."""
+    return bool(tmdb_id) and (rating_count or 0) >= MIN_RATING_COUNT and bool(runtime) and runtime >= MIN_RUNTIME
+
+class CatalogCrawler:
+    """Walks the popular and rating listings once and records every film in the film catalog.
+
+    Film pages go through the same HTTP-first pipeline as the scrapers, but
+    nothing is accepted or rejected here: each film's metadata is stored as
+    scraped, and films scraped within CATALOG_MAX_AGE_DAYS (typically the ones
+    both listings share) are not fetched again. TMDB details of every film
+    that passes the page checks are fetched into the TMDB cache, so the
+    derivation step can apply the keyword/genre filter offline.
+    """
+
+    def __init__(self):
+        self.driver = setup_webdriver()
+        self.catalog = FilmCatalog(CATALOG_PATH)
+        self.http_cache = HttpCache(HTTP_CACHE_PATH)
+        self.tmdb_cache = TmdbCache(TMDB_CACHE_PATH, TMDB_CACHE_TTL_DAYS)
+        self.tmdb_session = RateControlledSession(print_to_csv)
+        self.tmdb_prefetcher = TmdbPrefetcher(self.fetch_tmdb_details, TMDB_WORKERS)
+        self.tmdb_ids = set()
+        self.rate_controller = controller_for('letterboxd.com', print_to_csv)
+        self.fetcher = FilmFetcher(self.driver, FilmPageParser(),
+                                   create_film_session(cache=self.http_cache, max_age=HTTP_CACHE_MAX_AGE))
+        self.driver_pool = WebDriverPool(setup_webdriver, DRIVER_POOL_SIZE, DRIVER_RECYCLE_AFTER)
+        self.pipeline = FilmPagePipeline(self.fetcher, FILM_FETCH_CONCURRENCY, self.driver_pool, on_page=self.prefetch_tmdb)
+        self.scraped = 0
+        self.reused = 0
+        self.failed = 0
+        print_to_csv("Initialized film catalog crawler.")
+
+    def fetch_tmdb_details(self, tmdb_id: str) -> Tuple[List[str], List[str]]:
+        cached = self.tmdb_cache.get(tmdb_id)
+        if cached is not None:
+            return cached
+
+        movie_url = f"https://api.themoviedb.org/3/movie/{tmdb_id}?api_key={TMDB_API_KEY}&append_to_response=keywords"
+        response = self.tmdb_session.get(movie_url)
+
+        if response.status_code == 200:
+            movie_data = response.json()
+            keywords = [keyword['name'] for keyword in movie_data['keywords']['keywords']]
+            genres = [genre['name'] for genre in movie_data['genres']]
+            self.tmdb_cache.put(tmdb_id, keywords, genres)
+            return keywords, genres
+        else:
+            if response.status_code == 401:
+                print_to_csv("Check your API key.")
+            return [], []
+
+    def prefetch_tmdb(self, page: FilmPage):
+        """Start the TMDB lookup for a film that will reach the keyword/genre filter."""
+        if passes_page_checks(page.rating_count, page.runtime, page.tmdb_id):
+            self.tmdb_prefetcher.submit(page.tmdb_id)
+
+    def load_listing_page(self, url: str) -> List[Tuple[str, str]]:
+        """Return (title, film URL) for every poster on a listing page, in listing order."""
+        containers = []
+        for retry in range(PAGE_RETRIES):
+            try:
+                self.rate_controller.wait()
+                self.driver.get(url)
+                containers = WebDriverWait(self.driver, 10).until(
+                    EC.presence_of_all_elements_located((By.CSS_SELECTOR, 'div.react-component.poster'))
+                )
+                if len(containers) == FILMS_PER_PAGE or retry >= SHORT_PAGE_RETRIES:
+                    break
+                print_to_csv(f"Found only {len(containers)} containers, retrying... (Attempt {retry + 1}/{SHORT_PAGE_RETRIES})")
+                self.rate_controller.backoff("incomplete listing page")
+            except Exception as e:
+                if retry == PAGE_RETRIES - 1:
+                    raise Exception(f"Failed to load {url} after {PAGE_RETRIES} attempts: {str(e)}")
+                print_to_csv(f"Retry {retry + 1}/{PAGE_RETRIES} loading {url}: {str(e)}")
+                self.rate_controller.backoff("listing page failed to load")
+        self.rate_controller.success()
+
+        # The last page of a listing is short, so after a few reloads take what is there
+        films = []
+        for container in containers:
+            try:
+                film_url = container.find_element(By.CSS_SELECTOR, 'a').get_attribute('href')
+                film_title = container.get_attribute('data-film-name')
+                if film_title and film_url:
+                    films.append((film_title, film_url))
+            except Exception as e:
+                print_to_csv(f"Error collecting film data: {str(e)}")
+        return films
+
+    def scrape_film(self, film_title: str, film_url: str):
+        """Fetch a film page and store its metadata. Returns the stored record, or None."""
+        for retry in range(FILM_RETRIES):
+            try:
+                start = time.perf_counter()
+                prefetched = self.pipeline.take(film_url)
+                if prefetched is not None:
+                    film_events.add('page_wait', time.perf_counter() - start)
+                page = self.fetcher.fetch(film_url, prefetched)
+                film_events.fetched(self.fetcher.last_result, prefetched is not None)
+                with film_events.stage('catalog_write'):
+                    self.catalog.put(film_url, page.to_movie_data(film_title))
+                self.scraped += 1
+                return self.catalog.get(film_url)
+            except Exception as e:
+                print_to_csv(f"❌ Error scraping {film_title}: {str(e)}")
+                film_events.note(reason=str(e))
+                if retry < FILM_RETRIES - 1:
+                    print_to_csv(f"Retrying... (Attempt {retry + 1}/{FILM_RETRIES})")
+                    self.rate_controller.backoff("film page retry")
+        self.failed += 1
+        return None
+
+    def crawl_listing(self, listing: str):
+        """Walk one listing until CRAWL_TARGET of its films pass the page checks, or it runs out."""
+        base_url = LISTING_URLS[listing]
+        self.catalog.begin_listing(listing)
+        page_number = 1
+        position = 0
+        passing = 0
+        while passing < CRAWL_TARGET:
+            url = f'{base_url}page/{page_number}/'
+            print_to_csv(f"\nLoading {listing} page {page_number}: {url}")
+            films = self.load_listing_page(url)
+            if not films:
+                print_to_csv(f"No films on {listing} page {page_number}; the listing has ended.")
+                break
+            self.catalog.rank_page(listing, position, [film_url for _, film_url in films])
+            position += len(films)
+
+            stale = {film_url for _, film_url in films if not self.catalog.is_fresh(film_url, CATALOG_MAX_AGE_DAYS)}
+            self.pipeline.submit([film_url for _, film_url in films if film_url in stale])
+            for film_title, film_url in films:
+                film_events.begin(film_url, film_title, listing=listing)
+                if film_url in stale:
+                    record = self.scrape_film(film_title, film_url)
+                else:
+                    record = self.catalog.get(film_url)
+                    self.reused += 1
+                if record and passes_page_checks(record['RatingCount'], record['Runtime'], record['tmdbID']):
+                    passing += 1
+                    self.tmdb_ids.add(record['tmdbID'])
+                    self.tmdb_prefetcher.submit(record['tmdbID'])
+                if record is None:
+                    film_events.end('failed', film_events.film.get('reason'))
+                else:
+                    film_events.end('scraped' if film_url in stale else 'reused')
+
+            print_to_csv(f"📚 {listing.capitalize()} page {page_number}: {len(stale)} scraped, "
+                         f"{len(films) - len(stale)} already in the catalog ({passing}/{CRAWL_TARGET} pass the page checks)")
+            if len(films) < FILMS_PER_PAGE:
+                break
+            page_number += 1
+        self.catalog.finish_listing(listing)
+
+    def finish_tmdb(self):
+        """Wait for every TMDB lookup so the cache holds them before the lists are derived."""
+        for tmdb_id in self.tmdb_ids:
+            try:
+                self.tmdb_prefetcher.result(tmdb_id)
+            except Exception as e:
+                print_to_csv(f"TMDB lookup failed for {tmdb_id}: {str(e)}")
+
+    def close(self):
+        # The stores go last: the pipeline and the TMDB lookups still write to them until they are shut down
+        for close in (self.driver_pool.close, self.pipeline.close, self.tmdb_prefetcher.close, self.driver.quit,
+                      self.catalog.close, self.http_cache.close, self.tmdb_cache.close):
+            try:
+                close()
+            except Exception:
+                pass
+
+def main():
+    start_time = time.time()
+    crawler = None
+    try:
+        crawler = CatalogCrawler()
+        for listing in LISTING_URLS:
+            crawler.crawl_listing(listing)
+        crawler.finish_tmdb()
+        crawl_time = time.time() - start_time
+
+        print_to_csv(f"\n{'Deriving Lists':=^100}")
+        store = FilmStore(FILM_STORE_PATH)
+        deriver = ListDeriver(crawler.catalog, store, crawler.tmdb_cache, BASE_DIR, WHITELIST_PATH, BLACKLIST_PATH, print_to_csv)
+        derive_all(deriver, TOP_SIZE)
+        store.close()
+
+        execution_time = time.time() - start_time
+        print_to_csv(f"\n{'Execution Summary':=^100}")
+        print_to_csv(f"{'Films scraped:':<30} {crawler.scraped:>10}")
+        print_to_csv(f"{'Films reused from catalog:':<30} {crawler.reused:>10}")
+        print_to_csv(f"{'Films that failed:':<30} {crawler.failed:>10}")
+        print_to_csv(f"{'Films in catalog:':<30} {crawler.catalog.count():>10}")
+        print_to_csv(f"Crawl time: {format_time(crawl_time)}, derivation time: {format_time(execution_time - crawl_time)}")
+        crawler.fetcher.report(print_to_csv)
+        crawler.pipeline.report(print_to_csv)
+        report_rates(print_to_csv)
+        crawler.tmdb_cache.report(print_to_csv)
+        crawler.http_cache.report(print_to_csv)
+        crawler.tmdb_prefetcher.report(print_to_csv)
+        crawler.driver_pool.report(print_to_csv)
+        film_events.report(print_to_csv)
+
+    except Exception as e:
+        print_to_csv(f"\n{'Error':=^100}")
+        print_to_csv(f"❌ An error occurred during execution: {e}")
+    finally:
+        film_events.close()
+        if crawler is not None:
+            crawler.close()
+
+if __name__ == "__main__":
+    run_profiled(main, 'Crawl Film Catalog', BASE_DIR, print_to_csv)
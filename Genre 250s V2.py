@@ -1,4 +1,6 @@
 # Import necessary libraries
+import argparse
+import queue
 import time
 import random
 from selenium import webdriver
@@ -16,36 +18,41 @@ from requests.adapters import HTTPAdapter
 from urllib3.util import Retry
 from typing import Dict, List, Set, Tuple, Optional
 from dataclasses import dataclass
-from collections import defaultdict
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import unicodedata
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import json
+from film_catalog import CATALOG_FILENAME, FilmCatalog
+from film_store import FilmStore, StoreServer, STORE_FILENAME
+from whitelist_lookup import WhitelistLookup
+from film_page_parser import FilmPage, FilmPageParser
+from film_fetcher import FilmFetcher, create_film_session
+from http_cache import HTTP_CACHE_FILENAME, CachedSession, HttpCache
+from list_criteria import FILTER_GENRES, FILTER_KEYWORDS, GENRES, MIN_RATING_COUNT, MIN_RUNTIME, STAT_NAMES
+from list_derivation import ListDeriver
+from film_pipeline import FilmPagePipeline
+from rate_controller import controller_for, report_rates, split_rates
+from tmdb_cache import CACHE_FILENAME, TmdbCache
+from tmdb_prefetch import TmdbPrefetcher
+from webdriver_pool import WebDriverPool
+from output_log import output_log
+from film_events import FilmEventLog, events_path_for
+from stats_accumulator import STAT_CATEGORIES, StatsAccumulator
+from script_profiler import add_profile_arguments, run_profiled, stop_inherited_profiling
 
 # Define a custom print function
 def print_to_csv(message: str):
     """Prints a message to the terminal and appends it to All_Outputs.csv."""
     print(message)  # Print to terminal
-    with open('Outputs/All_Outputs.csv', mode='a', newline='', encoding='utf-8') as file:
-        writer = csv.writer(file)
-        writer.writerow([message])  # Write the message as a new row
+    output_log('Outputs/All_Outputs.csv').write(message)  # Queued and appended to the file in batches
 
 # Configure locale and constants
 locale.setlocale(locale.LC_ALL, 'en_US.UTF-8')
 MAX_MOVIES = 250 # Currently using 7000
 CHUNK_SIZE = 1900
 
-# Category display names for statistics
-category_display_names = {
-    'director_counts': 'directors',
-    'actor_counts': 'actors',
-    'decade_counts': 'decades',
-    'genre_counts': 'genres',
-    'studio_counts': 'studios',
-    'language_counts': 'languages',
-    'country_counts': 'countries'
-}
-
 def get_ordinal(n):
     if 10 <= n % 100 <= 20:
         suffix = 'th'
@@ -54,10 +61,10 @@ def get_ordinal(n):
     return str(n) + suffix
 
 # Configure settings
-MIN_RATING_COUNT = 1000
-MIN_RUNTIME = 40
+FILM_FETCH_CONCURRENCY = 8  # Film pages requested at once ahead of the scraping loop
+DRIVER_POOL_SIZE = 3  # Headless Firefox instances for film pages that need a browser
+DRIVER_RECYCLE_AFTER = 200  # Film pages a pooled browser loads before it is restarted
 MAX_RETRIES = 25
-RETRY_DELAY = 15
 
 # File paths
 BASE_DIR = r'C:\Users\bigba\aa Personal Projects\Letterboxd List Scraping\Outputs'
@@ -66,32 +73,37 @@ BLACKLIST_PATH = os.path.join(LIST_DIR, 'blacklist.xlsx')
 WHITELIST_PATH = os.path.join(LIST_DIR, 'whitelist.xlsx')
 INCOMPLETE_STATS_WHITELIST_PATH = os.path.join(LIST_DIR, 'Incomplete_Stats_Whitelist.xlsx')
 ZERO_REVIEWS_PATH = os.path.join(LIST_DIR, 'Zero_Reviews.xlsx')
+HTTP_CACHE_PATH = os.path.join(LIST_DIR, HTTP_CACHE_FILENAME)
+HTTP_CACHE_MAX_AGE = 0  # Seconds a stored Letterboxd page is reused without revalidating it
+TMDB_CACHE_PATH = os.path.join(LIST_DIR, CACHE_FILENAME)
+TMDB_CACHE_TTL_DAYS = 90  # Refetch TMDB keywords and genres older than this
+TMDB_WORKERS = 4  # TMDB lookups run at once ahead of the keyword/genre filter
+FILM_STORE_PATH = os.path.join(LIST_DIR, STORE_FILENAME)
+CATALOG_PATH = os.path.join(LIST_DIR, CATALOG_FILENAME)  # Filled by Crawl Film Catalog.py; read with --from-catalog
+EVENTS_PATH = events_path_for(BASE_DIR, 'Genre 250s V2')  # One JSON line per film; summarize with film_events.py
 
 # TMDb API key
 TMDB_API_KEY = ''
 
-# Filtering criteria
-FILTER_KEYWORDS = {
-    'concert film', 'miniseries',
-    'live performance', 'filmed theater', 'live theater', 
-    'stand-up comedy', 'edited from tv series'
-}
+class GenreStatsAccumulator(StatsAccumulator):
+    """StatsAccumulator plus the TMDB keyword counts the genre stats files list last."""
+
+    __slots__ = ('keyword_counts',)
 
-FILTER_GENRES = {'Documentary'}
+    def __init__(self):
+        super().__init__()
+        self.keyword_counts = Counter()
 
 # Initialize stats for MAX_MOVIES
 max_movies_stats = {
     'film_data': [],
-    'director_counts': defaultdict(int),
-    'actor_counts': defaultdict(int),
-    'decade_counts': defaultdict(int),
-    'genre_counts': defaultdict(int),
-    'studio_counts': defaultdict(int),
-    'language_counts': defaultdict(int),
-    'country_counts': defaultdict(int),
-    'keyword_counts': defaultdict(int)
+    'film_keys': set(),
+    'stats': GenreStatsAccumulator()
 }
 
+# Stage timings and the decision for every film the run handles; --workers processes each write their own file
+film_events = FilmEventLog(EVENTS_PATH, 'Genre 250s V2')
+
 @dataclass
 class MovieData:
     title: str
@@ -103,12 +115,13 @@ class MovieData:
     genres: List[str] = None
 
 class RequestsSession:
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(self, cache: HttpCache = None):
+        self.session = CachedSession(cache, HTTP_CACHE_MAX_AGE, print_to_csv)
         retry_strategy = Retry(
             total=3,
             backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504]
+            # 429s and 5xx go back to the session, whose rate controller backs off before retrying them
+            respect_retry_after_header=False
         )
         adapter = HTTPAdapter(max_retries=retry_strategy)
         self.session.mount("https://", adapter)
@@ -120,32 +133,61 @@ class RequestsSession:
 def normalize_text(text):
     return unicodedata.normalize('NFKC', str(text)).strip()
 
+def list_workbooks():
+    """(store table, workbook path) for every list the scraper reads and writes."""
+    return [('whitelist', WHITELIST_PATH), ('blacklist', BLACKLIST_PATH),
+            ('zero_reviews', ZERO_REVIEWS_PATH), ('incomplete_stats', INCOMPLETE_STATS_WHITELIST_PATH)]
+
+def export_lists(store: FilmStore):
+    """Export any lists changed during the run back to their workbooks."""
+    for table, path in list_workbooks():
+        try:
+            if store.export_if_dirty(table, path):
+                print_to_csv(f"💾 Exported {table} to {os.path.basename(path)}")
+        except Exception as e:
+            print_to_csv(f"Error exporting {table}: {str(e)}")
+
 class MovieProcessor:
-    def __init__(self):
-        self.session = RequestsSession()
+    def __init__(self, store: FilmStore = None):
+        self.http_cache = HttpCache(HTTP_CACHE_PATH)
+        self.session = RequestsSession(self.http_cache)
+        self.tmdb_cache = TmdbCache(TMDB_CACHE_PATH, TMDB_CACHE_TTL_DAYS)
+        self.tmdb_prefetcher = TmdbPrefetcher(self.fetch_tmdb_details, TMDB_WORKERS)
+        # All four lists live in an indexed SQLite store; the workbooks are synced in and exported at the end of the run.
+        # Parallel workers pass in a proxy to the one store their StoreServer owns.
+        self.store = store or FilmStore(FILM_STORE_PATH)
+        self.shares_store = store is not None
         self.whitelist = None
-        self.whitelist_lookup = {}
-        self.incomplete_stats_whitelist = None
+        self.whitelist_lookup = WhitelistLookup()
+        self.whitelist_url_index = {}
+        self.whitelist_title_index = {}
         self.incomplete_stats_lookup = {}
-        self.zero_reviews = None
-        self.zero_reviews_lookup = {}
+        self.blacklist_urls = set()
+        self.blacklist_title_years = set()
+        self.blacklist_by_title = {}
         self.load_whitelist()
         self.load_incomplete_stats_whitelist()
         self.load_zero_reviews()
-        
-        # Update blacklist loading to include the Link column
-        self.blacklist = pd.read_excel(BLACKLIST_PATH, header=0, names=['Title', 'Year', 'Reason', 'Link'], usecols=[0, 1, 2, 3])
-        
-        # Normalize titles and years in blacklist
-        self.blacklist['Title'] = self.blacklist['Title'].apply(normalize_text)
-        self.blacklist['Year'] = self.blacklist['Year'].astype(str).str.strip()
-        # Fill empty links with empty string instead of None
-        self.blacklist['Link'] = self.blacklist['Link'].fillna('')
-        
+        self.load_blacklist()
+        self.reset_run()
+
+    def reset_run(self):
+        """Clear what belongs to one genre/sort list, keeping the loaded lists and caches.
+
+        A processor sharing its store with other workers rebuilds its list
+        lookups from the store first, so films those workers whitelisted or
+        blacklisted during their own runs are recognised in this one.
+        """
+        if self.shares_store:
+            # The parent process already synced the workbooks into the store
+            self.load_whitelist(sync=False)
+            self.load_incomplete_stats_whitelist(sync=False)
+            self.load_blacklist(sync=False)
         self.added_movies: Set[Tuple[str, str]] = set()
         self.film_data: List[Dict] = []
         self.rejected_data: List[List] = []
         self.unfiltered_approved: List[List] = []
+        self.unfiltered_approved_keys: Set[Tuple[str, str]] = set()
         self.unfiltered_denied: List[List] = []
         
         # Statistics tracking
@@ -158,87 +200,86 @@ class MovieProcessor:
         self.country_counts: Dict[str, int] = {}
         self.rating_counts: Dict[str, int] = {}
 
-    def load_whitelist(self):
+    def load_whitelist(self, sync: bool = True):
         """Load and initialize the whitelist data."""
-        try:
-            # Read whitelist with explicit string type for Year column and include Information and Link columns
-            self.whitelist = pd.read_excel(WHITELIST_PATH, header=0, names=['Title', 'Year', 'Information', 'Link'], dtype={'Year': str})
-            
-            # Normalize the data
-            self.whitelist['Title'] = self.whitelist['Title'].apply(normalize_text)
-            self.whitelist['Year'] = self.whitelist['Year'].astype(str).str.strip()
-            # Fill empty links with empty string instead of None
-            self.whitelist['Link'] = self.whitelist['Link'].fillna('')
-            
-            # Create a lookup dictionary for faster matching
-            self.whitelist_lookup = {}
-            for idx, row in self.whitelist.iterrows():
-                key = f"{row['Title'].lower()}_{row['Year']}"
-                try:
-                    # Handle null/empty Information values by treating them as empty dictionaries
-                    if pd.isna(row['Information']) or row['Information'] == '':
-                        info = {}
-                    else:
-                        info = json.loads(row['Information']) if isinstance(row['Information'], str) else row['Information']
-                    self.whitelist_lookup[key] = (info, idx, row['Link'])
-                except (json.JSONDecodeError, TypeError):
-                    # If there's any error parsing, treat it as an empty dictionary
-                    info = {}
-                    self.whitelist_lookup[key] = (info, idx, row['Link'])
-                    continue
-                
-        except FileNotFoundError:
-            print_to_csv("whitelist.xlsx not found. Creating new file.")
-            self.whitelist = pd.DataFrame(columns=['Title', 'Year', 'Information', 'Link'])
-            self.whitelist.to_excel(WHITELIST_PATH, index=False)
+        # Re-import whitelist.xlsx only if it was edited since the last sync, then read the store copy.
+        # Titles are already normalized and blank links are stored as empty strings.
+        if sync:
+            self.store.sync_workbook('whitelist', WHITELIST_PATH)
+        self.whitelist = self.store.load_frame('whitelist')
+        
+        # Create a lookup dictionary for faster matching; row ids are the store's primary keys.
+        # Information stays a raw JSON string until the film is looked up.
+        self.whitelist_lookup = WhitelistLookup()
+        titles = {}
+        for idx, title, year, information, link in zip(
+            self.whitelist.index, self.whitelist['Title'], self.whitelist['Year'],
+            self.whitelist['Information'], self.whitelist['Link']
+        ):
+            key = f"{title.lower()}_{year}"
+            titles[key] = title
+            self.whitelist_lookup[key] = (information, idx, link)
+        
+        # Build the secondary indexes from the final lookup so duplicate rows resolve the same way
+        self.whitelist_url_index = {}
+        self.whitelist_title_index = {}
+        for key, (_, _, url) in self.whitelist_lookup.items():
+            self.index_whitelist_entry(key, titles[key], url)
+
+    def index_whitelist_entry(self, key: str, film_title: str, film_url: str = None):
+        """Register a whitelist_lookup key in the URL and title indexes."""
+        if film_url:
+            self.whitelist_url_index.setdefault(film_url, key)
+        keys = self.whitelist_title_index.setdefault(normalize_text(film_title).lower(), [])
+        if key not in keys:
+            keys.append(key)
+
+    def load_blacklist(self, sync: bool = True):
+        """Load the blacklist into URL and title/year hash indexes."""
+        if sync:
+            self.store.sync_workbook('blacklist', BLACKLIST_PATH)
+        blacklist = self.store.load_frame('blacklist')
+        self.blacklist_urls = set()
+        self.blacklist_title_years = set()
+        self.blacklist_by_title = {}
+        for row_id, title, year, link in zip(blacklist.index, blacklist['Title'], blacklist['Year'], blacklist['Link']):
+            self.index_blacklist_entry(row_id, title, year, link)
+        print_to_csv(f"Loaded {len(blacklist)} blacklist entries")
+
+    def index_blacklist_entry(self, row_id: int, film_title: str, release_year: str, film_url: str = None):
+        """Register a blacklist row in the URL, title/year and title indexes."""
+        normalized_title = normalize_text(film_title).lower()
+        year = str(release_year).strip()
+        if film_url:
+            self.blacklist_urls.add(film_url)
+        self.blacklist_title_years.add((normalized_title, year))
+        self.blacklist_by_title.setdefault(normalized_title, []).append(
+            {'id': row_id, 'Year': year, 'Link': film_url or ''}
+        )
 
-    def load_incomplete_stats_whitelist(self):
+    def load_incomplete_stats_whitelist(self, sync: bool = True):
         """Load and initialize the incomplete stats whitelist data."""
-        try:
-            # Read incomplete stats whitelist with explicit string type for Year column
-            self.incomplete_stats_whitelist = pd.read_excel(INCOMPLETE_STATS_WHITELIST_PATH, 
-                                                          header=0, 
-                                                          names=['Title', 'Year'], 
-                                                          dtype={'Year': str})
-            
-            # Normalize the data
-            self.incomplete_stats_whitelist['Title'] = self.incomplete_stats_whitelist['Title'].apply(normalize_text)
-            self.incomplete_stats_whitelist['Year'] = self.incomplete_stats_whitelist['Year'].astype(str).str.strip()
-            
-            # Create a lookup dictionary for faster matching
-            self.incomplete_stats_lookup = {}
-            for _, row in self.incomplete_stats_whitelist.iterrows():
-                key = f"{row['Title'].lower()}_{row['Year']}"
-                self.incomplete_stats_lookup[key] = True
-                
-        except FileNotFoundError:
-            print_to_csv("Incomplete_Stats_Whitelist.xlsx not found. Creating new file.")
-            self.incomplete_stats_whitelist = pd.DataFrame(columns=['Title', 'Year'])
-            self.incomplete_stats_whitelist.to_excel(INCOMPLETE_STATS_WHITELIST_PATH, index=False)
+        if sync:
+            self.store.sync_workbook('incomplete_stats', INCOMPLETE_STATS_WHITELIST_PATH)
+        incomplete_stats_whitelist = self.store.load_frame('incomplete_stats')
+        
+        # Create a lookup dictionary for faster matching
+        self.incomplete_stats_lookup = {}
+        for title, year in zip(incomplete_stats_whitelist['Title'], incomplete_stats_whitelist['Year']):
+            key = f"{title.lower()}_{year}"
+            self.incomplete_stats_lookup[key] = True
+
+    def add_to_incomplete_stats(self, film_title: str, release_year: str):
+        """Add a movie to the incomplete stats whitelist."""
+        self.store.upsert('incomplete_stats', film_title, release_year)
+        key = f"{film_title.lower()}_{release_year}"
+        self.incomplete_stats_lookup[key] = True
 
     def load_zero_reviews(self):
         """Load and initialize the zero reviews data."""
         try:
-            # Check if file exists
-            if os.path.exists(ZERO_REVIEWS_PATH):
-                # Read zero reviews with explicit string type for Year column
-                self.zero_reviews = pd.read_excel(ZERO_REVIEWS_PATH, header=0, names=['Title', 'Year', 'Blank', 'Link'], dtype={'Year': str})
-                
-                # Normalize the data
-                self.zero_reviews['Title'] = self.zero_reviews['Title'].apply(normalize_text)
-                self.zero_reviews['Year'] = self.zero_reviews['Year'].astype(str).str.strip()
-                self.zero_reviews['Link'] = self.zero_reviews['Link'].fillna('')
-                self.zero_reviews['Blank'] = ''  # Ensure Blank column is empty
-                            
-                # Create a lookup dictionary for faster matching
-                self.zero_reviews_lookup = {}
-                for idx, row in self.zero_reviews.iterrows():
-                    key = f"{row['Title'].lower()}_{row['Year']}"
-                    self.zero_reviews_lookup[key] = (row['Link'], idx)
-                    
-            else:
-                self.zero_reviews = pd.DataFrame(columns=['Title', 'Year', 'Blank', 'Link'])
-                self.zero_reviews.to_excel(ZERO_REVIEWS_PATH, index=False)
+            # Zero review checks are point lookups on the store's Link index
+            self.store.sync_workbook('zero_reviews', ZERO_REVIEWS_PATH)
                 
         except Exception as e:
             print_to_csv(f"ERROR loading zero reviews: {str(e)}")
@@ -263,73 +304,50 @@ class MovieProcessor:
         self.film_data.append(film_data)
 
         # Process MAX_MOVIES using centralized function
-        if add_to_max_movies(info.get('Title'), info.get('Year'), info.get('tmdbID')):
-            self.update_max_movies_statistics(info.get('Title'), info.get('Year'), info.get('tmdbID'))
+        with film_events.stage('stats_update'):
+            if add_to_max_movies(info.get('Title'), info.get('Year'), info.get('tmdbID')):
+                self.update_max_movies_statistics(info.get('Title'), info.get('Year'), info.get('tmdbID'))
 
     def update_whitelist(self, film_title: str, release_year: str, movie_data: Dict, film_url: str = None) -> bool:
         """Update the whitelist with new movie data."""
         try:
             key = f"{film_title.lower()}_{release_year}"
+            # Transactional upsert; the store only fills in the link if the stored one is blank
+            with film_events.stage('whitelist_write'):
+                row_idx = self.store.upsert('whitelist', film_title, release_year, json.dumps(movie_data), film_url)
             
             if key in self.whitelist_lookup:
                 # Update existing entry
-                _, row_idx, existing_url = self.whitelist_lookup[key]
-                self.whitelist.at[row_idx, 'Information'] = json.dumps(movie_data)
-                # Only update link if it's currently blank and we have a new URL
+                _, _, existing_url = self.whitelist_lookup[key]
                 if film_url and (not existing_url or existing_url == ''):
-                    self.whitelist.at[row_idx, 'Link'] = film_url
                     print_to_csv(f"🔗 Added link to whitelist for {film_title}")
-                self.whitelist_lookup[key] = (movie_data, row_idx, film_url or existing_url)
+                self.whitelist_lookup[key] = (movie_data, row_idx, existing_url or film_url or '')
             else:
                 # Add new entry
-                new_row = pd.DataFrame([{
-                    'Title': film_title,
-                    'Year': release_year,
-                    'Information': json.dumps(movie_data),
-                    'Link': film_url or ''
-                }])
-                self.whitelist = pd.concat([self.whitelist, new_row], ignore_index=True)
-                self.whitelist_lookup[key] = (movie_data, len(self.whitelist) - 1, film_url or '')
+                self.whitelist_lookup[key] = (movie_data, row_idx, film_url or '')
                 if film_url:
                     print_to_csv(f"🔗 Added link to whitelist for {film_title}")
-            
-            # Save to Excel
-            self.whitelist.to_excel(WHITELIST_PATH, index=False)
-            self.load_whitelist()  # Reload to ensure consistency
+            self.index_whitelist_entry(key, film_title, self.whitelist_lookup[key][2])
             return True
             
         except Exception as e:
             print_to_csv(f"Error updating whitelist: {str(e)}")
             return False
 
+    def save_lists(self):
+        """Export any lists changed during the run back to their workbooks."""
+        export_lists(self.store)
+
     def get_whitelist_data(self, film_title: str, release_year: str = None, film_url: str = None) -> Optional[Tuple[Dict, int]]:
         """Get the whitelist data for a movie if it exists."""
         
         # If we have a URL, check for URL match first
-        if film_url:
-            for key, value in self.whitelist_lookup.items():
-                if isinstance(value, tuple) and len(value) == 3:
-                    info, row_idx, url = value
-                    if url == film_url:
-                        return info, row_idx
+        if film_url and film_url in self.whitelist_url_index:
+            info, row_idx, _ = self.whitelist_lookup[self.whitelist_url_index[film_url]]
+            return info, row_idx
         
         # If no URL match or no URL provided, try title-only match
-        matches = []
-        for key, value in self.whitelist_lookup.items():
-            title = key.split('_')[0]
-            if title == film_title.lower():
-                # Handle case where value might not have all three elements
-                if isinstance(value, tuple):
-                    if len(value) == 3:
-                        info, row_idx, url = value
-                    elif len(value) == 2:
-                        info, row_idx = value
-                        url = ''
-                    else:
-                        continue
-                else:
-                    continue
-                matches.append((info, row_idx, url))
+        matches = [self.whitelist_lookup[key] for key in self.whitelist_title_index.get(normalize_text(film_title).lower(), [])]
 
         if len(matches) == 1:
             return matches[0][0], matches[0][1]
@@ -351,16 +369,7 @@ class MovieProcessor:
                         # Now try exact match with title and scraped year
                         key = f"{film_title.lower()}_{scraped_year}"
                         if key in self.whitelist_lookup:
-                            value = self.whitelist_lookup[key]
-                            if isinstance(value, tuple):
-                                if len(value) == 3:
-                                    info, row_idx, _ = value
-                                elif len(value) == 2:
-                                    info, row_idx = value
-                                else:
-                                    return None, None
-                            else:
-                                return None, None
+                            info, row_idx, _ = self.whitelist_lookup[key]
                             return info, row_idx
                 except Exception as e:
                     print_to_csv(f"DEBUG: Error scraping release year: {str(e)}")
@@ -369,6 +378,10 @@ class MovieProcessor:
         return None, None
 
     def fetch_tmdb_details(self, tmdb_id: str) -> Tuple[List[str], List[str]]:
+        cached = self.tmdb_cache.get(tmdb_id)
+        if cached is not None:
+            return cached
+
         movie_url = f"https://api.themoviedb.org/3/movie/{tmdb_id}?api_key={TMDB_API_KEY}&append_to_response=keywords"
         response = self.session.get(movie_url)
 
@@ -377,6 +390,7 @@ class MovieProcessor:
             keywords = [keyword['name'] for keyword in movie_data['keywords']['keywords']]
             genre_elements = movie_data['genres']
             genres = [genre['name'] for genre in genre_elements]
+            self.tmdb_cache.put(tmdb_id, keywords, genres)
             return keywords, genres
         else:
             if response.status_code == 401:
@@ -384,15 +398,9 @@ class MovieProcessor:
             return [], []
 
     def add_to_blacklist(self, film_title: str, release_year: str, reason: str, film_url: str = None) -> None:
-        if not any((film_title.lower() == str(row['Title']).lower() and 
-                   release_year == row['Year']) for _, row in self.blacklist.iterrows()):
-            # Create a new row as a DataFrame
-            new_row = pd.DataFrame([[film_title, release_year, reason, film_url]], 
-                                 columns=['Title', 'Year', 'Reason', 'Link'])
-            # Append to existing blacklist
-            self.blacklist = pd.concat([self.blacklist, new_row], ignore_index=True)
-            # Save back to Excel
-            self.blacklist.to_excel(BLACKLIST_PATH, index=False)
+        if (normalize_text(film_title).lower(), str(release_year).strip()) not in self.blacklist_title_years:
+            row_id = self.store.upsert('blacklist', film_title, release_year, reason, film_url)
+            self.index_blacklist_entry(row_id, film_title, release_year, film_url)
             print_to_csv(f"⚫ {film_title} ({release_year}) added to blacklist {reason}")
 
     def is_whitelisted(self, film_title: str, release_year: str) -> bool:
@@ -421,66 +429,37 @@ class MovieProcessor:
         if not movie_info:
             return
 
-        # Update directors
-        for director in movie_info.get('Directors', []):
-            max_movies_stats['director_counts'][director] += 1
-
-        # Update actors
-        for actor in movie_info.get('Actors', []):
-            max_movies_stats['actor_counts'][actor] += 1
-
-        # Update decade
-        decade = movie_info.get('Decade')
-        if decade:
-            max_movies_stats['decade_counts'][decade] += 1
-
-        # Update genres
-        for genre in movie_info.get('Genres', []):
-            max_movies_stats['genre_counts'][genre] += 1
-
-        # Update studios
-        for studio in movie_info.get('Studios', []):
-            max_movies_stats['studio_counts'][studio] += 1
-
-        # Update languages
-        for language in movie_info.get('Languages', []):
-            max_movies_stats['language_counts'][language] += 1
-
-        # Update countries
-        for country in movie_info.get('Countries', []):
-            max_movies_stats['country_counts'][country] += 1
+        # Genres and keywords come from TMDB, the details the keyword/genre filter checks (usually already cached)
+        keywords, genres = self.fetch_tmdb_details(tmdb_id) if tmdb_id else ([], [])
+        stats = max_movies_stats['stats']
+        stats.add(dict(movie_info, Genres=genres))
+        stats.keyword_counts.update(keywords)
 
     def is_blacklisted(self, film_title: str, release_year: str = None, film_url: str = None, driver = None) -> bool:
-        """Check if a movie is in the blacklist using a lookup dictionary."""
+        """Check if a movie is in the blacklist using the in-memory hash indexes."""
         # If we have a URL, check for URL match first
-        if film_url:
-            for _, row in self.blacklist.iterrows():
-                if row['Link'] == film_url:
-                    return True
+        if film_url and film_url in self.blacklist_urls:
+            return True
         
-        # If no URL match or no URL provided, try title matching
+        # If no URL match or no URL provided, try title matching against the normalized title index
         normalized_title = normalize_text(film_title).lower()
+        matching_entries = self.blacklist_by_title.get(normalized_title)
         
-        # Find all matching titles in blacklist
-        matching_entries = self.blacklist[
-            self.blacklist['Title'].apply(normalize_text).str.lower() == normalized_title
-        ]
-        
-        if matching_entries.empty:
+        if not matching_entries:
             return False
             
         # If we have a URL but no direct match, check year match
         if film_url:
-            for _, row in matching_entries.iterrows():
+            for row in matching_entries:
                 if row['Link'] == '':  # If link is empty, check year match
                     # Get release year from movie page if not provided
                     if not release_year and driver:  # Make sure we have a driver
                         print_to_csv("Getting release year from movie page...")
+                        controller_for('letterboxd.com').wait()
                         driver.get(film_url)  # Use the passed driver parameter
                         WebDriverWait(driver, 10).until(
                             EC.presence_of_element_located((By.CSS_SELECTOR, 'meta[property="og:title"]'))
                         )
-                        time.sleep(random.uniform(1.0, 1.5))
                         
                         meta_tag = driver.find_element(By.CSS_SELECTOR, 'meta[property="og:title"]')
                         if meta_tag:
@@ -490,18 +469,17 @@ class MovieProcessor:
                                 print_to_csv(f"Found release year: {release_year}")
                 
                     # Check if years match
-                    if release_year and str(row['Year']).strip() == str(release_year).strip():
+                    if release_year and row['Year'] == str(release_year).strip():
                         # Update the blacklist with the link
-                        self.blacklist.loc[row.name, 'Link'] = film_url
-                        self.blacklist.to_excel(BLACKLIST_PATH, index=False)
+                        self.store.set_link('blacklist', row['id'], film_url)
+                        row['Link'] = film_url
+                        self.blacklist_urls.add(film_url)
                         print_to_csv(f"🔗 Added link to blacklist for {film_title}")
                         return True
         
         # If no URL or no match found, check year if available
         if release_year:
-            for _, row in matching_entries.iterrows():
-                if str(row['Year']).strip() == str(release_year).strip():
-                    return True
+            return (normalized_title, str(release_year).strip()) in self.blacklist_title_years
         
         return False
 
@@ -528,23 +506,10 @@ class MovieProcessor:
         """Add a movie to the zero reviews list."""
         try:
             # Check if movie is already in zero_reviews by URL
-            if any(self.zero_reviews['Link'] == film_url):
+            if self.store.find('zero_reviews', link=film_url):
                 return
              
-            # Create a new row as a DataFrame
-            new_row = pd.DataFrame([[film_title, release_year, '', film_url]], 
-                                 columns=['Title', 'Year', 'Blank', 'Link'])
-            
-            # Append to existing zero reviews
-            self.zero_reviews = pd.concat([self.zero_reviews, new_row], ignore_index=True)
-                        
-            # Save back to Excel immediately
-            try:
-                self.zero_reviews.to_excel(ZERO_REVIEWS_PATH, index=False)
-            except Exception as excel_error:
-                print_to_csv(f"ERROR saving to Excel: {str(excel_error)}")
-                print_to_csv(f"ERROR type: {type(excel_error)}")
-                raise
+            self.store.upsert('zero_reviews', film_title, release_year, '', film_url, match_on='link')
             
         except Exception as e:
             print_to_csv(f"ERROR adding to zero reviews: {str(e)}")
@@ -555,18 +520,14 @@ class MovieProcessor:
     def is_zero_reviews(self, film_title: str, release_year: str, film_url: str) -> bool:
         """Check if a movie is in the zero reviews list."""
         try:
-            # Check if the URL exists in the zero_reviews DataFrame
+            # Check if the URL exists in the zero reviews store
             if film_url:
-                result = any(self.zero_reviews['Link'] == film_url)
+                matches = self.store.find('zero_reviews', link=film_url)
+                result = bool(matches)
                 if result:
                     # 1 in 15 chance to remove the entry after finding it
                     if random.random() < (1/15):
-                        # Find the index of the row to remove
-                        idx_to_remove = self.zero_reviews[self.zero_reviews['Link'] == film_url].index[0]
-                        # Remove the row
-                        self.zero_reviews = self.zero_reviews.drop(idx_to_remove)
-                        # Save the updated DataFrame
-                        self.zero_reviews.to_excel(ZERO_REVIEWS_PATH, index=False)
+                        self.store.delete('zero_reviews', matches[0]['id'])
                         print_to_csv(f"🗑️ Removed {film_title} from zero reviews list")
                 return result
             
@@ -618,62 +579,20 @@ def format_time(seconds):
     else:
         return f"{seconds}s"
 
-def extract_mpaa_rating(driver) -> Optional[str]:
-    """Extract the MPAA rating from the movie's page if the country is USA."""
-    try:
-        # Wait for the page to be fully loaded
-        wait = WebDriverWait(driver, 10)
-        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, '.release-country-list')))
-        
-        # Use JavaScript to extract all country data
-        js_script = """
-        const countries = Array.from(document.querySelectorAll('.release-country'));
-        return countries.map(country => {
-            const name = country.querySelector('.name')?.textContent?.trim() || '';
-            const rating = country.querySelector('.release-certification-badge .label')?.textContent?.trim() || '';
-            return { name, rating };
-        });
-        """
-        
-        country_data = driver.execute_script(js_script)
-        
-        # Process the country data
-        for data in country_data:
-            name = data['name']
-            rating = data['rating']
-            
-            if name == "USA" and rating:
-                # Handle special cases
-                if rating.upper() in ['NR', 'NOT RATED', 'UNRATED']:
-                    return 'NR'
-                
-                # Map common rating formats to MPAA ratings
-                rating_map = {
-                    'R': 'R',
-                    'PG-13': 'PG-13',
-                    'PG': 'PG',
-                    'G': 'G',
-                    'NC-17': 'NC-17',
-                    'X': 'NC-17',  # Historical rating
-                    'M': 'PG',     # Historical rating
-                    'GP': 'PG',    # Historical rating
-                }
-                
-                if rating in rating_map:
-                    return rating_map[rating]
-        
-        return None
-        
-    except Exception as e:
-        print_to_csv(f"Error extracting MPAA rating: {str(e)}")
-        return None
+def reset_max_movies_stats():
+    """Start max_movies_stats over for the next genre/sort list."""
+    global max_movies_stats
+    max_movies_stats = {
+        'film_data': [],
+        'film_keys': set(),
+        'stats': GenreStatsAccumulator()
+    }
 
 def add_to_max_movies(film_title: str, release_year: str, tmdb_id: str) -> bool:
     """
     Centralized function to add a movie to max_movies_stats if it's not already present.
     """
-    if any(movie['Title'] == film_title and movie['Year'] == release_year 
-           for movie in max_movies_stats['film_data']):
+    if (film_title, release_year) in max_movies_stats['film_keys']:
         return False
         
     if len(max_movies_stats['film_data']) >= MAX_MOVIES:
@@ -684,12 +603,116 @@ def add_to_max_movies(film_title: str, release_year: str, tmdb_id: str) -> bool:
         'Year': release_year,
         'tmdbId': tmdb_id
     })
+    max_movies_stats['film_keys'].add((film_title, release_year))
     return True
 
-class LetterboxdScraper:
-    def __init__(self, genre=None, sort_type=None):
+class ScraperSession:
+    """The browser, loaded lists and film page fetchers shared by every genre/sort run.
+
+    Each LetterboxdScraper used to launch Firefox and load the whitelist,
+    blacklist and zero reviews workbooks for itself. A session does that once;
+    start_run() then resets only the per-list stats. startup_seconds and
+    reset_seconds feed the timing breakdown in report().
+
+    A session given a shared store leaves exporting the workbooks to the
+    process that owns the store, and its processor reloads the lists from
+    the store at each start_run().
+    """
+
+    def __init__(self, store: FilmStore = None):
+        self.exports_lists = store is None
+        self.startup_seconds = {}
+        self.reset_seconds = 0.0
+        self.runs = 0
+        self.pool_launch_seconds = 0.0
+        self.pool_launches = 0
+
+        start = time.perf_counter()
         self.driver = setup_webdriver()
-        self.processor = MovieProcessor()
+        self.startup_seconds['Browser launch'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        self.processor = MovieProcessor(store)
+        self.startup_seconds['List loading'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        self.page_parser = FilmPageParser()
+        self.rate_controller = controller_for('letterboxd.com', print_to_csv)
+        self.fetcher = FilmFetcher(self.driver, self.page_parser,
+                                   create_film_session(cache=self.processor.http_cache, max_age=HTTP_CACHE_MAX_AGE))
+        self.driver_pool = WebDriverPool(self.launch_pool_driver, DRIVER_POOL_SIZE, DRIVER_RECYCLE_AFTER)
+        self.pipeline = FilmPagePipeline(self.fetcher, FILM_FETCH_CONCURRENCY, self.driver_pool, on_page=self.prefetch_tmdb)
+        self.startup_seconds['Fetcher setup'] = time.perf_counter() - start
+        print_to_csv(f"Started scraper session in {sum(self.startup_seconds.values()):.1f}s")
+
+    def launch_pool_driver(self) -> webdriver.Firefox:
+        """setup_webdriver for the pool, timed so the report can count the launches the session saved."""
+        start = time.perf_counter()
+        driver = setup_webdriver()
+        self.pool_launch_seconds += time.perf_counter() - start
+        self.pool_launches += 1
+        return driver
+
+    def prefetch_tmdb(self, page: FilmPage):
+        """Start the TMDB lookup for a prefetched page that will get as far as the keyword/genre filter."""
+        if page.tmdb_id and page.rating_count >= MIN_RATING_COUNT and page.runtime and page.runtime >= MIN_RUNTIME:
+            self.processor.tmdb_prefetcher.submit(page.tmdb_id)
+
+    def ensure_driver(self):
+        """Relaunch the main browser if it died during the previous run."""
+        try:
+            self.driver.current_url
+        except Exception:
+            print_to_csv("Browser is not responding, launching a new one")
+            try:
+                self.driver.quit()
+            except:
+                pass
+            self.driver = setup_webdriver()
+            self.fetcher.driver = self.driver
+
+    def start_run(self):
+        """Reset the per-list stats before the next genre/sort run."""
+        start = time.perf_counter()
+        reset_max_movies_stats()
+        self.processor.reset_run()
+        self.pipeline.cancel_pending()
+        self.processor.tmdb_prefetcher.cancel_pending()
+        self.ensure_driver()
+        self.reset_seconds += time.perf_counter() - start
+        self.runs += 1
+
+    def report(self, log=print):
+        """Log what starting up cost and how much sharing it across runs saved."""
+        startup = sum(self.startup_seconds.values())
+        log(f"Session startup: {startup:.1f}s for {self.runs} runs")
+        for stage, seconds in self.startup_seconds.items():
+            log(f"  {stage}: {seconds:.1f}s")
+        if self.pool_launches:
+            log(f"  Pooled browser launches: {self.pool_launches} ({self.pool_launch_seconds:.1f}s)")
+        if self.runs > 1:
+            log(f"  Resetting between runs: {self.reset_seconds / self.runs * 1000:.0f} ms per run")
+            # Every run used to start its own browser, lists, fetchers and pooled browsers
+            saved = (startup + self.pool_launch_seconds) * (self.runs - 1) - self.reset_seconds
+            log(f"  Startup time saved by sharing: about {format_time(saved)}")
+
+    def close(self):
+        """Export changed lists and shut down the fetchers and browsers."""
+        if self.exports_lists:
+            self.processor.save_lists()
+        # Close each on its own so one failing still shuts the others down
+        for close in (self.driver_pool.close, self.pipeline.close, self.processor.tmdb_prefetcher.close, self.driver.quit):
+            try:
+                close()
+            except Exception:
+                pass
+
+class LetterboxdScraper:
+    def __init__(self, genre=None, sort_type=None, session: ScraperSession = None):
+        # Runs share one session; a scraper built without one gets its own
+        self.session = session or ScraperSession()
+        self.driver = self.session.driver
+        self.processor = self.session.processor
         self.genre = genre
         self.sort_type = sort_type
         self.base_url = f'https://letterboxd.com/films/genre/{genre}/by/{sort_type}/' if genre and sort_type else None
@@ -699,8 +722,44 @@ class LetterboxdScraper:
         self.page_number = 1
         self.start_time = time.time()
         self.top_movies_count = 0  # Track the number of movies added to the genre lists
+        self.page_parser = self.session.page_parser
+        self.rate_controller = self.session.rate_controller
+        self.fetcher = self.session.fetcher
+        self.driver_pool = self.session.driver_pool
+        self.pipeline = self.session.pipeline
         print_to_csv("Initialized Letterboxd Scraper.")
 
+    def fetch_film_page(self, film_url: str) -> FilmPage:
+        """Fetch and parse a film page over HTTP, loading it in the driver only if a required field is missing.
+
+        Pages the pipeline already requested for the current listing page are
+        taken from it instead of being fetched again.
+        """
+        start = time.perf_counter()
+        prefetched = self.pipeline.take(film_url)
+        if prefetched is not None:
+            film_events.add('page_wait', time.perf_counter() - start)
+        page = self.fetcher.fetch(film_url, prefetched)
+        film_events.fetched(self.fetcher.last_result, prefetched is not None)
+        return page
+
+    def start_film_event(self, film_url: str, film_title: str):
+        """Start timing a film, noting the counts its decision is read from."""
+        film_events.begin(film_url, film_title, list=f"{self.genre}/{self.sort_type}")
+        self.event_counts = (self.valid_movies_count, len(self.processor.rejected_data))
+
+    def finish_film_event(self):
+        """Write the current film's event: accepted if the count went up, rejected with its reason if it was rejected."""
+        if not film_events.active:
+            return
+        accepted, rejected = self.event_counts
+        if self.valid_movies_count > accepted:
+            film_events.end('accepted')
+        elif len(self.processor.rejected_data) > rejected:
+            film_events.end('rejected', self.processor.rejected_data[-1][3])
+        else:
+            film_events.end('skipped', film_events.film.get('reason'))
+
     def process_movie_data(self, info, film_title=None, film_url=None):
         """Process movie data from the whitelist."""
         try:            
@@ -721,18 +780,9 @@ class LetterboxdScraper:
                         # Only proceed with link update if current link is blank
                         if not existing_url or existing_url == '':
                             try:
-                                # Load the movie page to verify it's the correct movie
-                                self.driver.get(film_url)
-                                WebDriverWait(self.driver, 10).until(
-                                    EC.presence_of_element_located((By.CSS_SELECTOR, 'meta[property="og:title"]'))
-                                )
-                                time.sleep(random.uniform(1.0, 1.5))
-                                
-                                # Extract release year from the page
-                                meta_tag = self.driver.find_element(By.CSS_SELECTOR, 'meta[property="og:title"]')
-                                content = meta_tag.get_attribute('content')
-                                if content and '(' in content and ')' in content:
-                                    page_year = content.split('(')[-1].split(')')[0].strip()
+                                # Fetch the movie page to verify it's the correct movie
+                                page_year = self.fetch_film_page(film_url).release_year
+                                if page_year:
                                     # If years match, update the whitelist with the link
                                     if page_year == release_year:
                                         self.processor.update_whitelist(film_title, release_year, info, film_url)
@@ -807,29 +857,21 @@ class LetterboxdScraper:
                 max_retries = 20
                 for retry in range(max_retries):
                     try:
-                        self.driver.get(film_url)
-                        WebDriverWait(self.driver, 10).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, 'meta[property="og:title"]'))
-                        )
-                        time.sleep(random.uniform(1.0, 1.5))
+                        page = self.fetch_film_page(film_url)
 
                         # Extract release year
-                        meta_tag = WebDriverWait(self.driver, 10).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, 'meta[property="og:title"]'))
-                        )
-                        content = meta_tag.get_attribute('content')
-                        if content and '(' in content and ')' in content:
-                            release_year = content.split('(')[-1].split(')')[0].strip()
+                        if page.release_year:
+                            release_year = page.release_year
                         else:
                             print_to_csv(f"❌ Could not extract release year for {film_title}")
                             if retry < max_retries - 1:
                                 print_to_csv(f"Retrying... (Attempt {retry + 1}/{max_retries})")
-                                time.sleep(2)
+                                self.rate_controller.backoff("film page retry")
                                 continue
                             return False
 
                         # Get fresh data and update whitelist
-                        movie_data = self.update_statistics_for_movie(film_title, release_year, info.get('tmdbID'), self.driver, film_url)
+                        movie_data = self.update_statistics_for_movie(film_title, release_year, info.get('tmdbID'), self.driver, film_url, page)
                         if movie_data:
                             # Update whitelist with fresh data
                             if self.processor.update_whitelist(film_title, release_year, movie_data, film_url):
@@ -847,44 +889,26 @@ class LetterboxdScraper:
                                 print_to_csv(f"❌ Failed to update whitelist for {film_title}")
                                 if retry < max_retries - 1:
                                     print_to_csv(f"Retrying... (Attempt {retry + 1}/{max_retries})")
-                                    time.sleep(2)
+                                    self.rate_controller.backoff("film page retry")
                                     continue
                                 return False
                         else:
                             if retry < max_retries - 1:
                                 print_to_csv(f"Retrying... (Attempt {retry + 1}/{max_retries})")
-                                time.sleep(2)
+                                self.rate_controller.backoff("film page retry")
                                 continue
                             # On final retry, check if we should add to incomplete stats whitelist
                             try:
                                 current_year = datetime.now().year
                                 movie_year = int(release_year)
-                                rating_count = 0
-                                page_source = self.driver.page_source
-                                match = re.search(r'ratingCount":(\d+)', page_source)
-                                if match:
-                                    rating_count = int(match.group(1))
+                                rating_count = page.rating_count
                                 
                                 # Check if movie meets criteria for incomplete stats whitelist
                                 if (current_year - movie_year > 5 and 
                                     rating_count > 50000 and 
                                     not self.processor.is_incomplete_stats_whitelisted(film_title, release_year)):
                                     # Add to incomplete stats whitelist
-                                    new_row = pd.DataFrame([{
-                                        'Title': film_title,
-                                        'Year': release_year
-                                    }])
-                                    self.processor.incomplete_stats_whitelist = pd.concat(
-                                        [self.processor.incomplete_stats_whitelist, new_row], 
-                                        ignore_index=True
-                                    )
-                                    self.processor.incomplete_stats_whitelist.to_excel(
-                                        INCOMPLETE_STATS_WHITELIST_PATH, 
-                                        index=False
-                                    )
-                                    # Update lookup dictionary
-                                    key = f"{film_title.lower()}_{release_year}"
-                                    self.processor.incomplete_stats_lookup[key] = True
+                                    self.processor.add_to_incomplete_stats(film_title, release_year)
                                     print_to_csv(f"📝 Added {film_title} ({release_year}) to incomplete stats whitelist")
                             except Exception as e:
                                 print_to_csv(f"Error checking incomplete stats whitelist criteria: {str(e)}")
@@ -894,7 +918,7 @@ class LetterboxdScraper:
                         print_to_csv(f"❌ Error rescraping {film_title}: {str(e)}")
                         if retry < max_retries - 1:
                             print_to_csv(f"Retrying... (Attempt {retry + 1}/{max_retries})")
-                            time.sleep(2)
+                            self.rate_controller.backoff("film page retry")
                             continue
                         return False
 
@@ -911,32 +935,22 @@ class LetterboxdScraper:
                     max_retries = 20
                     for retry in range(max_retries):
                         try:
-                            self.driver.get(film_url)
-                            # Wait for page to load
-                            WebDriverWait(self.driver, 10).until(
-                                EC.presence_of_element_located((By.CSS_SELECTOR, 'meta[property="og:title"]'))
-                            )
-                            time.sleep(random.uniform(1.0, 1.5))
+                            page = self.fetch_film_page(film_url)
                             break
                         except Exception as e:
                             if retry == max_retries - 1:
                                 print_to_csv(f"❌ Error loading movie page for {film_title}: {str(e)}")
                                 return
                             print_to_csv(f"Retry {retry + 1}/{max_retries} loading movie page for {film_title}")
-                            time.sleep(2)
+                            self.rate_controller.backoff("film page retry")
                 except Exception as e:
                     print_to_csv(f"❌ Error loading movie page for {film_title}: {str(e)}")
                     return
 
-                # Extract release year
+                # Take the release year from the fetched page
                 try:
-                    meta_tag = WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, 'meta[property="og:title"]'))
-                    )
-                    content = meta_tag.get_attribute('content')
-                    if content and '(' in content and ')' in content:
-                        release_year = content.split('(')[-1].split(')')[0].strip()
-                    else:
+                    release_year = page.release_year
+                    if not release_year:
                         print_to_csv(f"❌ Could not extract release year for {film_title}")
                         return False
                 except Exception as e:
@@ -946,15 +960,7 @@ class LetterboxdScraper:
                 # Check if movie is in whitelist first
                 whitelist_info, _ = self.processor.get_whitelist_data(film_title, release_year, film_url)
                     
-                # Extract rating count
-                rating_count = 0
-                try:
-                    page_source = self.driver.page_source
-                    match = re.search(r'ratingCount":(\d+)', page_source)
-                    if match:
-                        rating_count = int(match.group(1))
-                except Exception as e:
-                    print_to_csv(f"Error extracting rating count: {str(e)}")
+                rating_count = page.rating_count
 
                 # Check 1: Rating count minimum
                 if rating_count < MIN_RATING_COUNT:
@@ -973,137 +979,18 @@ class LetterboxdScraper:
                     self.process_movie_data(whitelist_info, film_title, film_url)
                     return
 
-                # Extract TMDb ID
-                try:
-                    tmdb_id = WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((By.TAG_NAME, 'body'))
-                    ).get_attribute('data-tmdb-id')
-                except Exception as e:
-                    tmdb_id = None
-                    print_to_csv(f"TMDb ID not found: {e}")
+                tmdb_id = page.tmdb_id
+                if not tmdb_id:
+                    print_to_csv(f"TMDb ID not found for {film_title}")
 
                 # Update statistics and collect data
-                self.update_statistics_for_movie(film_title, release_year, tmdb_id, self.driver, film_url)
-                
-                # Extract runtime
-                runtime = None
-                try:
-                    runtime_element = WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, 'p.text-link.text-footer'))
-                    )
-                    runtime_text = runtime_element.text
-                    match = re.search(r'(\d+)\s*min(?:s)?', runtime_text)
-                    if match:
-                        runtime = int(match.group(1))
-                except Exception as e:
-                    print_to_csv(f"Error extracting runtime: {str(e)}")
+                self.update_statistics_for_movie(film_title, release_year, tmdb_id, self.driver, film_url, page)
 
-                # Extract languages
-                movie_languages = set()
-                try:                    
-                    headings = self.driver.find_elements(By.CSS_SELECTOR, '#tab-details h3')
-                    
-                    for heading in headings:
-                        span = heading.find_element(By.TAG_NAME, 'span')
-                        heading_text = span.get_attribute('textContent').strip() if span else heading.get_attribute('textContent').strip()
-                        
-                        if any(lang in heading_text for lang in ["Language", "Primary Language", "Languages", "Primary Languages"]):
-                            try:
-                                sluglist = heading.find_element(By.XPATH, "following-sibling::div[contains(@class, 'text-sluglist')]")
-                                
-                                if sluglist:
-                                    p_tag = sluglist.find_element(By.TAG_NAME, 'p')
-                                    language_elements = p_tag.find_elements(By.CSS_SELECTOR, 'a.text-slug[href*="/films/language/"]')
-                                    
-                                    for language in language_elements:
-                                        language_name = language.get_attribute('textContent').strip()
-                                        if language_name:
-                                            movie_languages.add(language_name)
-                            except Exception:
-                                pass
-                except Exception:
-                    pass
-
-                # Extract MPAA rating
-                mpaa_rating = None
-                try:
-                    mpaa_rating = extract_mpaa_rating(self.driver)
-                except Exception as e:
-                    print_to_csv(f"Error extracting MPAA rating: {str(e)}")
-
-                # Extract directors
-                movie_directors = []
-                try:
-                    director_elements = self.driver.find_elements(By.CSS_SELECTOR, 'span.directorlist a.contributor')
-                    for director in director_elements:
-                        director_name = director.text.strip()
-                        if director_name:
-                            movie_directors.append(director_name)
-                except Exception:
-                    pass
-
-                # Extract actors
-                movie_actors = []
-                try:
-                    actor_elements = self.driver.find_elements(By.CSS_SELECTOR, '#tab-cast .text-sluglist a.text-slug.tooltip')
-                    for actor in actor_elements:
-                        actor_name = actor.text.strip()
-                        if actor_name:
-                            movie_actors.append(actor_name)
-                except Exception:
-                    pass
-
-                # Extract genres
-                movie_genres = []
-                try:
-                    genre_elements = self.driver.find_elements(By.CSS_SELECTOR, '#tab-genres .text-sluglist a.text-slug[href*="/films/genre/"]')
-                    for genre in genre_elements:
-                        genre_name = genre.get_attribute('textContent').strip()
-                        if genre_name and not any(char in genre_name for char in ['…', 'Show All']):
-                            movie_genres.append(genre_name)
-                except Exception:
-                    pass
-
-                # Extract studios
-                movie_studios = []
-                try:
-                    studio_elements = self.driver.find_elements(By.CSS_SELECTOR, '#tab-details .text-sluglist a.text-slug[href*="/studio/"]')
-                    for studio in studio_elements:
-                        studio_name = studio.get_attribute('textContent').strip()
-                        if studio_name:
-                            movie_studios.append(studio_name)
-                except Exception:
-                    pass
-
-                # Extract countries
-                movie_countries = []
-                try:
-                    country_elements = self.driver.find_elements(By.CSS_SELECTOR, '#tab-details .text-sluglist a.text-slug[href*="/films/country/"]')
-                    for country in country_elements:
-                        country_name = country.get_attribute('textContent').strip()
-                        if country_name:
-                            movie_countries.append(country_name)
-                            self.processor.country_counts[country_name] = self.processor.country_counts.get(country_name, 0) + 1
-                except Exception as e:
-                    print_to_csv(f"Error extracting countries: {str(e)}")
-                    movie_countries = []
+                for country_name in page.countries:
+                    self.processor.country_counts[country_name] = self.processor.country_counts.get(country_name, 0) + 1
 
                 # Create movie data dictionary
-                movie_data = {
-                    'Title': film_title,
-                    'Year': release_year,
-                    'tmdbID': tmdb_id,
-                    'MPAA': mpaa_rating,
-                    'Runtime': runtime,
-                    'RatingCount': rating_count,
-                    'Languages': list(movie_languages),
-                    'Countries': movie_countries,
-                    'Decade': (int(release_year) // 10) * 10,
-                    'Directors': movie_directors,
-                    'Genres': movie_genres,
-                    'Studios': movie_studios,
-                    'Actors': movie_actors
-                }
+                movie_data = page.to_movie_data(film_title, release_year, tmdb_id)
 
             # If we have valid info dict, process it normally
             if isinstance(info, dict):
@@ -1123,8 +1010,9 @@ class LetterboxdScraper:
                 
                 # Add to unfiltered_approved if not already in whitelist
                 if not self.processor.is_whitelisted(film_title, release_year):
-                    if not any(film_title.lower() == movie[0].lower() and release_year == movie[1] for movie in self.processor.unfiltered_approved):
+                    if (film_title.lower(), release_year) not in self.processor.unfiltered_approved_keys:
                         self.processor.unfiltered_approved.append([film_title, release_year, tmdb_id, film_url])
+                        self.processor.unfiltered_approved_keys.add((film_title.lower(), release_year))
                 
                 return True
             
@@ -1134,6 +1022,78 @@ class LetterboxdScraper:
             print_to_csv(f"Error details: {e.__dict__ if hasattr(e, '__dict__') else 'No details available'}")
             # Don't raise the exception, just continue
 
+    def load_listing_page(self, url: str) -> List[Tuple[str, str]]:
+        """Return (title, film URL) for every poster on a listing page, in listing order."""
+        film_containers = []
+        page_retries = 20
+        for retry in range(page_retries):
+            try:
+                self.rate_controller.wait()
+                self.driver.get(url)
+                film_containers = WebDriverWait(self.driver, 10).until(
+                    EC.presence_of_all_elements_located((By.CSS_SELECTOR, 'div.react-component.poster'))
+                )
+                # A genre's last page is short, so after a few reloads take what is there
+                if len(film_containers) == 72 or retry >= 3:
+                    break
+                print_to_csv(f"Found only {len(film_containers)} containers, retrying... (Attempt {retry + 1}/3)")
+                self.rate_controller.backoff("incomplete listing page")
+            except Exception as e:
+                if retry == page_retries - 1:
+                    raise Exception(f"Failed to load page after {page_retries} attempts: {str(e)}")
+                print_to_csv(f"Retry {retry + 1}/{page_retries} loading page {self.page_number}: {str(e)}")
+                self.rate_controller.backoff("listing page failed to load")
+        self.rate_controller.success()
+
+        films = []
+        for container in film_containers:
+            try:
+                film_url = container.find_element(By.CSS_SELECTOR, 'a').get_attribute('href')
+                film_title = container.get_attribute('data-film-name')
+                if film_title and film_url:
+                    films.append((film_title, film_url))
+            except Exception as e:
+                print_to_csv(f"Error collecting film data: {str(e)}")
+        return films
+
+    def discover_from_catalog(self, deriver: ListDeriver, catalog: FilmCatalog) -> List[Dict]:
+        """Walk this genre's listing, scraping only the films the catalog does not hold yet.
+
+        Used when the global listing crawl does not reach far enough for this
+        genre. Every film is judged by deriver as in the catalog-only path, so
+        the list comes out the same as a full crawl of the genre would make it.
+        """
+        films = []
+        scraped = 0
+        while len(films) < MAX_MOVIES:
+            url = f'{self.base_url}page/{self.page_number}/'
+            print_to_csv(f"\nLoading page {self.page_number}: {url}")
+            listing = self.load_listing_page(url)
+            if not listing:
+                break
+            records = {film_url: catalog.get(film_url) for _, film_url in listing}
+            self.pipeline.submit([film_url for film_url, record in records.items() if record is None])
+            for film_title, film_url in listing:
+                record = records[film_url]
+                if record is None:
+                    page = self.fetch_film_page(film_url)
+                    catalog.put(film_url, page.to_movie_data(film_title))
+                    record = catalog.get(film_url)
+                    scraped += 1
+                if record['tmdbID'] and (record['RatingCount'] or 0) >= MIN_RATING_COUNT and (record['Runtime'] or 0) >= MIN_RUNTIME:
+                    # Makes sure the keyword/genre filter finds the TMDB details in the cache
+                    self.processor.tmdb_prefetcher.result(record['tmdbID'])
+                film = deriver.decide(record)
+                if film is not None:
+                    films.append(film)
+                    if len(films) >= MAX_MOVIES:
+                        break
+            if len(listing) < 72:
+                break
+            self.page_number += 1
+        print_to_csv(f"🔎 Scraped {scraped} {self.genre} films the catalog did not hold")
+        return films
+
     def scrape_movies(self):
         seen_titles = set()  # <-- Add this at the start of the method
 
@@ -1146,6 +1106,7 @@ class LetterboxdScraper:
             page_retries = 20
             for retry in range(page_retries):
                 try:
+                    self.rate_controller.wait()
                     self.driver.get(url)
                     # Wait for the page to load
                     WebDriverWait(self.driver, 10).until(
@@ -1158,9 +1119,7 @@ class LetterboxdScraper:
                         self.save_results()  # Save progress before exiting
                         raise Exception(f"Failed to load page after {page_retries} attempts: {str(e)}")
                     print_to_csv(f"Retry {retry + 1}/{page_retries} loading page {self.page_number}: {str(e)}")
-                    time.sleep(2)
-            
-            time.sleep(random.uniform(1.0, 1.5))
+                    self.rate_controller.backoff("listing page failed to load")
                     
             # Find all film containers with retry mechanism
             film_containers = []
@@ -1174,7 +1133,7 @@ class LetterboxdScraper:
                         break
                     else:
                         print_to_csv(f"Found only {len(film_containers)} containers, retrying... (Attempt {retry + 1}/{container_retries})")
-                        time.sleep(5)  # Wait longer between retries
+                        self.rate_controller.backoff("incomplete listing page")
                         self.driver.refresh()  # Refresh the page
                         time.sleep(2)  # Wait for refresh
                 except Exception as e:
@@ -1183,7 +1142,7 @@ class LetterboxdScraper:
                         self.save_results()  # Save progress before exiting
                         raise Exception(f"Failed to find all 72 film containers after {container_retries} attempts: {str(e)}")
                     print_to_csv(f"Retry {retry + 1}/{container_retries} finding film containers: {str(e)}")
-                    time.sleep(5)
+                    self.rate_controller.backoff("incomplete listing page")
                     self.driver.refresh()
                     time.sleep(2)
             
@@ -1192,6 +1151,7 @@ class LetterboxdScraper:
                 self.save_results()  # Save progress before exiting
                 raise Exception(f"Failed to find all 72 film containers after {container_retries} attempts")
 
+            self.rate_controller.success()
             print_to_csv(f"\n{f' Page {self.page_number} ':=^100}")
 
             # First collect all film data from the page
@@ -1232,8 +1192,21 @@ class LetterboxdScraper:
                 self.page_number += 1
                 continue
 
+            # Lookups left from the previous page belong to films that never reached the TMDB step
+            self.processor.tmdb_prefetcher.cancel_pending()
+
+            # Start fetching the pages of films that will need one; the loop below still takes them in order
+            # Plain lookups only: is_zero_reviews also randomly evicts entries, which the loop below does once per film
+            self.pipeline.submit([
+                film_data['url'] for film_data in film_data_list
+                if not film_data['is_blacklisted']
+                and film_data['url'] not in self.processor.whitelist_url_index
+                and not self.processor.store.find('zero_reviews', link=film_data['url'])
+            ])
+
             # Now process each film one by one
             for film_data in film_data_list:
+                self.finish_film_event()
                 if self.valid_movies_count >= MAX_MOVIES:
                     print_to_csv(f"\nReached the target of {MAX_MOVIES} successful movies. Stopping scraping.")
                     return
@@ -1241,12 +1214,14 @@ class LetterboxdScraper:
                 film_title = film_data['title']
                 film_url = film_data['url']
                 release_year = film_data['release_year']
+                self.start_film_event(film_url, film_title)
 
                 # If we've seen this title before, require title+year match
                 if film_title.lower() in seen_titles:
                     whitelist_info, _ = self.processor.get_whitelist_data(film_title, release_year, film_url)
                 else:
                     whitelist_info, _ = self.processor.get_whitelist_data(film_title, film_url=film_url)
+                film_events.note(whitelist='hit' if whitelist_info else 'miss')
 
                 # After processing, add the title to seen_titles
                 seen_titles.add(film_title.lower())
@@ -1257,6 +1232,7 @@ class LetterboxdScraper:
                 # Check if movie is in zero reviews list
                 if self.processor.is_zero_reviews(film_title, release_year, film_url):
                     print_to_csv(f"📊 {film_title} is in zero reviews list. Skipping.")
+                    film_events.note(reason='In zero reviews list')
                     continue
                 
                 # Handle blacklisted movies first
@@ -1274,28 +1250,10 @@ class LetterboxdScraper:
                 movie_retries = 20  # Maximum number of retries for individual movie pages
                 for retry in range(movie_retries):
                     try:
-                        self.driver.get(film_url)
-                        WebDriverWait(self.driver, 10).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, 'meta[property="og:title"]'))
-                        )
-                        time.sleep(random.uniform(1.0, 1.5))
-                        
-                        # Extract basic info needed for checks
-                        meta_tag = self.driver.find_element(By.CSS_SELECTOR, 'meta[property="og:title"]')
-                        release_year = None
-                        if meta_tag:
-                            release_year_content = meta_tag.get_attribute('content')
-                            release_year = release_year_content.split('(')[-1].strip(')')
-                        
-                        # Extract rating count
-                        rating_count = 0
-                        try:
-                            page_source = self.driver.page_source
-                            match = re.search(r'ratingCount":(\d+)', page_source)
-                            if match:
-                                rating_count = int(match.group(1))
-                        except Exception as e:
-                            print_to_csv(f"Error extracting rating count: {str(e)}")
+                        # Fetch the page over HTTP and parse it once instead of querying each field through the driver
+                        page = self.fetch_film_page(film_url)
+                        release_year = page.release_year
+                        rating_count = page.rating_count
 
                         # Check if movie has zero reviews
                         if rating_count == 0:
@@ -1317,25 +1275,13 @@ class LetterboxdScraper:
                             break  # Break out of retry loop since this is a permanent rejection
                         
                         # Check 3: Runtime
-                        try:
-                            runtime_element = WebDriverWait(self.driver, 10).until(
-                                EC.presence_of_element_located((By.CSS_SELECTOR, 'p.text-link.text-footer'))
-                            )
-                            runtime_text = runtime_element.text
-                            match = re.search(r'(\d+)\s*min(?:s)?', runtime_text)
-                            if match:
-                                runtime = int(match.group(1))
-                            else:
-                                runtime = None
-                        except Exception as e:
-                            runtime = None
-                            print_to_csv(f"Error extracting runtime for {film_title}: {str(e)}")
+                        runtime = page.runtime
 
                         if runtime is None:
                             print_to_csv(f"⚠️ {film_title} skipped due to missing runtime")
                             if retry < 3:  # Only retry 3 times for runtime
                                 print_to_csv(f"Retrying runtime extraction... (Attempt {retry + 1}/3)")
-                                time.sleep(2)
+                                self.rate_controller.backoff("runtime missing from film page")
                                 continue
                             break
                             
@@ -1346,14 +1292,7 @@ class LetterboxdScraper:
                             break  # Break out of retry loop since this is a permanent rejection
                         
                         # Check 4: TMDB ID
-                        try:
-                            body_tag = WebDriverWait(self.driver, 10).until(
-                                EC.presence_of_element_located((By.TAG_NAME, 'body'))
-                            )
-                            tmdb_id = body_tag.get_attribute('data-tmdb-id')
-                        except Exception as e:
-                            tmdb_id = None
-                            print_to_csv(f"Error extracting TMDB ID for {film_title}: {str(e)}")
+                        tmdb_id = page.tmdb_id
                         
                         if not tmdb_id:
                             print_to_csv(f"❌ {film_title} was not added due to missing TMDB ID.")
@@ -1362,7 +1301,8 @@ class LetterboxdScraper:
                             break  # Break out of retry loop since this is a permanent rejection
                         
                         # Check 5: Keywords and Genres
-                        keywords, genres = self.processor.fetch_tmdb_details(tmdb_id)
+                        with film_events.stage('tmdb'):
+                            keywords, genres = self.processor.tmdb_prefetcher.result(tmdb_id)
                         
                         # Check keywords
                         matching_keywords = [k for k in FILTER_KEYWORDS if k in keywords]
@@ -1383,195 +1323,41 @@ class LetterboxdScraper:
                             break  # Break out of retry loop since this is a permanent rejection
                         
                         # Now do the full scrape and process the movie
-                        movie_data = {
-                            'Title': film_title,
-                            'Year': release_year,
-                            'tmdbID': tmdb_id,
-                            'Runtime': runtime,
-                            'RatingCount': rating_count
-                        }
-
-                        # Extract directors
-                        try:
-                            director_elements = self.driver.find_elements(By.CSS_SELECTOR, 'span.directorlist a.contributor')
-                            movie_data['Directors'] = [director.text.strip() for director in director_elements if director.text.strip()]
-                        except Exception as e:
-                            print_to_csv(f"Error extracting directors: {str(e)}")
-                            movie_data['Directors'] = []
-
-                        # Extract actors
-                        try:
-                            actor_elements = self.driver.find_elements(By.CSS_SELECTOR, '#tab-cast .text-sluglist a.text-slug.tooltip')
-                            movie_data['Actors'] = [actor.text.strip() for actor in actor_elements if actor.text.strip()]
-                        except Exception as e:
-                            print_to_csv(f"Error extracting actors: {str(e)}")
-                            movie_data['Actors'] = []
-
-                        # Extract genres
-                        try:
-                            genre_elements = self.driver.find_elements(By.CSS_SELECTOR, '#tab-genres .text-sluglist a.text-slug[href*="/films/genre/"]')
-                            movie_data['Genres'] = [genre.get_attribute('textContent').strip() for genre in genre_elements 
-                                                  if genre.get_attribute('textContent').strip() and 
-                                                  not any(char in genre.get_attribute('textContent').strip() for char in ['…', 'Show All'])]
-                        except Exception as e:
-                            print_to_csv(f"Error extracting genres: {str(e)}")
-                            movie_data['Genres'] = []
-
-                        # Extract studios
-                        try:
-                            studio_elements = self.driver.find_elements(By.CSS_SELECTOR, '#tab-details .text-sluglist a.text-slug[href*="/studio/"]')
-                            movie_data['Studios'] = [studio.get_attribute('textContent').strip() for studio in studio_elements if studio.get_attribute('textContent').strip()]
-                        except Exception as e:
-                            print_to_csv(f"Error extracting studios: {str(e)}")
-                            movie_data['Studios'] = []
-
-                        # Extract languages
-                        movie_languages = set()
-                        try:
-                            headings = self.driver.find_elements(By.CSS_SELECTOR, '#tab-details h3')
-                            for heading in headings:
-                                span = heading.find_element(By.TAG_NAME, 'span')
-                                heading_text = span.get_attribute('textContent').strip() if span else heading.get_attribute('textContent').strip()
-                                
-                                if any(lang in heading_text for lang in ["Language", "Primary Language", "Languages", "Primary Languages"]):
-                                    try:
-                                        sluglist = heading.find_element(By.XPATH, "following-sibling::div[contains(@class, 'text-sluglist')]")
-                                        if sluglist:
-                                            p_tag = sluglist.find_element(By.TAG_NAME, 'p')
-                                            language_elements = p_tag.find_elements(By.CSS_SELECTOR, 'a.text-slug[href*="/films/language/"]')
-                                            for language in language_elements:
-                                                language_name = language.get_attribute('textContent').strip()
-                                                if language_name:
-                                                    movie_languages.add(language_name)
-                                                    self.processor.language_counts[language_name] = self.processor.language_counts.get(language_name, 0) + 1
-                                    except Exception:
-                                        pass
-                        except Exception as e:
-                            print_to_csv(f"Error extracting languages: {str(e)}")
-                        movie_data['Languages'] = list(movie_languages)
-
-                        # Extract countries
-                        try:
-                            country_elements = self.driver.find_elements(By.CSS_SELECTOR, '#tab-details .text-sluglist a.text-slug[href*="/films/country/"]')
-                            movie_data['Countries'] = [country.get_attribute('textContent').strip() for country in country_elements if country.get_attribute('textContent').strip()]
-                        except Exception as e:
-                            print_to_csv(f"Error extracting countries: {str(e)}")
-                            movie_data['Countries'] = []
-
-                        # Add decade
-                        movie_data['Decade'] = (int(release_year) // 10) * 10
+                        movie_data = page.to_movie_data(film_title, release_year, tmdb_id)
+                        for language_name in page.languages:
+                            self.processor.language_counts[language_name] = self.processor.language_counts.get(language_name, 0) + 1
 
                         # Add to unfiltered_approved
-                        if not any(film_title.lower() == movie[0].lower() and release_year == movie[1] for movie in self.processor.unfiltered_approved):
+                        if (film_title.lower(), release_year) not in self.processor.unfiltered_approved_keys:
                             # Only add to unfiltered_approved if the movie is not in the whitelist
                             if not self.processor.is_whitelisted(film_title, release_year):
                                 self.processor.unfiltered_approved.append([film_title, release_year, tmdb_id, film_url])
+                                self.processor.unfiltered_approved_keys.add((film_title.lower(), release_year))
                                 # Only increment if successfully added to max_movies_stats
                                 if add_to_max_movies(film_title, release_year, tmdb_id):
-                                    self.processor.update_max_movies_statistics(film_title, release_year, tmdb_id)
+                                    with film_events.stage('stats_update'):
+                                        self.processor.update_max_movies_statistics(film_title, release_year, tmdb_id)
                                     self.valid_movies_count += 1
                                     print_to_csv(f"✅ Successfully approved {film_title} ({self.valid_movies_count}/{MAX_MOVIES})")
 
                         # Update statistics
-                        self.update_statistics_for_movie(film_title, release_year, tmdb_id, self.driver, film_url)
+                        self.update_statistics_for_movie(film_title, release_year, tmdb_id, self.driver, film_url, page)
                         break  # Successfully processed the movie, break out of retry loop
 
                     except Exception as e:
                         print_to_csv(f"❌ Error processing {film_title}: {str(e)}")
                         if retry < movie_retries - 1:
                             print_to_csv(f"Retrying... (Attempt {retry + 1}/{movie_retries})")
-                            time.sleep(2)
+                            self.rate_controller.backoff("film page retry")
                             continue
                         raise Exception(f"Failed to process {film_title} after {movie_retries} attempts")
 
+            self.finish_film_event()
             self.page_number += 1
-            time.sleep(random.uniform(1.0, 1.5))
 
         # If we reach here, we've successfully completed scraping
         return
 
-    def process_approved_movie(self, film_title: str, release_year: str, tmdb_id: str, film_url: str, approval_type: str):
-        if self.valid_movies_count >= MAX_MOVIES:
-            print_to_csv(f"⚠️ Skipping {film_title} as we've already reached {MAX_MOVIES} movies")
-            return
-
-        try:
-            # Add to max_movies_stats
-            if add_to_max_movies(film_title, release_year, tmdb_id):
-                self.update_max_movies_statistics(film_title, release_year, tmdb_id, self.driver)
-                # Only increment after successful addition
-                self.valid_movies_count += 1
-                print_to_csv(f"✅ Successfully added {film_title} ({self.valid_movies_count}/{MAX_MOVIES})")
-            else:
-                print_to_csv(f"⚠️ Failed to add {film_title} to max_movies_stats")
-
-            # Update statistics
-            self.update_statistics_for_movie(film_title, release_year, tmdb_id, self.driver, film_url)
-        except Exception as e:
-            print_to_csv(f"❌ Error processing {film_title}: {str(e)}")
-
-    def update_max_movies_statistics(self, film_title: str, release_year: str, tmdb_id: str, driver):
-        """Update statistics for MAX_MOVIES."""
-        # Get movie details from TMDb
-        genres, keywords = self.processor.fetch_tmdb_details(tmdb_id)
-        
-        # Update genre counts
-        for genre in genres:
-            max_movies_stats['genre_counts'][genre] = max_movies_stats['genre_counts'].get(genre, 0) + 1
-        
-        # Update keyword counts
-        for keyword in keywords:
-            max_movies_stats['keyword_counts'][keyword] = max_movies_stats['keyword_counts'].get(keyword, 0) + 1
-        
-        # Update decade counts
-        decade = f"{release_year[:3]}0s"
-        max_movies_stats['decade_counts'][decade] = max_movies_stats['decade_counts'].get(decade, 0) + 1
-        
-        # Update director counts
-        for heading in driver.find_elements(By.CSS_SELECTOR, '#tab-details h3'):
-            if "Director" in heading.text or "Directors" in heading.text:
-                sluglist = heading.find_element(By.CSS_SELECTOR, '.text-sluglist')
-                for director in sluglist.find_elements(By.CSS_SELECTOR, 'a.text-slug'):
-                    director_name = director.text.strip()
-                    if director_name:
-                        max_movies_stats['director_counts'][director_name] = max_movies_stats['director_counts'].get(director_name, 0) + 1
-        
-        # Update actor counts
-        for heading in driver.find_elements(By.CSS_SELECTOR, '#tab-details h3'):
-            if "Cast" in heading.text:
-                sluglist = heading.find_element(By.CSS_SELECTOR, '.text-sluglist')
-                for actor in sluglist.find_elements(By.CSS_SELECTOR, 'a.text-slug'):
-                    actor_name = actor.text.strip()
-                    if actor_name:
-                        max_movies_stats['actor_counts'][actor_name] = max_movies_stats['actor_counts'].get(actor_name, 0) + 1
-        
-        # Update studio counts
-        for heading in driver.find_elements(By.CSS_SELECTOR, '#tab-details h3'):
-            if "Studio" in heading.text or "Studios" in heading.text:
-                sluglist = heading.find_element(By.CSS_SELECTOR, '.text-sluglist')
-                for studio in sluglist.find_elements(By.CSS_SELECTOR, 'a.text-slug'):
-                    studio_name = studio.text.strip()
-                    if studio_name:
-                        max_movies_stats['studio_counts'][studio_name] = max_movies_stats['studio_counts'].get(studio_name, 0) + 1
-        
-        # Update language counts
-        for heading in driver.find_elements(By.CSS_SELECTOR, '#tab-details h3'):
-            if "Language" in heading.text or "Languages" in heading.text:
-                sluglist = heading.find_element(By.CSS_SELECTOR, '.text-sluglist')
-                for language in sluglist.find_elements(By.CSS_SELECTOR, 'a.text-slug'):
-                    language_name = language.text.strip()
-                    if language_name:
-                        max_movies_stats['language_counts'][language_name] = max_movies_stats['language_counts'].get(language_name, 0) + 1
-        
-        # Update country counts
-        for heading in driver.find_elements(By.CSS_SELECTOR, '#tab-details h3'):
-            if "Country" in heading.text or "Countries" in heading.text:
-                sluglist = heading.find_element(By.CSS_SELECTOR, '.text-sluglist')
-                for country in sluglist.find_elements(By.CSS_SELECTOR, 'a.text-slug'):
-                    country_name = country.text.strip()
-                    if country_name:
-                        max_movies_stats['country_counts'][country_name] = max_movies_stats['country_counts'].get(country_name, 0) + 1
-
     def save_max_movies_results(self):
         """Save results for MAX_MOVIES."""
         # Save movie data to CSV
@@ -1615,13 +1401,12 @@ class LetterboxdScraper:
             file.write("-- Entries that have scores inflated because they share a name with a popular television show are removed, as I notice them.\n\n")
             
             # Write top 10 statistics for this category
-            for category_name, counts in max_movies_stats.items():
-                if category_name != 'film_data':
-                    display_name = category_display_names.get(category_name, category_name.replace('_counts', ''))
-                    file.write(f"<strong>The ten most appearing {display_name}:</strong>\n")
-                    for item, count in sorted(counts.items(), key=lambda item: item[1], reverse=True)[:10]:
-                        file.write(f"{item}: {count}\n")
-                    file.write("\n")
+            for category_name, top_counts in max_movies_stats['stats'].top_all(10, STAT_CATEGORIES + ('keyword_counts',)):
+                display_name = STAT_NAMES.get(category_name, category_name.replace('_counts', ''))
+                file.write(f"<strong>The ten most appearing {display_name}:</strong>\n")
+                for item, count in top_counts:
+                    file.write(f"{item}: {count}\n")
+                file.write("\n")
             file.write("If you notice any movies you believe should/should not be included just let me know!")
 
     def save_results(self):
@@ -1651,32 +1436,20 @@ class LetterboxdScraper:
             writer.writerow(['Error Type', 'Error Message'])
             writer.writerow([type(error_message).__name__, error_message])  # Write the error type and message
 
-    def update_statistics_for_movie(self, film_title: str, release_year: str, tmdb_id: str, driver, film_url: str = None):
+    def update_statistics_for_movie(self, film_title: str, release_year: str, tmdb_id: str, driver, film_url: str = None, page: FilmPage = None):
         """Update statistics for the given movie."""
         try:
-            # Extract directors
-            movie_directors = []
-            try:
-                director_elements = driver.find_elements(By.CSS_SELECTOR, 'span.directorlist a.contributor')
-                for director in director_elements:
-                    director_name = director.text.strip()
-                    if director_name:
-                        movie_directors.append(director_name)
-                        self.processor.director_counts[director_name] = self.processor.director_counts.get(director_name, 0) + 1
-            except Exception as e:
-                print_to_csv(f"Error extracting directors: {str(e)}")
+            # Callers that already fetched the page pass it in; otherwise fetch it once
+            if page is None:
+                page = self.fetch_film_page(film_url)
 
-            # Extract actors
-            movie_actors = []
-            try:
-                actor_elements = driver.find_elements(By.CSS_SELECTOR, '#tab-cast .text-sluglist a.text-slug.tooltip')
-                for actor in actor_elements:
-                    actor_name = actor.text.strip()
-                    if actor_name:
-                        movie_actors.append(actor_name)
-                        self.processor.actor_counts[actor_name] = self.processor.actor_counts.get(actor_name, 0) + 1
-            except Exception as e:
-                print_to_csv(f"Error extracting actors: {str(e)}")
+            # Count directors
+            for director_name in page.directors:
+                self.processor.director_counts[director_name] = self.processor.director_counts.get(director_name, 0) + 1
+
+            # Count actors
+            for actor_name in page.actors:
+                self.processor.actor_counts[actor_name] = self.processor.actor_counts.get(actor_name, 0) + 1
 
             # Extract decade
             try:
@@ -1685,105 +1458,24 @@ class LetterboxdScraper:
             except Exception as e:
                 print_to_csv(f"Error extracting decade: {str(e)}")
 
-            # Extract genres
-            movie_genres = []
-            try:
-                genre_elements = driver.find_elements(By.CSS_SELECTOR, '#tab-genres .text-sluglist a.text-slug[href*="/films/genre/"]')
-                for genre in genre_elements:
-                    genre_name = genre.get_attribute('textContent').strip()
-                    if genre_name and not any(char in genre_name for char in ['…', 'Show All']):
-                        movie_genres.append(genre_name)
-                        self.processor.genre_counts[genre_name] = self.processor.genre_counts.get(genre_name, 0) + 1
-            except Exception as e:
-                print_to_csv(f"Error extracting genres: {str(e)}")
-
-            # Extract studios
-            movie_studios = []
-            try:
-                studio_elements = driver.find_elements(By.CSS_SELECTOR, '#tab-details .text-sluglist a.text-slug[href*="/studio/"]')
-                for studio in studio_elements:
-                    studio_name = studio.get_attribute('textContent').strip()
-                    if studio_name:
-                        movie_studios.append(studio_name)
-                        self.processor.studio_counts[studio_name] = self.processor.studio_counts.get(studio_name, 0) + 1
-            except Exception as e:
-                print_to_csv(f"Error extracting studios: {str(e)}")
-
-            # Extract languages
-            movie_languages = set()
-            try:
-                headings = driver.find_elements(By.CSS_SELECTOR, '#tab-details h3')
-                for heading in headings:
-                    span = heading.find_element(By.TAG_NAME, 'span')
-                    heading_text = span.get_attribute('textContent').strip() if span else heading.get_attribute('textContent').strip()
-                    
-                    if any(lang in heading_text for lang in ["Language", "Primary Language", "Languages", "Primary Languages"]):
-                        try:
-                            sluglist = heading.find_element(By.XPATH, "following-sibling::div[contains(@class, 'text-sluglist')]")
-                            if sluglist:
-                                p_tag = sluglist.find_element(By.TAG_NAME, 'p')
-                                language_elements = p_tag.find_elements(By.CSS_SELECTOR, 'a.text-slug[href*="/films/language/"]')
-                                for language in language_elements:
-                                    language_name = language.get_attribute('textContent').strip()
-                                    if language_name:
-                                        movie_languages.add(language_name)
-                                        self.processor.language_counts[language_name] = self.processor.language_counts.get(language_name, 0) + 1
-                        except Exception:
-                            pass
-            except Exception as e:
-                print_to_csv(f"Error extracting languages: {str(e)}")
+            # Count genres
+            for genre_name in page.genres:
+                self.processor.genre_counts[genre_name] = self.processor.genre_counts.get(genre_name, 0) + 1
 
-            # Extract rating count
-            rating_count = 0
-            try:
-                page_source = self.driver.page_source
-                match = re.search(r'ratingCount":(\d+)', page_source)
-                if match:
-                    rating_count = int(match.group(1))
-            except Exception as e:
-                print_to_csv(f"Error extracting rating count: {str(e)}")
+            # Count studios
+            for studio_name in page.studios:
+                self.processor.studio_counts[studio_name] = self.processor.studio_counts.get(studio_name, 0) + 1
 
-            # Extract countries
-            movie_countries = []
-            try:
-                country_elements = driver.find_elements(By.CSS_SELECTOR, '#tab-details .text-sluglist a.text-slug[href*="/films/country/"]')
-                for country in country_elements:
-                    country_name = country.get_attribute('textContent').strip()
-                    if country_name:
-                        movie_countries.append(country_name)
-                        self.processor.country_counts[country_name] = self.processor.country_counts.get(country_name, 0) + 1
-            except Exception as e:
-                print_to_csv(f"Error extracting countries: {str(e)}")
+            # Count languages
+            for language_name in page.languages:
+                self.processor.language_counts[language_name] = self.processor.language_counts.get(language_name, 0) + 1
 
-            # Extract runtime
-            runtime = None
-            try:
-                runtime_element = WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, 'p.text-link.text-footer'))
-                )
-                runtime_text = runtime_element.text
-                match = re.search(r'(\d+)\s*min(?:s)?', runtime_text)
-                if match:
-                    runtime = int(match.group(1))
-            except Exception as e:
-                print_to_csv(f"Error extracting runtime: {str(e)}")
+            # Count countries
+            for country_name in page.countries:
+                self.processor.country_counts[country_name] = self.processor.country_counts.get(country_name, 0) + 1
 
             # Create movie data dictionary
-            movie_data = {
-                'Title': film_title,
-                'Year': release_year,
-                'tmdbID': tmdb_id,
-                'MPAA': extract_mpaa_rating(self.driver),
-                'Runtime': runtime,
-                'RatingCount': rating_count,
-                'Languages': list(movie_languages),
-                'Countries': movie_countries,
-                'Decade': (int(release_year) // 10) * 10,
-                'Directors': movie_directors,
-                'Genres': movie_genres,
-                'Studios': movie_studios,
-                'Actors': movie_actors
-            }
+            movie_data = page.to_movie_data(film_title, release_year, tmdb_id)
 
             # Only update whitelist if the movie is already in it
             if self.processor.is_whitelisted(film_title, release_year):
@@ -1803,51 +1495,208 @@ class LetterboxdScraper:
             print_to_csv(f"Error in update_statistics_for_movie: {str(e)}")
             return None
     
-def main():
-    genres = ["action", "adventure", "animation", "comedy", "crime", "drama", "family", "fantasy", "history", "horror", "music", "mystery", "romance", "science-fiction", "thriller", "war", "western"]
+def build_genres_from_catalog(genres: List[str]):
+    """Build every genre/sort list from the film catalog instead of crawling each genre from scratch.
+
+    Each list is cut from the global popular or rating listing in the catalog,
+    using the whitelist data for whitelisted films. Only genres the global
+    crawl does not reach deep enough for get a scraper, which walks the genre
+    pages and fetches just the films the catalog is missing.
+    """
+    catalog = FilmCatalog(CATALOG_PATH)
+    store = FilmStore(FILM_STORE_PATH)
+    tmdb_cache = TmdbCache(TMDB_CACHE_PATH, TMDB_CACHE_TTL_DAYS)
+    deriver = ListDeriver(catalog, store, tmdb_cache, BASE_DIR, WHITELIST_PATH, BLACKLIST_PATH, print_to_csv)
+    session = None  # Only started once a genre needs its pages crawled
+    try:
+        for genre in genres:
+            for sort_type in ["rating", "popular"]:
+                films = deriver.genre_films(genre, sort_type, MAX_MOVIES)
+                source = "catalog"
+                if len(films) < MAX_MOVIES:
+                    print_to_csv(f"Only {len(films)} {genre} films in the {sort_type} catalog; crawling the genre pages for the rest")
+                    try:
+                        if session is None:
+                            session = ScraperSession()
+                        session.start_run()
+                        scraper = LetterboxdScraper(genre=genre, sort_type=sort_type, session=session)
+                        films = scraper.discover_from_catalog(deriver, catalog)
+                        source = "catalog and genre pages"
+                    except Exception as e:
+                        print_to_csv(f"❌ Error crawling {genre} {sort_type}, keeping the catalog films: {e}")
+                deriver.write_genre(genre, sort_type, films)
+                print_to_csv(f"✅ {genre.capitalize()} {sort_type}: {len(films)} films from the {source}")
+        deriver.report()
+        if session is not None:
+            session.report(print_to_csv)
+    finally:
+        if session is not None:
+            session.close()
+        catalog.close()
+        store.close()
+        tmdb_cache.close()
+
+def run_combination(session: ScraperSession, genre: str, sort_type: str, start_time: float, worker: int = 1) -> Dict:
+    """Scrape and save one genre/sort list with the session; returns its row for the duration table."""
+    result = {'Genre': genre, 'Sort': sort_type, 'Worker': worker, 'Films': 0, 'Seconds': 0.0, 'Error': None}
+    run_start = time.time()
+    try:
+        print_to_csv(f"\n{'Starting New Genre/Sort Type':=^100}")
+        print_to_csv(f"Genre: {genre.capitalize()}")
+        print_to_csv(f"Sort Type: {sort_type.capitalize()}")
+
+        # Reset max_movies_stats and the processor's per-list data for each combination
+        session.start_run()
+        scraper = LetterboxdScraper(genre=genre, sort_type=sort_type, session=session)
+        scraper.scrape_movies()
+        scraper.save_results()
+        result['Films'] = scraper.valid_movies_count
+
+        # Format execution time
+        execution_time = time.time() - start_time
+        print_to_csv(f"\n{'Execution Summary':=^100}")
+        print_to_csv(f"Total execution time: {format_time(execution_time)}")
+        print_to_csv(f"Average processing speed: {scraper.valid_movies_count / execution_time:.2f} movies/second")
+
+    except Exception as e:
+        print_to_csv(f"\n{'Error':=^100}")
+        print_to_csv(f"❌ An error occurred during execution: {e}")
+        result['Error'] = str(e)
+    result['Seconds'] = time.time() - run_start
+    return result
+
+def genre_worker(worker: int, combinations, store, workers: int) -> List[Dict]:
+    """Run genre/sort combinations off the shared queue until it is empty, in this process's own session."""
+    # Only the parent writes a profile; a forked worker would keep the parent's profiler running for nothing
+    stop_inherited_profiling()
+    # Every worker requests at once, so each takes its share of the single-process rates
+    global film_events
+    split_rates(workers)
+    # Workers append to files of their own rather than interleaving lines in one
+    film_events = FilmEventLog(events_path_for(BASE_DIR, f'Genre 250s V2 worker {worker}'), 'Genre 250s V2')
+
     start_time = time.time()
-    
-    for genre in genres:
-        for sort_type in ["rating", "popular"]:
-            scraper = None
+    results = []
+    session = ScraperSession(store)
+    try:
+        while True:
             try:
-                print_to_csv(f"\n{'Starting New Genre/Sort Type':=^100}")
-                print_to_csv(f"Genre: {genre.capitalize()}")
-                print_to_csv(f"Sort Type: {sort_type.capitalize()}")
-                
-                # Reset max_movies_stats for each new genre/sort type combination
-                global max_movies_stats
-                max_movies_stats = {
-                    'film_data': [],
-                    'director_counts': defaultdict(int),
-                    'actor_counts': defaultdict(int),
-                    'decade_counts': defaultdict(int),
-                    'genre_counts': defaultdict(int),
-                    'studio_counts': defaultdict(int),
-                    'language_counts': defaultdict(int),
-                    'country_counts': defaultdict(int),
-                    'keyword_counts': defaultdict(int)
-                }
-                
-                scraper = LetterboxdScraper(genre=genre, sort_type=sort_type)
-                scraper.scrape_movies()
-                scraper.save_results()
+                genre, sort_type = combinations.get_nowait()
+            except queue.Empty:
+                break
+            results.append(run_combination(session, genre, sort_type, start_time, worker))
+        print_to_csv(f"\n{f'Worker {worker} Summary':=^100}")
+        session.report(print_to_csv)
+        session.fetcher.report(print_to_csv)
+        session.pipeline.report(print_to_csv)
+        report_rates(print_to_csv)
+        film_events.report(print_to_csv)
+    finally:
+        film_events.close()
+        session.close()
+    return results
+
+def run_in_parallel(genres: List[str], workers: int) -> List[Dict]:
+    """Run every genre/sort combination across `workers` processes.
+
+    Each process launches its own browser and session. The whitelist,
+    blacklist and other lists are written through one FilmStore served by a
+    StoreServer, and exported to their workbooks here once every worker is done.
+    """
+    server = StoreServer()
+    server.start()
+    try:
+        store = server.FilmStore(FILM_STORE_PATH)
+        # Import edited workbooks once up front rather than in every worker at the same time
+        for table, path in list_workbooks():
+            store.sync_workbook(table, path)
 
-                # Format execution time
-                execution_time = time.time() - start_time
-                print_to_csv(f"\n{'Execution Summary':=^100}")
-                print_to_csv(f"Total execution time: {format_time(execution_time)}")
-                print_to_csv(f"Average processing speed: {scraper.valid_movies_count / execution_time:.2f} movies/second")
+        combinations = server.Queue()
+        for genre in genres:
+            for sort_type in ["rating", "popular"]:
+                combinations.put((genre, sort_type))
 
-            except Exception as e:
-                print_to_csv(f"\n{'Error':=^100}")
-                print_to_csv(f"❌ An error occurred during execution: {e}")
-            finally:
-                if scraper is not None:
-                    try:
-                        scraper.driver.quit()
-                    except:
-                        pass
+        results = []
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(genre_worker, worker, combinations, store, workers) for worker in range(1, workers + 1)]
+            for future in as_completed(futures):
+                try:
+                    results.extend(future.result())
+                except Exception as e:
+                    print_to_csv(f"❌ A worker stopped: {e}")
+
+        # Anything still queued belonged to workers that could not start
+        while True:
+            try:
+                genre, sort_type = combinations.get_nowait()
+            except queue.Empty:
+                break
+            results.append({'Genre': genre, 'Sort': sort_type, 'Worker': '-', 'Films': 0, 'Seconds': 0.0, 'Error': 'Not run'})
+
+        export_lists(store)
+        store.close()
+        return results
+    finally:
+        server.shutdown()
+
+def print_duration_table(results: List[Dict], wall_seconds: float):
+    """Log how long each genre/sort combination took."""
+    print_to_csv(f"\n{'Combination Durations':=^100}")
+    print_to_csv(f"{'Genre':<18}{'Sort':<10}{'Worker':>8}{'Films':>8}{'Duration':>12}  Status")
+    for result in sorted(results, key=lambda r: (r['Genre'], r['Sort'])):
+        print_to_csv(f"{result['Genre']:<18}{result['Sort']:<10}{result['Worker']:>8}{result['Films']:>8}"
+                     f"{format_time(result['Seconds']):>12}  {result['Error'] or 'OK'}")
+    busy_seconds = sum(result['Seconds'] for result in results)
+    print_to_csv(f"{len(results)} combinations: {format_time(busy_seconds)} of scraping in {format_time(wall_seconds)}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the top 250 lists for each genre.")
+    parser.add_argument('--from-catalog', action='store_true',
+                        help="Build the lists from the film catalog, crawling genre pages only for films it does not hold")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Scrape this many genre/sort combinations at once, each in its own process and browser")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    genres = GENRES
+    start_time = time.time()
+
+    if args.from_catalog:
+        build_genres_from_catalog(genres)
+        print_to_csv(f"Total execution time: {format_time(time.time() - start_time)}")
+        return
+
+    if args.workers > 1:
+        results = run_in_parallel(genres, args.workers)
+        print_duration_table(results, time.time() - start_time)
+        return
+
+    # One browser and one set of loaded lists serve every genre/sort combination
+    results = []
+    session = ScraperSession()
+    try:
+        for genre in genres:
+            for sort_type in ["rating", "popular"]:
+                try:
+                    results.append(run_combination(session, genre, sort_type, start_time))
+                finally:
+                    session.processor.save_lists()
+
+        # The fetchers and caches are shared, so their counts cover every run
+        print_to_csv(f"\n{'Session Summary':=^100}")
+        session.report(print_to_csv)
+        session.fetcher.report(print_to_csv)
+        session.pipeline.report(print_to_csv)
+        report_rates(print_to_csv)
+        session.processor.tmdb_cache.report(print_to_csv)
+        session.processor.http_cache.report(print_to_csv)
+        session.processor.tmdb_prefetcher.report(print_to_csv)
+        session.driver_pool.report(print_to_csv)
+        film_events.report(print_to_csv)
+        print_duration_table(results, time.time() - start_time)
+    finally:
+        film_events.close()
+        session.close()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    run_profiled(main, 'Genre 250s V2', BASE_DIR, print_to_csv)
\ No newline at end of file
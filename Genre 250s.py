@@ -1,1723 +1,1583 @@
-# Import necessary libraries
-import time
-import random
-from selenium import webdriver
-from selenium.webdriver.firefox.service import Service
-from selenium.webdriver.firefox.options import Options
-from selenium.webdriver.common.by import By
-import pandas as pd
-import requests
-import re
-import csv
-import locale
-import os
-import platform
-from datetime import datetime
-from requests.adapters import HTTPAdapter
-from urllib3.util import Retry
-from typing import Dict, List, Set, Tuple, Optional
-from dataclasses import dataclass
-from collections import defaultdict
-import unicodedata
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import json
-from selenium.common.exceptions import NoSuchElementException
-from credentials_loader import load_credentials
-
-# Detect operating system and set appropriate paths
-def get_os_specific_paths():
-    """Return OS-specific file paths."""
-    system = platform.system()
-    
-    if system == "Windows":
-        # Windows paths
-        base_dir = r'C:\Users\bigba\aa Personal Projects\Letterboxd List Scraping'
-        output_dir = os.path.join(base_dir, 'Outputs')
-    elif system == "Darwin":  # macOS
-        # macOS paths
-        base_dir = '/Users/calebcollins/Documents/Letterboxd List Scraping'
-        output_dir = os.path.join(base_dir, 'Outputs')
-    
-    return {
-        'base_dir': base_dir,
-        'output_dir': output_dir
-    }
-
-# Get OS-specific paths
-paths = get_os_specific_paths()
-BASE_DIR = paths['output_dir']
-LIST_DIR = paths['base_dir']
-
-# Define a custom print function
-def print_to_csv(message: str):
-    """Prints a message to the terminal and appends it to All_Outputs.csv."""
-    print(message)  # Print to terminal
-    with open(os.path.join(BASE_DIR, 'All_Outputs.csv'), mode='a', newline='', encoding='utf-8') as file:
-        writer = csv.writer(file)
-        writer.writerow([message])  # Write the message as a new row
-
-# Configure locale and constants
-locale.setlocale(locale.LC_ALL, 'en_US.UTF-8')
-MAX_MOVIES = 250
-
-# Configure settings
-MIN_RATING_COUNT = 1000
-MIN_RUNTIME = 40
-MAX_RETRIES = 25
-RETRY_DELAY = 15
-CHUNK_SIZE = 1900
-
-# File paths
-BLACKLIST_PATH = os.path.join(LIST_DIR, 'blacklist.xlsx')
-WHITELIST_PATH = os.path.join(LIST_DIR, 'whitelist.xlsx')
-INCOMPLETE_STATS_WHITELIST_PATH = os.path.join(LIST_DIR, 'Incomplete_Stats_Whitelist.xlsx')
-ZERO_REVIEWS_PATH = os.path.join(LIST_DIR, 'Zero_Reviews.xlsx')  # Add new path
-
-# Load credentials
-credentials = load_credentials()
-TMDB_API_KEY = credentials['TMDB_API_KEY']
-
-# Filtering criteria
-FILTER_KEYWORDS = {
-    'concert film', 'miniseries',
-    'live performance', 'filmed theater', 'live theater', 
-    'stand-up comedy', 'edited from tv series'
-}
-
-FILTER_GENRES = {'Documentary'}
-
-@dataclass
-class MovieData:
-    url: str  # Only identifier
-    title: str  # For reference only
-    year: str  # For reference only
-    tmdb_id: Optional[str] = None
-    rating_count: int = 0
-    runtime: int = 0
-    keywords: List[str] = None
-    genres: List[str] = None
-
-class RequestsSession:
-    def __init__(self):
-        self.session = requests.Session()
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504]
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("https://", adapter)
-        self.session.mount("http://", adapter)
-
-    def get(self, url: str, **kwargs) -> requests.Response:
-        return self.session.get(url, **kwargs)
-
-def normalize_text(text):
-    return unicodedata.normalize('NFKC', str(text)).strip()
-
-class MovieProcessor:
-    def __init__(self):
-        self.session = RequestsSession()
-        self.whitelist = None
-        self.whitelist_lookup = {}
-        self.incomplete_stats_whitelist = None
-        self.incomplete_stats_lookup = {}
-        self.zero_reviews = None
-        self.zero_reviews_lookup = {}
-        self.load_whitelist()
-        self.load_incomplete_stats_whitelist()
-        self.load_zero_reviews()
-        
-        # Update blacklist loading to include the Link column
-        self.blacklist = pd.read_excel(BLACKLIST_PATH, header=0, names=['Title', 'Year', 'Reason', 'Link'], usecols=[0, 1, 2, 3])
-        
-        # Normalize titles and years in blacklist
-        self.blacklist['Title'] = self.blacklist['Title'].apply(normalize_text)
-        self.blacklist['Year'] = self.blacklist['Year'].astype(str).str.strip()
-        # Fill empty links with empty string instead of None
-        self.blacklist['Link'] = self.blacklist['Link'].fillna('')
-        
-        # Create a lookup dictionary for faster matching using URLs as keys
-        self.blacklist_lookup = {}
-        for idx, row in self.blacklist.iterrows():
-            if row['Link']:  # Only store entries with URLs
-                self.blacklist_lookup[row['Link']] = True
-        
-        self.added_movies: Set[Tuple[str, str]] = set()
-        self.film_data: List[Dict] = []
-        self.rejected_data: List[List] = []
-        self.unfiltered_approved: List[List] = []
-        self.unfiltered_denied: List[List] = []
-        
-        # Statistics tracking
-        self.director_counts: Dict[str, int] = {}
-        self.actor_counts: Dict[str, int] = {}
-        self.decade_counts: Dict[str, int] = {}
-        self.genre_counts: Dict[str, int] = {}
-        self.studio_counts: Dict[str, int] = {}
-        self.language_counts: Dict[str, int] = {}
-        self.country_counts: Dict[str, int] = {}
-        self.rating_counts: Dict[str, int] = {}
-
-    def load_whitelist(self):
-        """Load and initialize the whitelist data."""
-        try:
-            # Read whitelist with explicit string type for Year column and include Information and Link columns
-            self.whitelist = pd.read_excel(WHITELIST_PATH, header=0, names=['Title', 'Year', 'Information', 'Link'], dtype={'Year': str})
-            
-            # Normalize the data
-            self.whitelist['Title'] = self.whitelist['Title'].apply(normalize_text)
-            self.whitelist['Year'] = self.whitelist['Year'].astype(str).str.strip()
-            # Fill empty links with empty string instead of None
-            self.whitelist['Link'] = self.whitelist['Link'].fillna('')
-            
-            # Create a lookup dictionary for faster matching using URLs as keys
-            self.whitelist_lookup = {}
-            for idx, row in self.whitelist.iterrows():
-                if row['Link']:  # Only store entries with URLs
-                    try:
-                        # Handle null/empty Information values by treating them as empty dictionaries
-                        if pd.isna(row['Information']) or row['Information'] == '':
-                            info = {}
-                        else:
-                            info = json.loads(row['Information']) if isinstance(row['Information'], str) else row['Information']
-                        self.whitelist_lookup[row['Link']] = (info, idx, row['Link'])  # Added URL to tuple
-                    except (json.JSONDecodeError, TypeError):
-                        # If there's any error parsing, treat it as an empty dictionary
-                        info = {}
-                        self.whitelist_lookup[row['Link']] = (info, idx, row['Link'])  # Added URL to tuple
-                        continue
-                
-        except FileNotFoundError:
-            print_to_csv("whitelist.xlsx not found. Creating new file.")
-            self.whitelist = pd.DataFrame(columns=['Title', 'Year', 'Information', 'Link'])
-            self.whitelist.to_excel(WHITELIST_PATH, index=False)
-
-    def load_incomplete_stats_whitelist(self):
-        """Load and initialize the incomplete stats whitelist data."""
-        try:
-            # Read incomplete stats whitelist with explicit string type for Year column
-            self.incomplete_stats_whitelist = pd.read_excel(
-                INCOMPLETE_STATS_WHITELIST_PATH,
-                header=0,
-                names=['Title', 'Year', 'Blank', 'Link'],
-                dtype={'Year': str}
-            )
-            
-            # Normalize the data
-            self.incomplete_stats_whitelist['Title'] = self.incomplete_stats_whitelist['Title'].apply(normalize_text)
-            self.incomplete_stats_whitelist['Year'] = self.incomplete_stats_whitelist['Year'].astype(str).str.strip()
-            self.incomplete_stats_whitelist['Link'] = self.incomplete_stats_whitelist['Link'].fillna('')
-            
-            # Create a lookup dictionary for faster matching using URLs as keys
-            self.incomplete_stats_lookup = {}
-            for idx, row in self.incomplete_stats_whitelist.iterrows():
-                if row['Link']:  # Only store entries with URLs
-                    self.incomplete_stats_lookup[row['Link']] = idx
-                
-        except FileNotFoundError:
-            print_to_csv("Incomplete_Stats_Whitelist.xlsx not found. Creating new file.")
-            self.incomplete_stats_whitelist = pd.DataFrame(columns=['Title', 'Year', 'Link'])
-            self.incomplete_stats_whitelist.to_excel(INCOMPLETE_STATS_WHITELIST_PATH, index=False)
-
-    def load_zero_reviews(self):
-        """Load and initialize the zero reviews data."""
-        try:
-            # Check if file exists
-            if os.path.exists(ZERO_REVIEWS_PATH):
-                # Read zero reviews with explicit string type for Year column
-                self.zero_reviews = pd.read_excel(ZERO_REVIEWS_PATH, header=0, names=['Title', 'Year', 'Blank', 'Link'], dtype={'Year': str})
-                
-                # Normalize the data
-                self.zero_reviews['Title'] = self.zero_reviews['Title'].apply(normalize_text)
-                self.zero_reviews['Year'] = self.zero_reviews['Year'].astype(str).str.strip()
-                self.zero_reviews['Link'] = self.zero_reviews['Link'].fillna('')
-                self.zero_reviews['Blank'] = ''  # Ensure Blank column is empty
-                            
-                # Create a lookup dictionary for faster matching using URLs as keys
-                self.zero_reviews_lookup = {}
-                for idx, row in self.zero_reviews.iterrows():
-                    if row['Link']:  # Only store entries with URLs
-                        self.zero_reviews_lookup[row['Link']] = idx
-                    
-            else:
-                self.zero_reviews = pd.DataFrame(columns=['Title', 'Year', 'Blank', 'Link'])
-                self.zero_reviews.to_excel(ZERO_REVIEWS_PATH, index=False)
-                
-        except Exception as e:
-            print_to_csv(f"ERROR loading zero reviews: {str(e)}")
-            print_to_csv(f"ERROR type: {type(e)}")
-            print_to_csv(f"ERROR details: {e.__dict__ if hasattr(e, '__dict__') else 'No details available'}")
-            raise  # Re-raise the exception to see the full traceback
-
-    def process_whitelist_info(self, info: Dict, film_url: str = None):
-        """Process information from whitelist and update statistics."""
-        if not isinstance(info, dict):
-            print_to_csv("❌ Info is not a dictionary, skipping")
-            return
-
-        # Create film_data entry
-        film_data = {
-            'Title': info.get('Title'),
-            'Year': info.get('Year'),
-            'tmdbID': info.get('tmdbID')
-        }
-
-        # Add to film data
-        self.film_data.append(film_data)
-
-        # Process MAX_MOVIES using centralized function - only call once
-        if add_to_MAX_MOVIES(info.get('Title'), info.get('Year'), info.get('tmdbID'), film_url):
-            
-            # Update statistics for MAX_MOVIES_stats
-            # Directors
-            for director in info.get('Directors', []):
-                MAX_MOVIES_stats['director_counts'][director] += 1
-
-            # Actors
-            for actor in info.get('Actors', []):
-                MAX_MOVIES_stats['actor_counts'][actor] += 1
-
-            # Decade
-            decade = info.get('Decade')
-            if decade:
-                MAX_MOVIES_stats['decade_counts'][decade] += 1
-
-            # Genres
-            for genre in info.get('Genres', []):
-                MAX_MOVIES_stats['genre_counts'][genre] += 1
-
-            # Studios
-            for studio in info.get('Studios', []):
-                MAX_MOVIES_stats['studio_counts'][studio] += 1
-
-            # Languages
-            for language in info.get('Languages', []):
-                MAX_MOVIES_stats['language_counts'][language] += 1
-
-            # Countries
-            for country in info.get('Countries', []):
-                MAX_MOVIES_stats['country_counts'][country] += 1
-     
-    def update_whitelist(self, film_title: str, release_year: str, movie_data: Dict, film_url: str = None) -> bool:
-        """Update whitelist with movie data using URL as primary identifier."""
-        if not film_url:
-            return False  # Can't update whitelist without URL
-            
-        try:
-            # Check if URL already exists in whitelist
-            for row_idx, row in self.whitelist.iterrows():
-                url = row.get('Link', '')
-                if url == film_url:
-                    # Update existing entry
-                    self.whitelist.at[row_idx, 'Information'] = json.dumps(movie_data)
-                    self.whitelist_lookup[film_url] = (movie_data, row_idx, film_url)
-                    # Save to Excel
-                    self.whitelist.to_excel(WHITELIST_PATH, index=False)
-                    self.load_whitelist()  # Reload to ensure consistency
-                    return True
-            
-            # Add new entry if URL not found
-            new_row = pd.DataFrame([{
-                'Title': film_title,
-                'Year': release_year,
-                'Information': json.dumps(movie_data),
-                'Link': film_url
-            }])
-            self.whitelist = pd.concat([self.whitelist, new_row], ignore_index=True)
-            self.whitelist_lookup[film_url] = (movie_data, len(self.whitelist) - 1, film_url)
-            print_to_csv(f"🔗 Added link to whitelist for {film_title}")
-            
-            # Save to Excel
-            self.whitelist.to_excel(WHITELIST_PATH, index=False)
-            self.load_whitelist()  # Reload to ensure consistency
-            return True
-            
-        except Exception as e:
-            print_to_csv(f"Error updating whitelist: {str(e)}")
-            return False
-
-    def get_whitelist_data(self, film_title: str, release_year: str = None, film_url: str = None) -> Optional[Tuple[Dict, int]]:
-        """Get the whitelist data for a movie if it exists. Only matches by URL."""
-        if not film_url:
-            return None, None  # Movie not in whitelist
-            
-        # Check if URL exists in whitelist lookup
-        if film_url in self.whitelist_lookup:
-            info, row_idx, _ = self.whitelist_lookup[film_url]
-            try:
-                # If info is a string, parse it as JSON
-                if isinstance(info, str):
-                    info = json.loads(info)
-                elif not isinstance(info, dict):
-                    print_to_csv(f"WARNING: Unexpected data type for {film_title}: {type(info)}")
-                    return None, None
-                    
-                return info, row_idx
-            except json.JSONDecodeError as e:
-                print_to_csv(f"ERROR parsing whitelist data for {film_title}: {str(e)}")
-                print_to_csv(f"Raw data: {info}")
-                return None, None
-            except Exception as e:
-                print_to_csv(f"ERROR processing whitelist data for {film_title}: {str(e)}")
-                return None, None
-                
-        return None, None  # Movie not in whitelist
-
-    def fetch_tmdb_details(self, tmdb_id: str) -> Optional[Tuple[List[str], List[str]]]:
-        movie_url = f"https://api.themoviedb.org/3/movie/{tmdb_id}?api_key={TMDB_API_KEY}&append_to_response=keywords"
-        response = self.session.get(movie_url)
-
-        if response.status_code == 200:
-            movie_data = response.json()
-            keywords = [keyword['name'] for keyword in movie_data['keywords']['keywords']]
-            genre_elements = movie_data['genres']
-            genres = [genre['name'] for genre in genre_elements]
-            return keywords, genres
-        else:
-            if response.status_code == 401:
-                print_to_csv("Check your API key.")
-            return None
-
-    def add_to_blacklist(self, film_title: str, release_year: str, reason: str, film_url: str = None) -> None:
-        """Add a movie to the blacklist if it fails a criteria, including the link if available. Never patch missing links in existing entries."""
-        if not film_url or not reason:
-            return
-            
-        # Check if URL already exists in lookup
-        if film_url in self.blacklist_lookup:
-            return
-            
-        # Add new entry
-        new_row = pd.DataFrame([[film_title, release_year, reason, film_url]],
-                               columns=['Title', 'Year', 'Reason', 'Link'])
-        self.blacklist = pd.concat([self.blacklist, new_row], ignore_index=True)
-        self.blacklist_lookup[film_url] = True
-        self.blacklist.to_excel(BLACKLIST_PATH, index=False)
-        print_to_csv(f"⚫ {film_title} ({release_year}) added to blacklist {reason}")
-
-    def is_whitelisted(self, film_title: str, release_year: str, film_url: str = None) -> bool:
-        """Check if a movie is in the whitelist using ONLY URL as identifier."""
-        if not film_url:
-            return False
-            
-        # Only check URL match, never use title/year
-        return film_url in self.whitelist_lookup
-
-    def extract_runtime(self, driver, film_title: str) -> Optional[int]:
-        try:
-            runtime_element = driver.find_element(By.CSS_SELECTOR, 'p.text-link.text-footer')
-            runtime_text = runtime_element.text
-            match = re.search(r'(\d+)\s*min(?:s)?', runtime_text)
-            if match:
-                runtime = int(match.group(1))
-                return runtime
-        except Exception:
-            pass
-        
-        print_to_csv(f"⚠️ No runtime found. Skipping {film_title}.")
-        return None
-
-    def update_MAX_MOVIES_statistics(self, film_title: str, release_year: str, tmdb_id: str, driver, film_url: str = None):
-        """Update statistics for the given movie for MAX_MOVIES."""
-        if not film_url:
-            print_to_csv("WARNING: No film URL provided for statistics update")
-            return
-
-        # Find the movie in film_data
-        movie_data = next((movie for movie in MAX_MOVIES_stats['film_data'] 
-                          if movie['Title'] == film_title and movie['Year'] == release_year), None)
-        
-        if not movie_data:
-            return
-
-        # Directors
-        try:
-            director_elements = driver.find_elements(By.CSS_SELECTOR, 'span.creatorlist a.contributor')
-            for director in director_elements:
-                director_name = director.text.strip()
-                if director_name:
-                    MAX_MOVIES_stats['director_counts'][director_name] += 1
-        except Exception:
-            pass
-
-        # Actors
-        try:
-            actor_elements = driver.find_elements(By.CSS_SELECTOR, '#tab-cast .text-sluglist a.text-slug.tooltip')
-            for actor in actor_elements:
-                actor_name = actor.text.strip()
-                if actor_name:
-                    MAX_MOVIES_stats['actor_counts'][actor_name] += 1
-        except Exception:
-            pass
-
-        # Decade
-        try:
-            meta_tag = driver.find_element(By.CSS_SELECTOR, 'meta[property="og:title"]')
-            content = meta_tag.get_attribute('content')
-            if content and '(' in content and ')' in content:
-                year = int(content.split('(')[-1].split(')')[0])
-                decade = (year // 10) * 10
-                MAX_MOVIES_stats['decade_counts'][decade] += 1
-        except Exception:
-            pass
-
-        # Genres - Only get main genres, not microgenres
-        try:
-            genre_elements = driver.find_elements(By.CSS_SELECTOR, '#tab-genres .text-sluglist a.text-slug[href*="/films/genre/"]')
-            genres = []
-            for genre in genre_elements:
-                genre_name = genre.get_attribute('textContent').strip()
-                if genre_name and not any(char in genre_name for char in ['…', 'Show All']):
-                    genres.append(genre_name)
-                    MAX_MOVIES_stats['genre_counts'][genre_name] += 1
-            movie_data['Genres'] = genres
-        except Exception:
-            pass
-
-        # Studios
-        try:
-            studio_elements = driver.find_elements(By.CSS_SELECTOR, '#tab-details .text-sluglist a.text-slug[href*="/studio/"]')
-            studios = []
-            for studio in studio_elements:
-                studio_name = studio.get_attribute('textContent').strip()
-                if studio_name:
-                    studios.append(studio_name)
-                    MAX_MOVIES_stats['studio_counts'][studio_name] += 1
-            movie_data['Studios'] = studios
-        except Exception:
-            pass
-
-        # Languages
-        try:
-            language_elements = driver.find_elements(By.CSS_SELECTOR, '#tab-details .text-sluglist a.text-slug[href*="/films/language/"]')
-            languages = []
-            for language in language_elements:
-                language_name = language.get_attribute('textContent').strip()
-                if language_name:
-                    languages.append(language_name)
-                    MAX_MOVIES_stats['language_counts'][language_name] += 1
-            movie_data['Languages'] = languages
-        except Exception:
-            pass
-
-        # Countries
-        try:
-            country_elements = driver.find_elements(By.CSS_SELECTOR, '#tab-details .text-sluglist a.text-slug[href*="/films/country/"]')
-            countries = []
-            for country in country_elements:
-                country_name = country.get_attribute('textContent').strip()
-                if country_name:
-                    countries.append(country_name)
-                    MAX_MOVIES_stats['country_counts'][country_name] += 1
-            movie_data['Countries'] = countries
-        except Exception:
-            pass
-
-    def is_blacklisted(self, film_title: str, release_year: str = None, film_url: str = None, driver = None) -> bool:
-        """Check if a movie is blacklisted using URL as primary identifier."""
-        if not film_url:
-            return False
-            
-        # Check if URL exists in blacklist lookup
-        return film_url in self.blacklist_lookup
-
-    def save_refreshed_data(self, film_title: str, release_year: str, tmdb_id: str, film_url: str = None, reason: str = "") -> None:
-        """Save information about movies that had their data reconstructed, using URL as primary identifier, and include the reason."""
-        if not film_url:
-            return
-        try:
-            # Check if file exists to determine if we need to write headers
-            file_exists = os.path.exists(os.path.join(BASE_DIR, 'Refreshed_Data.csv'))
-            with open(os.path.join(BASE_DIR, 'Refreshed_Data.csv'), mode='a', newline='', encoding='utf-8') as file:
-                writer = csv.writer(file)
-                if not file_exists:
-                    writer.writerow(['Title', 'Year', 'tmdbID', 'Link', 'Reason'])
-                writer.writerow([film_title, release_year, tmdb_id, film_url, reason])
-        except Exception as e:
-            print_to_csv(f"Error saving refreshed data: {str(e)}")
-
-    def is_incomplete_stats_whitelisted(self, film_title: str, release_year: str, film_url: str = None) -> bool:
-        """Check if a movie is in the incomplete stats whitelist using URL as primary identifier."""
-        if not film_url:
-            return False
-            
-        try:
-            # Check if URL exists in incomplete stats lookup
-            return film_url in self.incomplete_stats_lookup
-                
-        except Exception as e:
-            print_to_csv(f"ERROR checking incomplete stats whitelist: {str(e)}")
-            return False
-
-    def add_to_zero_reviews(self, film_title: str, release_year: str, film_url: str):
-        """Add a movie to the zero reviews list using URL as primary identifier."""
-        if not film_url:
-            return
-            
-        try:
-            # Check if URL already exists in lookup
-            if film_url in self.zero_reviews_lookup:
-                return
-                
-            # Create new row
-            new_row = pd.DataFrame([{
-                'Title': film_title,
-                'Year': release_year,
-                'Blank': '',
-                'Link': film_url
-            }])
-            # Add to DataFrame
-            self.zero_reviews = pd.concat([self.zero_reviews, new_row], ignore_index=True)
-            # Add to lookup
-            self.zero_reviews_lookup[film_url] = len(self.zero_reviews) - 1
-            # Save to Excel
-            self.zero_reviews.to_excel(ZERO_REVIEWS_PATH, index=False)
-                
-        except Exception as e:
-            print_to_csv(f"ERROR adding to zero reviews: {str(e)}")
-
-    def is_zero_reviews(self, film_title: str, release_year: str, film_url: str) -> bool:
-        """Check if a movie is in the zero reviews list using URL as primary identifier."""
-        if not film_url:
-            return False
-            
-        try:
-            # Check if URL exists in zero reviews lookup
-            if film_url in self.zero_reviews_lookup:
-                # 1 in 15 chance to remove the entry after finding it
-                if random.random() < (1/15):
-                    # Get the index from lookup
-                    idx_to_remove = self.zero_reviews_lookup[film_url]
-                    # Remove the row
-                    self.zero_reviews = self.zero_reviews.drop(idx_to_remove)
-                    # Remove from lookup
-                    del self.zero_reviews_lookup[film_url]
-                    # Save the updated DataFrame
-                    self.zero_reviews.to_excel(ZERO_REVIEWS_PATH, index=False)
-                    print_to_csv(f"🗑️  Removed {film_title} from zero reviews list")
-                return True
-            return False
-                
-        except Exception as e:
-            print_to_csv(f"ERROR checking zero reviews: {str(e)}")
-            return False
-
-def setup_webdriver() -> webdriver.Firefox:
-    options = Options()
-    options.headless = True
-    options.set_preference("permissions.default.image", 2)  # Disable images
-    options.set_preference("dom.ipc.plugins.enabled.libflashplayer.so", "false")
-    options.set_preference("browser.display.use_document_fonts", 0)
-    options.set_preference("browser.display.document_color_use", 2)
-    
-    # Add these preferences to prevent random downloads
-    options.set_preference("browser.download.folderList", 2)  # Use custom download location
-    options.set_preference("browser.download.manager.showWhenStarting", False)  # Don't show download manager
-    options.set_preference("browser.download.dir", os.path.join(BASE_DIR, "downloads"))  # Set download directory
-    options.set_preference("browser.helperApps.neverAsk.saveToDisk", "text/html,text/plain")  # Don't ask to save HTML files
-    options.set_preference("browser.helperApps.alwaysAsk.force", False)  # Don't force asking
-    options.set_preference("browser.download.manager.alertOnEXEOpen", False)  # Don't alert on exe downloads
-    options.set_preference("browser.download.manager.focusWhenStarting", False)  # Don't focus download manager
-    options.set_preference("browser.download.manager.useWindow", False)  # Don't use window for downloads
-    options.set_preference("browser.download.manager.showAlertOnComplete", False)  # Don't show alert when complete
-    options.set_preference("browser.download.manager.closeWhenDone", True)  # Close download manager when done
-    
-    # Add these optimizations:
-    options.set_preference("javascript.enabled", True)  # Keep JS enabled but optimize
-    options.set_preference("network.http.connection-timeout", 30)  # Reduce timeout
-    options.set_preference("network.http.max-connections-per-server", 10)  # Limit connections
-    options.set_preference("browser.cache.disk.enable", True)  # Enable disk cache
-    options.set_preference("browser.cache.memory.enable", True)  # Enable memory cache
-    
-    service = Service()
-    return webdriver.Firefox(service=service, options=options)
-
-def format_time(seconds):
-    """Format seconds into hours, minutes, seconds string"""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    seconds = int(seconds % 60)
-    
-    if hours > 0:
-        return f"{hours}h {minutes}m {seconds}s"
-    elif minutes > 0:
-        return f"{minutes}m {seconds}s"
-    else:
-        return f"{seconds}s"
-
-def extract_mpaa_rating(driver) -> Optional[str]:
-    """Extract the MPAA rating from the movie's page if the country is USA."""
-    try:
-        # Wait for the page to be fully loaded
-        wait = WebDriverWait(driver, 10)
-        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, '.release-country-list')))
-        
-        # Use JavaScript to extract all country data
-        js_script = """
-        const countries = Array.from(document.querySelectorAll('.release-country'));
-        return countries.map(country => {
-            const name = country.querySelector('.name')?.textContent?.trim() || '';
-            const rating = country.querySelector('.release-certification-badge .label')?.textContent?.trim() || '';
-            return { name, rating };
-        });
-        """
-        
-        country_data = driver.execute_script(js_script)
-        
-        # Process the country data
-        for data in country_data:
-            name = data['name']
-            rating = data['rating']
-            
-            if name == "USA" and rating:
-                # Handle special cases
-                if rating.upper() in ['NR', 'NOT RATED', 'UNRATED']:
-                    return 'NR'
-                
-                # Map common rating formats to MPAA ratings
-                rating_map = {
-                    'R': 'R',
-                    'PG-13': 'PG-13',
-                    'PG': 'PG',
-                    'G': 'G',
-                    'NC-17': 'NC-17',
-                    'X': 'NC-17',  # Historical rating
-                    'M': 'PG',     # Historical rating
-                    'GP': 'PG',    # Historical rating
-                }
-                
-                if rating in rating_map:
-                    return rating_map[rating]
-        
-        return None
-        
-    except Exception as e:
-        # Only print error if it's not a NoSuchElementError
-        if not isinstance(e, NoSuchElementException):
-            print_to_csv(f"Error extracting MPAA rating: {str(e)}")
-        return None
-
-# Initialize stats for MAX_MOVIES
-MAX_MOVIES_stats = {
-    'film_data': [],  # Each entry will have Title, Year, tmdbID, and URL fields
-    'director_counts': defaultdict(int),
-    'actor_counts': defaultdict(int),
-    'decade_counts': defaultdict(int),
-    'genre_counts': defaultdict(int),
-    'studio_counts': defaultdict(int),
-    'language_counts': defaultdict(int),
-    'country_counts': defaultdict(int)
-}
-
-def add_to_MAX_MOVIES(film_title: str, release_year: str, tmdb_id: str, film_url: str) -> bool:
-    """
-    Centralized function to add a movie to MAX_MOVIES_stats if it's not already present.
-    Returns True if the movie was added, False if it was already present or if we've reached the limit.
-    """
-
-    if not film_url:
-        return False
-
-    # Check if movie already exists by URL
-    if any(movie['Link'] == film_url for movie in MAX_MOVIES_stats['film_data']):
-        return False
-
-    # Check if we've reached the limit
-    if len(MAX_MOVIES_stats['film_data']) >= MAX_MOVIES:
-        return False
-
-    # Add the movie
-    MAX_MOVIES_stats['film_data'].append({
-        'Title': film_title,  # For reference only
-        'Year': release_year,  # For reference only
-        'tmdbID': tmdb_id,
-        'Link': film_url  # Primary identifier
-    })
-    return True
-
-class LetterboxdScraper:
-    def __init__(self):
-        self.driver = setup_webdriver()
-        self.processor = MovieProcessor()
-        self.base_url = 'https://letterboxd.com/films/by/rating/'
-        self.total_titles = 0
-        self.processed_titles = 0
-        self.valid_movies_count = 0
-        self.page_number = 1
-        self.start_time = time.time()
-        self.top_movies_count = 0  # Track the number of movies added to the top genre list
-        self.rejected_movies_count = 0  # Add counter for rejected movies
-        print_to_csv("Initialized Letterboxd Scraper.")
-
-    def process_movie_data(self, info, film_title=None, film_url=None):
-        """Process movie data from the whitelist using URL as the primary identifier."""
-        try:
-            if not info or not film_url:
-                return False
-                
-            film_title = info.get('Title')  # Only for display purposes
-            release_year = info.get('Year')  # Only for display purposes
-            tmdb_id = info.get('tmdbID')  # Only for display purposes
-                        
-            # Process using URL as primary identifier
-            if self.processor.is_whitelisted(None, None, film_url):
-                # If in incomplete stats whitelist, skip all refreshes
-                if self.processor.is_incomplete_stats_whitelisted(film_title, release_year, film_url):
-                    self.processor.process_whitelist_info(info, film_url)
-                    self.valid_movies_count += 1
-                    print_to_csv(f"✅ Processed whitelist data for {film_title} ({self.valid_movies_count}/{MAX_MOVIES})")
-                    return True
-                # If info is empty or incomplete, collect fresh data
-                required_fields = [
-                    'Title', 'Year', 'Runtime', 'RatingCount',
-                    'Languages', 'Countries', 'Directors', 'Genres', 'Studios', 'Actors'
-                ]
-                missing_fields = [field for field in required_fields if not info.get(field)]
-                if not info or info == {} or missing_fields:
-                    # Only log to Refreshed_Data if info is partially filled (not empty, not just {}), and 4 or fewer fields are missing
-                    if missing_fields and info and info != {} and len(missing_fields) <= 4:
-                        reason = f"Missing or blank fields: {', '.join(missing_fields)}"
-                        self.processor.save_refreshed_data(film_title, release_year, tmdb_id, film_url, reason)
-                    try:
-                        self.driver.get(film_url)
-                        WebDriverWait(self.driver, 10).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, 'meta[property=\"og:title\"]'))
-                        )
-                        #time.sleep(random.uniform(1.0, 1.5))
-                        
-                        # Extract basic info
-                        meta_tag = self.driver.find_element(By.CSS_SELECTOR, 'meta[property="og:title"]')
-                        release_year = None
-                        if meta_tag:
-                            release_year_content = meta_tag.get_attribute('content')
-                            release_year = release_year_content.split('(')[-1].strip(')')
-
-                        # Extract rating count
-                        rating_count = 0
-                        try:
-                            page_source = self.driver.page_source
-                            match = re.search(r'ratingCount":(\d+)', page_source)
-                            if match:
-                                rating_count = int(match.group(1))
-                            
-                            # Extract TMDB ID from body tag
-                            tmdb_match = re.search(r'data-tmdb-id="(\d+)"', page_source)
-                            if tmdb_match:
-                                tmdb_id = tmdb_match.group(1)
-                            else:
-                                print_to_csv(f"No TMDB ID found in page source for {film_title}")
-                        except Exception as e:
-                            print_to_csv(f"Error extracting rating count or TMDB ID: {str(e)}")
-                        
-                        # Extract runtime
-                        runtime = None
-                        try:
-                            runtime_element = WebDriverWait(self.driver, 10).until(
-                                EC.presence_of_element_located((By.CSS_SELECTOR, 'p.text-link.text-footer'))
-                            )
-                            runtime_text = runtime_element.text
-                            match = re.search(r'(\d+)\s*min(?:s)?', runtime_text)
-                            if match:
-                                runtime = int(match.group(1))
-                        except Exception as e:
-                            print_to_csv(f"Error extracting runtime: {str(e)}")
-                        
-                        # Extract directors
-                        movie_directors = []
-                        try:
-                            director_elements = self.driver.find_elements(By.CSS_SELECTOR, 'span.creatorlist a.contributor span.prettify')
-                            for director in director_elements:
-                                director_name = director.text.strip()
-                                if director_name:
-                                    movie_directors.append(director_name)
-                        except Exception:
-                            pass
-                        
-                        # Extract actors
-                        movie_actors = []
-                        try:
-                            actor_elements = self.driver.find_elements(By.CSS_SELECTOR, '#tab-cast .text-sluglist a.text-slug.tooltip')
-                            for actor in actor_elements:
-                                actor_name = actor.text.strip()
-                                if actor_name:
-                                    movie_actors.append(actor_name)
-                        except Exception as e:
-                            print_to_csv(f"Error extracting actors: {str(e)}")
-                        
-                        # Extract genres
-                        movie_genres = []
-                        try:
-                            genre_elements = self.driver.find_elements(By.CSS_SELECTOR, '#tab-genres .text-sluglist a.text-slug[href*="/films/genre/"]')
-                            for genre in genre_elements:
-                                genre_name = genre.get_attribute('textContent').strip()
-                                if genre_name and not any(char in genre_name for char in ['…', 'Show All']):
-                                    movie_genres.append(genre_name)
-                        except Exception as e:
-                            print_to_csv(f"Error extracting genres: {str(e)}")
-                        
-                        # Extract studios
-                        movie_studios = []
-                        try:
-                            studio_elements = self.driver.find_elements(By.CSS_SELECTOR, '#tab-details .text-sluglist a.text-slug[href*="/studio/"]')
-                            for studio in studio_elements:
-                                studio_name = studio.get_attribute('textContent').strip()
-                                if studio_name:
-                                    movie_studios.append(studio_name)
-                        except Exception as e:
-                            print_to_csv(f"Error extracting studios: {str(e)}")
-                        
-                        # Extract languages
-                        movie_languages = set()
-                        try:
-                            headings = self.driver.find_elements(By.CSS_SELECTOR, '#tab-details h3')
-                            for heading in headings:
-                                span = heading.find_element(By.TAG_NAME, 'span')
-                                heading_text = span.get_attribute('textContent').strip() if span else heading.get_attribute('textContent').strip()
-                                
-                                if any(lang in heading_text for lang in ["Language", "Primary Language", "Languages", "Primary Languages"]):
-                                    try:
-                                        sluglist = heading.find_element(By.XPATH, "following-sibling::div[contains(@class, 'text-sluglist')]")
-                                        if sluglist:
-                                            p_tag = sluglist.find_element(By.TAG_NAME, 'p')
-                                            language_elements = p_tag.find_elements(By.CSS_SELECTOR, 'a.text-slug[href*="/films/language/"]')
-                                            for language in language_elements:
-                                                language_name = language.get_attribute('textContent').strip()
-                                                if language_name:
-                                                    movie_languages.add(language_name)
-                                    except Exception:
-                                        pass
-                        except Exception:
-                            pass
-                        
-                        # Extract countries
-                        movie_countries = []
-                        try:
-                            country_elements = self.driver.find_elements(By.CSS_SELECTOR, '#tab-details .text-sluglist a.text-slug[href*="/films/country/"]')
-                            for country in country_elements:
-                                country_name = country.get_attribute('textContent').strip()
-                                if country_name:
-                                    movie_countries.append(country_name)
-                        except Exception as e:
-                            print_to_csv(f"Error extracting countries: {str(e)}")
-                        
-                        # Extract MPAA rating
-                        mpaa_rating = None
-                        try:
-                            mpaa_rating = extract_mpaa_rating(self.driver)
-                        except Exception as e:
-                            print_to_csv(f"Error extracting MPAA rating: {str(e)}")
-                        
-                        # Create updated movie data
-                        info = {
-                            "Title": film_title,
-                            "Year": release_year,
-                            "tmdbID": tmdb_id,
-                            "MPAA": mpaa_rating,
-                            "Runtime": runtime,
-                            "RatingCount": rating_count,
-                            "Languages": list(movie_languages),
-                            "Countries": movie_countries,
-                            "Decade": (int(release_year) // 10) * 10 if release_year else None,
-                            "Directors": movie_directors,
-                            "Genres": movie_genres,
-                            "Studios": movie_studios,
-                            "Actors": movie_actors
-                        }
-                        
-                        # Update whitelist with fresh data
-                        if self.processor.update_whitelist(film_title, release_year, info, film_url):
-                            print_to_csv(f"📝 Updated whitelist data for {film_title}")
-                    except Exception as e:
-                        print_to_csv(f"Error collecting fresh data for {film_title}: {str(e)}")
-                        self.processor.rejected_data.append([film_title, release_year, None, f'Error collecting data: {str(e)}'])
-                        return False
-                
-                # Process the whitelist information
-                self.processor.process_whitelist_info(info, film_url)
-                self.valid_movies_count += 1
-                print_to_csv(f"✅ Processed whitelist data for {film_title} ({self.valid_movies_count}/{MAX_MOVIES})")
-                
-                # 2% chance to clear the whitelist data for random auditing
-                if random.random() < 0.02:
-                    self.processor.update_whitelist(film_title, release_year, {}, film_url)
-                    print_to_csv(f"🤓 Random data audit scheduled for {film_title} ({release_year})")
-                
-                return True
-            
-            # If not whitelisted, process as a new movie
-            self.process_approved_movie(film_title, release_year, tmdb_id, film_url, 'unfiltered')
-            return True
-                
-        except Exception as e:
-            print_to_csv(f"Error processing movie data: {str(e)}")
-            print_to_csv(f"Error type: {type(e)}")
-            print_to_csv(f"Error details: {e.__dict__ if hasattr(e, '__dict__') else 'No details available'}")
-            return False
-
-    def scrape_movies(self):
-        seen_titles = set()  # <-- Add this at the start of the method
-
-        while self.valid_movies_count < MAX_MOVIES:
-            # Construct the URL for the current page
-            url = f'{self.base_url}page/{self.page_number}/'
-            print_to_csv(f"\nLoading page {self.page_number}: {url}")
-            
-            # Send a GET request to the URL with retry mechanism
-            page_retries = 20
-            for retry in range(page_retries):
-                try:
-                    self.driver.get(url)
-                    # Wait for the page to load
-                    WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, 'div.react-component.poster'))
-                    )
-                    break
-                except Exception as e:
-                    if retry == page_retries - 1:
-                        print_to_csv(f"❌ Failed to load page after {page_retries} attempts: {str(e)}")
-                        self.save_results_emergency()  # Save progress before exiting
-                        raise Exception(f"Failed to load page after {page_retries} attempts: {str(e)}")
-                    print_to_csv(f"Retry {retry + 1}/{page_retries} loading page {self.page_number}: {str(e)}")
-                    time.sleep(2)
-            
-            #time.sleep(random.uniform(1.0, 1.5))
-                    
-            # Find all film containers with retry mechanism
-            film_containers = []
-            container_retries = 25  # Maximum number of retries
-            for retry in range(container_retries):
-                try:
-                    film_containers = WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_all_elements_located((By.CSS_SELECTOR, 'div.react-component.poster'))
-                    )
-                    if len(film_containers) == 72:  # Check for exactly 72 containers
-                        break
-                    else:
-                        print_to_csv(f"Found only {len(film_containers)} containers, retrying... (Attempt {retry + 1}/{container_retries})")
-                        time.sleep(5)  # Wait longer between retries
-                        self.driver.refresh()  # Refresh the page
-                        time.sleep(2)  # Wait for refresh
-                except Exception as e:
-                    if retry == container_retries - 1:
-                        print_to_csv(f"❌ Failed to find all 72 film containers after {container_retries} attempts: {str(e)}")
-                        self.save_results_emergency()  # Save progress before exiting
-                        raise Exception(f"Failed to find all 72 film containers after {container_retries} attempts: {str(e)}")
-                    print_to_csv(f"Retry {retry + 1}/{container_retries} finding film containers: {str(e)}")
-                    time.sleep(5)
-                    self.driver.refresh()
-                    time.sleep(2)
-            
-            if len(film_containers) != 72:
-                print_to_csv(f"❌ Failed to find all 72 film containers after {container_retries} attempts")
-                self.save_results_emergency()  # Save progress before exiting
-                raise Exception(f"Failed to find all 72 film containers after {container_retries} attempts")
-
-            print_to_csv(f"\n{f' Page {self.page_number} ':=^100}")
-
-            # First collect all film data from the page
-            film_data_list = []
-            for container in film_containers:
-                try:
-                    # Get the anchor element first
-                    anchor = container.find_element(By.CSS_SELECTOR, 'a')
-                    film_url = anchor.get_attribute('href')
-                    
-                    # Get the film name from the data attribute
-                    film_title = container.get_attribute('data-film-name')
-                    
-                    if film_title and film_url:
-                        # Extract year from title if possible
-                        release_year = None
-                        if '(' in film_title and ')' in film_title:
-                            release_year = film_title.split('(')[-1].split(')')[0].strip()
-                        
-                        # Just check if title exists in blacklist, don't try to get release year yet
-                        is_blacklisted = self.processor.is_blacklisted(None, None, film_url, None)  # Pass None as driver
-                        film_data_list.append({
-                            'title': film_title,
-                            'url': film_url,
-                            'is_blacklisted': is_blacklisted,
-                            'release_year': release_year
-                        })
-                    else:
-                        print_to_csv(f"Missing data for movie - Title: {film_title}, URL: {film_url}")
-                        self.processor.rejected_data.append([film_title, None, None, 'Missing title or URL'])
-                except Exception as e:
-                    print_to_csv(f"Error collecting film data: {str(e)}")
-                    continue
-
-            print_to_csv(f"Collected {len(film_data_list)} movies from page {self.page_number}")
-            
-            if not film_data_list:
-                print_to_csv("No valid film data collected. Moving to next page...")
-                self.page_number += 1
-                continue
-
-            # Now process each film one by one
-            for film_data in film_data_list:
-                if self.valid_movies_count >= MAX_MOVIES:
-                    print_to_csv(f"\nReached the target of {MAX_MOVIES} successful movies. Stopping scraping.")
-                    return
-
-                film_title = film_data['title']
-                film_url = film_data['url']
-                release_year = film_data['release_year']
-
-                # Get whitelist data using URL only
-                whitelist_info, _ = self.processor.get_whitelist_data(None, None, film_url)
-
-                # After processing, add the title to seen_titles for reference only
-                seen_titles.add(film_title.lower())
-
-                # Increment total_titles for each movie we process, including blacklisted ones
-                self.total_titles += 1
-                
-                # Check if movie is in zero reviews list
-                if self.processor.is_zero_reviews(film_title, release_year, film_url):
-                    print_to_csv(f"📊 {film_title} is in zero reviews list. Skipping.")
-                    self.processor.rejected_data.append([film_title, release_year, None, 'Zero reviews'])
-                    self.rejected_movies_count += 1  # Increment rejected counter
-                    continue
-                
-                # Handle blacklisted movies first
-                if film_data['is_blacklisted']:
-                    print_to_csv(f"❌ {film_title} was not added due to being blacklisted.")
-                    self.processor.rejected_data.append([film_title, release_year, None, 'Blacklisted'])
-                    self.rejected_movies_count += 1  # Increment rejected counter
-                    continue
-                
-                # First check for exact matches in whitelist
-                if whitelist_info:
-                    self.process_movie_data(whitelist_info, film_title, film_url)
-                    continue
-                                
-                # Get initial movie data without full scrape
-                movie_retries = 20  # Maximum number of retries for individual movie pages
-                for retry in range(movie_retries):
-                    try:
-                        self.driver.get(film_url)
-                        # Only wait for the page source to be available, not for any specific element
-                        page_source = self.driver.page_source
-                        # Extract rating count as fast as possible
-                        match = re.search(r'ratingCount":(\d+)', page_source)
-                        rating_count = int(match.group(1)) if match else 0
-
-                        if rating_count == 0:
-                            # Extract title/year if not already known
-                            # Try to get year from meta tag if not in film_data_list
-                            if not release_year:
-                                try:
-                                    meta_tag = self.driver.find_element(By.CSS_SELECTOR, 'meta[property="og:title"]')
-                                    if meta_tag:
-                                        release_year_content = meta_tag.get_attribute('content')
-                                        release_year = release_year_content.split('(')[-1].strip(')')
-                                except Exception:
-                                    release_year = None
-                            print_to_csv(f"📊 {film_title} has no reviews. Adding to zero reviews list.")
-                            self.processor.add_to_zero_reviews(film_title, release_year, film_url)
-                            self.processor.rejected_data.append([film_title, release_year, None, 'Zero reviews'])
-                            self.rejected_movies_count += 1
-                            break  # Skip to next movie
-                        elif rating_count < MIN_RATING_COUNT:
-                            # Not enough reviews, skip immediately
-                            print_to_csv(f"❌ {film_title} was not added due to insufficient ratings: {rating_count} ratings.")
-                            self.processor.rejected_data.append([film_title, release_year, None, 'Insufficient ratings (< 1000)'])
-                            self.rejected_movies_count += 1
-                            break  # Skip to next movie
-                        # If here, rating_count >= 1000, proceed as before
-                        WebDriverWait(self.driver, 10).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, 'meta[property=\"og:title\"]'))
-                        )
-                        meta_tag = self.driver.find_element(By.CSS_SELECTOR, 'meta[property="og:title"]')
-                        release_year = None
-                        if meta_tag:
-                            release_year_content = meta_tag.get_attribute('content')
-                            release_year = release_year_content.split('(')[-1].strip(')')
-                        # Extract TMDB ID from body tag
-                        tmdb_id = None
-                        try:
-                            tmdb_match = re.search(r'data-tmdb-id="(\d+)"', page_source)
-                            if tmdb_match:
-                                tmdb_id = tmdb_match.group(1)
-                        except Exception as e:
-                            print_to_csv(f"Error extracting TMDB ID: {str(e)}")
-                        # Extract runtime
-                        runtime = None
-                        try:
-                            runtime_element = WebDriverWait(self.driver, 10).until(
-                                EC.presence_of_element_located((By.CSS_SELECTOR, 'p.text-link.text-footer'))
-                            )
-                            runtime_text = runtime_element.text
-                            match = re.search(r'(\d+)\s*min(?:s)?', runtime_text)
-                            if match:
-                                runtime = int(match.group(1))
-                                if runtime < MIN_RUNTIME:
-                                    print_to_csv(f"❌ {film_title} was not added due to insufficient runtime: {runtime} minutes.")
-                                    self.processor.rejected_data.append([film_title, release_year, None, 'Insufficient runtime (< 40 minutes)'])
-                                    self.processor.add_to_blacklist(film_title, release_year, 'Insufficient runtime (< 40 minutes)', film_url)
-                                    self.rejected_movies_count += 1
-                                    break  # Skip to next movie
-                        except Exception as e:
-                            runtime = None
-                            print_to_csv(f"Error extracting runtime for {film_title}: {str(e)}")
-                        if runtime is None:
-                            runtime_retries = 5
-                            print_to_csv(f"⚠️ {film_title} skipped due to missing runtime")
-                            self.rejected_movies_count += 1  # Increase rejected movie count
-                            if retry < runtime_retries - 1:
-                                print_to_csv(f"Retrying... (Attempt {retry + 1}/{movie_retries})")
-                                time.sleep(2)
-                                continue
-                        # If we get here, the movie passed all checks
-                        # Create movie data dictionary
-                        movie_data = {
-                            'Title': film_title,
-                            'Year': release_year,
-                            'tmdbID': tmdb_id,
-                            'MPAA': None,  # We don't need MPAA for processing
-                            'Runtime': runtime,
-                            'RatingCount': rating_count,
-                            'Languages': [],
-                            'Countries': [],
-                            'Decade': (int(release_year) // 10) * 10 if release_year else None,
-                            'Directors': [],
-                            'Genres': [],
-                            'Studios': [],
-                            'Actors': [],
-                            'Link': film_url
-                        }
-                        # Process the movie data
-                        self.process_movie_data(movie_data, film_title, film_url)
-                        break  # Break out of retry loop since we successfully processed the movie
-                    except Exception as e:
-                        if retry == movie_retries - 1:
-                            print_to_csv(f"❌ Failed to process movie after {movie_retries} attempts: {str(e)}")
-                            self.processor.rejected_data.append([film_title, release_year, None, f'Error: {str(e)}'])
-                        else:
-                            print_to_csv(f"Retry {retry + 1}/{movie_retries} processing movie: {str(e)}")
-                            time.sleep(2)
-                            continue
-            
-            self.page_number += 1
-
-    def process_approved_movie(self, film_title: str, release_year: str, tmdb_id: str, film_url: str, approval_type: str):
-        """Process a movie that has been approved."""
-        try:
-            # Extract TMDB ID from page source
-            try:
-                page_source = self.driver.page_source
-                tmdb_match = re.search(r'data-tmdb-id="(\d+)"', page_source)
-                if tmdb_match:
-                    tmdb_id = tmdb_match.group(1)
-                else:
-                    print_to_csv(f"❌ {film_title} was not added due to missing TMDB ID.")
-                    self.processor.rejected_data.append([film_title, release_year, None, 'Missing TMDB ID'])
-                    self.processor.unfiltered_denied.append([film_title, release_year, None, film_url])
-                    self.rejected_movies_count += 1  # Increment rejected counter
-                    return
-            except Exception as e:
-                print_to_csv(f"Error extracting TMDB ID: {str(e)}")
-                print_to_csv(f"❌ {film_title} was not added due to missing TMDB ID.")
-                self.processor.rejected_data.append([film_title, release_year, None, 'Missing TMDB ID'])
-                self.processor.unfiltered_denied.append([film_title, release_year, None, film_url])
-                self.rejected_movies_count += 1  # Increment rejected counter
-                return
-
-            # Extract rating count
-            rating_count = 0
-            try:
-                match = re.search(r'ratingCount":(\d+)', page_source)
-                if match:
-                    rating_count = int(match.group(1))
-            except Exception as e:
-                print_to_csv(f"Error extracting rating count: {str(e)}")
-
-            # Extract runtime using Selenium
-            runtime = None
-            try:
-                runtime_text = self.driver.find_element(By.CSS_SELECTOR, 'p.text-link.text-footer').text
-                match = re.search(r'(\d+)\s*min(?:s)?', runtime_text)
-                if match:
-                    runtime = int(match.group(1))
-            except Exception:
-                runtime = None
-
-            # Check if movie has zero reviews
-            if rating_count == 0:
-                print_to_csv(f"📊 {film_title} has no reviews. Adding to zero reviews list.")
-                self.processor.add_to_zero_reviews(film_title, release_year, film_url)
-                self.processor.rejected_data.append([film_title, release_year, None, 'Zero reviews'])
-                self.rejected_movies_count += 1  # Increment rejected counter
-                return
-
-            # Check minimum rating count
-            if rating_count < MIN_RATING_COUNT:
-                print_to_csv(f"❌ {film_title} was not added due to insufficient ratings: {rating_count} ratings.")
-                self.processor.rejected_data.append([film_title, release_year, None, 'Insufficient ratings (< 1000)'])
-                self.rejected_movies_count += 1  # Increment rejected counter
-                return
-
-            if runtime is None:
-                print_to_csv(f"❌ {film_title} was not added due to missing runtime.")
-                self.processor.rejected_data.append([film_title, release_year, None, 'Missing runtime'])
-                self.processor.unfiltered_denied.append([film_title, release_year, None, film_url])
-                self.rejected_movies_count += 1  # Increment rejected counter
-                return
-
-            if runtime < MIN_RUNTIME:
-                print_to_csv(f"❌ {film_title} was not added due to a short runtime of {runtime} minutes.")
-                self.processor.rejected_data.append([film_title, release_year, None, f'Short runtime of {runtime} minutes'])
-                self.processor.add_to_blacklist(film_title, release_year, f'Short runtime of {runtime} minutes', film_url)
-                self.rejected_movies_count += 1  # Increment rejected counter
-                return
-
-            # Check for blacklisted keywords and genres
-            tmdb_data = self.processor.fetch_tmdb_details(tmdb_id)
-            if tmdb_data is None:
-                print_to_csv(f"❌ {film_title} was not added due to failed TMDB data fetch.")
-                self.processor.rejected_data.append([film_title, release_year, None, 'Failed TMDB data fetch'])
-                self.processor.unfiltered_denied.append([film_title, release_year, None, film_url])
-                self.rejected_movies_count += 1  # Increment rejected counter
-                return
-                
-            keywords, genres = tmdb_data
-            
-            # Check keywords - case insensitive comparison
-            matching_keywords = [k for k in FILTER_KEYWORDS if k.lower() in [kw.lower() for kw in keywords]]
-            if matching_keywords:
-                rejection_reason = f"due to being a {', '.join(matching_keywords)}."
-                print_to_csv(f"❌ {film_title} was not added {rejection_reason}")
-                self.processor.rejected_data.append([film_title, release_year, None, rejection_reason])
-                self.processor.add_to_blacklist(film_title, release_year, rejection_reason, film_url)
-                self.rejected_movies_count += 1  # Increment rejected counter
-                return
-            
-            # Check genres - case insensitive comparison
-            matching_genres = [g for g in FILTER_GENRES if g.lower() in [gen.lower() for gen in genres]]
-            if matching_genres:
-                rejection_reason = f"due to being a {', '.join(matching_genres)}."
-                print_to_csv(f"❌ {film_title} was not added {rejection_reason}")
-                self.processor.rejected_data.append([film_title, release_year, None, rejection_reason])
-                self.processor.add_to_blacklist(film_title, release_year, rejection_reason, film_url)
-                self.rejected_movies_count += 1  # Increment rejected counter
-                return
-
-            # If we reach here, the movie is approved
-            # Check if we've reached the limit BEFORE incrementing
-            if self.valid_movies_count >= MAX_MOVIES:
-                print_to_csv(f"⚠️ {film_title} would be the {self.valid_movies_count + 1}th movie, but we've reached the limit of {MAX_MOVIES}")
-                return
-            
-            self.valid_movies_count += 1
-            print_to_csv(f"✅ {film_title} was approved ({self.valid_movies_count}/{MAX_MOVIES})")
-            
-            # Add to unfiltered_approved
-            self.processor.unfiltered_approved.append([film_title, release_year, tmdb_id, film_url])
-            
-            # Add to film data
-            self.processor.film_data.append({
-                'Title': film_title,
-                'Year': release_year,
-                'tmdbID': tmdb_id,
-                'Link': film_url
-            })
-
-            # Add to MAX_MOVIES_stats if we haven't reached the limit
-            if len(MAX_MOVIES_stats['film_data']) < MAX_MOVIES:
-                MAX_MOVIES_stats['film_data'].append({
-                    'Title': film_title,
-                    'Year': release_year,
-                    'tmdbID': tmdb_id,
-                    'Link': film_url
-                })
-                # Update statistics for this movie
-                self.update_MAX_MOVIES_statistics(film_title, release_year, tmdb_id, self.driver, film_url)
-
-        except Exception as e:
-            print_to_csv(f"Error processing approved movie {film_title}: {str(e)}")
-            self.processor.rejected_data.append([film_title, release_year, None, f'Error processing: {str(e)}'])
-            return False
-
-    def update_MAX_MOVIES_statistics(self, film_title: str, release_year: str, tmdb_id: str, driver, film_url: str = None):
-        """Update statistics for the given movie for MAX_MOVIES."""
-        if not film_url:
-            print_to_csv("WARNING: No film URL provided for statistics update")
-            return
-
-        # Find the movie in film_data
-        movie_data = next((movie for movie in MAX_MOVIES_stats['film_data'] 
-                          if movie['Title'] == film_title and movie['Year'] == release_year), None)
-        
-        if not movie_data:
-            return
-
-        # Directors
-        try:
-            director_elements = driver.find_elements(By.CSS_SELECTOR, 'span.creatorlist a.contributor')
-            for director in director_elements:
-                director_name = director.text.strip()
-                if director_name:
-                    MAX_MOVIES_stats['director_counts'][director_name] += 1
-        except Exception:
-            pass
-
-        # Actors
-        try:
-            actor_elements = driver.find_elements(By.CSS_SELECTOR, '#tab-cast .text-sluglist a.text-slug.tooltip')
-            for actor in actor_elements:
-                actor_name = actor.text.strip()
-                if actor_name:
-                    MAX_MOVIES_stats['actor_counts'][actor_name] += 1
-        except Exception:
-            pass
-
-        # Decade
-        try:
-            meta_tag = driver.find_element(By.CSS_SELECTOR, 'meta[property="og:title"]')
-            content = meta_tag.get_attribute('content')
-            if content and '(' in content and ')' in content:
-                year = int(content.split('(')[-1].split(')')[0])
-                decade = (year // 10) * 10
-                MAX_MOVIES_stats['decade_counts'][decade] += 1
-        except Exception:
-            pass
-
-        # Genres - Only get main genres, not microgenres
-        try:
-            genre_elements = driver.find_elements(By.CSS_SELECTOR, '#tab-genres .text-sluglist a.text-slug[href*="/films/genre/"]')
-            genres = []
-            for genre in genre_elements:
-                genre_name = genre.get_attribute('textContent').strip()
-                if genre_name and not any(char in genre_name for char in ['…', 'Show All']):
-                    genres.append(genre_name)
-                    MAX_MOVIES_stats['genre_counts'][genre_name] += 1
-            movie_data['Genres'] = genres
-        except Exception:
-            pass
-
-        # Studios
-        try:
-            studio_elements = driver.find_elements(By.CSS_SELECTOR, '#tab-details .text-sluglist a.text-slug[href*="/studio/"]')
-            studios = []
-            for studio in studio_elements:
-                studio_name = studio.get_attribute('textContent').strip()
-                if studio_name:
-                    studios.append(studio_name)
-                    MAX_MOVIES_stats['studio_counts'][studio_name] += 1
-            movie_data['Studios'] = studios
-        except Exception:
-            pass
-
-        # Languages
-        try:
-            language_elements = driver.find_elements(By.CSS_SELECTOR, '#tab-details .text-sluglist a.text-slug[href*="/films/language/"]')
-            languages = []
-            for language in language_elements:
-                language_name = language.get_attribute('textContent').strip()
-                if language_name:
-                    languages.append(language_name)
-                    MAX_MOVIES_stats['language_counts'][language_name] += 1
-            movie_data['Languages'] = languages
-        except Exception:
-            pass
-
-        # Countries
-        try:
-            country_elements = driver.find_elements(By.CSS_SELECTOR, '#tab-details .text-sluglist a.text-slug[href*="/films/country/"]')
-            countries = []
-            for country in country_elements:
-                country_name = country.get_attribute('textContent').strip()
-                if country_name:
-                    countries.append(country_name)
-                    MAX_MOVIES_stats['country_counts'][country_name] += 1
-            movie_data['Countries'] = countries
-        except Exception:
-            pass
-
-    def save_MAX_MOVIES_results(self, genre, sort_type):
-        """Save results for MAX_MOVIES."""
-               
-        # Save movie data in chunks
-        num_chunks = (len(MAX_MOVIES_stats['film_data']) + CHUNK_SIZE - 1) // CHUNK_SIZE
-        for i in range(num_chunks):
-            start_idx = i * CHUNK_SIZE
-            end_idx = min((i + 1) * CHUNK_SIZE, len(MAX_MOVIES_stats['film_data']))
-            chunk_df = pd.DataFrame(MAX_MOVIES_stats['film_data'][start_idx:end_idx])
-            chunk_df = chunk_df[['Title', 'Year', 'tmdbID']]
-            output_path = os.path.join(BASE_DIR, f'top_250_{genre}_{sort_type}.csv')
-            chunk_df.to_csv(output_path, index=False, encoding='utf-8')
-
-        def get_ordinal(n):
-            if 10 <= n % 100 <= 20:
-                suffix = 'th'
-            else:
-                suffix = {1: 'st', 2: 'nd', 3: 'rd'}.get(n % 10, 'th')
-            return str(n) + suffix
-
-        current_date = datetime.now()
-        formatted_date = current_date.strftime('%B ') + get_ordinal(current_date.day) + f", {current_date.year}"
-
-        # Save statistics for this genre and sort type
-        stats_path = os.path.join(BASE_DIR, f'stats_top_250_{genre}_{sort_type}.txt')
-        
-        with open(stats_path, mode='w', encoding='utf-8') as file:
-            # Change "Animation" to "Animated" and "Science-fiction" to "Science Fiction"
-            formatted_header = genre.capitalize()
-            if formatted_header == "Animation":
-                formatted_header = "Animated"
-            if formatted_header == "Science-fiction":
-                formatted_header = "Science Fiction"
-
-            formatted_genre = genre.capitalize()
-            if formatted_genre == "Science-fiction":
-                formatted_genre = "Science Fiction"
-            
-            if sort_type == "popular":
-                file.write(f"<strong>The Top {len(MAX_MOVIES_stats['film_data'])} Most Popular {formatted_header} Narrative Feature Films on Letterboxd, as defined by Letterboxd.</strong>\n\n")
-            else:
-                file.write(f"<strong>The Top {len(MAX_MOVIES_stats['film_data'])} Highest Rated {formatted_header} Narrative Feature Films on Letterboxd, as defined by Letterboxd.</strong>\n\n")
-            file.write(f"<strong>Last updated: {formatted_date}</strong>\n\n")
-            file.write("<a href=https://letterboxd.com/bigbadraj/list/the-official-list-index/> Check out more of the lists I update regularly!</a>\n\n")
-            
-            # Write eligibility criteria
-            file.write("<strong>Film eligibility criteria:</strong>\n")
-            file.write("-- Must have a minimum of 1,000 reviews on Letterboxd.\n")
-            file.write("-- Cannot be a short film (minimum 40 minutes).\n")
-            file.write("-- Cannot be a television miniseries.\n")
-            file.write("-- Cannot be a compilation of short serials.\n")
-            file.write("-- Cannot be a documentary.\n")
-            file.write("-- Cannot be a non-narrative project (paint drying for 10 hours, a timelapse of the construction of a building, abstract images, etc).\n")
-            file.write("-- Cannot be a recording of a live performance (stand-up specials, recordings of live theater, concert films, etc).\n")
-            file.write("-- Cannot be a television special episode, though feature film spin-offs from television shows are allowed.\n")
-            file.write("-- Feature film spin-offs from television shows must contain original material, not just recap or compilation of existing material.\n")
-            file.write("-- Entries that have scores inflated because they share a name with a popular television show are removed, as I notice them.\n\n")
-
-            # Write all top 10 statistics
-            categories1 = [
-                ("directors", MAX_MOVIES_stats['director_counts']),
-                ("actors", MAX_MOVIES_stats['actor_counts']),
-                ("decades", MAX_MOVIES_stats['decade_counts'])
-            ]
-
-            for category_name, counts in categories1:
-                file.write(f"<strong>The ten most appearing {category_name}:</strong>\n")
-                sorted_items = sorted(counts.items(), key=lambda item: item[1], reverse=True)[:10]
-                for item, count in sorted_items:
-                    file.write(f"{item}: {count}\n")
-                file.write("\n")
-
-            # Add the specific genres excluding the main genre
-            top_genres = sorted(MAX_MOVIES_stats['genre_counts'].items(), key=lambda item: item[1], reverse=True)[1:11]  # Exclude the first genre
-            file.write(f"<strong>The Ten Most Appearing Genres (Excluding {formatted_genre}):</strong>\n")
-            for item, count in top_genres:
-                file.write(f"{item}: {count}\n")
-            file.write("\n")
-
-            categories2 = [
-                ("studios", MAX_MOVIES_stats['studio_counts']),
-                ("languages", MAX_MOVIES_stats['language_counts']),
-                ("countries", MAX_MOVIES_stats['country_counts'])
-            ]
-
-            for category_name, counts in categories2:
-                file.write(f"<strong>The ten most appearing {category_name}:</strong>\n")
-                sorted_items = sorted(counts.items(), key=lambda item: item[1], reverse=True)[:10]
-                for item, count in sorted_items:
-                    file.write(f"{item}: {count}\n")
-                file.write("\n")
-
-            file.write("<strong>Have a great day!</strong>")
-
-        print_to_csv(f"Top 10 statistics saved to stats_top_250_{genre}_{sort_type}.txt")
-
-    def save_results(self, genre, sort_type):
-        """Save all results to files"""
-        
-        # Track movies by title
-        title_to_movies = defaultdict(list)
-        
-        # Add approved movies
-        for movie in self.processor.film_data:
-            # Only add if not already in the list with the same tmdbID
-            if not any(m['tmdb_id'] == movie['tmdbID'] for m in title_to_movies[movie['Title'].lower()]):
-                title_to_movies[movie['Title'].lower()].append({
-                    'title': movie['Title'],
-                    'year': movie['Year'],
-                    'tmdb_id': movie['tmdbID'],
-                    'status': 'Approved'
-                })
-        
-        # Add rejected movies
-        for movie in self.processor.rejected_data:
-            if len(movie) >= 3:  # Ensure we have at least title, year, and reason
-                # Only add if not already in the list with the same tmdbID
-                if not any(m['tmdb_id'] == movie[2] for m in title_to_movies[movie[0].lower()]):
-                    title_to_movies[movie[0].lower()].append({
-                        'title': movie[0],
-                        'year': movie[1],
-                        'tmdb_id': movie[2] if len(movie) > 2 else 'N/A',
-                        'status': f'Rejected: {movie[3]}' if len(movie) > 3 else 'Rejected'
-                    })
-
-        # Save unfiltered approved data (append mode)
-        approved_path = os.path.join(BASE_DIR, 'unfiltered_approved.csv')
-        with open(approved_path, mode='a', newline='', encoding='utf-8') as file:
-            writer = csv.writer(file)
-            # Write header if file is empty
-            if file.tell() == 0:
-                writer.writerow(['Title', 'Year', 'Blank', 'URL', f'{genre.capitalize()} Top'])
-            for movie in self.processor.unfiltered_approved:
-                # Ensure we have at least title, year, and URL
-                if len(movie) >= 4:
-                    writer.writerow([movie[0], movie[1], '', movie[3], f'{genre.capitalize()} Top'])
-                else:
-                    print_to_csv(f"Warning: Movie data incomplete for {movie[0] if movie else 'Unknown'}")
-
-        # Save unfiltered denied data (append mode)
-        denied_path = os.path.join(BASE_DIR, 'unfiltered_denied.csv')
-        with open(denied_path, mode='a', newline='', encoding='utf-8') as file:
-            writer = csv.writer(file)
-            # Write header if file is empty
-            if file.tell() == 0:
-                writer.writerow(['Title', 'Year', 'Blank', 'URL', f'{genre.capitalize()} Top'])
-            for movie in self.processor.unfiltered_denied:
-                if len(movie) >= 4:
-                    writer.writerow([movie[0], movie[1], '', movie[3], f'{genre.capitalize()} Top'])
-                else:
-                    print_to_csv(f"Warning: Movie data incomplete for {movie[0] if movie else 'Unknown'}")
-
-        # Save MAX_MOVIES results
-        self.save_MAX_MOVIES_results(genre, sort_type)
-
-    def log_error_to_csv(self, error_message: str):
-        """Log error messages to update_results.csv."""
-        error_path = os.path.join(BASE_DIR, 'update_results.csv')
-        with open(error_path, mode='a', newline='', encoding='utf-8') as file:
-            writer = csv.writer(file)
-            writer.writerow(['Error Type', 'Error Message'])
-            writer.writerow([type(error_message).__name__, error_message])  # Write the error type and message
-
-    def update_statistics_for_movie(self, film_title: str, release_year: str, tmdb_id: str, driver, film_url: str = None):
-        """Update statistics for the given movie."""
-        try:
-            # Get movie data from whitelist
-            movie_data, _ = self.processor.get_whitelist_data(film_title, release_year, film_url)
-            if not movie_data:
-                return None
-
-            # Only update whitelist if the movie is already in it
-            if self.processor.is_whitelisted(film_title, release_year):
-                if self.processor.update_whitelist(film_title, release_year, movie_data, film_url):
-                    print_to_csv(f"📝 Successfully updated whitelist data for {film_title}")
-                    # Process through all output channels
-                    self.processor.process_whitelist_info(movie_data, film_url)
-                    
-                    self.valid_movies_count += 1
-                    print_to_csv(f"✅ Processed whitelist data for {film_title} ({self.valid_movies_count}/{MAX_MOVIES})")
-                    return movie_data
-
-        except Exception as e:
-            print_to_csv(f"Error in update_statistics_for_movie: {str(e)}")
-            return None
-    
-    def reset_MAX_MOVIES_stats(self):
-        """Reset MAX_MOVIES_stats for a new genre/sort type combination."""
-        global MAX_MOVIES_stats
-        MAX_MOVIES_stats = {
-            'film_data': [],  # Each entry will have Title, Year, tmdbID, and URL fields
-            'director_counts': defaultdict(int),
-            'actor_counts': defaultdict(int),
-            'decade_counts': defaultdict(int),
-            'genre_counts': defaultdict(int),
-            'studio_counts': defaultdict(int),
-            'language_counts': defaultdict(int),
-            'country_counts': defaultdict(int)
-        }
-
-    def reset_counters(self):
-        """Reset internal counters for a new genre/sort type combination."""
-        self.total_titles = 0
-        self.processed_titles = 0
-        self.valid_movies_count = 0
-        self.page_number = 1
-        self.start_time = time.time()
-        self.top_movies_count = 0
-        self.rejected_movies_count = 0
-        # Reset processor data for new genre/sort type
-        self.processor.film_data = []
-        self.processor.rejected_data = []
-        self.processor.unfiltered_approved = []
-        self.processor.unfiltered_denied = []
-
-    def save_results_emergency(self):
-        """Save results without genre/sort_type parameters for error handling."""
-        # Save unfiltered approved data (append mode)
-        approved_path = os.path.join(BASE_DIR, 'unfiltered_approved.csv')
-        with open(approved_path, mode='a', newline='', encoding='utf-8') as file:
-            writer = csv.writer(file)
-            # Write header if file is empty
-            if file.tell() == 0:
-                writer.writerow(['Title', 'Year', 'Blank', 'URL', 'Emergency'])
-            for movie in self.processor.unfiltered_approved:
-                # Ensure we have at least title, year, and URL
-                if len(movie) >= 4:
-                    writer.writerow([movie[0], movie[1], '', movie[3], 'Emergency'])
-                else:
-                    print_to_csv(f"Warning: Movie data incomplete for {movie[0] if movie else 'Unknown'}")
-
-        # Save unfiltered denied data (append mode)
-        denied_path = os.path.join(BASE_DIR, 'unfiltered_denied.csv')
-        with open(denied_path, mode='a', newline='', encoding='utf-8') as file:
-            writer = csv.writer(file)
-            # Write header if file is empty
-            if file.tell() == 0:
-                writer.writerow(['Title', 'Year', 'Blank', 'URL', 'Emergency'])
-            for movie in self.processor.unfiltered_denied:
-                if len(movie) >= 4:
-                    writer.writerow([movie[0], movie[1], '', movie[3], 'Emergency'])
-                else:
-                    print_to_csv(f"Warning: Movie data incomplete for {movie[0] if movie else 'Unknown'}")
-
-def main():
-    genres = ["action", "adventure", "animation", "comedy", "crime", "drama", "family", "fantasy", "history", "horror", "music", "mystery", "romance", "science-fiction", "thriller", "war", "western"]  # List of genres to iterate through
-
-    start_time = time.time()
-    
-    for genre in genres:
-        for sort_type in ["rating", "popular"]:  # Loop through both "rating" and "popular"
-            try:
-                scraper = LetterboxdScraper()
-                scraper.base_url = f'https://letterboxd.com/films/genre/{genre}/by/{sort_type}/'  # Update base URL for the genre and sort type
-                scraper.reset_MAX_MOVIES_stats()  # Reset statistics for new genre/sort type
-                scraper.reset_counters()  # Reset counters for new genre/sort type
-                scraper.scrape_movies()
-                scraper.save_results(genre, sort_type)  # Pass genre and sort_type to save_results
-
-                # Format final statistics
-                print_to_csv(f"\n{'Final Statistics':=^100}")
-                print_to_csv(f"{'Total movies scraped:':<30} {scraper.total_titles:>10}")
-                print_to_csv(f"{'Total accepted:':<30} {scraper.valid_movies_count:>10}")
-                print_to_csv(f"{'Total rejected:':<30} {scraper.rejected_movies_count:>10}")  # Use counter instead of len(rejected_data)
-                print_to_csv(f"{'Total unfiltered approved:':<30} {len(scraper.processor.unfiltered_approved):>10}")
-                print_to_csv(f"{'Total unfiltered denied:':<30} {len(scraper.processor.unfiltered_denied):>10}")
-
-                # Format execution time
-                execution_time = time.time() - start_time
-                print_to_csv(f"\n{'Execution Summary':=^100}")
-                print_to_csv(f"Total execution time: {format_time(execution_time)}")
-                print_to_csv(f"Average processing speed: {scraper.valid_movies_count / execution_time:.2f} movies/second")
-
-            except Exception as e:
-                print_to_csv(f"\n{'Error':=^100}")
-                print_to_csv(f"❌ An error occurred during execution: {e}")
-            finally:
-                if 'scraper' in locals():
-                    try:
-                        scraper.driver.quit()
-                    except:
-                        pass
-
-if __name__ == "__main__":
-    main()
\ No newline at end of file
+# Import necessary libraries
+import time
+import random
+from selenium import webdriver
+from selenium.webdriver.firefox.service import Service
+from selenium.webdriver.firefox.options import Options
+from selenium.webdriver.common.by import By
+import pandas as pd
+import requests
+import re
+import csv
+import locale
+import os
+import platform
+from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from typing import Dict, List, Set, Tuple, Optional
+from dataclasses import dataclass
+from collections import defaultdict
+import unicodedata
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+import json
+from whitelist_journal import WhitelistJournal
+from snapshot_cache import StartupTimer, cached_load
+from whitelist_lookup import WhitelistLookup
+from film_page_parser import FilmPage, FilmPageParser
+from film_fetcher import FilmFetcher, create_film_session
+from http_cache import HTTP_CACHE_FILENAME, CachedSession, HttpCache
+from list_criteria import FILTER_GENRES, FILTER_KEYWORDS, GENRES, MIN_RATING_COUNT, MIN_RUNTIME
+from film_pipeline import FilmPagePipeline
+from rate_controller import controller_for, report_rates
+from tmdb_cache import CACHE_FILENAME, TmdbCache
+from tmdb_prefetch import TmdbPrefetcher
+from credentials_loader import load_credentials
+from output_log import output_log
+from script_profiler import run_profiled
+from film_events import FilmEventLog, events_path_for
+
+# Detect operating system and set appropriate paths
+def get_os_specific_paths():
+    """Return OS-specific file paths."""
+    system = platform.system()
+    
+    if system == "Windows":
+        # Windows paths
+        base_dir = r'C:\Users\bigba\aa Personal Projects\Letterboxd List Scraping'
+        output_dir = os.path.join(base_dir, 'Outputs')
+    elif system == "Darwin":  # macOS
+        # macOS paths
+        base_dir = '/Users/calebcollins/Documents/Letterboxd List Scraping'
+        output_dir = os.path.join(base_dir, 'Outputs')
+    
+    return {
+        'base_dir': base_dir,
+        'output_dir': output_dir
+    }
+
+# Get OS-specific paths
+paths = get_os_specific_paths()
+BASE_DIR = paths['output_dir']
+LIST_DIR = paths['base_dir']
+
+# Define a custom print function
+def print_to_csv(message: str):
+    """Prints a message to the terminal and appends it to All_Outputs.csv."""
+    print(message)  # Print to terminal
+    output_log(os.path.join(BASE_DIR, 'All_Outputs.csv')).write(message)  # Queued and appended to the file in batches
+
+# Configure locale and constants
+locale.setlocale(locale.LC_ALL, 'en_US.UTF-8')
+MAX_MOVIES = 250
+
+# Configure settings
+FILM_FETCH_CONCURRENCY = 8  # Film pages requested at once ahead of the scraping loop
+MAX_RETRIES = 25
+CHUNK_SIZE = 1900
+
+# File paths
+BLACKLIST_PATH = os.path.join(LIST_DIR, 'blacklist.xlsx')
+WHITELIST_PATH = os.path.join(LIST_DIR, 'whitelist.xlsx')
+INCOMPLETE_STATS_WHITELIST_PATH = os.path.join(LIST_DIR, 'Incomplete_Stats_Whitelist.xlsx')
+ZERO_REVIEWS_PATH = os.path.join(LIST_DIR, 'Zero_Reviews.xlsx')  # Add new path
+HTTP_CACHE_PATH = os.path.join(LIST_DIR, HTTP_CACHE_FILENAME)
+HTTP_CACHE_MAX_AGE = 0  # Seconds a stored Letterboxd page is reused without revalidating it
+TMDB_CACHE_PATH = os.path.join(LIST_DIR, CACHE_FILENAME)
+TMDB_CACHE_TTL_DAYS = 90  # Refetch TMDB keywords and genres older than this
+TMDB_WORKERS = 4  # TMDB lookups run at once ahead of the keyword/genre filter
+EVENTS_PATH = events_path_for(BASE_DIR, 'Genre 250s')  # One JSON line per film; summarize with film_events.py
+
+# Load credentials
+credentials = load_credentials()
+TMDB_API_KEY = credentials['TMDB_API_KEY']
+
+@dataclass
+class MovieData:
+    url: str  # Only identifier
+    title: str  # For reference only
+    year: str  # For reference only
+    tmdb_id: Optional[str] = None
+    rating_count: int = 0
+    runtime: int = 0
+    keywords: List[str] = None
+    genres: List[str] = None
+
+class RequestsSession:
+    def __init__(self, cache: HttpCache = None):
+        self.session = CachedSession(cache, HTTP_CACHE_MAX_AGE, print_to_csv)
+        retry_strategy = Retry(
+            total=3,
+            backoff_factor=1,
+            # 429s and 5xx go back to the session, whose rate controller backs off before retrying them
+            respect_retry_after_header=False
+        )
+        adapter = HTTPAdapter(max_retries=retry_strategy)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.session.get(url, **kwargs)
+
+def normalize_text(text):
+    return unicodedata.normalize('NFKC', str(text)).strip()
+
+class MovieProcessor:
+    def __init__(self):
+        self.http_cache = HttpCache(HTTP_CACHE_PATH)
+        self.session = RequestsSession(self.http_cache)
+        self.tmdb_cache = TmdbCache(TMDB_CACHE_PATH, TMDB_CACHE_TTL_DAYS)
+        self.tmdb_prefetcher = TmdbPrefetcher(self.fetch_tmdb_details, TMDB_WORKERS)
+        self.startup_timer = StartupTimer()
+        self.whitelist = None
+        self.whitelist_journal = WhitelistJournal(WHITELIST_PATH)
+        self.whitelist_lookup = {}
+        self.incomplete_stats_whitelist = None
+        self.incomplete_stats_lookup = {}
+        self.zero_reviews = None
+        self.zero_reviews_lookup = {}
+        self.load_whitelist()
+        self.load_incomplete_stats_whitelist()
+        self.load_zero_reviews()
+        
+        with self.startup_timer.measure('blacklist') as timing:
+            (self.blacklist, self.blacklist_lookup), timing['source'] = cached_load(
+                BLACKLIST_PATH, 'blacklist', self.read_blacklist
+            )
+        self.startup_timer.report(print_to_csv)
+        
+        self.added_movies: Set[Tuple[str, str]] = set()
+        self.film_data: List[Dict] = []
+        self.rejected_data: List[List] = []
+        self.unfiltered_approved: List[List] = []
+        self.unfiltered_denied: List[List] = []
+        
+        # Statistics tracking
+        self.director_counts: Dict[str, int] = {}
+        self.actor_counts: Dict[str, int] = {}
+        self.decade_counts: Dict[str, int] = {}
+        self.genre_counts: Dict[str, int] = {}
+        self.studio_counts: Dict[str, int] = {}
+        self.language_counts: Dict[str, int] = {}
+        self.country_counts: Dict[str, int] = {}
+        self.rating_counts: Dict[str, int] = {}
+
+    def read_blacklist(self):
+        """Read blacklist.xlsx and build the URL lookup."""
+        # Update blacklist loading to include the Link column
+        blacklist = pd.read_excel(BLACKLIST_PATH, header=0, names=['Title', 'Year', 'Reason', 'Link'], usecols=[0, 1, 2, 3])
+        
+        # Normalize titles and years in blacklist
+        blacklist['Title'] = blacklist['Title'].apply(normalize_text)
+        blacklist['Year'] = blacklist['Year'].astype(str).str.strip()
+        # Fill empty links with empty string instead of None
+        blacklist['Link'] = blacklist['Link'].fillna('')
+        
+        # Create a lookup dictionary for faster matching using URLs as keys
+        blacklist_lookup = {}
+        for idx, row in blacklist.iterrows():
+            if row['Link']:  # Only store entries with URLs
+                blacklist_lookup[row['Link']] = True
+        return blacklist, blacklist_lookup
+
+    def read_whitelist(self):
+        """Read whitelist.xlsx, replay the journal and build the URL lookup."""
+        # Read whitelist with explicit string type for Year column and include Information and Link columns
+        whitelist = pd.read_excel(WHITELIST_PATH, header=0, names=['Title', 'Year', 'Information', 'Link'], dtype={'Year': str})
+        
+        # Normalize the data
+        whitelist['Title'] = whitelist['Title'].apply(normalize_text)
+        whitelist['Year'] = whitelist['Year'].astype(str).str.strip()
+        # Fill empty links with empty string instead of None
+        whitelist['Link'] = whitelist['Link'].fillna('')
+        # Fold in upserts journalled since the last compaction (e.g. after a crash)
+        whitelist = self.whitelist_journal.replay(whitelist, match_on='link')
+        
+        # Create a lookup dictionary for faster matching using URLs as keys.
+        # Information stays a raw JSON string until the film is looked up.
+        whitelist_lookup = WhitelistLookup()
+        for idx, information, link in zip(whitelist.index, whitelist['Information'], whitelist['Link']):
+            if link:  # Only store entries with URLs
+                whitelist_lookup[link] = (information, idx, link)  # Added URL to tuple
+        return whitelist, whitelist_lookup
+
+    def load_whitelist(self):
+        """Load and initialize the whitelist data."""
+        try:
+            # The snapshot is keyed on the journal too, so it already includes any replayed upserts
+            with self.startup_timer.measure('whitelist') as timing:
+                (self.whitelist, self.whitelist_lookup), timing['source'] = cached_load(
+                    [WHITELIST_PATH, self.whitelist_journal.journal_path], 'whitelist', self.read_whitelist
+                )
+            if timing['source'] == 'snapshot' and os.path.exists(self.whitelist_journal.journal_path):
+                # Keep replayed upserts pending so they still get compacted into the workbook
+                self.whitelist_journal.pending = len(self.whitelist_journal.read_entries())
+                
+        except FileNotFoundError:
+            print_to_csv("whitelist.xlsx not found. Creating new file.")
+            self.whitelist = pd.DataFrame(columns=['Title', 'Year', 'Information', 'Link'])
+            self.whitelist.to_excel(WHITELIST_PATH, index=False)
+
+    def read_incomplete_stats_whitelist(self):
+        """Read Incomplete_Stats_Whitelist.xlsx and build the URL lookup."""
+        # Read incomplete stats whitelist with explicit string type for Year column
+        incomplete_stats_whitelist = pd.read_excel(
+            INCOMPLETE_STATS_WHITELIST_PATH,
+            header=0,
+            names=['Title', 'Year', 'Blank', 'Link'],
+            dtype={'Year': str}
+        )
+        
+        # Normalize the data
+        incomplete_stats_whitelist['Title'] = incomplete_stats_whitelist['Title'].apply(normalize_text)
+        incomplete_stats_whitelist['Year'] = incomplete_stats_whitelist['Year'].astype(str).str.strip()
+        incomplete_stats_whitelist['Link'] = incomplete_stats_whitelist['Link'].fillna('')
+        
+        # Create a lookup dictionary for faster matching using URLs as keys
+        incomplete_stats_lookup = {}
+        for idx, row in incomplete_stats_whitelist.iterrows():
+            if row['Link']:  # Only store entries with URLs
+                incomplete_stats_lookup[row['Link']] = idx
+        return incomplete_stats_whitelist, incomplete_stats_lookup
+
+    def load_incomplete_stats_whitelist(self):
+        """Load and initialize the incomplete stats whitelist data."""
+        try:
+            with self.startup_timer.measure('incomplete stats') as timing:
+                (self.incomplete_stats_whitelist, self.incomplete_stats_lookup), timing['source'] = cached_load(
+                    INCOMPLETE_STATS_WHITELIST_PATH, 'incomplete_stats', self.read_incomplete_stats_whitelist
+                )
+                
+        except FileNotFoundError:
+            print_to_csv("Incomplete_Stats_Whitelist.xlsx not found. Creating new file.")
+            self.incomplete_stats_whitelist = pd.DataFrame(columns=['Title', 'Year', 'Link'])
+            self.incomplete_stats_whitelist.to_excel(INCOMPLETE_STATS_WHITELIST_PATH, index=False)
+
+    def read_zero_reviews(self):
+        """Read Zero_Reviews.xlsx and build the URL lookup."""
+        # Read zero reviews with explicit string type for Year column
+        zero_reviews = pd.read_excel(ZERO_REVIEWS_PATH, header=0, names=['Title', 'Year', 'Blank', 'Link'], dtype={'Year': str})
+        
+        # Normalize the data
+        zero_reviews['Title'] = zero_reviews['Title'].apply(normalize_text)
+        zero_reviews['Year'] = zero_reviews['Year'].astype(str).str.strip()
+        zero_reviews['Link'] = zero_reviews['Link'].fillna('')
+        zero_reviews['Blank'] = ''  # Ensure Blank column is empty
+                    
+        # Create a lookup dictionary for faster matching using URLs as keys
+        zero_reviews_lookup = {}
+        for idx, row in zero_reviews.iterrows():
+            if row['Link']:  # Only store entries with URLs
+                zero_reviews_lookup[row['Link']] = idx
+        return zero_reviews, zero_reviews_lookup
+
+    def load_zero_reviews(self):
+        """Load and initialize the zero reviews data."""
+        try:
+            # Check if file exists
+            if os.path.exists(ZERO_REVIEWS_PATH):
+                with self.startup_timer.measure('zero reviews') as timing:
+                    (self.zero_reviews, self.zero_reviews_lookup), timing['source'] = cached_load(
+                        ZERO_REVIEWS_PATH, 'zero_reviews', self.read_zero_reviews
+                    )
+                    
+            else:
+                self.zero_reviews = pd.DataFrame(columns=['Title', 'Year', 'Blank', 'Link'])
+                self.zero_reviews.to_excel(ZERO_REVIEWS_PATH, index=False)
+                
+        except Exception as e:
+            print_to_csv(f"ERROR loading zero reviews: {str(e)}")
+            print_to_csv(f"ERROR type: {type(e)}")
+            print_to_csv(f"ERROR details: {e.__dict__ if hasattr(e, '__dict__') else 'No details available'}")
+            raise  # Re-raise the exception to see the full traceback
+
+    def process_whitelist_info(self, info: Dict, film_url: str = None):
+        """Process information from whitelist and update statistics."""
+        if not isinstance(info, dict):
+            print_to_csv("❌ Info is not a dictionary, skipping")
+            return
+
+        # Create film_data entry
+        film_data = {
+            'Title': info.get('Title'),
+            'Year': info.get('Year'),
+            'tmdbID': info.get('tmdbID')
+        }
+
+        # Add to film data
+        self.film_data.append(film_data)
+
+        # Process MAX_MOVIES using centralized function - only call once
+        if add_to_MAX_MOVIES(info.get('Title'), info.get('Year'), info.get('tmdbID'), film_url):
+            
+            # Update statistics for MAX_MOVIES_stats
+            # Directors
+            for director in info.get('Directors', []):
+                MAX_MOVIES_stats['director_counts'][director] += 1
+
+            # Actors
+            for actor in info.get('Actors', []):
+                MAX_MOVIES_stats['actor_counts'][actor] += 1
+
+            # Decade
+            decade = info.get('Decade')
+            if decade:
+                MAX_MOVIES_stats['decade_counts'][decade] += 1
+
+            # Genres
+            for genre in info.get('Genres', []):
+                MAX_MOVIES_stats['genre_counts'][genre] += 1
+
+            # Studios
+            for studio in info.get('Studios', []):
+                MAX_MOVIES_stats['studio_counts'][studio] += 1
+
+            # Languages
+            for language in info.get('Languages', []):
+                MAX_MOVIES_stats['language_counts'][language] += 1
+
+            # Countries
+            for country in info.get('Countries', []):
+                MAX_MOVIES_stats['country_counts'][country] += 1
+     
+    def update_whitelist(self, film_title: str, release_year: str, movie_data: Dict, film_url: str = None) -> bool:
+        """Update whitelist with movie data using URL as primary identifier."""
+        if not film_url:
+            return False  # Can't update whitelist without URL
+            
+        try:
+            # Check if URL already exists in whitelist
+            if film_url in self.whitelist_lookup:
+                # Update existing entry
+                _, row_idx, _ = self.whitelist_lookup[film_url]
+                self.whitelist.at[row_idx, 'Information'] = json.dumps(movie_data)
+                self.whitelist_lookup[film_url] = (movie_data, row_idx, film_url)
+            else:
+                # Add new entry if URL not found
+                new_row = pd.DataFrame([{
+                    'Title': film_title,
+                    'Year': release_year,
+                    'Information': json.dumps(movie_data),
+                    'Link': film_url
+                }])
+                self.whitelist = pd.concat([self.whitelist, new_row], ignore_index=True)
+                self.whitelist_lookup[film_url] = (movie_data, len(self.whitelist) - 1, film_url)
+                print_to_csv(f"🔗 Added link to whitelist for {film_title}")
+            
+            # Journal the upsert instead of rewriting and reloading the whole workbook
+            with film_events.stage('whitelist_write'):
+                self.whitelist_journal.append(film_title, release_year, movie_data, film_url)
+                self.whitelist_journal.compact_if_due(self.whitelist)
+            return True
+            
+        except Exception as e:
+            print_to_csv(f"Error updating whitelist: {str(e)}")
+            return False
+
+    def save_whitelist(self):
+        """Compact the whitelist journal back into whitelist.xlsx."""
+        try:
+            if self.whitelist_journal.pending:
+                self.whitelist_journal.compact(self.whitelist)
+                print_to_csv("💾 Compacted whitelist journal into whitelist.xlsx")
+        except Exception as e:
+            print_to_csv(f"Error compacting whitelist journal: {str(e)}")
+
+    def get_whitelist_data(self, film_title: str, release_year: str = None, film_url: str = None) -> Optional[Tuple[Dict, int]]:
+        """Get the whitelist data for a movie if it exists. Only matches by URL."""
+        if not film_url:
+            return None, None  # Movie not in whitelist
+            
+        # Check if URL exists in whitelist lookup
+        if film_url in self.whitelist_lookup:
+            info, row_idx, _ = self.whitelist_lookup[film_url]
+            try:
+                # If info is a string, parse it as JSON
+                if isinstance(info, str):
+                    info = json.loads(info)
+                elif not isinstance(info, dict):
+                    print_to_csv(f"WARNING: Unexpected data type for {film_title}: {type(info)}")
+                    return None, None
+                    
+                return info, row_idx
+            except json.JSONDecodeError as e:
+                print_to_csv(f"ERROR parsing whitelist data for {film_title}: {str(e)}")
+                print_to_csv(f"Raw data: {info}")
+                return None, None
+            except Exception as e:
+                print_to_csv(f"ERROR processing whitelist data for {film_title}: {str(e)}")
+                return None, None
+                
+        return None, None  # Movie not in whitelist
+
+    def fetch_tmdb_details(self, tmdb_id: str) -> Optional[Tuple[List[str], List[str]]]:
+        cached = self.tmdb_cache.get(tmdb_id)
+        if cached is not None:
+            return cached
+
+        movie_url = f"https://api.themoviedb.org/3/movie/{tmdb_id}?api_key={TMDB_API_KEY}&append_to_response=keywords"
+        response = self.session.get(movie_url)
+
+        if response.status_code == 200:
+            movie_data = response.json()
+            keywords = [keyword['name'] for keyword in movie_data['keywords']['keywords']]
+            genre_elements = movie_data['genres']
+            genres = [genre['name'] for genre in genre_elements]
+            self.tmdb_cache.put(tmdb_id, keywords, genres)
+            return keywords, genres
+        else:
+            if response.status_code == 401:
+                print_to_csv("Check your API key.")
+            return None
+
+    def add_to_blacklist(self, film_title: str, release_year: str, reason: str, film_url: str = None) -> None:
+        """Add a movie to the blacklist if it fails a criteria, including the link if available. Never patch missing links in existing entries."""
+        if not film_url or not reason:
+            return
+            
+        # Check if URL already exists in lookup
+        if film_url in self.blacklist_lookup:
+            return
+            
+        # Add new entry
+        new_row = pd.DataFrame([[film_title, release_year, reason, film_url]],
+                               columns=['Title', 'Year', 'Reason', 'Link'])
+        self.blacklist = pd.concat([self.blacklist, new_row], ignore_index=True)
+        self.blacklist_lookup[film_url] = True
+        self.blacklist.to_excel(BLACKLIST_PATH, index=False)
+        print_to_csv(f"⚫ {film_title} ({release_year}) added to blacklist {reason}")
+
+    def is_whitelisted(self, film_title: str, release_year: str, film_url: str = None) -> bool:
+        """Check if a movie is in the whitelist using ONLY URL as identifier."""
+        if not film_url:
+            return False
+            
+        # Only check URL match, never use title/year
+        return film_url in self.whitelist_lookup
+
+    def extract_runtime(self, driver, film_title: str) -> Optional[int]:
+        try:
+            runtime_element = driver.find_element(By.CSS_SELECTOR, 'p.text-link.text-footer')
+            runtime_text = runtime_element.text
+            match = re.search(r'(\d+)\s*min(?:s)?', runtime_text)
+            if match:
+                runtime = int(match.group(1))
+                return runtime
+        except Exception:
+            pass
+        
+        print_to_csv(f"⚠️ No runtime found. Skipping {film_title}.")
+        return None
+
+    def update_MAX_MOVIES_statistics(self, film_title: str, release_year: str, tmdb_id: str, driver, film_url: str = None):
+        """Update statistics for the given movie for MAX_MOVIES."""
+        if not film_url:
+            print_to_csv("WARNING: No film URL provided for statistics update")
+            return
+
+        # Find the movie in film_data
+        movie_data = next((movie for movie in MAX_MOVIES_stats['film_data'] 
+                          if movie['Title'] == film_title and movie['Year'] == release_year), None)
+        
+        if not movie_data:
+            return
+
+        # Directors
+        try:
+            director_elements = driver.find_elements(By.CSS_SELECTOR, 'span.creatorlist a.contributor')
+            for director in director_elements:
+                director_name = director.text.strip()
+                if director_name:
+                    MAX_MOVIES_stats['director_counts'][director_name] += 1
+        except Exception:
+            pass
+
+        # Actors
+        try:
+            actor_elements = driver.find_elements(By.CSS_SELECTOR, '#tab-cast .text-sluglist a.text-slug.tooltip')
+            for actor in actor_elements:
+                actor_name = actor.text.strip()
+                if actor_name:
+                    MAX_MOVIES_stats['actor_counts'][actor_name] += 1
+        except Exception:
+            pass
+
+        # Decade
+        try:
+            meta_tag = driver.find_element(By.CSS_SELECTOR, 'meta[property="og:title"]')
+            content = meta_tag.get_attribute('content')
+            if content and '(' in content and ')' in content:
+                year = int(content.split('(')[-1].split(')')[0])
+                decade = (year // 10) * 10
+                MAX_MOVIES_stats['decade_counts'][decade] += 1
+        except Exception:
+            pass
+
+        # Genres - Only get main genres, not microgenres
+        try:
+            genre_elements = driver.find_elements(By.CSS_SELECTOR, '#tab-genres .text-sluglist a.text-slug[href*="/films/genre/"]')
+            genres = []
+            for genre in genre_elements:
+                genre_name = genre.get_attribute('textContent').strip()
+                if genre_name and not any(char in genre_name for char in ['…', 'Show All']):
+                    genres.append(genre_name)
+                    MAX_MOVIES_stats['genre_counts'][genre_name] += 1
+            movie_data['Genres'] = genres
+        except Exception:
+            pass
+
+        # Studios
+        try:
+            studio_elements = driver.find_elements(By.CSS_SELECTOR, '#tab-details .text-sluglist a.text-slug[href*="/studio/"]')
+            studios = []
+            for studio in studio_elements:
+                studio_name = studio.get_attribute('textContent').strip()
+                if studio_name:
+                    studios.append(studio_name)
+                    MAX_MOVIES_stats['studio_counts'][studio_name] += 1
+            movie_data['Studios'] = studios
+        except Exception:
+            pass
+
+        # Languages
+        try:
+            language_elements = driver.find_elements(By.CSS_SELECTOR, '#tab-details .text-sluglist a.text-slug[href*="/films/language/"]')
+            languages = []
+            for language in language_elements:
+                language_name = language.get_attribute('textContent').strip()
+                if language_name:
+                    languages.append(language_name)
+                    MAX_MOVIES_stats['language_counts'][language_name] += 1
+            movie_data['Languages'] = languages
+        except Exception:
+            pass
+
+        # Countries
+        try:
+            country_elements = driver.find_elements(By.CSS_SELECTOR, '#tab-details .text-sluglist a.text-slug[href*="/films/country/"]')
+            countries = []
+            for country in country_elements:
+                country_name = country.get_attribute('textContent').strip()
+                if country_name:
+                    countries.append(country_name)
+                    MAX_MOVIES_stats['country_counts'][country_name] += 1
+            movie_data['Countries'] = countries
+        except Exception:
+            pass
+
+    def is_blacklisted(self, film_title: str, release_year: str = None, film_url: str = None, driver = None) -> bool:
+        """Check if a movie is blacklisted using URL as primary identifier."""
+        if not film_url:
+            return False
+            
+        # Check if URL exists in blacklist lookup
+        return film_url in self.blacklist_lookup
+
+    def save_refreshed_data(self, film_title: str, release_year: str, tmdb_id: str, film_url: str = None, reason: str = "") -> None:
+        """Save information about movies that had their data reconstructed, using URL as primary identifier, and include the reason."""
+        if not film_url:
+            return
+        try:
+            # Check if file exists to determine if we need to write headers
+            file_exists = os.path.exists(os.path.join(BASE_DIR, 'Refreshed_Data.csv'))
+            with open(os.path.join(BASE_DIR, 'Refreshed_Data.csv'), mode='a', newline='', encoding='utf-8') as file:
+                writer = csv.writer(file)
+                if not file_exists:
+                    writer.writerow(['Title', 'Year', 'tmdbID', 'Link', 'Reason'])
+                writer.writerow([film_title, release_year, tmdb_id, film_url, reason])
+        except Exception as e:
+            print_to_csv(f"Error saving refreshed data: {str(e)}")
+
+    def is_incomplete_stats_whitelisted(self, film_title: str, release_year: str, film_url: str = None) -> bool:
+        """Check if a movie is in the incomplete stats whitelist using URL as primary identifier."""
+        if not film_url:
+            return False
+            
+        try:
+            # Check if URL exists in incomplete stats lookup
+            return film_url in self.incomplete_stats_lookup
+                
+        except Exception as e:
+            print_to_csv(f"ERROR checking incomplete stats whitelist: {str(e)}")
+            return False
+
+    def add_to_zero_reviews(self, film_title: str, release_year: str, film_url: str):
+        """Add a movie to the zero reviews list using URL as primary identifier."""
+        if not film_url:
+            return
+            
+        try:
+            # Check if URL already exists in lookup
+            if film_url in self.zero_reviews_lookup:
+                return
+                
+            # Create new row
+            new_row = pd.DataFrame([{
+                'Title': film_title,
+                'Year': release_year,
+                'Blank': '',
+                'Link': film_url
+            }])
+            # Add to DataFrame
+            self.zero_reviews = pd.concat([self.zero_reviews, new_row], ignore_index=True)
+            # Add to lookup
+            self.zero_reviews_lookup[film_url] = len(self.zero_reviews) - 1
+            # Save to Excel
+            self.zero_reviews.to_excel(ZERO_REVIEWS_PATH, index=False)
+                
+        except Exception as e:
+            print_to_csv(f"ERROR adding to zero reviews: {str(e)}")
+
+    def is_zero_reviews(self, film_title: str, release_year: str, film_url: str) -> bool:
+        """Check if a movie is in the zero reviews list using URL as primary identifier."""
+        if not film_url:
+            return False
+            
+        try:
+            # Check if URL exists in zero reviews lookup
+            if film_url in self.zero_reviews_lookup:
+                # 1 in 15 chance to remove the entry after finding it
+                if random.random() < (1/15):
+                    # Get the index from lookup
+                    idx_to_remove = self.zero_reviews_lookup[film_url]
+                    # Remove the row
+                    self.zero_reviews = self.zero_reviews.drop(idx_to_remove)
+                    # Remove from lookup
+                    del self.zero_reviews_lookup[film_url]
+                    # Save the updated DataFrame
+                    self.zero_reviews.to_excel(ZERO_REVIEWS_PATH, index=False)
+                    print_to_csv(f"🗑️  Removed {film_title} from zero reviews list")
+                return True
+            return False
+                
+        except Exception as e:
+            print_to_csv(f"ERROR checking zero reviews: {str(e)}")
+            return False
+
+def setup_webdriver() -> webdriver.Firefox:
+    options = Options()
+    options.headless = True
+    options.set_preference("permissions.default.image", 2)  # Disable images
+    options.set_preference("dom.ipc.plugins.enabled.libflashplayer.so", "false")
+    options.set_preference("browser.display.use_document_fonts", 0)
+    options.set_preference("browser.display.document_color_use", 2)
+    
+    # Add these preferences to prevent random downloads
+    options.set_preference("browser.download.folderList", 2)  # Use custom download location
+    options.set_preference("browser.download.manager.showWhenStarting", False)  # Don't show download manager
+    options.set_preference("browser.download.dir", os.path.join(BASE_DIR, "downloads"))  # Set download directory
+    options.set_preference("browser.helperApps.neverAsk.saveToDisk", "text/html,text/plain")  # Don't ask to save HTML files
+    options.set_preference("browser.helperApps.alwaysAsk.force", False)  # Don't force asking
+    options.set_preference("browser.download.manager.alertOnEXEOpen", False)  # Don't alert on exe downloads
+    options.set_preference("browser.download.manager.focusWhenStarting", False)  # Don't focus download manager
+    options.set_preference("browser.download.manager.useWindow", False)  # Don't use window for downloads
+    options.set_preference("browser.download.manager.showAlertOnComplete", False)  # Don't show alert when complete
+    options.set_preference("browser.download.manager.closeWhenDone", True)  # Close download manager when done
+    
+    # Add these optimizations:
+    options.set_preference("javascript.enabled", True)  # Keep JS enabled but optimize
+    options.set_preference("network.http.connection-timeout", 30)  # Reduce timeout
+    options.set_preference("network.http.max-connections-per-server", 10)  # Limit connections
+    options.set_preference("browser.cache.disk.enable", True)  # Enable disk cache
+    options.set_preference("browser.cache.memory.enable", True)  # Enable memory cache
+    
+    service = Service()
+    return webdriver.Firefox(service=service, options=options)
+
+def format_time(seconds):
+    """Format seconds into hours, minutes, seconds string"""
+    hours = int(seconds // 3600)
+    minutes = int((seconds % 3600) // 60)
+    seconds = int(seconds % 60)
+    
+    if hours > 0:
+        return f"{hours}h {minutes}m {seconds}s"
+    elif minutes > 0:
+        return f"{minutes}m {seconds}s"
+    else:
+        return f"{seconds}s"
+
+# Initialize stats for MAX_MOVIES
+MAX_MOVIES_stats = {
+    'film_data': [],  # Each entry will have Title, Year, tmdbID, and URL fields
+    'director_counts': defaultdict(int),
+    'actor_counts': defaultdict(int),
+    'decade_counts': defaultdict(int),
+    'genre_counts': defaultdict(int),
+    'studio_counts': defaultdict(int),
+    'language_counts': defaultdict(int),
+    'country_counts': defaultdict(int)
+}
+
+# Stage timings and the decision for every film the run handles
+film_events = FilmEventLog(EVENTS_PATH, 'Genre 250s')
+
+def add_to_MAX_MOVIES(film_title: str, release_year: str, tmdb_id: str, film_url: str) -> bool:
+    """
+    Centralized function to add a movie to MAX_MOVIES_stats if it's not already present.
+    Returns True if the movie was added, False if it was already present or if we've reached the limit.
+    """
+
+    if not film_url:
+        return False
+
+    # Check if movie already exists by URL
+    if any(movie['Link'] == film_url for movie in MAX_MOVIES_stats['film_data']):
+        return False
+
+    # Check if we've reached the limit
+    if len(MAX_MOVIES_stats['film_data']) >= MAX_MOVIES:
+        return False
+
+    # Add the movie
+    MAX_MOVIES_stats['film_data'].append({
+        'Title': film_title,  # For reference only
+        'Year': release_year,  # For reference only
+        'tmdbID': tmdb_id,
+        'Link': film_url  # Primary identifier
+    })
+    return True
+
+class LetterboxdScraper:
+    def __init__(self):
+        self.driver = setup_webdriver()
+        self.processor = MovieProcessor()
+        self.base_url = 'https://letterboxd.com/films/by/rating/'
+        self.list_name = None  # genre/sort type, set by main() with base_url
+        self.total_titles = 0
+        self.processed_titles = 0
+        self.valid_movies_count = 0
+        self.page_number = 1
+        self.start_time = time.time()
+        self.top_movies_count = 0  # Track the number of movies added to the top genre list
+        self.rejected_movies_count = 0  # Add counter for rejected movies
+        self.page_parser = FilmPageParser()
+        self.rate_controller = controller_for('letterboxd.com', print_to_csv)
+        self.fetcher = FilmFetcher(self.driver, self.page_parser,
+                                   create_film_session(cache=self.processor.http_cache, max_age=HTTP_CACHE_MAX_AGE))
+        self.pipeline = FilmPagePipeline(self.fetcher, FILM_FETCH_CONCURRENCY, on_page=self.prefetch_tmdb)
+        print_to_csv("Initialized Letterboxd Scraper.")
+
+    def fetch_film_page(self, film_url: str) -> FilmPage:
+        """Fetch and parse a film page over HTTP, loading it in the driver only if a required field is missing.
+
+        Pages the pipeline already requested for the current listing page are
+        taken from it instead of being fetched again.
+        """
+        start = time.perf_counter()
+        prefetched = self.pipeline.take(film_url)
+        if prefetched is not None:
+            film_events.add('page_wait', time.perf_counter() - start)
+        page = self.fetcher.fetch(film_url, prefetched)
+        film_events.fetched(self.fetcher.last_result, prefetched is not None)
+        return page
+
+    def start_film_event(self, film_url: str, film_title: str):
+        """Start timing a film, noting the counts its decision is read from."""
+        film_events.begin(film_url, film_title, list=self.list_name)
+        self.event_counts = (self.valid_movies_count, len(self.processor.rejected_data))
+
+    def finish_film_event(self):
+        """Write the current film's event: accepted if the count went up, rejected with its reason if it was rejected."""
+        if not film_events.active:
+            return
+        accepted, rejected = self.event_counts
+        if self.valid_movies_count > accepted:
+            film_events.end('accepted')
+        elif len(self.processor.rejected_data) > rejected:
+            film_events.end('rejected', self.processor.rejected_data[-1][3])
+        else:
+            film_events.end('skipped', film_events.film.get('reason'))
+
+    def prefetch_tmdb(self, page: FilmPage):
+        """Start the TMDB lookup for a prefetched page that will get as far as the keyword/genre filter."""
+        if page.tmdb_id and page.rating_count >= MIN_RATING_COUNT and page.runtime and page.runtime >= MIN_RUNTIME:
+            self.processor.tmdb_prefetcher.submit(page.tmdb_id)
+
+    def process_movie_data(self, info, film_title=None, film_url=None, page: FilmPage = None):
+        """Process movie data from the whitelist using URL as the primary identifier."""
+        try:
+            if not info or not film_url:
+                return False
+                
+            film_title = info.get('Title')  # Only for display purposes
+            release_year = info.get('Year')  # Only for display purposes
+            tmdb_id = info.get('tmdbID')  # Only for display purposes
+                        
+            # Process using URL as primary identifier
+            if self.processor.is_whitelisted(None, None, film_url):
+                # If in incomplete stats whitelist, skip all refreshes
+                if self.processor.is_incomplete_stats_whitelisted(film_title, release_year, film_url):
+                    with film_events.stage('stats_update'):
+                        self.processor.process_whitelist_info(info, film_url)
+                    self.valid_movies_count += 1
+                    print_to_csv(f"✅ Processed whitelist data for {film_title} ({self.valid_movies_count}/{MAX_MOVIES})")
+                    return True
+                # If info is empty or incomplete, collect fresh data
+                required_fields = [
+                    'Title', 'Year', 'Runtime', 'RatingCount',
+                    'Languages', 'Countries', 'Directors', 'Genres', 'Studios', 'Actors'
+                ]
+                missing_fields = [field for field in required_fields if not info.get(field)]
+                if not info or info == {} or missing_fields:
+                    # Only log to Refreshed_Data if info is partially filled (not empty, not just {}), and 4 or fewer fields are missing
+                    if missing_fields and info and info != {} and len(missing_fields) <= 4:
+                        reason = f"Missing or blank fields: {', '.join(missing_fields)}"
+                        self.processor.save_refreshed_data(film_title, release_year, tmdb_id, film_url, reason)
+                    try:
+                        # Fetch the page over HTTP and parse it once, unless the caller already did
+                        if page is None:
+                            page = self.fetch_film_page(film_url)
+                        release_year = page.release_year
+                        if page.tmdb_id:
+                            tmdb_id = page.tmdb_id
+                        else:
+                            print_to_csv(f"No TMDB ID found in page source for {film_title}")
+
+                        # Create updated movie data
+                        info = page.to_movie_data(film_title, release_year, tmdb_id)
+
+                        # Update whitelist with fresh data
+                        if self.processor.update_whitelist(film_title, release_year, info, film_url):
+                            print_to_csv(f"📝 Updated whitelist data for {film_title}")
+                    except Exception as e:
+                        print_to_csv(f"Error collecting fresh data for {film_title}: {str(e)}")
+                        self.processor.rejected_data.append([film_title, release_year, None, f'Error collecting data: {str(e)}'])
+                        return False
+                
+                # Process the whitelist information
+                with film_events.stage('stats_update'):
+                    self.processor.process_whitelist_info(info, film_url)
+                self.valid_movies_count += 1
+                print_to_csv(f"✅ Processed whitelist data for {film_title} ({self.valid_movies_count}/{MAX_MOVIES})")
+                
+                # 2% chance to clear the whitelist data for random auditing
+                if random.random() < 0.02:
+                    self.processor.update_whitelist(film_title, release_year, {}, film_url)
+                    print_to_csv(f"🤓 Random data audit scheduled for {film_title} ({release_year})")
+                
+                return True
+            
+            # If not whitelisted, process as a new movie
+            self.process_approved_movie(film_title, release_year, tmdb_id, film_url, 'unfiltered', page)
+            return True
+                
+        except Exception as e:
+            print_to_csv(f"Error processing movie data: {str(e)}")
+            print_to_csv(f"Error type: {type(e)}")
+            print_to_csv(f"Error details: {e.__dict__ if hasattr(e, '__dict__') else 'No details available'}")
+            return False
+
+    def scrape_movies(self):
+        seen_titles = set()  # <-- Add this at the start of the method
+
+        while self.valid_movies_count < MAX_MOVIES:
+            # Construct the URL for the current page
+            url = f'{self.base_url}page/{self.page_number}/'
+            print_to_csv(f"\nLoading page {self.page_number}: {url}")
+            
+            # Send a GET request to the URL with retry mechanism
+            page_retries = 20
+            for retry in range(page_retries):
+                try:
+                    self.rate_controller.wait()
+                    self.driver.get(url)
+                    # Wait for the page to load
+                    WebDriverWait(self.driver, 10).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, 'div.react-component.poster'))
+                    )
+                    break
+                except Exception as e:
+                    if retry == page_retries - 1:
+                        print_to_csv(f"❌ Failed to load page after {page_retries} attempts: {str(e)}")
+                        self.save_results_emergency()  # Save progress before exiting
+                        raise Exception(f"Failed to load page after {page_retries} attempts: {str(e)}")
+                    print_to_csv(f"Retry {retry + 1}/{page_retries} loading page {self.page_number}: {str(e)}")
+                    self.rate_controller.backoff("listing page failed to load")
+            
+            #time.sleep(random.uniform(1.0, 1.5))
+                    
+            # Find all film containers with retry mechanism
+            film_containers = []
+            container_retries = 25  # Maximum number of retries
+            for retry in range(container_retries):
+                try:
+                    film_containers = WebDriverWait(self.driver, 10).until(
+                        EC.presence_of_all_elements_located((By.CSS_SELECTOR, 'div.react-component.poster'))
+                    )
+                    if len(film_containers) == 72:  # Check for exactly 72 containers
+                        break
+                    else:
+                        print_to_csv(f"Found only {len(film_containers)} containers, retrying... (Attempt {retry + 1}/{container_retries})")
+                        self.rate_controller.backoff("incomplete listing page")
+                        self.driver.refresh()  # Refresh the page
+                        time.sleep(2)  # Wait for refresh
+                except Exception as e:
+                    if retry == container_retries - 1:
+                        print_to_csv(f"❌ Failed to find all 72 film containers after {container_retries} attempts: {str(e)}")
+                        self.save_results_emergency()  # Save progress before exiting
+                        raise Exception(f"Failed to find all 72 film containers after {container_retries} attempts: {str(e)}")
+                    print_to_csv(f"Retry {retry + 1}/{container_retries} finding film containers: {str(e)}")
+                    self.rate_controller.backoff("incomplete listing page")
+                    self.driver.refresh()
+                    time.sleep(2)
+            
+            if len(film_containers) != 72:
+                print_to_csv(f"❌ Failed to find all 72 film containers after {container_retries} attempts")
+                self.save_results_emergency()  # Save progress before exiting
+                raise Exception(f"Failed to find all 72 film containers after {container_retries} attempts")
+
+            self.rate_controller.success()
+            print_to_csv(f"\n{f' Page {self.page_number} ':=^100}")
+
+            # First collect all film data from the page
+            film_data_list = []
+            for container in film_containers:
+                try:
+                    # Get the anchor element first
+                    anchor = container.find_element(By.CSS_SELECTOR, 'a')
+                    film_url = anchor.get_attribute('href')
+                    
+                    # Get the film name from the data attribute
+                    film_title = container.get_attribute('data-film-name')
+                    
+                    if film_title and film_url:
+                        # Extract year from title if possible
+                        release_year = None
+                        if '(' in film_title and ')' in film_title:
+                            release_year = film_title.split('(')[-1].split(')')[0].strip()
+                        
+                        # Just check if title exists in blacklist, don't try to get release year yet
+                        is_blacklisted = self.processor.is_blacklisted(None, None, film_url, None)  # Pass None as driver
+                        film_data_list.append({
+                            'title': film_title,
+                            'url': film_url,
+                            'is_blacklisted': is_blacklisted,
+                            'release_year': release_year
+                        })
+                    else:
+                        print_to_csv(f"Missing data for movie - Title: {film_title}, URL: {film_url}")
+                        self.processor.rejected_data.append([film_title, None, None, 'Missing title or URL'])
+                except Exception as e:
+                    print_to_csv(f"Error collecting film data: {str(e)}")
+                    continue
+
+            print_to_csv(f"Collected {len(film_data_list)} movies from page {self.page_number}")
+            
+            if not film_data_list:
+                print_to_csv("No valid film data collected. Moving to next page...")
+                self.page_number += 1
+                continue
+
+            # Lookups left from the previous page belong to films that never reached the TMDB step
+            self.processor.tmdb_prefetcher.cancel_pending()
+
+            # Start fetching the pages of films that will need one; the loop below still takes them in order
+            # Plain lookups only: is_zero_reviews also randomly evicts entries, which the loop below does once per film
+            self.pipeline.submit([
+                film_data['url'] for film_data in film_data_list
+                if not film_data['is_blacklisted']
+                and not self.processor.is_whitelisted(None, None, film_data['url'])
+                and film_data['url'] not in self.processor.zero_reviews_lookup
+            ])
+
+            # Now process each film one by one
+            for film_data in film_data_list:
+                self.finish_film_event()
+                if self.valid_movies_count >= MAX_MOVIES:
+                    print_to_csv(f"\nReached the target of {MAX_MOVIES} successful movies. Stopping scraping.")
+                    return
+
+                film_title = film_data['title']
+                film_url = film_data['url']
+                release_year = film_data['release_year']
+                self.start_film_event(film_url, film_title)
+
+                # Get whitelist data using URL only
+                whitelist_info, _ = self.processor.get_whitelist_data(None, None, film_url)
+                film_events.note(whitelist='hit' if whitelist_info else 'miss')
+
+                # After processing, add the title to seen_titles for reference only
+                seen_titles.add(film_title.lower())
+
+                # Increment total_titles for each movie we process, including blacklisted ones
+                self.total_titles += 1
+                
+                # Check if movie is in zero reviews list
+                if self.processor.is_zero_reviews(film_title, release_year, film_url):
+                    print_to_csv(f"📊 {film_title} is in zero reviews list. Skipping.")
+                    self.processor.rejected_data.append([film_title, release_year, None, 'Zero reviews'])
+                    self.rejected_movies_count += 1  # Increment rejected counter
+                    continue
+                
+                # Handle blacklisted movies first
+                if film_data['is_blacklisted']:
+                    print_to_csv(f"❌ {film_title} was not added due to being blacklisted.")
+                    self.processor.rejected_data.append([film_title, release_year, None, 'Blacklisted'])
+                    self.rejected_movies_count += 1  # Increment rejected counter
+                    continue
+                
+                # First check for exact matches in whitelist
+                if whitelist_info:
+                    self.process_movie_data(whitelist_info, film_title, film_url)
+                    continue
+                                
+                # Get initial movie data without full scrape
+                movie_retries = 20  # Maximum number of retries for individual movie pages
+                for retry in range(movie_retries):
+                    try:
+                        # Fetch the page over HTTP and parse it once; the rating count decides whether anything else is needed
+                        page = self.fetch_film_page(film_url)
+                        rating_count = page.rating_count
+
+                        if rating_count == 0:
+                            # Extract title/year if not already known
+                            # Try to get year from the parsed page if not in film_data_list
+                            if not release_year:
+                                release_year = page.release_year
+                            print_to_csv(f"📊 {film_title} has no reviews. Adding to zero reviews list.")
+                            self.processor.add_to_zero_reviews(film_title, release_year, film_url)
+                            self.processor.rejected_data.append([film_title, release_year, None, 'Zero reviews'])
+                            self.rejected_movies_count += 1
+                            break  # Skip to next movie
+                        elif rating_count < MIN_RATING_COUNT:
+                            # Not enough reviews, skip immediately
+                            print_to_csv(f"❌ {film_title} was not added due to insufficient ratings: {rating_count} ratings.")
+                            self.processor.rejected_data.append([film_title, release_year, None, 'Insufficient ratings (< 1000)'])
+                            self.rejected_movies_count += 1
+                            break  # Skip to next movie
+                        # If here, rating_count >= 1000, proceed as before
+                        release_year = page.release_year
+                        tmdb_id = page.tmdb_id
+                        # Extract runtime
+                        runtime = None
+                        try:
+                            runtime = page.runtime
+                            if runtime is not None:
+                                if runtime < MIN_RUNTIME:
+                                    print_to_csv(f"❌ {film_title} was not added due to insufficient runtime: {runtime} minutes.")
+                                    self.processor.rejected_data.append([film_title, release_year, None, 'Insufficient runtime (< 40 minutes)'])
+                                    self.processor.add_to_blacklist(film_title, release_year, 'Insufficient runtime (< 40 minutes)', film_url)
+                                    self.rejected_movies_count += 1
+                                    break  # Skip to next movie
+                        except Exception as e:
+                            runtime = None
+                            print_to_csv(f"Error extracting runtime for {film_title}: {str(e)}")
+                        if runtime is None:
+                            runtime_retries = 5
+                            print_to_csv(f"⚠️ {film_title} skipped due to missing runtime")
+                            self.rejected_movies_count += 1  # Increase rejected movie count
+                            if retry < runtime_retries - 1:
+                                print_to_csv(f"Retrying... (Attempt {retry + 1}/{movie_retries})")
+                                self.rate_controller.backoff("film page retry")
+                                continue
+                        # If we get here, the movie passed all checks
+                        # Create movie data dictionary
+                        movie_data = {
+                            'Title': film_title,
+                            'Year': release_year,
+                            'tmdbID': tmdb_id,
+                            'MPAA': None,  # We don't need MPAA for processing
+                            'Runtime': runtime,
+                            'RatingCount': rating_count,
+                            'Languages': [],
+                            'Countries': [],
+                            'Decade': (int(release_year) // 10) * 10 if release_year else None,
+                            'Directors': [],
+                            'Genres': [],
+                            'Studios': [],
+                            'Actors': [],
+                            'Link': film_url
+                        }
+                        # Process the movie data
+                        self.process_movie_data(movie_data, film_title, film_url, page)
+                        break  # Break out of retry loop since we successfully processed the movie
+                    except Exception as e:
+                        if retry == movie_retries - 1:
+                            print_to_csv(f"❌ Failed to process movie after {movie_retries} attempts: {str(e)}")
+                            self.processor.rejected_data.append([film_title, release_year, None, f'Error: {str(e)}'])
+                        else:
+                            print_to_csv(f"Retry {retry + 1}/{movie_retries} processing movie: {str(e)}")
+                            self.rate_controller.backoff("film page retry")
+                            continue
+            
+            self.finish_film_event()
+            self.page_number += 1
+
+    def process_approved_movie(self, film_title: str, release_year: str, tmdb_id: str, film_url: str, approval_type: str, page: FilmPage = None):
+        """Process a movie that has been approved."""
+        try:
+            # Take the TMDB ID from the film page, fetching it if the caller has not
+            try:
+                if page is None:
+                    page = self.fetch_film_page(film_url)
+                if page.tmdb_id:
+                    tmdb_id = page.tmdb_id
+                else:
+                    print_to_csv(f"❌ {film_title} was not added due to missing TMDB ID.")
+                    self.processor.rejected_data.append([film_title, release_year, None, 'Missing TMDB ID'])
+                    self.processor.unfiltered_denied.append([film_title, release_year, None, film_url])
+                    self.rejected_movies_count += 1  # Increment rejected counter
+                    return
+            except Exception as e:
+                print_to_csv(f"Error extracting TMDB ID: {str(e)}")
+                print_to_csv(f"❌ {film_title} was not added due to missing TMDB ID.")
+                self.processor.rejected_data.append([film_title, release_year, None, 'Missing TMDB ID'])
+                self.processor.unfiltered_denied.append([film_title, release_year, None, film_url])
+                self.rejected_movies_count += 1  # Increment rejected counter
+                return
+
+            rating_count = page.rating_count
+            runtime = page.runtime
+
+            # Check if movie has zero reviews
+            if rating_count == 0:
+                print_to_csv(f"📊 {film_title} has no reviews. Adding to zero reviews list.")
+                self.processor.add_to_zero_reviews(film_title, release_year, film_url)
+                self.processor.rejected_data.append([film_title, release_year, None, 'Zero reviews'])
+                self.rejected_movies_count += 1  # Increment rejected counter
+                return
+
+            # Check minimum rating count
+            if rating_count < MIN_RATING_COUNT:
+                print_to_csv(f"❌ {film_title} was not added due to insufficient ratings: {rating_count} ratings.")
+                self.processor.rejected_data.append([film_title, release_year, None, 'Insufficient ratings (< 1000)'])
+                self.rejected_movies_count += 1  # Increment rejected counter
+                return
+
+            if runtime is None:
+                print_to_csv(f"❌ {film_title} was not added due to missing runtime.")
+                self.processor.rejected_data.append([film_title, release_year, None, 'Missing runtime'])
+                self.processor.unfiltered_denied.append([film_title, release_year, None, film_url])
+                self.rejected_movies_count += 1  # Increment rejected counter
+                return
+
+            if runtime < MIN_RUNTIME:
+                print_to_csv(f"❌ {film_title} was not added due to a short runtime of {runtime} minutes.")
+                self.processor.rejected_data.append([film_title, release_year, None, f'Short runtime of {runtime} minutes'])
+                self.processor.add_to_blacklist(film_title, release_year, f'Short runtime of {runtime} minutes', film_url)
+                self.rejected_movies_count += 1  # Increment rejected counter
+                return
+
+            # Check for blacklisted keywords and genres
+            with film_events.stage('tmdb'):
+                tmdb_data = self.processor.tmdb_prefetcher.result(tmdb_id)
+            if tmdb_data is None:
+                print_to_csv(f"❌ {film_title} was not added due to failed TMDB data fetch.")
+                self.processor.rejected_data.append([film_title, release_year, None, 'Failed TMDB data fetch'])
+                self.processor.unfiltered_denied.append([film_title, release_year, None, film_url])
+                self.rejected_movies_count += 1  # Increment rejected counter
+                return
+                
+            keywords, genres = tmdb_data
+            
+            # Check keywords - case insensitive comparison
+            matching_keywords = [k for k in FILTER_KEYWORDS if k.lower() in [kw.lower() for kw in keywords]]
+            if matching_keywords:
+                rejection_reason = f"due to being a {', '.join(matching_keywords)}."
+                print_to_csv(f"❌ {film_title} was not added {rejection_reason}")
+                self.processor.rejected_data.append([film_title, release_year, None, rejection_reason])
+                self.processor.add_to_blacklist(film_title, release_year, rejection_reason, film_url)
+                self.rejected_movies_count += 1  # Increment rejected counter
+                return
+            
+            # Check genres - case insensitive comparison
+            matching_genres = [g for g in FILTER_GENRES if g.lower() in [gen.lower() for gen in genres]]
+            if matching_genres:
+                rejection_reason = f"due to being a {', '.join(matching_genres)}."
+                print_to_csv(f"❌ {film_title} was not added {rejection_reason}")
+                self.processor.rejected_data.append([film_title, release_year, None, rejection_reason])
+                self.processor.add_to_blacklist(film_title, release_year, rejection_reason, film_url)
+                self.rejected_movies_count += 1  # Increment rejected counter
+                return
+
+            # If we reach here, the movie is approved
+            # Check if we've reached the limit BEFORE incrementing
+            if self.valid_movies_count >= MAX_MOVIES:
+                print_to_csv(f"⚠️ {film_title} would be the {self.valid_movies_count + 1}th movie, but we've reached the limit of {MAX_MOVIES}")
+                return
+            
+            self.valid_movies_count += 1
+            print_to_csv(f"✅ {film_title} was approved ({self.valid_movies_count}/{MAX_MOVIES})")
+            
+            # Add to unfiltered_approved
+            self.processor.unfiltered_approved.append([film_title, release_year, tmdb_id, film_url])
+            
+            # Add to film data
+            self.processor.film_data.append({
+                'Title': film_title,
+                'Year': release_year,
+                'tmdbID': tmdb_id,
+                'Link': film_url
+            })
+
+            # Add to MAX_MOVIES_stats if we haven't reached the limit
+            if len(MAX_MOVIES_stats['film_data']) < MAX_MOVIES:
+                MAX_MOVIES_stats['film_data'].append({
+                    'Title': film_title,
+                    'Year': release_year,
+                    'tmdbID': tmdb_id,
+                    'Link': film_url
+                })
+                # Update statistics for this movie
+                with film_events.stage('stats_update'):
+                    self.update_MAX_MOVIES_statistics(film_title, release_year, tmdb_id, self.driver, film_url, page)
+
+        except Exception as e:
+            print_to_csv(f"Error processing approved movie {film_title}: {str(e)}")
+            self.processor.rejected_data.append([film_title, release_year, None, f'Error processing: {str(e)}'])
+            return False
+
+    def update_MAX_MOVIES_statistics(self, film_title: str, release_year: str, tmdb_id: str, driver, film_url: str = None, page: FilmPage = None):
+        """Update statistics for the given movie for MAX_MOVIES."""
+        if not film_url:
+            print_to_csv("WARNING: No film URL provided for statistics update")
+            return
+
+        # Find the movie in film_data
+        movie_data = next((movie for movie in MAX_MOVIES_stats['film_data'] 
+                          if movie['Title'] == film_title and movie['Year'] == release_year), None)
+        
+        if not movie_data:
+            return
+
+        # Callers that already parsed the page pass it in; otherwise parse the loaded page once
+        if page is None:
+            page = self.page_parser.parse(driver.page_source)
+
+        # Directors
+        for director_name in page.directors:
+            MAX_MOVIES_stats['director_counts'][director_name] += 1
+
+        # Actors
+        for actor_name in page.actors:
+            MAX_MOVIES_stats['actor_counts'][actor_name] += 1
+
+        # Decade
+        try:
+            if page.release_year:
+                decade = (int(page.release_year) // 10) * 10
+                MAX_MOVIES_stats['decade_counts'][decade] += 1
+        except ValueError:
+            pass
+
+        # Genres - Only get main genres, not microgenres
+        for genre_name in page.genres:
+            MAX_MOVIES_stats['genre_counts'][genre_name] += 1
+        movie_data['Genres'] = list(page.genres)
+
+        # Studios
+        for studio_name in page.studios:
+            MAX_MOVIES_stats['studio_counts'][studio_name] += 1
+        movie_data['Studios'] = list(page.studios)
+
+        # Languages
+        for language_name in page.languages:
+            MAX_MOVIES_stats['language_counts'][language_name] += 1
+        movie_data['Languages'] = list(page.languages)
+
+        # Countries
+        for country_name in page.countries:
+            MAX_MOVIES_stats['country_counts'][country_name] += 1
+        movie_data['Countries'] = list(page.countries)
+
+    def save_MAX_MOVIES_results(self, genre, sort_type):
+        """Save results for MAX_MOVIES."""
+               
+        # Save movie data in chunks
+        num_chunks = (len(MAX_MOVIES_stats['film_data']) + CHUNK_SIZE - 1) // CHUNK_SIZE
+        for i in range(num_chunks):
+            start_idx = i * CHUNK_SIZE
+            end_idx = min((i + 1) * CHUNK_SIZE, len(MAX_MOVIES_stats['film_data']))
+            chunk_df = pd.DataFrame(MAX_MOVIES_stats['film_data'][start_idx:end_idx])
+            chunk_df = chunk_df[['Title', 'Year', 'tmdbID']]
+            output_path = os.path.join(BASE_DIR, f'top_250_{genre}_{sort_type}.csv')
+            chunk_df.to_csv(output_path, index=False, encoding='utf-8')
+
+        def get_ordinal(n):
+            if 10 <= n % 100 <= 20:
+                suffix = 'th'
+            else:
+                suffix = {1: 'st', 2: 'nd', 3: 'rd'}.get(n % 10, 'th')
+            return str(n) + suffix
+
+        current_date = datetime.now()
+        formatted_date = current_date.strftime('%B ') + get_ordinal(current_date.day) + f", {current_date.year}"
+
+        # Save statistics for this genre and sort type
+        stats_path = os.path.join(BASE_DIR, f'stats_top_250_{genre}_{sort_type}.txt')
+        
+        with open(stats_path, mode='w', encoding='utf-8') as file:
+            # Change "Animation" to "Animated" and "Science-fiction" to "Science Fiction"
+            formatted_header = genre.capitalize()
+            if formatted_header == "Animation":
+                formatted_header = "Animated"
+            if formatted_header == "Science-fiction":
+                formatted_header = "Science Fiction"
+
+            formatted_genre = genre.capitalize()
+            if formatted_genre == "Science-fiction":
+                formatted_genre = "Science Fiction"
+            
+            if sort_type == "popular":
+                file.write(f"<strong>The Top {len(MAX_MOVIES_stats['film_data'])} Most Popular {formatted_header} Narrative Feature Films on Letterboxd, as defined by Letterboxd.</strong>\n\n")
+            else:
+                file.write(f"<strong>The Top {len(MAX_MOVIES_stats['film_data'])} Highest Rated {formatted_header} Narrative Feature Films on Letterboxd, as defined by Letterboxd.</strong>\n\n")
+            file.write(f"<strong>Last updated: {formatted_date}</strong>\n\n")
+            file.write("<a href=https://letterboxd.com/bigbadraj/list/the-official-list-index/> Check out more of the lists I update regularly!</a>\n\n")
+            
+            # Write eligibility criteria
+            file.write("<strong>Film eligibility criteria:</strong>\n")
+            file.write("-- Must have a minimum of 1,000 reviews on Letterboxd.\n")
+            file.write("-- Cannot be a short film (minimum 40 minutes).\n")
+            file.write("-- Cannot be a television miniseries.\n")
+            file.write("-- Cannot be a compilation of short serials.\n")
+            file.write("-- Cannot be a documentary.\n")
+            file.write("-- Cannot be a non-narrative project (paint drying for 10 hours, a timelapse of the construction of a building, abstract images, etc).\n")
+            file.write("-- Cannot be a recording of a live performance (stand-up specials, recordings of live theater, concert films, etc).\n")
+            file.write("-- Cannot be a television special episode, though feature film spin-offs from television shows are allowed.\n")
+            file.write("-- Feature film spin-offs from television shows must contain original material, not just recap or compilation of existing material.\n")
+            file.write("-- Entries that have scores inflated because they share a name with a popular television show are removed, as I notice them.\n\n")
+
+            # Write all top 10 statistics
+            categories1 = [
+                ("directors", MAX_MOVIES_stats['director_counts']),
+                ("actors", MAX_MOVIES_stats['actor_counts']),
+                ("decades", MAX_MOVIES_stats['decade_counts'])
+            ]
+
+            for category_name, counts in categories1:
+                file.write(f"<strong>The ten most appearing {category_name}:</strong>\n")
+                sorted_items = sorted(counts.items(), key=lambda item: item[1], reverse=True)[:10]
+                for item, count in sorted_items:
+                    file.write(f"{item}: {count}\n")
+                file.write("\n")
+
+            # Add the specific genres excluding the main genre
+            top_genres = sorted(MAX_MOVIES_stats['genre_counts'].items(), key=lambda item: item[1], reverse=True)[1:11]  # Exclude the first genre
+            file.write(f"<strong>The Ten Most Appearing Genres (Excluding {formatted_genre}):</strong>\n")
+            for item, count in top_genres:
+                file.write(f"{item}: {count}\n")
+            file.write("\n")
+
+            categories2 = [
+                ("studios", MAX_MOVIES_stats['studio_counts']),
+                ("languages", MAX_MOVIES_stats['language_counts']),
+                ("countries", MAX_MOVIES_stats['country_counts'])
+            ]
+
+            for category_name, counts in categories2:
+                file.write(f"<strong>The ten most appearing {category_name}:</strong>\n")
+                sorted_items = sorted(counts.items(), key=lambda item: item[1], reverse=True)[:10]
+                for item, count in sorted_items:
+                    file.write(f"{item}: {count}\n")
+                file.write("\n")
+
+            file.write("<strong>Have a great day!</strong>")
+
+        print_to_csv(f"Top 10 statistics saved to stats_top_250_{genre}_{sort_type}.txt")
+
+    def save_results(self, genre, sort_type):
+        """Save all results to files"""
+        
+        # Track movies by title
+        title_to_movies = defaultdict(list)
+        
+        # Add approved movies
+        for movie in self.processor.film_data:
+            # Only add if not already in the list with the same tmdbID
+            if not any(m['tmdb_id'] == movie['tmdbID'] for m in title_to_movies[movie['Title'].lower()]):
+                title_to_movies[movie['Title'].lower()].append({
+                    'title': movie['Title'],
+                    'year': movie['Year'],
+                    'tmdb_id': movie['tmdbID'],
+                    'status': 'Approved'
+                })
+        
+        # Add rejected movies
+        for movie in self.processor.rejected_data:
+            if len(movie) >= 3:  # Ensure we have at least title, year, and reason
+                # Only add if not already in the list with the same tmdbID
+                if not any(m['tmdb_id'] == movie[2] for m in title_to_movies[movie[0].lower()]):
+                    title_to_movies[movie[0].lower()].append({
+                        'title': movie[0],
+                        'year': movie[1],
+                        'tmdb_id': movie[2] if len(movie) > 2 else 'N/A',
+                        'status': f'Rejected: {movie[3]}' if len(movie) > 3 else 'Rejected'
+                    })
+
+        # Save unfiltered approved data (append mode)
+        approved_path = os.path.join(BASE_DIR, 'unfiltered_approved.csv')
+        with open(approved_path, mode='a', newline='', encoding='utf-8') as file:
+            writer = csv.writer(file)
+            # Write header if file is empty
+            if file.tell() == 0:
+                writer.writerow(['Title', 'Year', 'Blank', 'URL', f'{genre.capitalize()} Top'])
+            for movie in self.processor.unfiltered_approved:
+                # Ensure we have at least title, year, and URL
+                if len(movie) >= 4:
+                    writer.writerow([movie[0], movie[1], '', movie[3], f'{genre.capitalize()} Top'])
+                else:
+                    print_to_csv(f"Warning: Movie data incomplete for {movie[0] if movie else 'Unknown'}")
+
+        # Save unfiltered denied data (append mode)
+        denied_path = os.path.join(BASE_DIR, 'unfiltered_denied.csv')
+        with open(denied_path, mode='a', newline='', encoding='utf-8') as file:
+            writer = csv.writer(file)
+            # Write header if file is empty
+            if file.tell() == 0:
+                writer.writerow(['Title', 'Year', 'Blank', 'URL', f'{genre.capitalize()} Top'])
+            for movie in self.processor.unfiltered_denied:
+                if len(movie) >= 4:
+                    writer.writerow([movie[0], movie[1], '', movie[3], f'{genre.capitalize()} Top'])
+                else:
+                    print_to_csv(f"Warning: Movie data incomplete for {movie[0] if movie else 'Unknown'}")
+
+        # Save MAX_MOVIES results
+        self.save_MAX_MOVIES_results(genre, sort_type)
+
+    def log_error_to_csv(self, error_message: str):
+        """Log error messages to update_results.csv."""
+        error_path = os.path.join(BASE_DIR, 'update_results.csv')
+        with open(error_path, mode='a', newline='', encoding='utf-8') as file:
+            writer = csv.writer(file)
+            writer.writerow(['Error Type', 'Error Message'])
+            writer.writerow([type(error_message).__name__, error_message])  # Write the error type and message
+
+    def update_statistics_for_movie(self, film_title: str, release_year: str, tmdb_id: str, driver, film_url: str = None):
+        """Update statistics for the given movie."""
+        try:
+            # Get movie data from whitelist
+            movie_data, _ = self.processor.get_whitelist_data(film_title, release_year, film_url)
+            if not movie_data:
+                return None
+
+            # Only update whitelist if the movie is already in it
+            if self.processor.is_whitelisted(film_title, release_year):
+                if self.processor.update_whitelist(film_title, release_year, movie_data, film_url):
+                    print_to_csv(f"📝 Successfully updated whitelist data for {film_title}")
+                    # Process through all output channels
+                    with film_events.stage('stats_update'):
+                        self.processor.process_whitelist_info(movie_data, film_url)
+                    
+                    self.valid_movies_count += 1
+                    print_to_csv(f"✅ Processed whitelist data for {film_title} ({self.valid_movies_count}/{MAX_MOVIES})")
+                    return movie_data
+
+        except Exception as e:
+            print_to_csv(f"Error in update_statistics_for_movie: {str(e)}")
+            return None
+    
+    def reset_MAX_MOVIES_stats(self):
+        """Reset MAX_MOVIES_stats for a new genre/sort type combination."""
+        global MAX_MOVIES_stats
+        MAX_MOVIES_stats = {
+            'film_data': [],  # Each entry will have Title, Year, tmdbID, and URL fields
+            'director_counts': defaultdict(int),
+            'actor_counts': defaultdict(int),
+            'decade_counts': defaultdict(int),
+            'genre_counts': defaultdict(int),
+            'studio_counts': defaultdict(int),
+            'language_counts': defaultdict(int),
+            'country_counts': defaultdict(int)
+        }
+
+    def reset_counters(self):
+        """Reset internal counters for a new genre/sort type combination."""
+        self.total_titles = 0
+        self.processed_titles = 0
+        self.valid_movies_count = 0
+        self.page_number = 1
+        self.start_time = time.time()
+        self.top_movies_count = 0
+        self.rejected_movies_count = 0
+        # Reset processor data for new genre/sort type
+        self.processor.film_data = []
+        self.processor.rejected_data = []
+        self.processor.unfiltered_approved = []
+        self.processor.unfiltered_denied = []
+
+    def save_results_emergency(self):
+        """Save results without genre/sort_type parameters for error handling."""
+        # Save unfiltered approved data (append mode)
+        approved_path = os.path.join(BASE_DIR, 'unfiltered_approved.csv')
+        with open(approved_path, mode='a', newline='', encoding='utf-8') as file:
+            writer = csv.writer(file)
+            # Write header if file is empty
+            if file.tell() == 0:
+                writer.writerow(['Title', 'Year', 'Blank', 'URL', 'Emergency'])
+            for movie in self.processor.unfiltered_approved:
+                # Ensure we have at least title, year, and URL
+                if len(movie) >= 4:
+                    writer.writerow([movie[0], movie[1], '', movie[3], 'Emergency'])
+                else:
+                    print_to_csv(f"Warning: Movie data incomplete for {movie[0] if movie else 'Unknown'}")
+
+        # Save unfiltered denied data (append mode)
+        denied_path = os.path.join(BASE_DIR, 'unfiltered_denied.csv')
+        with open(denied_path, mode='a', newline='', encoding='utf-8') as file:
+            writer = csv.writer(file)
+            # Write header if file is empty
+            if file.tell() == 0:
+                writer.writerow(['Title', 'Year', 'Blank', 'URL', 'Emergency'])
+            for movie in self.processor.unfiltered_denied:
+                if len(movie) >= 4:
+                    writer.writerow([movie[0], movie[1], '', movie[3], 'Emergency'])
+                else:
+                    print_to_csv(f"Warning: Movie data incomplete for {movie[0] if movie else 'Unknown'}")
+
+def main():
+    genres = GENRES  # List of genres to iterate through
+
+    start_time = time.time()
+    
+    for genre in genres:
+        for sort_type in ["rating", "popular"]:  # Loop through both "rating" and "popular"
+            try:
+                scraper = LetterboxdScraper()
+                scraper.base_url = f'https://letterboxd.com/films/genre/{genre}/by/{sort_type}/'  # Update base URL for the genre and sort type
+                scraper.list_name = f"{genre}/{sort_type}"
+                scraper.reset_MAX_MOVIES_stats()  # Reset statistics for new genre/sort type
+                scraper.reset_counters()  # Reset counters for new genre/sort type
+                scraper.scrape_movies()
+                scraper.save_results(genre, sort_type)  # Pass genre and sort_type to save_results
+
+                # Format final statistics
+                print_to_csv(f"\n{'Final Statistics':=^100}")
+                print_to_csv(f"{'Total movies scraped:':<30} {scraper.total_titles:>10}")
+                print_to_csv(f"{'Total accepted:':<30} {scraper.valid_movies_count:>10}")
+                print_to_csv(f"{'Total rejected:':<30} {scraper.rejected_movies_count:>10}")  # Use counter instead of len(rejected_data)
+                print_to_csv(f"{'Total unfiltered approved:':<30} {len(scraper.processor.unfiltered_approved):>10}")
+                print_to_csv(f"{'Total unfiltered denied:':<30} {len(scraper.processor.unfiltered_denied):>10}")
+
+                # Format execution time
+                execution_time = time.time() - start_time
+                print_to_csv(f"\n{'Execution Summary':=^100}")
+                print_to_csv(f"Total execution time: {format_time(execution_time)}")
+                print_to_csv(f"Average processing speed: {scraper.valid_movies_count / execution_time:.2f} movies/second")
+                scraper.fetcher.report(print_to_csv)
+                scraper.pipeline.report(print_to_csv)
+                report_rates(print_to_csv)
+                scraper.processor.tmdb_cache.report(print_to_csv)
+                scraper.processor.http_cache.report(print_to_csv)
+                scraper.processor.tmdb_prefetcher.report(print_to_csv)
+                film_events.report(print_to_csv)
+
+            except Exception as e:
+                print_to_csv(f"\n{'Error':=^100}")
+                print_to_csv(f"❌ An error occurred during execution: {e}")
+            finally:
+                # Ends a film an error cut short; the next combination reopens the file
+                film_events.close()
+                if 'scraper' in locals():
+                    scraper.processor.save_whitelist()
+                    # Close each on its own so one failing still shuts the others down
+                    for close in (scraper.pipeline.close, scraper.processor.tmdb_prefetcher.close, scraper.driver.quit):
+                        try:
+                            close()
+                        except Exception:
+                            pass
+
+if __name__ == "__main__":
+    run_profiled(main, 'Genre 250s', BASE_DIR, print_to_csv)
\ No newline at end of file
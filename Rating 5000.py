@@ -1,4 +1,5 @@
 # Import necessary libraries
+import argparse
 import time
 import random
 from selenium import webdriver
@@ -22,8 +23,24 @@ import unicodedata
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import json
-from selenium.common.exceptions import NoSuchElementException
+from film_store import FilmStore, STORE_FILENAME
+from whitelist_lookup import WhitelistLookup
+from film_page_parser import FilmPage, FilmPageParser
+from film_fetcher import FilmFetcher, create_film_session
+from http_cache import HTTP_CACHE_FILENAME, CachedSession, HttpCache
+import list_criteria
+from list_criteria import CONTINENTS_COUNTRIES, FILTER_GENRES, FILTER_KEYWORDS, MIN_RATING_COUNT, MIN_RUNTIME, STAT_NAMES
+from film_pipeline import FilmPagePipeline
+from rate_controller import controller_for, report_rates
+from tmdb_cache import CACHE_FILENAME, TmdbCache
+from tmdb_prefetch import TmdbPrefetcher
+from webdriver_pool import WebDriverPool
+from scrape_checkpoint import ScrapeCheckpoint, checkpoint_path_for
 from credentials_loader import load_credentials
+from output_log import output_log
+from film_events import FilmEventLog, events_path_for
+from stats_accumulator import StatsAccumulator, decade_of
+from script_profiler import add_profile_arguments, run_profiled
 
 # Detect operating system and set appropriate paths
 def get_os_specific_paths():
@@ -53,9 +70,7 @@ LIST_DIR = paths['base_dir']
 def print_to_csv(message: str):
     """Prints a message to the terminal and appends it to All_Outputs.csv."""
     print(message)  # Print to terminal
-    with open(os.path.join(output_dir, 'All_Outputs.csv'), mode='a', newline='', encoding='utf-8') as file:
-        writer = csv.writer(file)
-        writer.writerow([message])  # Write the message as a new row
+    output_log(os.path.join(output_dir, 'All_Outputs.csv')).write(message)  # Queued and appended to the file in batches
 
 # Configure locale and constants
 locale.setlocale(locale.LC_ALL, 'en_US.UTF-8')
@@ -66,10 +81,10 @@ MAX_MOVIES_RUNTIME = 250
 MAX_MOVIES_CONTINENT = 250
 
 # Configure settings
-MIN_RATING_COUNT = 1000
-MIN_RUNTIME = 40
+FILM_FETCH_CONCURRENCY = 8  # Film pages requested at once ahead of the scraping loop
+DRIVER_POOL_SIZE = 3  # Headless Firefox instances for film pages that need a browser
+DRIVER_RECYCLE_AFTER = 200  # Film pages a pooled browser loads before it is restarted
 MAX_RETRIES = 25
-RETRY_DELAY = 15
 CHUNK_SIZE = 1900
 
 # Configure specific maxes
@@ -85,26 +100,29 @@ MAX_MOVIES_SOUTH_AMERICA = 250
 BLACKLIST_PATH = os.path.join(LIST_DIR, 'blacklist.xlsx')
 WHITELIST_PATH = os.path.join(LIST_DIR, 'whitelist.xlsx')
 ZERO_REVIEWS_PATH = os.path.join(LIST_DIR, 'Zero_Reviews.xlsx')  # Add new path
+HTTP_CACHE_PATH = os.path.join(LIST_DIR, HTTP_CACHE_FILENAME)
+HTTP_CACHE_MAX_AGE = 0  # Seconds a stored Letterboxd page is reused without revalidating it
+TMDB_CACHE_PATH = os.path.join(LIST_DIR, CACHE_FILENAME)
+TMDB_CACHE_TTL_DAYS = 90  # Refetch TMDB keywords and genres older than this
+TMDB_WORKERS = 4  # TMDB lookups run at once ahead of the keyword/genre filter
+FILM_STORE_PATH = os.path.join(LIST_DIR, STORE_FILENAME)
+CHECKPOINT_PATH = checkpoint_path_for(LIST_DIR, 'Rating 5000')  # Written after every listing page; read with --resume
+EVENTS_PATH = events_path_for(output_dir, 'Rating 5000')  # One JSON line per film; summarize with film_events.py
+
+# What a checkpoint restores: the scraper's and MovieProcessor's per-run attributes, plus the module-level stats
+SCRAPER_RUN_FIELDS = ('page_number', 'total_titles', 'processed_titles', 'valid_movies_count', 'top_movies_count', 'rejected_movies_count',
+                      'unknown_continent_films', 'seen_titles', 'approved_saved', 'denied_saved')
+PROCESSOR_RUN_FIELDS = ('added_movies', 'film_data', 'rejected_data', 'unfiltered_approved', 'unfiltered_denied',
+                        'director_counts', 'actor_counts', 'decade_counts', 'genre_counts', 'studio_counts',
+                        'language_counts', 'country_counts', 'rating_counts', 'mpaa_counts')
 
 # Load credentials
 credentials = load_credentials()
 TMDB_API_KEY = credentials['TMDB_API_KEY']
 
-# Filtering criteria
-FILTER_KEYWORDS = {
-    'concert film', 'miniseries',
-    'live performance', 'filmed theater', 'live theater', 
-    'stand-up comedy', 'edited from tv series'
-}
-
-FILTER_GENRES = {'Documentary'}
-
 # Add new constants for MPAA ratings
-MPAA_RATINGS = ['G', 'PG', 'PG-13', 'R', 'NC-17']
-mpaa_stats = {rating: {'film_data': [], 'director_counts': defaultdict(int), 'actor_counts': defaultdict(int), 
-                       'decade_counts': defaultdict(int), 'genre_counts': defaultdict(int), 
-                       'studio_counts': defaultdict(int), 'language_counts': defaultdict(int), 
-                       'country_counts': defaultdict(int)} for rating in MPAA_RATINGS}  # Each entry will have Title, Year, tmdbID, and URL fields
+MPAA_RATINGS = [rating for rating in list_criteria.MPAA_RATINGS if rating != 'NR']  # The 5000 lists have no NR bucket
+mpaa_stats = {rating: {'film_data': [], 'stats': StatsAccumulator()} for rating in MPAA_RATINGS}  # Each entry will have Title, Year, tmdbID, and URL fields
 
 # Add new constants for runtime categories
 RUNTIME_CATEGORIES = {
@@ -114,52 +132,23 @@ RUNTIME_CATEGORIES = {
     '240_Minutes_or_Greater': []
 }
 
-runtime_stats = {
-    '90_Minutes_or_Less': {'film_data': [], 'director_counts': defaultdict(int), 'actor_counts': defaultdict(int), 
-                     'decade_counts': defaultdict(int), 'genre_counts': defaultdict(int), 
-                     'studio_counts': defaultdict(int), 'language_counts': defaultdict(int), 
-                     'country_counts': defaultdict(int)},  # Each entry will have Title, Year, tmdbID, and URL fields
-    '120_Minutes_or_Less': {'film_data': [], 'director_counts': defaultdict(int), 'actor_counts': defaultdict(int), 
-                      'decade_counts': defaultdict(int), 'genre_counts': defaultdict(int), 
-                      'studio_counts': defaultdict(int), 'language_counts': defaultdict(int), 
-                      'country_counts': defaultdict(int)},  # Each entry will have Title, Year, tmdbID, and URL fields
-    '180_Minutes_or_Greater': {'film_data': [], 'director_counts': defaultdict(int), 'actor_counts': defaultdict(int), 
-                         'decade_counts': defaultdict(int), 'genre_counts': defaultdict(int), 
-                         'studio_counts': defaultdict(int), 'language_counts': defaultdict(int), 
-                         'country_counts': defaultdict(int)},  # Each entry will have Title, Year, tmdbID, and URL fields
-    '240_Minutes_or_Greater': {'film_data': [], 'director_counts': defaultdict(int), 'actor_counts': defaultdict(int), 
-                         'decade_counts': defaultdict(int), 'genre_counts': defaultdict(int), 
-                         'studio_counts': defaultdict(int), 'language_counts': defaultdict(int), 
-                         'country_counts': defaultdict(int)}  # Each entry will have Title, Year, tmdbID, and URL fields
-}
-
-# Define continents and their associated countries in a case-insensitive manner
-CONTINENTS_COUNTRIES = {
-    'Africa': ['Ivory Coast', 'Algeria', 'Angola', 'Benin', 'Botswana', 'Burkina Faso', 'Burundi', 'Cabo Verde', 'Cameroon', 'Central African Republic', 'Chad', 'Comoros', 'Congo, Democratic Republic of the', 'Congo, Republic of the', 'Djibouti', 'Egypt', 'Equatorial Guinea', 'Eritrea', 'Eswatini', 'Ethiopia', 'Gabon', 'Gambia', 'Ghana', 'Guinea', 'Guinea-Bissau', 'Kenya', 'Lesotho', 'Liberia', 'Libya', 'Madagascar', 'Malawi', 'Mali', 'Mauritania', 'Mauritius', 'Morocco', 'Mozambique', 'Namibia', 'Niger', 'Nigeria', 'Rwanda', 'Sao Tome and Principe', 'Senegal', 'Seychelles', 'Sierra Leone', 'Somalia', 'South Africa', 'South Sudan', 'Sudan', 'Tanzania', 'Togo', 'Tunisia', 'Uganda', 'Zambia', 'Zimbabwe', 'Congo'],
-    'Asia': ['State of Palestine', 'Hong Kong', 'Afghanistan', 'Armenia', 'Azerbaijan', 'Bahrain', 'Bangladesh', 'Bhutan', 'Brunei', 'Cambodia', 'China', 'Cyprus', 'Georgia', 'India', 'Indonesia', 'Iran', 'Iraq', 'Israel', 'Japan', 'Jordan', 'Kazakhstan', 'Kuwait', 'Kyrgyzstan', 'Laos', 'Lebanon', 'Malaysia', 'Maldives', 'Mongolia', 'Myanmar', 'Nepal', 'North Korea', 'Oman', 'Pakistan', 'Palestine', 'Philippines', 'Qatar', 'Russia', 'Saudi Arabia', 'Singapore', 'South Korea', 'Sri Lanka', 'Syrian Arab Republic', 'Taiwan', 'Tajikistan', 'Thailand', 'Timor-Leste', 'Turkey', 'Turkmenistan', 'United Arab Emirates', 'Uzbekistan', 'Vietnam', 'Yemen', 'Syria'],
-    'Europe': ['East Germany', 'North Macedonia', 'Yugoslavia', 'Serbia and Montenegro', 'Czechoslovakia', 'Czechia', 'USSR', 'Albania', 'Latvia', 'Andorra', 'Liechtenstein', 'Armenia', 'Lithuania', 'Austria', 'Luxembourg', 'Azerbaijan', 'Malta', 'Belarus', 'Moldova', 'Belgium', 'Monaco', 'Bosnia and Herzegovina', 'Montenegro', 'Bulgaria', 'Netherlands', 'Croatia', 'Norway', 'Cyprus', 'Poland', 'Czech Republic', 'Portugal', 'Denmark', 'Romania', 'Estonia', 'Russia', 'Finland', 'San Marino', 'Former Yugoslav Republic of Macedonia', 'Serbia', 'France', 'Slovakia', 'Georgia', 'Slovenia', 'Germany', 'Spain', 'Greece', 'Sweden', 'Hungary', 'Switzerland', 'Iceland', 'Ireland', 'Turkey', 'Italy', 'Ukraine', 'Kosovo', 'UK'],
-    'North America': ['Bahamas', 'Guadeloupe', 'Cuba', 'The Bahamas', 'Bermuda', 'Canada', 'The Caribbean', 'Clipperton Island', 'Greenland', 'Mexico', 'Saint Pierre and Miquelon', 'Turks and Caicos Islands', 'USA', 'United States', 'Belize', 'Costa Rica', 'El Salvador', 'Guatemala', 'Honduras', 'Nicaragua', 'Panama', 'Dominican Republic', 'Haiti', 'Jamaica', 'Martinique', 'Netherlands Antilles', 'Puerto Rico'],
-    'Oceania': ['Australia', 'Fiji', 'Kiribati', 'Marshall Islands', 'Micronesia', 'Nauru', 'New Zealand', 'Palau', 'Papua New Guinea', 'Samoa', 'Solomon Islands', 'Tonga', 'Tuvalu', 'Vanuatu', 'French Polynesia'],
-    'South America': ['Argentina', 'Bolivia', 'Brazil', 'Chile', 'Colombia', 'Ecuador', 'Guyana', 'Paraguay', 'Peru', 'Suriname', 'Uruguay', 'Bolivarian Republic of Venezuela', 'The Falkland Islands', 'South Georgia and the South Sandwich Islands', 'French Guiana', 'Venezuela'],
-}
+runtime_stats = {category: {'film_data': [], 'stats': StatsAccumulator()}
+                 for category in RUNTIME_CATEGORIES}  # Each entry will have Title, Year, tmdbID, and URL fields
 
 # Initialize continent stats with additional counts
 continent_stats = {
     continent: {
         'film_data': [],  # Each entry will have Title, Year, tmdbID, and URL fields
-        'country_counts': defaultdict(int),
-        'director_counts': defaultdict(int),
-        'actor_counts': defaultdict(int),
-        'decade_counts': defaultdict(int),
-        'genre_counts': defaultdict(int),
-        'studio_counts': defaultdict(int),
-        'language_counts': defaultdict(int)
+        'stats': StatsAccumulator()
     } for continent in CONTINENTS_COUNTRIES.keys()
 }
 
 # Track unmapped countries
 unmapped_countries = set()
 
+# Stage timings and the decision for every film the run handles
+film_events = FilmEventLog(EVENTS_PATH, 'Rating 5000')
+
 @dataclass
 class MovieData:
     url: str  # Only identifier
@@ -172,12 +161,13 @@ class MovieData:
     genres: List[str] = None
 
 class RequestsSession:
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(self, cache: HttpCache = None):
+        self.session = CachedSession(cache, HTTP_CACHE_MAX_AGE, print_to_csv)
         retry_strategy = Retry(
             total=3,
             backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504]
+            # 429s and 5xx go back to the session, whose rate controller backs off before retrying them
+            respect_retry_after_header=False
         )
         adapter = HTTPAdapter(max_retries=retry_strategy)
         self.session.mount("https://", adapter)
@@ -191,28 +181,27 @@ def normalize_text(text):
 
 class MovieProcessor:
     def __init__(self):
-        self.session = RequestsSession()
+        self.http_cache = HttpCache(HTTP_CACHE_PATH)
+        self.session = RequestsSession(self.http_cache)
+        self.tmdb_cache = TmdbCache(TMDB_CACHE_PATH, TMDB_CACHE_TTL_DAYS)
+        self.tmdb_prefetcher = TmdbPrefetcher(self.fetch_tmdb_details, TMDB_WORKERS)
+        # All lists live in an indexed SQLite store; the workbooks are synced in and exported at the end of the run
+        self.store = FilmStore(FILM_STORE_PATH)
         self.whitelist = None
         self.whitelist_lookup = {}
-        self.zero_reviews = None
         self.zero_reviews_lookup = {}
         self.load_whitelist()
         self.load_zero_reviews()
         
-        # Update blacklist loading to include the Link column
-        self.blacklist = pd.read_excel(BLACKLIST_PATH, header=0, names=['Title', 'Year', 'Reason', 'Link'], usecols=[0, 1, 2, 3])
-        
-        # Normalize titles and years in blacklist
-        self.blacklist['Title'] = self.blacklist['Title'].apply(normalize_text)
-        self.blacklist['Year'] = self.blacklist['Year'].astype(str).str.strip()
-        # Fill empty links with empty string instead of None
-        self.blacklist['Link'] = self.blacklist['Link'].fillna('')
+        # Load the blacklist from the store, picking up any edits to blacklist.xlsx
+        self.store.sync_workbook('blacklist', BLACKLIST_PATH)
+        blacklist = self.store.load_frame('blacklist')
         
         # Create a lookup dictionary for faster matching using URLs as keys
         self.blacklist_lookup = {}
-        for idx, row in self.blacklist.iterrows():
-            if row['Link']:  # Only store entries with URLs
-                self.blacklist_lookup[row['Link']] = True
+        for link in blacklist['Link']:
+            if link:  # Only store entries with URLs
+                self.blacklist_lookup[link] = True
         
         self.added_movies: Set[Tuple[str, str]] = set()
         self.film_data: List[Dict] = []
@@ -233,63 +222,31 @@ class MovieProcessor:
 
     def load_whitelist(self):
         """Load and initialize the whitelist data."""
-        try:
-            # Read whitelist with explicit string type for Year column and include Information and Link columns
-            self.whitelist = pd.read_excel(WHITELIST_PATH, header=0, names=['Title', 'Year', 'Information', 'Link'], dtype={'Year': str})
-            
-            # Normalize the data
-            self.whitelist['Title'] = self.whitelist['Title'].apply(normalize_text)
-            self.whitelist['Year'] = self.whitelist['Year'].astype(str).str.strip()
-            # Fill empty links with empty string instead of None
-            self.whitelist['Link'] = self.whitelist['Link'].fillna('')
-            
-            # Create a lookup dictionary for faster matching using URLs as keys
-            self.whitelist_lookup = {}
-            for idx, row in self.whitelist.iterrows():
-                if row['Link']:  # Only store entries with URLs
-                    try:
-                        # Handle null/empty Information values by treating them as empty dictionaries
-                        if pd.isna(row['Information']) or row['Information'] == '':
-                            info = {}
-                        else:
-                            info = json.loads(row['Information']) if isinstance(row['Information'], str) else row['Information']
-                        self.whitelist_lookup[row['Link']] = (info, idx, row['Link'])  # Added URL to tuple
-                    except (json.JSONDecodeError, TypeError):
-                        # If there's any error parsing, treat it as an empty dictionary
-                        info = {}
-                        self.whitelist_lookup[row['Link']] = (info, idx, row['Link'])  # Added URL to tuple
-                        continue
-                
-        except FileNotFoundError:
-            print_to_csv("whitelist.xlsx not found. Creating new file.")
-            self.whitelist = pd.DataFrame(columns=['Title', 'Year', 'Information', 'Link'])
-            self.whitelist.to_excel(WHITELIST_PATH, index=False)
+        # Re-import whitelist.xlsx only if it was edited since the last sync, then read the store copy.
+        # Titles are already normalized and blank links are stored as empty strings.
+        self.store.sync_workbook('whitelist', WHITELIST_PATH)
+        self.whitelist = self.store.load_frame('whitelist')
+        
+        # Create a lookup dictionary for faster matching using URLs as keys; row ids are the store's primary keys.
+        # Information stays a raw JSON string until the film is looked up.
+        self.whitelist_lookup = WhitelistLookup()
+        for idx, information, link in zip(self.whitelist.index, self.whitelist['Information'], self.whitelist['Link']):
+            if link:  # Only store entries with URLs
+                self.whitelist_lookup[link] = (information, idx, link)  # Added URL to tuple
 
 
 
     def load_zero_reviews(self):
         """Load and initialize the zero reviews data."""
         try:
-            # Check if file exists
-            if os.path.exists(ZERO_REVIEWS_PATH):
-                # Read zero reviews with explicit string type for Year column
-                self.zero_reviews = pd.read_excel(ZERO_REVIEWS_PATH, header=0, names=['Title', 'Year', 'Blank', 'Link'], dtype={'Year': str})
-                
-                # Normalize the data
-                self.zero_reviews['Title'] = self.zero_reviews['Title'].apply(normalize_text)
-                self.zero_reviews['Year'] = self.zero_reviews['Year'].astype(str).str.strip()
-                self.zero_reviews['Link'] = self.zero_reviews['Link'].fillna('')
-                self.zero_reviews['Blank'] = ''  # Ensure Blank column is empty
+            self.store.sync_workbook('zero_reviews', ZERO_REVIEWS_PATH)
+            zero_reviews = self.store.load_frame('zero_reviews')
                             
-                # Create a lookup dictionary for faster matching using URLs as keys
-                self.zero_reviews_lookup = {}
-                for idx, row in self.zero_reviews.iterrows():
-                    if row['Link']:  # Only store entries with URLs
-                        self.zero_reviews_lookup[row['Link']] = idx
-                    
-            else:
-                self.zero_reviews = pd.DataFrame(columns=['Title', 'Year', 'Blank', 'Link'])
-                self.zero_reviews.to_excel(ZERO_REVIEWS_PATH, index=False)
+            # Create a lookup dictionary for faster matching using URLs as keys; values are store row ids
+            self.zero_reviews_lookup = {}
+            for idx, link in zip(zero_reviews.index, zero_reviews['Link']):
+                if link:  # Only store entries with URLs
+                    self.zero_reviews_lookup[link] = idx
                 
         except Exception as e:
             print_to_csv(f"ERROR loading zero reviews: {str(e)}")
@@ -313,6 +270,9 @@ class MovieProcessor:
         # Add to film data
         self.film_data.append(film_data)
 
+        # Runtime, MPAA and continent lists the film joins; counted below with one whitelist lookup
+        buckets = []
+
         # Process runtime category if we have runtime info
         runtime = info.get('Runtime')
         if runtime:
@@ -328,46 +288,17 @@ class MovieProcessor:
         
             for category in categories:
                 if add_to_runtime_stats(category, info.get('Title'), info.get('Year'), info.get('tmdbID'), film_url):
-                    self.update_runtime_statistics(info.get('Title'), info.get('Year'), info.get('tmdbID'), None, category)
+                    buckets.append(runtime_stats[category])
 
         # Process MAX_MOVIES_5000 using centralized function
         if add_to_max_movies_5000(info.get('Title'), info.get('Year'), info.get('tmdbID'), film_url):
-            
-            # Update statistics for max_5000_stats
-            # Directors
-            for director in info.get('Directors', []):
-                max_movies_5000_stats['director_counts'][director] += 1
-
-            # Actors
-            for actor in info.get('Actors', []):
-                max_movies_5000_stats['actor_counts'][actor] += 1
-
-            # Decade
-            decade = info.get('Decade')
-            if decade:
-                max_movies_5000_stats['decade_counts'][decade] += 1
-
-            # Genres
-            for genre in info.get('Genres', []):
-                max_movies_5000_stats['genre_counts'][genre] += 1
-
-            # Studios
-            for studio in info.get('Studios', []):
-                max_movies_5000_stats['studio_counts'][studio] += 1
-
-            # Languages
-            for language in info.get('Languages', []):
-                max_movies_5000_stats['language_counts'][language] += 1
-
-            # Countries
-            for country in info.get('Countries', []):
-                max_movies_5000_stats['country_counts'][country] += 1
+            max_movies_5000_stats['stats'].add(info)
 
         # Process MPAA rating if we have it
         mpaa_rating = info.get('MPAA')
         if mpaa_rating and mpaa_rating in MPAA_RATINGS:
             if add_to_mpaa_stats(mpaa_rating, info.get('Title'), info.get('Year'), info.get('tmdbID'), film_url):
-                self.update_statistics(mpaa_rating, film_url)
+                buckets.append(mpaa_stats[mpaa_rating])
 
         # Process continent data if we have countries
         countries = info.get('Countries', [])
@@ -383,7 +314,7 @@ class MovieProcessor:
                         # If continent not already added, add it to stats
                         if continent not in added_to_continent:
                             if add_to_continent_stats(continent, info.get('Title'), info.get('Year'), info.get('tmdbID'), film_url):
-                                self.update_continent_statistics(continent, film_url)
+                                buckets.append(continent_stats[continent])
                                 added_to_continent.add(continent)  # Mark the continent as processed
                         # Mark country as mapped regardless of whether continent was already added
                         country_mapped = True
@@ -404,6 +335,7 @@ class MovieProcessor:
                         self.unmapped_countries_movies[country].append(movie_info)
                     print_to_csv(f"DEBUG: {info.get('Title')} has unmapped country: {country}")
 
+        self.update_bucket_statistics(film_url, buckets)
 
             
     def update_whitelist(self, film_title: str, release_year: str, movie_data: Dict, film_url: str = None) -> bool:
@@ -412,38 +344,28 @@ class MovieProcessor:
             return False  # Can't update whitelist without URL
             
         try:
-            # Check if URL already exists in whitelist
-            for row_idx, row in self.whitelist.iterrows():
-                url = row.get('Link', '')
-                if url == film_url:
-                    # Update existing entry
-                    self.whitelist.at[row_idx, 'Information'] = json.dumps(movie_data)
-                    self.whitelist_lookup[film_url] = (movie_data, row_idx, film_url)
-                    # Save to Excel
-                    self.whitelist.to_excel(WHITELIST_PATH, index=False)
-                    self.load_whitelist()  # Reload to ensure consistency
-                    return True
-            
-            # Add new entry if URL not found
-            new_row = pd.DataFrame([{
-                'Title': film_title,
-                'Year': release_year,
-                'Information': json.dumps(movie_data),
-                'Link': film_url
-            }])
-            self.whitelist = pd.concat([self.whitelist, new_row], ignore_index=True)
-            self.whitelist_lookup[film_url] = (movie_data, len(self.whitelist) - 1, film_url)
-            print_to_csv(f"🔗 Added link to whitelist for {film_title}")
-            
-            # Save to Excel
-            self.whitelist.to_excel(WHITELIST_PATH, index=False)
-            self.load_whitelist()  # Reload to ensure consistency
+            is_new = film_url not in self.whitelist_lookup
+            # Transactional upsert keyed on the store's Link index
+            with film_events.stage('whitelist_write'):
+                row_idx = self.store.upsert('whitelist', film_title, release_year, json.dumps(movie_data), film_url, match_on='link')
+            self.whitelist_lookup[film_url] = (movie_data, row_idx, film_url)
+            if is_new:
+                print_to_csv(f"🔗 Added link to whitelist for {film_title}")
             return True
             
         except Exception as e:
             print_to_csv(f"Error updating whitelist: {str(e)}")
             return False
 
+    def save_lists(self):
+        """Export any lists changed during the run back to their workbooks."""
+        for table, path in [('whitelist', WHITELIST_PATH), ('blacklist', BLACKLIST_PATH), ('zero_reviews', ZERO_REVIEWS_PATH)]:
+            try:
+                if self.store.export_if_dirty(table, path):
+                    print_to_csv(f"💾 Exported {table} to {os.path.basename(path)}")
+            except Exception as e:
+                print_to_csv(f"Error exporting {table}: {str(e)}")
+
     def get_whitelist_data(self, film_title: str, release_year: str = None, film_url: str = None) -> Optional[Tuple[Dict, int]]:
         """Get the whitelist data for a movie if it exists. Only matches by URL."""
         if not film_url:
@@ -472,6 +394,10 @@ class MovieProcessor:
         return None, None  # Movie not in whitelist
 
     def fetch_tmdb_details(self, tmdb_id: str) -> Optional[Tuple[List[str], List[str]]]:
+        cached = self.tmdb_cache.get(tmdb_id)
+        if cached is not None:
+            return cached
+
         movie_url = f"https://api.themoviedb.org/3/movie/{tmdb_id}?api_key={TMDB_API_KEY}&append_to_response=keywords"
         response = self.session.get(movie_url)
 
@@ -480,6 +406,7 @@ class MovieProcessor:
             keywords = [keyword['name'] for keyword in movie_data['keywords']['keywords']]
             genre_elements = movie_data['genres']
             genres = [genre['name'] for genre in genre_elements]
+            self.tmdb_cache.put(tmdb_id, keywords, genres)
             return keywords, genres
         else:
             if response.status_code == 401:
@@ -496,11 +423,8 @@ class MovieProcessor:
             return
             
         # Add new entry
-        new_row = pd.DataFrame([[film_title, release_year, reason, film_url]],
-                               columns=['Title', 'Year', 'Reason', 'Link'])
-        self.blacklist = pd.concat([self.blacklist, new_row], ignore_index=True)
+        self.store.upsert('blacklist', film_title, release_year, reason, film_url, match_on='link')
         self.blacklist_lookup[film_url] = True
-        self.blacklist.to_excel(BLACKLIST_PATH, index=False)
         print_to_csv(f"⚫ {film_title} ({release_year}) added to blacklist {reason}")
 
     def is_whitelisted(self, film_title: str, release_year: str, film_url: str = None) -> bool:
@@ -540,241 +464,21 @@ class MovieProcessor:
             categories.append('240_Minutes_or_Greater')
                     
         # Add to each applicable category
-        for category in categories:
-            if add_to_runtime_stats(category, film_title, release_year, tmdb_id, film_url):
-                self.update_runtime_statistics(film_title, release_year, tmdb_id, driver, category, film_url)
-
-    def update_runtime_statistics(self, film_title: str, release_year: str, tmdb_id: str, driver, category: str, film_url: str = None):
-        """Update statistics for the given runtime category."""
-        # Get the most recently added movie from the runtime category's film_data
-        if not runtime_stats[category]['film_data']:
-            return
-            
-        latest_movie = runtime_stats[category]['film_data'][-1]
-        film_title = latest_movie['Title']
-        release_year = latest_movie['Year']
-        film_url = latest_movie['Link']  # Get URL from the movie data
-        
-        # Get the movie info from whitelist using URL
-        movie_info, _ = self.get_whitelist_data(None, None, film_url)
-        if not movie_info:
-            return
-        
-        # Update directors
-        for director in movie_info.get('Directors', []):
-            runtime_stats[category]['director_counts'][director] += 1
-
-        # Update actors
-        for actor in movie_info.get('Actors', []):
-            runtime_stats[category]['actor_counts'][actor] += 1
-
-        # Update decade
-        decade = movie_info.get('Decade')
-        if decade:
-            runtime_stats[category]['decade_counts'][decade] += 1
-
-        # Update genres
-        for genre in movie_info.get('Genres', []):
-            runtime_stats[category]['genre_counts'][genre] += 1
-
-        # Update studios
-        for studio in movie_info.get('Studios', []):
-            runtime_stats[category]['studio_counts'][studio] += 1
-
-        # Update languages
-        for language in movie_info.get('Languages', []):
-            runtime_stats[category]['language_counts'][language] += 1
-
-        # Update countries
-        for country in movie_info.get('Countries', []):
-            runtime_stats[category]['country_counts'][country] += 1
-
-    def update_statistics(self, mpaa_rating: str, film_url: str = None):
-        """Update statistics for the given MPAA rating."""
-        # Get the most recently added movie from the MPAA rating's film_data
-            
-        latest_movie = mpaa_stats[mpaa_rating]['film_data'][-1]
-        film_title = latest_movie['Title']
-        release_year = latest_movie['Year']
-        film_url = latest_movie['Link']  # Get URL from the movie data
-        
-        # Get the movie info from whitelist using URL
-        movie_info, _ = self.get_whitelist_data(None, None, film_url)
-        if not movie_info:
-            return
-        
-        # Update directors
-        for director in movie_info.get('Directors', []):
-            mpaa_stats[mpaa_rating]['director_counts'][director] += 1
-
-        # Update actors
-        for actor in movie_info.get('Actors', []):
-            mpaa_stats[mpaa_rating]['actor_counts'][actor] += 1
+        buckets = [runtime_stats[category] for category in categories
+                   if add_to_runtime_stats(category, film_title, release_year, tmdb_id, film_url)]
+        self.update_bucket_statistics(film_url, buckets)
 
-        # Update decade
-        decade = movie_info.get('Decade')
-        if decade:
-            mpaa_stats[mpaa_rating]['decade_counts'][decade] += 1
-
-        # Update genres
-        for genre in movie_info.get('Genres', []):
-            mpaa_stats[mpaa_rating]['genre_counts'][genre] += 1
-
-        # Update studios
-        for studio in movie_info.get('Studios', []):
-            mpaa_stats[mpaa_rating]['studio_counts'][studio] += 1
-
-        # Update languages
-        for language in movie_info.get('Languages', []):
-            mpaa_stats[mpaa_rating]['language_counts'][language] += 1
-
-        # Update countries
-        for country in movie_info.get('Countries', []):
-            mpaa_stats[mpaa_rating]['country_counts'][country] += 1
-
-    def update_continent_statistics(self, continent: str, film_url: str = None):
-        """Update statistics for the given continent."""
-        if not film_url:
-            print_to_csv("WARNING: No film URL provided for continent statistics update")
+    def update_bucket_statistics(self, film_url: str, buckets: List[Dict]):
+        """Count a movie in the stats of every bucket it was just added to, looking up its whitelist data once."""
+        if not buckets:
             return
 
-        # Get the most recently added movie from the continent's film_data
-        if not continent_stats[continent]['film_data']:
-            return
-            
-        latest_movie = continent_stats[continent]['film_data'][-1]
-        film_title = latest_movie['Title']
-        release_year = latest_movie['Year']
-        
-        # Get the movie info from whitelist
-        movie_info, _ = self.get_whitelist_data(film_title, release_year, film_url)
+        movie_info, _ = self.get_whitelist_data(None, None, film_url)
         if not movie_info:
             return
 
-        # Update directors
-        for director in movie_info.get('Directors', []):
-            continent_stats[continent]['director_counts'][director] += 1
-
-        # Update actors
-        for actor in movie_info.get('Actors', []):
-            continent_stats[continent]['actor_counts'][actor] += 1
-
-        # Update decade
-        decade = movie_info.get('Decade')
-        if decade:
-            continent_stats[continent]['decade_counts'][decade] += 1
-
-        # Update genres
-        for genre in movie_info.get('Genres', []):
-            continent_stats[continent]['genre_counts'][genre] += 1
-
-        # Update studios
-        for studio in movie_info.get('Studios', []):
-            continent_stats[continent]['studio_counts'][studio] += 1
-
-        # Update languages
-        for language in movie_info.get('Languages', []):
-            continent_stats[continent]['language_counts'][language] += 1
-
-        # Update countries
-        for country in movie_info.get('Countries', []):
-            continent_stats[continent]['country_counts'][country] += 1
-
-    def update_max_movies_5000_statistics(self, film_title: str, release_year: str, tmdb_id: str, driver, film_url: str = None):
-        """Update statistics for the given movie for MAX_MOVIES_5000."""
-        if not film_url:
-            print_to_csv("WARNING: No film URL provided for statistics update")
-            return
-
-        # Find the movie in film_data
-        movie_data = next((movie for movie in max_movies_5000_stats['film_data'] 
-                          if movie['Title'] == film_title and movie['Year'] == release_year), None)
-        
-        if not movie_data:
-            return
-
-        # Directors
-        try:
-            director_elements = driver.find_elements(By.CSS_SELECTOR, 'span.creatorlist a.contributor')
-            for director in director_elements:
-                director_name = director.text.strip()
-                if director_name:
-                    max_movies_5000_stats['director_counts'][director_name] += 1
-        except Exception:
-            pass
-
-        # Actors
-        try:
-            actor_elements = driver.find_elements(By.CSS_SELECTOR, '#tab-cast .text-sluglist a.text-slug.tooltip')
-            for actor in actor_elements:
-                actor_name = actor.text.strip()
-                if actor_name:
-                    max_movies_5000_stats['actor_counts'][actor_name] += 1
-        except Exception:
-            pass
-
-        # Decade
-        try:
-            meta_tag = driver.find_element(By.CSS_SELECTOR, 'meta[property="og:title"]')
-            content = meta_tag.get_attribute('content')
-            if content and '(' in content and ')' in content:
-                year = int(content.split('(')[-1].split(')')[0])
-                decade = (year // 10) * 10
-                max_movies_5000_stats['decade_counts'][decade] += 1
-        except Exception:
-            pass
-
-        # Genres - Only get main genres, not microgenres
-        try:
-            genre_elements = driver.find_elements(By.CSS_SELECTOR, '#tab-genres .text-sluglist a.text-slug[href*="/films/genre/"]')
-            genres = []
-            for genre in genre_elements:
-                genre_name = genre.get_attribute('textContent').strip()
-                if genre_name and not any(char in genre_name for char in ['…', 'Show All']):
-                    genres.append(genre_name)
-                    max_movies_5000_stats['genre_counts'][genre_name] += 1
-            movie_data['Genres'] = genres
-        except Exception:
-            pass
-
-        # Studios
-        try:
-            studio_elements = driver.find_elements(By.CSS_SELECTOR, '#tab-details .text-sluglist a.text-slug[href*="/studio/"]')
-            studios = []
-            for studio in studio_elements:
-                studio_name = studio.get_attribute('textContent').strip()
-                if studio_name:
-                    studios.append(studio_name)
-                    max_movies_5000_stats['studio_counts'][studio_name] += 1
-            movie_data['Studios'] = studios
-        except Exception:
-            pass
-
-        # Languages
-        try:
-            language_elements = driver.find_elements(By.CSS_SELECTOR, '#tab-details .text-sluglist a.text-slug[href*="/films/language/"]')
-            languages = []
-            for language in language_elements:
-                language_name = language.get_attribute('textContent').strip()
-                if language_name:
-                    languages.append(language_name)
-                    max_movies_5000_stats['language_counts'][language_name] += 1
-            movie_data['Languages'] = languages
-        except Exception:
-            pass
-
-        # Countries
-        try:
-            country_elements = driver.find_elements(By.CSS_SELECTOR, '#tab-details .text-sluglist a.text-slug[href*="/films/country/"]')
-            countries = []
-            for country in country_elements:
-                country_name = country.get_attribute('textContent').strip()
-                if country_name:
-                    countries.append(country_name)
-                    max_movies_5000_stats['country_counts'][country_name] += 1
-            movie_data['Countries'] = countries
-        except Exception:
-            pass
+        for bucket in buckets:
+            bucket['stats'].add(movie_info)
 
     def is_blacklisted(self, film_title: str, release_year: str = None, film_url: str = None, driver = None) -> bool:
         """Check if a movie is blacklisted using URL as primary identifier."""
@@ -794,19 +498,8 @@ class MovieProcessor:
             if film_url in self.zero_reviews_lookup:
                 return
                 
-            # Create new row
-            new_row = pd.DataFrame([{
-                'Title': film_title,
-                'Year': release_year,
-                'Blank': '',
-                'Link': film_url
-            }])
-            # Add to DataFrame
-            self.zero_reviews = pd.concat([self.zero_reviews, new_row], ignore_index=True)
-            # Add to lookup
-            self.zero_reviews_lookup[film_url] = len(self.zero_reviews) - 1
-            # Save to Excel
-            self.zero_reviews.to_excel(ZERO_REVIEWS_PATH, index=False)
+            # Add to store and lookup
+            self.zero_reviews_lookup[film_url] = self.store.upsert('zero_reviews', film_title, release_year, '', film_url, match_on='link')
                 
         except Exception as e:
             print_to_csv(f"ERROR adding to zero reviews: {str(e)}")
@@ -821,14 +514,9 @@ class MovieProcessor:
             if film_url in self.zero_reviews_lookup:
                 # 1 in 10 chance to remove the entry after finding it
                 if random.random() < (1/10):
-                    # Get the index from lookup
-                    idx_to_remove = self.zero_reviews_lookup[film_url]
-                    # Remove the row
-                    self.zero_reviews = self.zero_reviews.drop(idx_to_remove)
-                    # Remove from lookup
+                    # Remove the row from the store and the lookup
+                    self.store.delete('zero_reviews', self.zero_reviews_lookup[film_url])
                     del self.zero_reviews_lookup[film_url]
-                    # Save the updated DataFrame
-                    self.zero_reviews.to_excel(ZERO_REVIEWS_PATH, index=False)
                     print_to_csv(f"🗑️  Removed {film_title} from zero reviews list")
                 return True
             return False
@@ -880,77 +568,11 @@ def format_time(seconds):
     else:
         return f"{seconds}s"
 
-def extract_mpaa_rating(driver) -> Optional[str]:
-    """Extract the MPAA rating from the movie's page if the country is USA."""
-    try:
-        # Wait for the page to be fully loaded
-        wait = WebDriverWait(driver, 10)
-        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, '.release-country-list')))
-        
-        # Use JavaScript to extract all country data
-        js_script = """
-        const countries = Array.from(document.querySelectorAll('.release-country'));
-        return countries.map(country => {
-            const name = country.querySelector('.name')?.textContent?.trim() || '';
-            const rating = country.querySelector('.release-certification-badge .label')?.textContent?.trim() || '';
-            return { name, rating };
-        });
-        """
-        
-        country_data = driver.execute_script(js_script)
-        
-        # Collect all USA ratings
-        usa_ratings = []
-        for data in country_data:
-            name = data['name']
-            rating = data['rating']
-            
-            if name == "USA" and rating:
-                usa_ratings.append(rating)
-        
-        # If no USA ratings found, return None
-        if not usa_ratings:
-            return None
-        
-        # Check if ANY USA rating exists and is not unrated
-        # If there are any rated releases, use the most appropriate one
-        rating_map = {
-            'R': 'R',
-            'PG-13': 'PG-13',
-            'PG': 'PG',
-            'G': 'G',
-            'NC-17': 'NC-17',
-            'X': 'NC-17',  # Historical rating
-            'M': 'PG',     # Historical rating
-            'GP': 'PG',    # Historical rating
-        }
-        
-        # First, look for any rated releases (non-NR)
-        for rating in usa_ratings:
-            if rating.upper() not in ['NR', 'NOT RATED', 'UNRATED']:
-                if rating in rating_map:
-                    return rating_map[rating]
-        
-        # If all USA releases were unrated, skip this movie entirely
-        # This means the movie was never rated by the MPAA in the USA
-        return None
-        
-    except Exception as e:
-        # Only print error if it's not a NoSuchElementError
-        if not isinstance(e, NoSuchElementException):
-            print_to_csv(f"Error extracting MPAA rating: {str(e)}")
-        return None
-
 # Initialize stats for MAX_MOVIES_5000
 max_movies_5000_stats = {
     'film_data': [],  # Each entry will have Title, Year, tmdbID, and URL fields
-    'director_counts': defaultdict(int),
-    'actor_counts': defaultdict(int),
-    'decade_counts': defaultdict(int),
-    'genre_counts': defaultdict(int),
-    'studio_counts': defaultdict(int),
-    'language_counts': defaultdict(int),
-    'country_counts': defaultdict(int)
+    'film_links': set(),  # The Link of every film_data entry, for duplicate checks
+    'stats': StatsAccumulator()
 }
 
 def add_to_max_movies_5000(film_title: str, release_year: str, tmdb_id: str, film_url: str) -> bool:
@@ -974,6 +596,7 @@ def add_to_max_movies_5000(film_title: str, release_year: str, tmdb_id: str, fil
         'tmdbID': tmdb_id,
         'Link': film_url  # Primary identifier
     })
+    max_movies_5000_stats['film_links'].add(film_url)
     return True
 
 def add_to_continent_stats(continent: str, film_title: str, release_year: str, tmdb_id: str, film_url: str) -> bool:
@@ -1058,9 +681,87 @@ class LetterboxdScraper:
         self.unknown_continent_films = []  # Initialize the list for unknown continent films
         self.top_movies_count = 0  # Track the number of movies added to the top 5000 list
         self.rejected_movies_count = 0  # Add counter for rejected movies
+        self.page_parser = FilmPageParser()
+        self.rate_controller = controller_for('letterboxd.com', print_to_csv)
+        self.fetcher = FilmFetcher(self.driver, self.page_parser,
+                                   create_film_session(cache=self.processor.http_cache, max_age=HTTP_CACHE_MAX_AGE))
+        self.driver_pool = WebDriverPool(setup_webdriver, DRIVER_POOL_SIZE, DRIVER_RECYCLE_AFTER)
+        self.pipeline = FilmPagePipeline(self.fetcher, FILM_FETCH_CONCURRENCY, self.driver_pool, on_page=self.prefetch_tmdb)
+        self.seen_titles = set()
+        # Unfiltered approved/denied rows already appended to their CSVs, so a resumed run does not append them twice
+        self.approved_saved = 0
+        self.denied_saved = 0
+        self.checkpoint = ScrapeCheckpoint(CHECKPOINT_PATH, (self.base_url, MAX_MOVIES))
         print_to_csv("Initialized Letterboxd Scraper.")
 
-    def process_movie_data(self, info, film_title=None, film_url=None):
+    def save_checkpoint(self):
+        """Save everything the run has built so far; called once a listing page is finished."""
+        self.checkpoint.save({
+            'scraper': {name: getattr(self, name) for name in SCRAPER_RUN_FIELDS},
+            'processor': {name: getattr(self.processor, name) for name in PROCESSOR_RUN_FIELDS},
+            'mpaa_stats': mpaa_stats,
+            'runtime_stats': runtime_stats,
+            'continent_stats': continent_stats,
+            'max_movies_5000_stats': max_movies_5000_stats,
+        })
+
+    def resume_from_checkpoint(self) -> bool:
+        """Restore the last checkpoint so scraping carries on from the page after it. Returns False if there is none."""
+        loaded = self.checkpoint.load()
+        if loaded is None:
+            print_to_csv("No checkpoint to resume from; starting from page 1.")
+            return False
+        state, saved_at = loaded
+        for name, value in state['scraper'].items():
+            setattr(self, name, value)
+        for name, value in state['processor'].items():
+            setattr(self.processor, name, value)
+        # The stats dicts are updated in place because the add_to_* functions read them as module globals
+        for stats, saved in ((mpaa_stats, state['mpaa_stats']), (runtime_stats, state['runtime_stats']),
+                             (continent_stats, state['continent_stats']), (max_movies_5000_stats, state['max_movies_5000_stats'])):
+            stats.clear()
+            stats.update(saved)
+        print_to_csv(f"♻️ Resuming from page {self.page_number} with {self.valid_movies_count} films accepted "
+                     f"(checkpoint saved {datetime.fromtimestamp(saved_at):%Y-%m-%d %H:%M})")
+        return True
+
+    def fetch_film_page(self, film_url: str) -> FilmPage:
+        """Fetch and parse a film page over HTTP, loading it in the driver only if a required field is missing.
+
+        Pages the pipeline already requested for the current listing page are
+        taken from it instead of being fetched again.
+        """
+        start = time.perf_counter()
+        prefetched = self.pipeline.take(film_url)
+        if prefetched is not None:
+            film_events.add('page_wait', time.perf_counter() - start)
+        page = self.fetcher.fetch(film_url, prefetched)
+        film_events.fetched(self.fetcher.last_result, prefetched is not None)
+        return page
+
+    def start_film_event(self, film_url: str, film_title: str):
+        """Start timing a film, noting the counts its decision is read from."""
+        film_events.begin(film_url, film_title)
+        self.event_counts = (self.valid_movies_count, len(self.processor.rejected_data))
+
+    def finish_film_event(self):
+        """Write the current film's event: accepted if the count went up, rejected with its reason if it was rejected."""
+        if not film_events.active:
+            return
+        accepted, rejected = self.event_counts
+        if self.valid_movies_count > accepted:
+            film_events.end('accepted')
+        elif len(self.processor.rejected_data) > rejected:
+            film_events.end('rejected', self.processor.rejected_data[-1][3])
+        else:
+            film_events.end('skipped', film_events.film.get('reason'))
+
+    def prefetch_tmdb(self, page: FilmPage):
+        """Start the TMDB lookup for a prefetched page that will get as far as the keyword/genre filter."""
+        if page.tmdb_id and page.rating_count >= MIN_RATING_COUNT and page.runtime and page.runtime >= MIN_RUNTIME:
+            self.processor.tmdb_prefetcher.submit(page.tmdb_id)
+
+    def process_movie_data(self, info, film_title=None, film_url=None, page: FilmPage = None):
         """Process movie data from the whitelist using URL as the primary identifier."""
         try:
             if not info or not film_url:
@@ -1082,151 +783,18 @@ class LetterboxdScraper:
                 missing_fields = [field for field in required_fields if not info.get(field)]
                 if not info or info == {} or missing_fields:
                     try:
-                        self.driver.get(film_url)
-                        WebDriverWait(self.driver, 10).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, 'meta[property=\"og:title\"]'))
-                        )
-                        #time.sleep(random.uniform(1.0, 1.5))
-                        
-                        # Extract basic info
-                        meta_tag = self.driver.find_element(By.CSS_SELECTOR, 'meta[property="og:title"]')
-                        release_year = None
-                        if meta_tag:
-                            release_year_content = meta_tag.get_attribute('content')
-                            release_year = release_year_content.split('(')[-1].strip(')')
+                        # Fetch the page over HTTP and parse it once, unless the caller already did
+                        if page is None:
+                            page = self.fetch_film_page(film_url)
+                        release_year = page.release_year
+                        if page.tmdb_id:
+                            tmdb_id = page.tmdb_id
+                        else:
+                            print_to_csv(f"No TMDB ID found in page source for {film_title}")
 
-                        # Extract rating count
-                        rating_count = 0
-                        try:
-                            page_source = self.driver.page_source
-                            match = re.search(r'ratingCount":(\d+)', page_source)
-                            if match:
-                                rating_count = int(match.group(1))
-                            
-                            # Extract TMDB ID from body tag
-                            tmdb_match = re.search(r'data-tmdb-id="(\d+)"', page_source)
-                            if tmdb_match:
-                                tmdb_id = tmdb_match.group(1)
-                            else:
-                                print_to_csv(f"No TMDB ID found in page source for {film_title}")
-                        except Exception as e:
-                            print_to_csv(f"Error extracting rating count or TMDB ID: {str(e)}")
-                        
-                        # Extract runtime
-                        runtime = None
-                        try:
-                            runtime_element = WebDriverWait(self.driver, 10).until(
-                                EC.presence_of_element_located((By.CSS_SELECTOR, 'p.text-link.text-footer'))
-                            )
-                            runtime_text = runtime_element.text
-                            match = re.search(r'(\d+)\s*min(?:s)?', runtime_text)
-                            if match:
-                                runtime = int(match.group(1))
-                        except Exception as e:
-                            print_to_csv(f"Error extracting runtime: {str(e)}")
-                        
-                        # Extract directors
-                        movie_directors = []
-                        try:
-                            director_elements = self.driver.find_elements(By.CSS_SELECTOR, 'span.creatorlist a.contributor span.prettify')
-                            for director in director_elements:
-                                director_name = director.text.strip()
-                                if director_name:
-                                    movie_directors.append(director_name)
-                        except Exception:
-                            pass
-                        
-                        # Extract actors
-                        movie_actors = []
-                        try:
-                            actor_elements = self.driver.find_elements(By.CSS_SELECTOR, '#tab-cast .text-sluglist a.text-slug.tooltip')
-                            for actor in actor_elements:
-                                actor_name = actor.text.strip()
-                                if actor_name:
-                                    movie_actors.append(actor_name)
-                        except Exception as e:
-                            print_to_csv(f"Error extracting actors: {str(e)}")
-                        
-                        # Extract genres
-                        movie_genres = []
-                        try:
-                            genre_elements = self.driver.find_elements(By.CSS_SELECTOR, '#tab-genres .text-sluglist a.text-slug[href*="/films/genre/"]')
-                            for genre in genre_elements:
-                                genre_name = genre.get_attribute('textContent').strip()
-                                if genre_name and not any(char in genre_name for char in ['…', 'Show All']):
-                                    movie_genres.append(genre_name)
-                        except Exception as e:
-                            print_to_csv(f"Error extracting genres: {str(e)}")
-                        
-                        # Extract studios
-                        movie_studios = []
-                        try:
-                            studio_elements = self.driver.find_elements(By.CSS_SELECTOR, '#tab-details .text-sluglist a.text-slug[href*="/studio/"]')
-                            for studio in studio_elements:
-                                studio_name = studio.get_attribute('textContent').strip()
-                                if studio_name:
-                                    movie_studios.append(studio_name)
-                        except Exception as e:
-                            print_to_csv(f"Error extracting studios: {str(e)}")
-                        
-                        # Extract languages
-                        movie_languages = set()
-                        try:
-                            headings = self.driver.find_elements(By.CSS_SELECTOR, '#tab-details h3')
-                            for heading in headings:
-                                span = heading.find_element(By.TAG_NAME, 'span')
-                                heading_text = span.get_attribute('textContent').strip() if span else heading.get_attribute('textContent').strip()
-                                
-                                if any(lang in heading_text for lang in ["Language", "Primary Language", "Languages", "Primary Languages"]):
-                                    try:
-                                        sluglist = heading.find_element(By.XPATH, "following-sibling::div[contains(@class, 'text-sluglist')]")
-                                        if sluglist:
-                                            p_tag = sluglist.find_element(By.TAG_NAME, 'p')
-                                            language_elements = p_tag.find_elements(By.CSS_SELECTOR, 'a.text-slug[href*="/films/language/"]')
-                                            for language in language_elements:
-                                                language_name = language.get_attribute('textContent').strip()
-                                                if language_name:
-                                                    movie_languages.add(language_name)
-                                    except Exception:
-                                        pass
-                        except Exception:
-                            pass
-                        
-                        # Extract countries
-                        movie_countries = []
-                        try:
-                            country_elements = self.driver.find_elements(By.CSS_SELECTOR, '#tab-details .text-sluglist a.text-slug[href*="/films/country/"]')
-                            for country in country_elements:
-                                country_name = country.get_attribute('textContent').strip()
-                                if country_name:
-                                    movie_countries.append(country_name)
-                        except Exception as e:
-                            print_to_csv(f"Error extracting countries: {str(e)}")
-                        
-                        # Extract MPAA rating
-                        mpaa_rating = None
-                        try:
-                            mpaa_rating = extract_mpaa_rating(self.driver)
-                        except Exception as e:
-                            print_to_csv(f"Error extracting MPAA rating: {str(e)}")
-                        
                         # Create updated movie data
-                        info = {
-                            "Title": film_title,
-                            "Year": release_year,
-                            "tmdbID": tmdb_id,
-                            "MPAA": mpaa_rating,
-                            "Runtime": runtime,
-                            "RatingCount": rating_count,
-                            "Languages": list(movie_languages),
-                            "Countries": movie_countries,
-                            "Decade": (int(release_year) // 10) * 10 if release_year else None,
-                            "Directors": movie_directors,
-                            "Genres": movie_genres,
-                            "Studios": movie_studios,
-                            "Actors": movie_actors
-                        }
-                        
+                        info = page.to_movie_data(film_title, release_year, tmdb_id)
+
                         # Update whitelist with fresh data
                         if self.processor.update_whitelist(film_title, release_year, info, film_url):
                             print_to_csv(f"📝 Updated whitelist data for {film_title}")
@@ -1236,7 +804,8 @@ class LetterboxdScraper:
                         return False
                 
                 # Process the whitelist information regardless of MAX_MOVIES_5000 limit
-                self.processor.process_whitelist_info(info, film_url)
+                with film_events.stage('stats_update'):
+                    self.processor.process_whitelist_info(info, film_url)
                 self.valid_movies_count += 1
                 print_to_csv(f"✅ Processed whitelist data for {film_title} ({self.valid_movies_count}/{MAX_MOVIES})")
                 
@@ -1248,7 +817,7 @@ class LetterboxdScraper:
                 return True
             
             # If not whitelisted, process as a new movie
-            self.process_approved_movie(film_title, release_year, tmdb_id, film_url, 'unfiltered')
+            self.process_approved_movie(film_title, release_year, tmdb_id, film_url, 'unfiltered', page)
             return True
                 
         except Exception as e:
@@ -1258,7 +827,6 @@ class LetterboxdScraper:
             return False
 
     def scrape_movies(self):
-        seen_titles = set()  # <-- Add this at the start of the method
 
         while self.valid_movies_count < MAX_MOVIES:
             # Safety check: if we've tried too many pages without success, save and exit
@@ -1275,6 +843,7 @@ class LetterboxdScraper:
             page_retries = 20
             for retry in range(page_retries):
                 try:
+                    self.rate_controller.wait()
                     self.driver.get(url)
                     
                     # Check if page loaded successfully
@@ -1309,12 +878,12 @@ class LetterboxdScraper:
                         self.page_number += 1
                         continue
                     print_to_csv(f"Retry {retry + 1}/{page_retries} loading page {self.page_number}: {str(e)}")
-                    time.sleep(2)
+                    self.rate_controller.backoff("listing page failed to load")
                     
                     # Additional error handling for network issues
                     if "timeout" in str(e).lower() or "connection" in str(e).lower():
                         print_to_csv(f"⚠️ Network issue detected, waiting longer before retry...")
-                        time.sleep(10)  # Wait longer for network issues
+                        self.rate_controller.backoff("network error loading a listing page")
             
             #time.sleep(random.uniform(1.0, 1.5))
                     
@@ -1333,7 +902,7 @@ class LetterboxdScraper:
                         break
                     else:
                         print_to_csv(f"Found only {len(film_containers)} containers, retrying... (Attempt {retry + 1}/{container_retries})")
-                        time.sleep(5)  # Wait longer between retries
+                        self.rate_controller.backoff("incomplete listing page")
                         self.driver.refresh()  # Refresh the page
                         time.sleep(2)  # Wait for refresh
                 except Exception as e:
@@ -1343,14 +912,14 @@ class LetterboxdScraper:
                         self.page_number += 1
                         continue
                     print_to_csv(f"Retry {retry + 1}/{container_retries} finding film containers: {str(e)}")
-                    time.sleep(5)
+                    self.rate_controller.backoff("incomplete listing page")
                     self.driver.refresh()
                     time.sleep(2)
                     
                     # Additional error handling for specific issues
                     if "timeout" in str(e).lower():
                         print_to_csv(f"⚠️ Timeout detected, waiting longer before retry...")
-                        time.sleep(10)  # Wait longer for timeouts
+                        self.rate_controller.backoff("listing page timed out")
             
             if len(film_containers) < 30:  # More flexible threshold
                 print_to_csv(f"❌ Found only {len(film_containers)} film containers, which seems too low")
@@ -1358,6 +927,7 @@ class LetterboxdScraper:
                 self.page_number += 1
                 continue
 
+            self.rate_controller.success()
             print_to_csv(f"\n{f' Page {self.page_number} ':=^100}")
 
             # First collect all film data from the page
@@ -1464,8 +1034,21 @@ class LetterboxdScraper:
                 self.page_number += 1
                 continue
 
+            # Lookups left from the previous page belong to films that never reached the TMDB step
+            self.processor.tmdb_prefetcher.cancel_pending()
+
+            # Start fetching the pages of films that will need one; the loop below still takes them in order
+            # Plain lookups only: is_zero_reviews also randomly evicts entries, which the loop below does once per film
+            self.pipeline.submit([
+                film_data['url'] for film_data in film_data_list
+                if not film_data['is_blacklisted']
+                and not self.processor.is_whitelisted(None, None, film_data['url'])
+                and film_data['url'] not in self.processor.zero_reviews_lookup
+            ])
+
             # Now process each film one by one
             for film_data in film_data_list:
+                self.finish_film_event()
                 if self.valid_movies_count >= MAX_MOVIES:
                     print_to_csv(f"✅ {MAX_MOVIES} unique movies successfully scraped. Stopping scraping.")
                     return
@@ -1473,12 +1056,14 @@ class LetterboxdScraper:
                 film_title = film_data['title']
                 film_url = film_data['url']
                 release_year = film_data['release_year']
+                self.start_film_event(film_url, film_title)
 
                 # Get whitelist data using URL only
                 whitelist_info, _ = self.processor.get_whitelist_data(None, None, film_url)
+                film_events.note(whitelist='hit' if whitelist_info else 'miss')
 
                 # After processing, add the title to seen_titles for reference only
-                seen_titles.add(film_title.lower())
+                self.seen_titles.add(film_title.lower())
 
                 # Increment total_titles for each movie we process, including blacklisted ones
                 self.total_titles += 1
@@ -1498,8 +1083,9 @@ class LetterboxdScraper:
                     continue
                 
                 # Check if URL has already been processed in this scrape session (duplicate prevention)
-                if any(movie['Link'] == film_url for movie in max_movies_5000_stats['film_data']):
+                if film_url in max_movies_5000_stats['film_links']:
                     print_to_csv(f"⚠️ {film_title} was already processed in this session. Skipping.")
+                    film_events.note(reason='Already processed this run')
                     continue
                 
                 # First check for exact matches in whitelist
@@ -1508,6 +1094,7 @@ class LetterboxdScraper:
                     # Check again after whitelist processing
                     if self.valid_movies_count >= MAX_MOVIES:
                         print_to_csv(f"✅ {MAX_MOVIES} unique movies successfully scraped. Stopping scraping.")
+                        self.finish_film_event()
                         return
                     continue
                                 
@@ -1515,34 +1102,22 @@ class LetterboxdScraper:
                 movie_retries = 20  # Maximum number of retries for individual movie pages
                 for retry in range(movie_retries):
                     try:
-                        self.driver.get(film_url)
+                        # Fetch the page over HTTP and parse it once; the rating count decides whether anything else is needed
+                        page = self.fetch_film_page(film_url)
                         
                         # Check if we got redirected to an error page
-                        try:
-                            page_title = self.driver.title
-                            if "not found" in page_title.lower() or "error" in page_title.lower():
-                                print_to_csv(f"⚠️ Movie page appears to be an error page: {page_title}")
-                                break  # Skip to next movie
-                        except:
-                            pass
+                        if not page.og_title:
+                            print_to_csv(f"⚠️ Movie page appears to be an error page: {film_url}")
+                            film_events.note(reason='Error page')
+                            break  # Skip to next movie
                         
-                        # Only wait for the page source to be available, not for any specific element
-                        page_source = self.driver.page_source
-                        # Extract rating count as fast as possible
-                        match = re.search(r'ratingCount":(\d+)', page_source)
-                        rating_count = int(match.group(1)) if match else 0
+                        rating_count = page.rating_count
 
                         if rating_count == 0:
                             # Extract title/year if not already known
-                            # Try to get year from meta tag if not in film_data_list
+                            # Try to get year from the parsed page if not in film_data_list
                             if not release_year:
-                                try:
-                                    meta_tag = self.driver.find_element(By.CSS_SELECTOR, 'meta[property="og:title"]')
-                                    if meta_tag:
-                                        release_year_content = meta_tag.get_attribute('content')
-                                        release_year = release_year_content.split('(')[-1].strip(')')
-                                except Exception:
-                                    release_year = None
+                                release_year = page.release_year
                             print_to_csv(f"📊 {film_title} has no reviews. Adding to zero reviews list.")
                             self.processor.add_to_zero_reviews(film_title, release_year, film_url)
                             self.processor.rejected_data.append([film_title, release_year, None, 'Zero reviews'])
@@ -1555,32 +1130,13 @@ class LetterboxdScraper:
                             self.rejected_movies_count += 1
                             break  # Skip to next movie
                         # If here, rating_count >= 1000, proceed as before
-                        WebDriverWait(self.driver, 10).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, 'meta[property="og:title"]'))
-                        )
-                        meta_tag = self.driver.find_element(By.CSS_SELECTOR, 'meta[property="og:title"]')
-                        release_year = None
-                        if meta_tag:
-                            release_year_content = meta_tag.get_attribute('content')
-                            release_year = release_year_content.split('(')[-1].strip(')')
-                        # Extract TMDB ID from body tag
-                        tmdb_id = None
-                        try:
-                            tmdb_match = re.search(r'data-tmdb-id="(\d+)"', page_source)
-                            if tmdb_match:
-                                tmdb_id = tmdb_match.group(1)
-                        except Exception as e:
-                            print_to_csv(f"Error extracting TMDB ID: {str(e)}")
+                        release_year = page.release_year
+                        tmdb_id = page.tmdb_id
                         # Extract runtime
                         runtime = None
                         try:
-                            runtime_element = WebDriverWait(self.driver, 10).until(
-                                EC.presence_of_element_located((By.CSS_SELECTOR, 'p.text-link.text-footer'))
-                            )
-                            runtime_text = runtime_element.text
-                            match = re.search(r'(\d+)\s*min(?:s)?', runtime_text)
-                            if match:
-                                runtime = int(match.group(1))
+                            runtime = page.runtime
+                            if runtime is not None:
                                 if runtime < MIN_RUNTIME:
                                     print_to_csv(f"❌ {film_title} was not added due to insufficient runtime: {runtime} minutes.")
                                     self.processor.rejected_data.append([film_title, release_year, None, 'Insufficient runtime (< 40 minutes)'])
@@ -1596,7 +1152,7 @@ class LetterboxdScraper:
                             self.rejected_movies_count += 1  # Increase rejected movie count
                             if retry < runtime_retries - 1:
                                 print_to_csv(f"Retrying... (Attempt {retry + 1}/{movie_retries})")
-                                time.sleep(2)
+                                self.rate_controller.backoff("film page retry")
                                 continue
                         # If we get here, the movie passed all checks
                         # Create movie data dictionary
@@ -1617,10 +1173,11 @@ class LetterboxdScraper:
                             'Link': film_url
                         }
                         # Process the movie data
-                        self.process_movie_data(movie_data, film_title, film_url)
+                        self.process_movie_data(movie_data, film_title, film_url, page)
                         # Check again after processing
                         if self.valid_movies_count >= MAX_MOVIES:
                             print_to_csv(f"✅ {MAX_MOVIES} unique movies successfully scraped. Stopping scraping.")
+                            self.finish_film_event()
                             return
                         break  # Break out of retry loop since we successfully processed the movie
                     except Exception as e:
@@ -1631,22 +1188,25 @@ class LetterboxdScraper:
                             break  # Skip to next movie
                         else:
                             print_to_csv(f"Retry {retry + 1}/{movie_retries} processing movie: {str(e)}")
-                            time.sleep(2)
+                            self.rate_controller.backoff("film page retry")
                             continue
             
+            self.finish_film_event()
             self.page_number += 1
+            # The page is done, so a crash from here on resumes at the next one
+            self.save_checkpoint()
 
 
 
-    def process_approved_movie(self, film_title: str, release_year: str, tmdb_id: str, film_url: str, approval_type: str):
+    def process_approved_movie(self, film_title: str, release_year: str, tmdb_id: str, film_url: str, approval_type: str, page: FilmPage = None):
         """Process a movie that has been approved."""
         try:
-            # Extract TMDB ID from page source
+            # Take the TMDB ID from the film page, fetching it if the caller has not
             try:
-                page_source = self.driver.page_source
-                tmdb_match = re.search(r'data-tmdb-id="(\d+)"', page_source)
-                if tmdb_match:
-                    tmdb_id = tmdb_match.group(1)
+                if page is None:
+                    page = self.fetch_film_page(film_url)
+                if page.tmdb_id:
+                    tmdb_id = page.tmdb_id
                 else:
                     print_to_csv(f"❌ {film_title} was not added due to missing TMDB ID.")
                     self.processor.rejected_data.append([film_title, release_year, None, 'Missing TMDB ID'])
@@ -1661,24 +1221,8 @@ class LetterboxdScraper:
                 self.rejected_movies_count += 1  # Increment rejected counter
                 return
 
-            # Extract rating count
-            rating_count = 0
-            try:
-                match = re.search(r'ratingCount":(\d+)', page_source)
-                if match:
-                    rating_count = int(match.group(1))
-            except Exception as e:
-                print_to_csv(f"Error extracting rating count: {str(e)}")
-
-            # Extract runtime using Selenium
-            runtime = None
-            try:
-                runtime_text = self.driver.find_element(By.CSS_SELECTOR, 'p.text-link.text-footer').text
-                match = re.search(r'(\d+)\s*min(?:s)?', runtime_text)
-                if match:
-                    runtime = int(match.group(1))
-            except Exception:
-                runtime = None
+            rating_count = page.rating_count
+            runtime = page.runtime
 
             # Check if movie has zero reviews
             if rating_count == 0:
@@ -1710,7 +1254,8 @@ class LetterboxdScraper:
                 return
 
             # Check for blacklisted keywords and genres
-            tmdb_data = self.processor.fetch_tmdb_details(tmdb_id)
+            with film_events.stage('tmdb'):
+                tmdb_data = self.processor.tmdb_prefetcher.result(tmdb_id)
             if tmdb_data is None:
                 print_to_csv(f"❌ {film_title} was not added due to failed TMDB data fetch.")
                 self.processor.rejected_data.append([film_title, release_year, None, 'Failed TMDB data fetch'])
@@ -1763,13 +1308,18 @@ class LetterboxdScraper:
                     'tmdbID': tmdb_id,
                     'Link': film_url
                 })
+                max_movies_5000_stats['film_links'].add(film_url)
                 # Update statistics for this movie
-                self.update_max_movies_5000_statistics(film_title, release_year, tmdb_id, self.driver, film_url)
+                with film_events.stage('stats_update'):
+                    self.update_max_movies_5000_statistics(film_title, release_year, tmdb_id, self.driver, film_url, page)
             else:
                 print_to_csv(f"⚠️ {film_title} would be the {len(max_movies_5000_stats['film_data']) + 1}th movie, but we've reached the limit of {MAX_MOVIES_5000}")
 
+            # MPAA, runtime and continent lists the film joins; counted below with one whitelist lookup
+            buckets = []
+
             # Add to MPAA stats if applicable
-            mpaa_rating = extract_mpaa_rating(self.driver)
+            mpaa_rating = page.mpaa_rating
             if mpaa_rating in MPAA_RATINGS:
                 # Check if we've reached the limit for this rating
                 max_limit = (
@@ -1784,8 +1334,7 @@ class LetterboxdScraper:
                         'tmdbID': tmdb_id,
                         'Link': film_url
                     })
-                    # Update MPAA statistics
-                    self.processor.update_statistics(mpaa_rating, film_url)
+                    buckets.append(mpaa_stats[mpaa_rating])
 
             # Add to runtime stats if applicable
             if runtime is not None:
@@ -1813,15 +1362,12 @@ class LetterboxdScraper:
                             'tmdbID': tmdb_id,
                             'Link': film_url
                         })
-                        # Update runtime statistics
-                        self.processor.update_runtime_statistics(film_title, release_year, tmdb_id, self.driver, category, film_url)
+                        buckets.append(runtime_stats[category])
 
             # Add to continent stats if applicable
             try:
-                country_elements = self.driver.find_elements(By.CSS_SELECTOR, '#tab-details .text-sluglist a.text-slug[href*="/films/country/"]')
                 added_to_continent = set()  # Track which continents the film has been added to
-                for country in country_elements:
-                    country_name = country.get_attribute('textContent').strip()
+                for country_name in page.countries:
                     if country_name:
                         # Check if the country belongs to any continent
                         for continent, countries in CONTINENTS_COUNTRIES.items():
@@ -1843,113 +1389,50 @@ class LetterboxdScraper:
                                             'tmdbID': tmdb_id,
                                             'Link': film_url
                                         })
-                                        # Update continent statistics
-                                        self.processor.update_continent_statistics(continent, film_url)
+                                        buckets.append(continent_stats[continent])
                                         added_to_continent.add(continent)  # Mark the continent as processed
                                 break
             except Exception:
                 pass
 
+            with film_events.stage('stats_update'):
+                self.processor.update_bucket_statistics(film_url, buckets)
+
         except Exception as e:
             print_to_csv(f"Error processing approved movie {film_title}: {str(e)}")
             self.processor.rejected_data.append([film_title, release_year, None, f'Error processing: {str(e)}'])
             return False
 
-    def update_max_movies_5000_statistics(self, film_title: str, release_year: str, tmdb_id: str, driver, film_url: str = None):
+    def update_max_movies_5000_statistics(self, film_title: str, release_year: str, tmdb_id: str, driver, film_url: str = None, page: FilmPage = None):
         """Update statistics for the given movie for MAX_MOVIES_5000."""
         if not film_url:
             print_to_csv("WARNING: No film URL provided for statistics update")
             return
 
-        # Find the movie in film_data
-        movie_data = next((movie for movie in max_movies_5000_stats['film_data'] 
-                          if movie['Title'] == film_title and movie['Year'] == release_year), None)
-        
-        if not movie_data:
+        if film_url not in max_movies_5000_stats['film_links']:
             return
-
-        # Directors
-        try:
-            director_elements = driver.find_elements(By.CSS_SELECTOR, 'span.creatorlist a.contributor')
-            for director in director_elements:
-                director_name = director.text.strip()
-                if director_name:
-                    max_movies_5000_stats['director_counts'][director_name] += 1
-        except Exception:
-            pass
-
-        # Actors
-        try:
-            actor_elements = driver.find_elements(By.CSS_SELECTOR, '#tab-cast .text-sluglist a.text-slug.tooltip')
-            for actor in actor_elements:
-                actor_name = actor.text.strip()
-                if actor_name:
-                    max_movies_5000_stats['actor_counts'][actor_name] += 1
-        except Exception:
-            pass
-
-        # Decade
-        try:
-            meta_tag = driver.find_element(By.CSS_SELECTOR, 'meta[property="og:title"]')
-            content = meta_tag.get_attribute('content')
-            if content and '(' in content and ')' in content:
-                year = int(content.split('(')[-1].split(')')[0])
-                decade = (year // 10) * 10
-                max_movies_5000_stats['decade_counts'][decade] += 1
-        except Exception:
-            pass
-
-        # Genres - Only get main genres, not microgenres
-        try:
-            genre_elements = driver.find_elements(By.CSS_SELECTOR, '#tab-genres .text-sluglist a.text-slug[href*="/films/genre/"]')
-            genres = []
-            for genre in genre_elements:
-                genre_name = genre.get_attribute('textContent').strip()
-                if genre_name and not any(char in genre_name for char in ['…', 'Show All']):
-                    genres.append(genre_name)
-                    max_movies_5000_stats['genre_counts'][genre_name] += 1
-            movie_data['Genres'] = genres
-        except Exception:
-            pass
-
-        # Studios
-        try:
-            studio_elements = driver.find_elements(By.CSS_SELECTOR, '#tab-details .text-sluglist a.text-slug[href*="/studio/"]')
-            studios = []
-            for studio in studio_elements:
-                studio_name = studio.get_attribute('textContent').strip()
-                if studio_name:
-                    studios.append(studio_name)
-                    max_movies_5000_stats['studio_counts'][studio_name] += 1
-            movie_data['Studios'] = studios
-        except Exception:
-            pass
-
-        # Languages
-        try:
-            language_elements = driver.find_elements(By.CSS_SELECTOR, '#tab-details .text-sluglist a.text-slug[href*="/films/language/"]')
-            languages = []
-            for language in language_elements:
-                language_name = language.get_attribute('textContent').strip()
-                if language_name:
-                    languages.append(language_name)
-                    max_movies_5000_stats['language_counts'][language_name] += 1
-            movie_data['Languages'] = languages
-        except Exception:
-            pass
-
-        # Countries
-        try:
-            country_elements = driver.find_elements(By.CSS_SELECTOR, '#tab-details .text-sluglist a.text-slug[href*="/films/country/"]')
-            countries = []
-            for country in country_elements:
-                country_name = country.get_attribute('textContent').strip()
-                if country_name:
-                    countries.append(country_name)
-                    max_movies_5000_stats['country_counts'][country_name] += 1
-            movie_data['Countries'] = countries
-        except Exception:
-            pass
+        # The caller appends the film's entry just before updating its statistics
+        movie_data = max_movies_5000_stats['film_data'][-1]
+        if movie_data['Link'] != film_url:
+            movie_data = {}
+
+        # Callers that already parsed the page pass it in; otherwise parse the loaded page once
+        if page is None:
+            page = self.page_parser.parse(driver.page_source)
+
+        max_movies_5000_stats['stats'].add({
+            'Directors': page.directors,
+            'Actors': page.actors,
+            'Decade': decade_of(page.release_year),
+            'Genres': page.genres,  # Only main genres, not microgenres
+            'Studios': page.studios,
+            'Languages': page.languages,
+            'Countries': page.countries
+        })
+        movie_data['Genres'] = list(page.genres)
+        movie_data['Studios'] = list(page.studios)
+        movie_data['Languages'] = list(page.languages)
+        movie_data['Countries'] = list(page.countries)
 
     def save_max_movies_5000_results(self):
         """Save results for MAX_MOVIES_5000."""
@@ -1996,40 +1479,17 @@ class LetterboxdScraper:
             file.write("-- Feature film spin-offs from television shows must contain original material, not just recap or compilation of existing material.\n")
             file.write("-- Entries that have scores inflated because they share a name with a popular television show are removed, as I notice them.\n\n")
 
-            # Mapping for display names
-            category_display_names = {
-                'director_counts': 'directors',
-                'actor_counts': 'actors',
-                'decade_counts': 'decades',
-                'genre_counts': 'genres',
-                'studio_counts': 'studios',
-                'language_counts': 'languages',
-                'country_counts': 'countries'
-            }
-
             # Write top 10 statistics for this category
-            for category_name, counts in max_movies_5000_stats.items():
-                if category_name != 'film_data':
-                    display_name = category_display_names.get(category_name, category_name.replace('_counts', ''))
-                    file.write(f"<strong>The ten most appearing {display_name}:</strong>\n")
-                    sorted_items = sorted(counts.items(), key=lambda item: item[1], reverse=True)[:10]
-                    for item, count in sorted_items:
-                        file.write(f"{item}: {count}\n")
-                    file.write("\n")
+            for category_name, top_counts in max_movies_5000_stats['stats'].top_all(10):
+                display_name = STAT_NAMES.get(category_name, category_name.replace('_counts', ''))
+                file.write(f"<strong>The ten most appearing {display_name}:</strong>\n")
+                for item, count in top_counts:
+                    file.write(f"{item}: {count}\n")
+                file.write("\n")
             file.write("<strong>If you notice any movies you believe should/should not be included just let me know!</strong>")
 
     def save_continent_results(self):
         """Save results for each continent."""
-        category_display_names = {
-            'director_counts': 'directors',
-            'actor_counts': 'actors',
-            'decade_counts': 'decades',
-            'genre_counts': 'genres',
-            'studio_counts': 'studios',
-            'language_counts': 'languages',
-            'country_counts': 'countries'
-        }
-
         def get_ordinal(n):
             if 10 <= n % 100 <= 20:
                 suffix = 'th'
@@ -2082,81 +1542,29 @@ class LetterboxdScraper:
                         file.write("-- Entries that have scores inflated because they share a name with a popular television show are removed, as I notice them.\n\n")
 
                         # Write top 10 statistics for this continent
-                        for category_name in category_display_names.keys():  # Use the same order as defined in the dictionary
-                            if category_name in continent_stats[continent]:  # Only process if the category exists
-                                counts = continent_stats[continent][category_name]
-                                display_name = category_display_names.get(category_name, category_name.replace('_', ' '))
-                                file.write(f"<strong>The ten most appearing {display_name}:</strong>\n")
-                                for item, count in sorted(counts.items(), key=lambda item: item[1], reverse=True)[:10]:
-                                    file.write(f"{item}: {count}\n")
-                                file.write("\n")
+                        for category_name, top_counts in continent_stats[continent]['stats'].top_all(10):
+                            display_name = STAT_NAMES.get(category_name, category_name.replace('_', ' '))
+                            file.write(f"<strong>The ten most appearing {display_name}:</strong>\n")
+                            for item, count in top_counts:
+                                file.write(f"{item}: {count}\n")
+                            file.write("\n")
                         file.write("<strong>If you notice any movies you believe should/should not be included just let me know!</strong>")
 
                     # Ensure we only save up to MAX_MOVIES_CONTINENT in the film data
                     continent_stats[continent]['film_data'] = continent_stats[continent]['film_data'][:MAX_MOVIES_CONTINENT]
                     
                     # Recalculate statistics from the limited data
-                    self.recalculate_continent_statistics(continent)
-
-    def recalculate_continent_statistics(self, continent):
-        """Recalculate statistics for a continent based on the limited film data."""
-        # Reset all statistics
-        continent_stats[continent]['director_counts'] = defaultdict(int)
-        continent_stats[continent]['actor_counts'] = defaultdict(int)
-        continent_stats[continent]['decade_counts'] = defaultdict(int)
-        continent_stats[continent]['genre_counts'] = defaultdict(int)
-        continent_stats[continent]['studio_counts'] = defaultdict(int)
-        continent_stats[continent]['language_counts'] = defaultdict(int)
-        continent_stats[continent]['country_counts'] = defaultdict(int)
-        
-        # Recalculate statistics from the limited film data
-        for movie in continent_stats[continent]['film_data']:
+                    self.recalculate_statistics(continent_stats[continent], continent_stats[continent]['film_data'])
+
+    def recalculate_statistics(self, bucket, top_data):
+        """Recount a bucket's statistics from its limited film data; these counts label decades like '1990s'."""
+        bucket['stats'] = StatsAccumulator()
+        for movie in top_data:
             # Get movie data from whitelist
             movie_data, _ = self.processor.get_whitelist_data(movie['Title'], movie['Year'], movie['Link'])
             if movie_data:
-                # Update statistics
-                self.update_continent_statistics(continent, movie_data)
-
-    def update_continent_statistics(self, continent, movie_data):
-        """Update statistics for a continent with movie data."""
-        # Update director counts
-        if movie_data.get('Directors'):
-            for director in movie_data['Directors']:
-                continent_stats[continent]['director_counts'][director] += 1
-        
-        # Update actor counts
-        if movie_data.get('Actors'):
-            for actor in movie_data['Actors']:
-                continent_stats[continent]['actor_counts'][actor] += 1
-        
-        # Update decade counts
-        if movie_data.get('Year'):
-            try:
-                year = int(movie_data['Year'])
-                decade = f"{year // 10 * 10}s"
-                continent_stats[continent]['decade_counts'][decade] += 1
-            except (ValueError, TypeError):
-                pass
-        
-        # Update genre counts
-        if movie_data.get('Genres'):
-            for genre in movie_data['Genres']:
-                continent_stats[continent]['genre_counts'][genre] += 1
-        
-        # Update studio counts
-        if movie_data.get('Studios'):
-            for studio in movie_data['Studios']:
-                continent_stats[continent]['studio_counts'][studio] += 1
-        
-        # Update language counts
-        if movie_data.get('Languages'):
-            for language in movie_data['Languages']:
-                continent_stats[continent]['language_counts'][language] += 1
-        
-        # Update country counts
-        if movie_data.get('Countries'):
-            for country in movie_data['Countries']:
-                continent_stats[continent]['country_counts'][country] += 1
+                decade = decade_of(movie_data.get('Year'))
+                bucket['stats'].add(dict(movie_data, Decade=f"{decade}s" if decade is not None else None))
 
     def save_results(self):
         """Save all results to files"""
@@ -2194,7 +1602,7 @@ class LetterboxdScraper:
             # Write header if file is empty
             if file.tell() == 0:
                 writer.writerow(['Title', 'Year', 'Blank', 'URL', '5000 Top'])
-            for movie in self.processor.unfiltered_approved:
+            for movie in self.processor.unfiltered_approved[self.approved_saved:]:
                 # Ensure we have at least title, year, and URL
                 if len(movie) >= 4:
                     writer.writerow([movie[0], movie[1], '', movie[3], '5000 Top'])
@@ -2208,12 +1616,17 @@ class LetterboxdScraper:
             # Write header if file is empty
             if file.tell() == 0:
                 writer.writerow(['Title', 'Year', 'Blank', 'URL', '5000 Top'])
-            for movie in self.processor.unfiltered_denied:
+            for movie in self.processor.unfiltered_denied[self.denied_saved:]:
                 if len(movie) >= 4:
                     writer.writerow([movie[0], movie[1], '', movie[3], '5000 Top'])
                 else:
                     print_to_csv(f"Warning: Movie data incomplete for {movie[0] if movie else 'Unknown'}")
 
+        # Record what was appended, so resuming after a crash does not append it again
+        self.approved_saved = len(self.processor.unfiltered_approved)
+        self.denied_saved = len(self.processor.unfiltered_denied)
+        self.save_checkpoint()
+
         # Save ceiling counts
         self.save_ceiling_counts()
 
@@ -2251,7 +1664,7 @@ class LetterboxdScraper:
             top_data = top_data[:max_limit]
             
             # Recalculate statistics from the limited data
-            self.recalculate_mpaa_statistics(rating, top_data)
+            self.recalculate_statistics(mpaa_stats[rating], top_data)
 
             # Save movie data in chunks
             for i in range(0, len(top_data), CHUNK_SIZE):
@@ -2293,86 +1706,14 @@ class LetterboxdScraper:
                 f.write("-- Entries that have scores inflated because they share a name with a popular television show are removed, as I notice them.\n\n")
 
                 # Write statistics for each category
-                category_display_names = {
-                    'director_counts': 'directors',
-                    'actor_counts': 'actors',
-                    'decade_counts': 'decades',
-                    'genre_counts': 'genres',
-                    'studio_counts': 'studios',
-                    'language_counts': 'languages',
-                    'country_counts': 'countries'
-                }
-
-                for category_name, counts in mpaa_stats[rating].items():
-                    if category_name != 'film_data':
-                        # Use the mapping for display names
-                        display_name = category_display_names.get(category_name, category_name.replace('_', ' '))
-                        f.write(f"<strong>The ten most appearing {display_name}:</strong>\n")
-                        for item, count in sorted(counts.items(), key=lambda item: item[1], reverse=True)[:10]:
-                            f.write(f"{item}: {count}\n")
-                        f.write("\n")
+                for category_name, top_counts in mpaa_stats[rating]['stats'].top_all(10):
+                    display_name = STAT_NAMES.get(category_name, category_name.replace('_', ' '))
+                    f.write(f"<strong>The ten most appearing {display_name}:</strong>\n")
+                    for item, count in top_counts:
+                        f.write(f"{item}: {count}\n")
+                    f.write("\n")
                 f.write("<strong>If you notice any movies you believe should/should not be included just let me know!</strong>")
 
-    def recalculate_mpaa_statistics(self, rating, top_data):
-        """Recalculate statistics for an MPAA rating based on the limited film data."""
-        # Reset all statistics
-        mpaa_stats[rating]['director_counts'] = defaultdict(int)
-        mpaa_stats[rating]['actor_counts'] = defaultdict(int)
-        mpaa_stats[rating]['decade_counts'] = defaultdict(int)
-        mpaa_stats[rating]['genre_counts'] = defaultdict(int)
-        mpaa_stats[rating]['studio_counts'] = defaultdict(int)
-        mpaa_stats[rating]['language_counts'] = defaultdict(int)
-        mpaa_stats[rating]['country_counts'] = defaultdict(int)
-        
-        # Recalculate statistics from the limited film data
-        for movie in top_data:
-            # Get movie data from whitelist
-            movie_data, _ = self.processor.get_whitelist_data(movie['Title'], movie['Year'], movie['Link'])
-            if movie_data:
-                # Update statistics
-                self.update_mpaa_statistics(rating, movie_data)
-
-    def update_mpaa_statistics(self, rating, movie_data):
-        """Update statistics for an MPAA rating with movie data."""
-        # Update director counts
-        if movie_data.get('Directors'):
-            for director in movie_data['Directors']:
-                mpaa_stats[rating]['director_counts'][director] += 1
-        
-        # Update actor counts
-        if movie_data.get('Actors'):
-            for actor in movie_data['Actors']:
-                mpaa_stats[rating]['actor_counts'][actor] += 1
-        
-        # Update decade counts
-        if movie_data.get('Year'):
-            try:
-                year = int(movie_data['Year'])
-                decade = f"{year // 10 * 10}s"
-                mpaa_stats[rating]['decade_counts'][decade] += 1
-            except (ValueError, TypeError):
-                pass
-        
-        # Update genre counts
-        if movie_data.get('Genres'):
-            for genre in movie_data['Genres']:
-                mpaa_stats[rating]['genre_counts'][genre] += 1
-        
-        # Update studio counts
-        if movie_data.get('Studios'):
-            for studio in movie_data['Studios']:
-                mpaa_stats[rating]['studio_counts'][studio] += 1
-        
-        # Update language counts
-        if movie_data.get('Languages'):
-            for language in movie_data['Languages']:
-                mpaa_stats[rating]['language_counts'][language] += 1
-        
-        # Update country counts
-        if movie_data.get('Countries'):
-            for country in movie_data['Countries']:
-                mpaa_stats[rating]['country_counts'][country] += 1
-
     def save_runtime_results(self):
         """Save results for each runtime category."""
         for category in RUNTIME_CATEGORIES.keys():
@@ -2388,7 +1729,7 @@ class LetterboxdScraper:
                 top_data = category_data[:int(max_limit)]  # Ensure it does not exceed the max
                 
                 # Recalculate statistics from the limited data
-                self.recalculate_runtime_statistics(category, top_data)
+                self.recalculate_statistics(runtime_stats[category], top_data)
 
                 # Save movie data in chunks
                 num_chunks = (len(top_data) + CHUNK_SIZE - 1) // CHUNK_SIZE
@@ -2429,86 +1770,14 @@ class LetterboxdScraper:
                     file.write("-- Entries that have scores inflated because they share a name with a popular television show are removed, as I notice them.\n\n")
 
                     # Write statistics for each category
-                    category_display_names = {
-                        'director_counts': 'directors',
-                        'actor_counts': 'actors',
-                        'decade_counts': 'decades',
-                        'genre_counts': 'genres',
-                        'studio_counts': 'studios',
-                        'language_counts': 'languages',
-                        'country_counts': 'countries'
-                    }
-
-                    for category_name, counts in runtime_stats[category].items():
-                        if category_name != 'film_data':
-                            # Use the mapping for display names
-                            display_name = category_display_names.get(category_name, category_name.replace('_', ' '))
-                            file.write(f"<strong>The ten most appearing {display_name}:</strong>\n")
-                            for item, count in sorted(counts.items(), key=lambda item: item[1], reverse=True)[:10]:
-                                file.write(f"{item}: {count}\n")
-                            file.write("\n")
+                    for category_name, top_counts in runtime_stats[category]['stats'].top_all(10):
+                        display_name = STAT_NAMES.get(category_name, category_name.replace('_', ' '))
+                        file.write(f"<strong>The ten most appearing {display_name}:</strong>\n")
+                        for item, count in top_counts:
+                            file.write(f"{item}: {count}\n")
+                        file.write("\n")
                     file.write("<strong>If you notice any movies you believe should/should not be included just let me know!</strong>")
 
-    def recalculate_runtime_statistics(self, category, top_data):
-        """Recalculate statistics for a runtime category based on the limited film data."""
-        # Reset all statistics
-        runtime_stats[category]['director_counts'] = defaultdict(int)
-        runtime_stats[category]['actor_counts'] = defaultdict(int)
-        runtime_stats[category]['decade_counts'] = defaultdict(int)
-        runtime_stats[category]['genre_counts'] = defaultdict(int)
-        runtime_stats[category]['studio_counts'] = defaultdict(int)
-        runtime_stats[category]['language_counts'] = defaultdict(int)
-        runtime_stats[category]['country_counts'] = defaultdict(int)
-        
-        # Recalculate statistics from the limited film data
-        for movie in top_data:
-            # Get movie data from whitelist
-            movie_data, _ = self.processor.get_whitelist_data(movie['Title'], movie['Year'], movie['Link'])
-            if movie_data:
-                # Update statistics
-                self.update_runtime_statistics(category, movie_data)
-
-    def update_runtime_statistics(self, category, movie_data):
-        """Update statistics for a runtime category with movie data."""
-        # Update director counts
-        if movie_data.get('Directors'):
-            for director in movie_data['Directors']:
-                runtime_stats[category]['director_counts'][director] += 1
-        
-        # Update actor counts
-        if movie_data.get('Actors'):
-            for actor in movie_data['Actors']:
-                runtime_stats[category]['actor_counts'][actor] += 1
-        
-        # Update decade counts
-        if movie_data.get('Year'):
-            try:
-                year = int(movie_data['Year'])
-                decade = f"{year // 10 * 10}s"
-                runtime_stats[category]['decade_counts'][decade] += 1
-            except (ValueError, TypeError):
-                pass
-        
-        # Update genre counts
-        if movie_data.get('Genres'):
-            for genre in movie_data['Genres']:
-                runtime_stats[category]['genre_counts'][genre] += 1
-        
-        # Update studio counts
-        if movie_data.get('Studios'):
-            for studio in movie_data['Studios']:
-                runtime_stats[category]['studio_counts'][studio] += 1
-        
-        # Update language counts
-        if movie_data.get('Languages'):
-            for language in movie_data['Languages']:
-                runtime_stats[category]['language_counts'][language] += 1
-        
-        # Update country counts
-        if movie_data.get('Countries'):
-            for country in movie_data['Countries']:
-                runtime_stats[category]['country_counts'][country] += 1
-
     def save_unknown_continent_films(self):
         """Save list of films with unknown countries to a file."""
         if unmapped_countries:
@@ -2546,7 +1815,8 @@ class LetterboxdScraper:
                 if self.processor.update_whitelist(film_title, release_year, movie_data, film_url):
                     print_to_csv(f"📝 Successfully updated whitelist data for {film_title}")
                     # Process through all output channels
-                    self.processor.process_whitelist_info(movie_data, film_url)
+                    with film_events.stage('stats_update'):
+                        self.processor.process_whitelist_info(movie_data, film_url)
                     
                     self.valid_movies_count += 1
                     print_to_csv(f"✅ Processed whitelist data for {film_title} ({self.valid_movies_count}/{MAX_MOVIES})")
@@ -2590,11 +1860,21 @@ class LetterboxdScraper:
             file.write(f"{'='*50}\n\n")
 
 def main():
+    parser = argparse.ArgumentParser(description="Scrape the highest rated films on Letterboxd.")
+    parser.add_argument('--resume', action='store_true',
+                        help="Carry on from the last listing page a crashed run finished, with everything it had collected")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
     start_time = time.time()
     try:
         scraper = LetterboxdScraper()
+        if args.resume:
+            scraper.resume_from_checkpoint()
         scraper.scrape_movies()
         scraper.save_results()
+        # The results are saved, so there is nothing left to resume
+        scraper.checkpoint.clear()
 
         # Format final statistics
         print_to_csv(f"\n{'Final Statistics':=^100}")
@@ -2609,19 +1889,33 @@ def main():
         print_to_csv(f"\n{'Execution Summary':=^100}")
         print_to_csv(f"Total execution time: {format_time(execution_time)}")
         print_to_csv(f"Average processing speed: {scraper.valid_movies_count / execution_time:.2f} movies/second")
+        scraper.fetcher.report(print_to_csv)
+        scraper.pipeline.report(print_to_csv)
+        report_rates(print_to_csv)
+        scraper.processor.tmdb_cache.report(print_to_csv)
+        scraper.processor.http_cache.report(print_to_csv)
+        scraper.processor.tmdb_prefetcher.report(print_to_csv)
+        scraper.driver_pool.report(print_to_csv)
+        scraper.checkpoint.report(print_to_csv)
+        film_events.report(print_to_csv)
 
     except Exception as e:
         print_to_csv(f"\n{'Error':=^100}")
         print_to_csv(f"❌ An error occurred during execution: {e}")
+        print_to_csv("Run again with --resume to carry on from the last finished page.")
     finally:
+        film_events.close()
         if 'scraper' in locals():
-            try:
-                scraper.driver.quit()
-            except:
-                pass
+            scraper.processor.save_lists()
+            # Close each on its own so one failing still shuts the others down
+            for close in (scraper.driver_pool.close, scraper.pipeline.close, scraper.processor.tmdb_prefetcher.close, scraper.driver.quit):
+                try:
+                    close()
+                except Exception:
+                    pass
 
 if __name__ == "__main__":
-    main()
+    run_profiled(main, 'Rating 5000', output_dir, print_to_csv)
 
 # Maybe combine popular and rating?
 # Check each toggle, base list, and icon
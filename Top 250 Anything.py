@@ -11,7 +11,10 @@ import re
 import os
 import platform
 from tqdm import tqdm
-import csv
+from film_events import FilmEventLog, events_path_for
+from film_store import FilmStore, STORE_FILENAME
+from output_log import output_log
+from script_profiler import run_profiled
 
 # Detect operating system and set appropriate paths
 def get_os_specific_paths():
@@ -38,38 +41,34 @@ def get_os_specific_paths():
 # Get OS-specific paths
 paths = get_os_specific_paths()
 EXCEL_PATH = paths['excel_path']
+FILM_STORE_PATH = os.path.join(paths['base_dir'], STORE_FILENAME)
 output_dir = paths['output_dir']
+EVENTS_PATH = events_path_for(output_dir, 'Top 250 Anything')  # One JSON line per film; summarize with film_events.py
 
 # Define a custom print function
 def print_to_csv(message: str):
     """Prints a message to the terminal and appends it to All_Outputs.csv."""
     print(message)  # Print to terminal
-    with open(os.path.join(output_dir, 'All_Outputs.csv'), mode='a', newline='', encoding='utf-8') as file:
-        writer = csv.writer(file)
-        writer.writerow([message])  # Write the message as a new row
+    output_log(os.path.join(output_dir, 'All_Outputs.csv')).write(message)  # Queued and appended to the file in batches
 
 class MovieCache:
     def __init__(self):
-        self.cache = None
+        self.store = FilmStore(FILM_STORE_PATH)
         self.cache_lookup = {}
         self.load_cache()
     
     def load_cache(self):
-        """Load the Excel cache file."""
-        try:
-            self.cache = pd.read_excel(EXCEL_PATH)
-            # Create lookup dictionary for faster matching
-            for idx, row in self.cache.iterrows():
-                self.cache_lookup[row['Link']] = {
-                    'Title': row['Title'],
-                    'Year': row['Year'],
-                    'index': idx
-                }
-            print_to_csv(f"📚 Loaded {len(self.cache)} movies from cache")
-        except FileNotFoundError:
-            print_to_csv("📚 Cache file not found. Creating new file.")
-            self.cache = pd.DataFrame(columns=['Title', 'Year', 'Link'])
-            self.cache.to_excel(EXCEL_PATH, index=False)
+        """Load the cache from the film store, re-importing top_250_data.xlsx if it was edited."""
+        self.store.sync_workbook('top_250_data', EXCEL_PATH)
+        cache = self.store.load_frame('top_250_data')
+        # Create lookup dictionary for faster matching
+        for idx, title, year, link in zip(cache.index, cache['Title'], cache['Year'], cache['Link']):
+            self.cache_lookup[link] = {
+                'Title': title,
+                'Year': year,
+                'index': idx
+            }
+        print_to_csv(f"📚 Loaded {len(cache)} movies from cache")
     
     def is_cached(self, film_url: str) -> bool:
         """Check if a movie is in the cache."""
@@ -81,47 +80,28 @@ class MovieCache:
     
     def update_cache(self, film_title: str, release_year: str, film_url: str):
         """Update the cache with new movie data."""
-        if film_url in self.cache_lookup:
-            # Update existing entry
-            idx = self.cache_lookup[film_url]['index']
-            self.cache.at[idx, 'Title'] = film_title
-            self.cache.at[idx, 'Year'] = release_year
-            print_to_csv(f"📝 Updated cache entry for {film_title} ({release_year})")
-        else:
-            # Add new entry
-            new_row = pd.DataFrame([{
-                'Title': film_title,
-                'Year': release_year,
-                'Link': film_url
-            }])
-            self.cache = pd.concat([self.cache, new_row], ignore_index=True)
-            self.cache_lookup[film_url] = {
-                'Title': film_title,
-                'Year': release_year,
-                'index': len(self.cache) - 1
-            }
+        is_new = film_url not in self.cache_lookup
+        idx = self.store.upsert('top_250_data', film_title, release_year, film_url=film_url, match_on='link')
+        self.cache_lookup[film_url] = {
+            'Title': film_title,
+            'Year': release_year,
+            'index': idx
+        }
+        if is_new:
             print_to_csv(f"💾 Added new cache entry for {film_title} ({release_year})")
-        
-        # Save to Excel immediately
-        self.cache.to_excel(EXCEL_PATH, index=False)
-
-# Set up Firefox options and service
-options = Options()
-options.headless = False  # Set to True if you don't want the browser to open
-
-# Initialize the Firefox driver with GeckoDriver in PATH
-service = Service()
-driver = webdriver.Firefox(service=service, options=options)
+        else:
+            print_to_csv(f"📝 Updated cache entry for {film_title} ({release_year})")
+    
+    def save(self):
+        """Write the cache back to top_250_data.xlsx if it changed during the run."""
+        if self.store.export_if_dirty('top_250_data', EXCEL_PATH):
+            print_to_csv("💾 Saved cache to top_250_data.xlsx")
 
-# Initialize movie cache
-movie_cache = MovieCache()
+# Stage timings and the decision for every film the run handles
+film_events = FilmEventLog(EVENTS_PATH, 'Top 250 Anything')
 
 # Base URL of the Letterboxd films page
 base_url = 'https://letterboxd.com/films/by/rating/'
-film_titles = []
-total_titles = 0  # Counter for total titles scraped
-page_number = 1  # Start at page 1
-
 max_movies = 250
 MIN_RATING_COUNT = 1000
 
@@ -162,180 +142,218 @@ def format_time(seconds):
     else:
         return f"{seconds}s"
 
-# Initialize progress tracker
-progress_tracker = ProgressTracker(max_movies)
-print_to_csv(f"\n{' Starting Film Scraping ':=^100}")
+def main():
+    # Set up Firefox options and service
+    options = Options()
+    options.headless = False  # Set to True if you don't want the browser to open
 
-# First, collect all film URLs
-print_to_csv("Collecting film URLs...")
-film_urls = []
-current_page = 1
+    # Initialize the Firefox driver with GeckoDriver in PATH
+    service = Service()
+    driver = webdriver.Firefox(service=service, options=options)
 
-while len(film_urls) < max_movies:
-    url = f'{base_url}page/{current_page}/'
-    print_to_csv(f'Collecting URLs from page {current_page}')
-    
-    # Add retry mechanism for page loading
-    page_retries = 20
-    for retry in range(page_retries):
-        try:
-            driver.get(url)
-            # Wait for the page to load
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, 'div.react-component.poster'))
-            )
-            time.sleep(random.uniform(1.0, 1.5))
-            break
-        except Exception as e:
-            if retry == page_retries - 1:
-                print_to_csv(f"❌ Failed to load page after {page_retries} attempts: {str(e)}")
-                raise Exception(f"Failed to load page after {page_retries} attempts: {str(e)}")
-            print_to_csv(f"Retry {retry + 1}/{page_retries} loading page {current_page}: {str(e)}")
-            time.sleep(2)
-    
-    # Find all film containers with retry mechanism
-    film_containers = []
-    container_retries = 25
-    for retry in range(container_retries):
-        try:
-            film_containers = WebDriverWait(driver, 10).until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, 'div.react-component.poster'))
-            )
-            if len(film_containers) > 0:  # Check for any containers
-                break
-            else:
-                print_to_csv(f"Found no containers, retrying... (Attempt {retry + 1}/{container_retries})")
-                time.sleep(5)  # Wait longer between retries
-                driver.refresh()  # Refresh the page
-                time.sleep(2)  # Wait for refresh
-        except Exception as e:
-            if retry == container_retries - 1:
-                print_to_csv(f"❌ Failed to find film containers after {container_retries} attempts: {str(e)}")
-                raise Exception(f"Failed to find film containers after {container_retries} attempts: {str(e)}")
-            print_to_csv(f"Retry {retry + 1}/{container_retries} finding film containers: {str(e)}")
-            time.sleep(5)
-            driver.refresh()
-            time.sleep(2)
-    
-    for container in film_containers:
-        if len(film_urls) >= max_movies:
-            break
-        film_url = container.find_element(By.CSS_SELECTOR, 'a').get_attribute('href')
-        film_urls.append(film_url)
-    
-    current_page += 1
-    time.sleep(random.uniform(1.0, 1.5))
+    # Initialize movie cache
+    movie_cache = MovieCache()
 
-print_to_csv(f"Collected {len(film_urls)} film URLs")
+    film_titles = []
+    total_titles = 0  # Counter for total titles scraped
 
-# Now process each film URL
-with tqdm(total=max_movies, desc="Total Progress", unit=" films") as overall_pbar:
-    for film_url in film_urls:
-        if total_titles >= max_movies:
-            break
-        
-        # Check if movie is in cache
-        if movie_cache.is_cached(film_url):
-            cached_data = movie_cache.get_cached_data(film_url)
-            film_title = cached_data['Title']
-            release_year = cached_data['Year']
-            print_to_csv(f"✅ Using cached data for {film_title} ({release_year})")
-            
-            film_titles.append({
-                'Title': film_title,
-                'Year': release_year
-            })
-            total_titles += 1
-            progress_tracker.increment()
-            overall_pbar.update(1)
-            
-            # Print progress for cached movies too
-            stats = progress_tracker.get_progress_stats()
-            print_to_csv(f"\n{f'Overall Progress: {total_titles}/{max_movies} films':^100}")
-            print_to_csv(f"{'Elapsed Time: ' + format_time(stats['elapsed_time']) + ' | Estimated Time Remaining: ' + format_time(stats['time_remaining']):^100}")
-            print_to_csv(f"{'Processing Speed: {:.2f} movies/second'.format(stats['movies_per_second']):^100}")
-            continue
-            
-        # Add retry logic for fetching film details
-        max_retries = 20
-        success = False
-        
-        for retry in range(max_retries):
+    # Initialize progress tracker
+    progress_tracker = ProgressTracker(max_movies)
+    print_to_csv(f"\n{' Starting Film Scraping ':=^100}")
+
+    # First, collect all film URLs
+    print_to_csv("Collecting film URLs...")
+    film_urls = []
+    current_page = 1
+
+    while len(film_urls) < max_movies:
+        url = f'{base_url}page/{current_page}/'
+        print_to_csv(f'Collecting URLs from page {current_page}')
+
+        # Add retry mechanism for page loading
+        page_retries = 20
+        for retry in range(page_retries):
             try:
-                driver.get(film_url)
+                driver.get(url)
+                # Wait for the page to load
                 WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, 'meta[property="og:title"]'))
+                    EC.presence_of_element_located((By.CSS_SELECTOR, 'div.react-component.poster'))
                 )
                 time.sleep(random.uniform(1.0, 1.5))
-                
-                # Get title and year in one go from the meta title
-                meta_title = driver.find_element(By.CSS_SELECTOR, 'meta[property="og:title"]')
-                title_content = meta_title.get_attribute('content')
-                film_title = title_content.split(' (')[0]
-                release_year = title_content.split('(')[-1].strip(')')
-                
-                # Extract rating count
-                rating_count = 0
+                break
+            except Exception as e:
+                if retry == page_retries - 1:
+                    print_to_csv(f"❌ Failed to load page after {page_retries} attempts: {str(e)}")
+                    raise Exception(f"Failed to load page after {page_retries} attempts: {str(e)}")
+                print_to_csv(f"Retry {retry + 1}/{page_retries} loading page {current_page}: {str(e)}")
+                time.sleep(2)
+
+        # Find all film containers with retry mechanism
+        film_containers = []
+        container_retries = 25
+        for retry in range(container_retries):
+            try:
+                film_containers = WebDriverWait(driver, 10).until(
+                    EC.presence_of_all_elements_located((By.CSS_SELECTOR, 'div.react-component.poster'))
+                )
+                if len(film_containers) > 0:  # Check for any containers
+                    break
+                else:
+                    print_to_csv(f"Found no containers, retrying... (Attempt {retry + 1}/{container_retries})")
+                    time.sleep(5)  # Wait longer between retries
+                    driver.refresh()  # Refresh the page
+                    time.sleep(2)  # Wait for refresh
+            except Exception as e:
+                if retry == container_retries - 1:
+                    print_to_csv(f"❌ Failed to find film containers after {container_retries} attempts: {str(e)}")
+                    raise Exception(f"Failed to find film containers after {container_retries} attempts: {str(e)}")
+                print_to_csv(f"Retry {retry + 1}/{container_retries} finding film containers: {str(e)}")
+                time.sleep(5)
+                driver.refresh()
+                time.sleep(2)
+
+        for container in film_containers:
+            if len(film_urls) >= max_movies:
+                break
+            film_url = container.find_element(By.CSS_SELECTOR, 'a').get_attribute('href')
+            film_urls.append(film_url)
+
+        current_page += 1
+        time.sleep(random.uniform(1.0, 1.5))
+
+    print_to_csv(f"Collected {len(film_urls)} film URLs")
+
+    # Now process each film URL
+    with tqdm(total=max_movies, desc="Total Progress", unit=" films") as overall_pbar:
+        for film_url in film_urls:
+            if total_titles >= max_movies:
+                break
+            film_events.begin(film_url)
+
+            # Check if movie is in cache
+            if movie_cache.is_cached(film_url):
+                cached_data = movie_cache.get_cached_data(film_url)
+                film_title = cached_data['Title']
+                release_year = cached_data['Year']
+                print_to_csv(f"✅ Using cached data for {film_title} ({release_year})")
+                film_events.note(title=film_title, cache='hit')
+
+                film_titles.append({
+                    'Title': film_title,
+                    'Year': release_year
+                })
+                total_titles += 1
+                progress_tracker.increment()
+                overall_pbar.update(1)
+
+                # Print progress for cached movies too
+                stats = progress_tracker.get_progress_stats()
+                print_to_csv(f"\n{f'Overall Progress: {total_titles}/{max_movies} films':^100}")
+                print_to_csv(f"{'Elapsed Time: ' + format_time(stats['elapsed_time']) + ' | Estimated Time Remaining: ' + format_time(stats['time_remaining']):^100}")
+                print_to_csv(f"{'Processing Speed: {:.2f} movies/second'.format(stats['movies_per_second']):^100}")
+                film_events.end('accepted')
+                continue
+
+            # Add retry logic for fetching film details
+            max_retries = 20
+            success = False
+
+            film_events.note(cache='miss')
+
+            for retry in range(max_retries):
                 try:
-                    page_source = driver.page_source
-                    match = re.search(r'ratingCount":(\d+)', page_source)
-                    if match:
-                        rating_count = int(match.group(1))
+                    with film_events.stage('page_load'):
+                        driver.get(film_url)
+                        WebDriverWait(driver, 10).until(
+                            EC.presence_of_element_located((By.CSS_SELECTOR, 'meta[property="og:title"]'))
+                        )
+                    time.sleep(random.uniform(1.0, 1.5))
+
+                    with film_events.stage('parse'):
+                        # Get title and year in one go from the meta title
+                        meta_title = driver.find_element(By.CSS_SELECTOR, 'meta[property="og:title"]')
+                        title_content = meta_title.get_attribute('content')
+                        film_title = title_content.split(' (')[0]
+                        release_year = title_content.split('(')[-1].strip(')')
+                    film_events.note(title=film_title)
+
+                    # Extract rating count
+                    rating_count = 0
+                    try:
+                        with film_events.stage('parse'):
+                            page_source = driver.page_source
+                            match = re.search(r'ratingCount":(\d+)', page_source)
+                        if match:
+                            rating_count = int(match.group(1))
+                    except Exception as e:
+                        print_to_csv(f"Error extracting rating count: {str(e)}")
+                        film_events.note(reason=f"Error extracting rating count: {str(e)}")
+                        if retry < max_retries - 1:
+                            print_to_csv(f"Retrying... (Attempt {retry + 1}/{max_retries})")
+                            time.sleep(2)
+                            continue
+                        break
+
+                    # Only add movies with sufficient ratings
+                    if rating_count >= MIN_RATING_COUNT:
+                        # Update cache with new movie data
+                        with film_events.stage('cache_write'):
+                            movie_cache.update_cache(film_title, release_year, film_url)
+
+                        film_titles.append({
+                            'Title': film_title,
+                            'Year': release_year
+                        })
+                        total_titles += 1
+                        progress_tracker.increment()
+
+                        # Update the overall progress bar
+                        overall_pbar.update(1)
+
+                        # Print progress every movie
+                        stats = progress_tracker.get_progress_stats()
+                        print_to_csv(f"\n{f'Overall Progress: {total_titles}/{max_movies} films':^100}")
+                        print_to_csv(f"{'Elapsed Time: ' + format_time(stats['elapsed_time']) + ' | Estimated Time Remaining: ' + format_time(stats['time_remaining']):^100}")
+                        print_to_csv(f"{'Processing Speed: {:.2f} movies/second'.format(stats['movies_per_second']):^100}")
+                        print_to_csv(f"Last Scraped: {film_title} ({release_year})")
+                        film_events.end('accepted')
+                        success = True
+                        break
+                    else:
+                        print_to_csv(f"Skipping {film_title} - insufficient ratings ({rating_count})")
+                        film_events.end('rejected', f"Insufficient ratings (< {MIN_RATING_COUNT})")
+                        success = True  # Mark as success since we got the data, just didn't meet criteria
+                        break
+
                 except Exception as e:
-                    print_to_csv(f"Error extracting rating count: {str(e)}")
+                    print_to_csv(f"Error processing {film_url} (attempt {retry + 1}/{max_retries}): {str(e)}")
+                    film_events.note(reason=str(e))
                     if retry < max_retries - 1:
                         print_to_csv(f"Retrying... (Attempt {retry + 1}/{max_retries})")
                         time.sleep(2)
                         continue
                     break
-                
-                # Only add movies with sufficient ratings
-                if rating_count >= MIN_RATING_COUNT:
-                    # Update cache with new movie data
-                    movie_cache.update_cache(film_title, release_year, film_url)
-                    
-                    film_titles.append({
-                        'Title': film_title,
-                        'Year': release_year
-                    })
-                    total_titles += 1
-                    progress_tracker.increment()
-                    
-                    # Update the overall progress bar
-                    overall_pbar.update(1)
-                    
-                    # Print progress every movie
-                    stats = progress_tracker.get_progress_stats()
-                    print_to_csv(f"\n{f'Overall Progress: {total_titles}/{max_movies} films':^100}")
-                    print_to_csv(f"{'Elapsed Time: ' + format_time(stats['elapsed_time']) + ' | Estimated Time Remaining: ' + format_time(stats['time_remaining']):^100}")
-                    print_to_csv(f"{'Processing Speed: {:.2f} movies/second'.format(stats['movies_per_second']):^100}")
-                    print_to_csv(f"Last Scraped: {film_title} ({release_year})")
-                    success = True
-                    break
-                else:
-                    print_to_csv(f"Skipping {film_title} - insufficient ratings ({rating_count})")
-                    success = True  # Mark as success since we got the data, just didn't meet criteria
-                    break
-                    
-            except Exception as e:
-                print_to_csv(f"Error processing {film_url} (attempt {retry + 1}/{max_retries}): {str(e)}")
-                if retry < max_retries - 1:
-                    print_to_csv(f"Retrying... (Attempt {retry + 1}/{max_retries})")
-                    time.sleep(2)
-                    continue
-                break
 
-# Close the browser
-driver.quit()
+            if not success:
+                film_events.end('failed', film_events.film.get('reason'))
+
+    # Close the browser
+    driver.quit()
+    movie_cache.save()
+    film_events.close()
+
+    # Check if any titles were scraped
+    if film_titles:
+        print_to_csv(f'{len(film_titles)} Film titles were scraped successfully:')
+    else:
+        print_to_csv("No film titles were scraped.")
 
-# Check if any titles were scraped
-if film_titles:
-    print_to_csv(f'{len(film_titles)} Film titles were scraped successfully:')
-else:
-    print_to_csv("No film titles were scraped.")
+    # Create a DataFrame and save to CSV if desired
+    df = pd.DataFrame(film_titles)
+    output_csv = os.path.join(output_dir, 'film_titles.csv')
+    df.to_csv(output_csv, index=False, encoding='utf-8')
+    print_to_csv("Film titles have been successfully saved to film_titles.csv.")
+    film_events.report(print_to_csv)
 
-# Create a DataFrame and save to CSV if desired
-df = pd.DataFrame(film_titles)
-output_csv = os.path.join(output_dir, 'film_titles.csv')
-df.to_csv(output_csv, index=False, encoding='utf-8')
-print_to_csv("Film titles have been successfully saved to film_titles.csv.")
\ No newline at end of file
+if __name__ == "__main__":
+    run_profiled(main, 'Top 250 Anything', output_dir, print_to_csv)
@@ -0,0 +1,176 @@
+import argparse
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+from credentials_loader import get_os_specific_paths
+
+CATALOG_FILENAME = 'film_catalog.db'
+
+# Listing name -> the Letterboxd listing it is crawled from
+LISTING_URLS = {
+    'popular': 'https://letterboxd.com/films/by/popular/',
+    'rating': 'https://letterboxd.com/films/by/rating/',
+}
+
+# Record keys stored as JSON lists
+LIST_FIELDS = ('Genres', 'Countries', 'Languages', 'Directors', 'Actors', 'Studios')
+
+class FilmCatalog:
+    """SQLite store of the metadata of every film a listing crawl has seen.
+
+    One row per film URL holds what the scrapers read off a film page, in
+    the same keys as a whitelist Information entry, with the time it was
+    scraped. The rankings table keeps the order each listing was last walked
+    in, so lists can be derived from the catalog without going back to
+    Letterboxd. Safe to use from worker threads.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        with self.conn:
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS films (
+                    url TEXT PRIMARY KEY,
+                    title TEXT NOT NULL,
+                    year TEXT,
+                    tmdb_id TEXT,
+                    runtime INTEGER,
+                    rating_count INTEGER,
+                    mpaa TEXT,
+                    genres TEXT NOT NULL DEFAULT '[]',
+                    countries TEXT NOT NULL DEFAULT '[]',
+                    languages TEXT NOT NULL DEFAULT '[]',
+                    directors TEXT NOT NULL DEFAULT '[]',
+                    actors TEXT NOT NULL DEFAULT '[]',
+                    studios TEXT NOT NULL DEFAULT '[]',
+                    scraped_at REAL NOT NULL
+                )''')
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS rankings (
+                    listing TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    url TEXT NOT NULL,
+                    PRIMARY KEY (listing, position)
+                )''')
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS crawls (
+                    listing TEXT PRIMARY KEY,
+                    started_at REAL,
+                    finished_at REAL,
+                    pages INTEGER NOT NULL DEFAULT 0
+                )''')
+
+    def put(self, url, movie_data):
+        """Store a film from its whitelist-style movie_data dict (FilmPage.to_movie_data)."""
+        with self.lock, self.conn:
+            self.conn.execute(
+                '''INSERT OR REPLACE INTO films (url, title, year, tmdb_id, runtime, rating_count, mpaa, genres,
+                   countries, languages, directors, actors, studios, scraped_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''',
+                (url, movie_data['Title'], movie_data.get('Year'), movie_data.get('tmdbID'), movie_data.get('Runtime'),
+                 movie_data.get('RatingCount'), movie_data.get('MPAA'),
+                 *(json.dumps(list(movie_data.get(field) or [])) for field in LIST_FIELDS), time.time())
+            )
+
+    def _row_to_record(self, row):
+        year = row['year']
+        record = {
+            'Title': row['title'],
+            'Year': year,
+            'tmdbID': row['tmdb_id'],
+            'MPAA': row['mpaa'],
+            'Runtime': row['runtime'],
+            'RatingCount': row['rating_count'],
+            'Decade': (int(year) // 10) * 10 if year and str(year).isdigit() else None,
+        }
+        for field in LIST_FIELDS:
+            record[field] = json.loads(row[field.lower()])
+        record['Link'] = row['url']
+        record['ScrapedAt'] = row['scraped_at']
+        return record
+
+    def get(self, url):
+        """Return the stored record for a film URL, or None."""
+        with self.lock:
+            row = self.conn.execute('SELECT * FROM films WHERE url = ?', (url,)).fetchone()
+        return self._row_to_record(row) if row else None
+
+    def is_fresh(self, url, max_age_days: float):
+        """True if the film was scraped within the last max_age_days."""
+        with self.lock:
+            row = self.conn.execute('SELECT scraped_at FROM films WHERE url = ?', (url,)).fetchone()
+        return row is not None and time.time() - row['scraped_at'] < max_age_days * 86400
+
+    def begin_listing(self, listing):
+        """Forget a listing's previous order before it is walked again."""
+        with self.lock, self.conn:
+            self.conn.execute('DELETE FROM rankings WHERE listing = ?', (listing,))
+            self.conn.execute('''
+                INSERT INTO crawls (listing, started_at, finished_at, pages) VALUES (?, ?, NULL, 0)
+                ON CONFLICT(listing) DO UPDATE SET started_at = excluded.started_at, finished_at = NULL, pages = 0''',
+                (listing, time.time()))
+
+    def rank_page(self, listing, first_position, urls):
+        """Record one listing page; positions count from first_position."""
+        with self.lock, self.conn:
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO rankings (listing, position, url) VALUES (?, ?, ?)',
+                [(listing, first_position + offset, url) for offset, url in enumerate(urls)]
+            )
+            self.conn.execute('UPDATE crawls SET pages = pages + 1 WHERE listing = ?', (listing,))
+
+    def finish_listing(self, listing):
+        with self.lock, self.conn:
+            self.conn.execute('UPDATE crawls SET finished_at = ? WHERE listing = ?', (time.time(), listing))
+
+    def ranked(self, listing):
+        """Return (url, record) pairs in listing order; record is None for a film never scraped."""
+        with self.lock:
+            rows = self.conn.execute('''
+                SELECT rankings.url AS ranked_url, films.* FROM rankings
+                LEFT JOIN films ON films.url = rankings.url
+                WHERE rankings.listing = ? ORDER BY rankings.position''', (listing,)).fetchall()
+        return [(row['ranked_url'], self._row_to_record(row) if row['url'] else None) for row in rows]
+
+    def crawl_state(self, listing):
+        """Return (films ranked, pages, finished_at) for a listing's last crawl."""
+        with self.lock:
+            ranked = self.conn.execute('SELECT COUNT(*) FROM rankings WHERE listing = ?', (listing,)).fetchone()[0]
+            row = self.conn.execute('SELECT pages, finished_at FROM crawls WHERE listing = ?', (listing,)).fetchone()
+        return ranked, (row['pages'] if row else 0), (row['finished_at'] if row else None)
+
+    def count(self):
+        with self.lock:
+            return self.conn.execute('SELECT COUNT(*) FROM films').fetchone()[0]
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Show what the film catalog holds.")
+    parser.add_argument('--dir', default=get_os_specific_paths()['base_dir'], help="Folder holding film_catalog.db")
+    args = parser.parse_args()
+
+    catalog = FilmCatalog(os.path.join(args.dir, CATALOG_FILENAME))
+    print(f"{catalog.count()} films in the catalog")
+    for listing in LISTING_URLS:
+        ranked, pages, finished_at = catalog.crawl_state(listing)
+        if finished_at:
+            status = f"finished {datetime.fromtimestamp(finished_at):%Y-%m-%d %H:%M}"
+        else:
+            status = "not finished" if pages else "never crawled"
+        print(f"{listing}: {ranked} films over {pages} pages ({status})")
+    catalog.close()
+
+if __name__ == "__main__":
+    main()
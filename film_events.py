@@ -0,0 +1,214 @@
+import argparse
+import glob
+import json
+import math
+import os
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+
+from credentials_loader import get_os_specific_paths
+
+EVENTS_DIRNAME = 'Events'
+# The stages a film's time is split into, in the order the summary lists them
+STAGES = ('page_wait', 'page_load', 'parse', 'tmdb', 'whitelist_write', 'stats_update')
+# Stages a prefetched page went through on a pipeline thread while the loop handled earlier films
+PREFETCHED_STAGES = {'page_load', 'parse'}
+PERCENTILES = (50, 90, 99)
+
+def events_path_for(output_dir, name):
+    """Return the JSONL file a scraper writes its film events to."""
+    return os.path.join(output_dir, EVENTS_DIRNAME, f'{name}.jsonl')
+
+class FilmEventLog:
+    """Writes one JSON line per film a scraper handles, with how long each stage of it took.
+
+    begin() starts timing a film and end() writes its event: the URL, the
+    decision and rejection reason, whether the whitelist had it, and the
+    milliseconds spent in each stage. stage() times a block against the film
+    being handled and does nothing between films; a stage entered again
+    inside itself is only counted once. The file is line-buffered, so a
+    crashed run keeps every event it finished. run tells this run's events
+    apart from earlier ones appended to the same file.
+    """
+
+    def __init__(self, path, script):
+        self.path = path
+        self.script = script
+        self.run = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self.file = None
+        self.film = None
+        self.open_stages = set()
+        self.events = 0
+
+    @property
+    def active(self):
+        return self.film is not None
+
+    def begin(self, film_url, film_title=None, **fields):
+        """Start timing a film, writing the previous one first if it was never ended."""
+        if self.film is not None:
+            self.end('unfinished')
+        self.film = {'url': film_url, 'title': film_title, **fields, 'ms': defaultdict(float),
+                     'start': time.perf_counter()}
+
+    def note(self, **fields):
+        """Record fields on the current film's event, such as whitelist='hit'."""
+        if self.film is not None:
+            self.film.update(fields)
+
+    def add(self, stage, seconds):
+        if self.film is not None:
+            self.film['ms'][stage] += seconds * 1000
+
+    @contextmanager
+    def stage(self, name):
+        if self.film is None or name in self.open_stages:
+            yield
+            return
+        self.open_stages.add(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.open_stages.discard(name)
+            self.add(name, time.perf_counter() - start)
+
+    def fetched(self, result, prefetched=False):
+        """Split a FilmFetcher result into page load and parse time."""
+        if self.film is None or result is None:
+            return
+        parse_seconds = result.page.parse_seconds if result.page is not None else 0.0
+        self.add('page_load', max(result.seconds - parse_seconds, 0.0))
+        self.add('parse', parse_seconds)
+        self.film['page'] = 'driver' if result.rendered else 'http'
+        self.film['prefetched'] = prefetched
+
+    def end(self, decision, reason=None):
+        """Write the current film's event."""
+        film, self.film = self.film, None
+        if film is None:
+            return
+        total_ms = (time.perf_counter() - film.pop('start')) * 1000
+        stage_ms = film.pop('ms')
+        event = {
+            'time': datetime.now().isoformat(timespec='seconds'),
+            'script': self.script,
+            'run': self.run,
+            **film,
+            'decision': decision,
+            'reason': reason,
+            'ms': {name: round(ms, 1) for name, ms in stage_ms.items()},
+            'total_ms': round(total_ms, 1),
+        }
+        try:
+            if self.file is None:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                self.file = open(self.path, 'a', encoding='utf-8', buffering=1)
+            self.file.write(json.dumps(event, ensure_ascii=False) + '\n')
+        except OSError:
+            # Losing the event stream must not stop the scraper
+            return
+        self.events += 1
+
+    def close(self):
+        if self.film is not None:
+            self.end('unfinished')
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def report(self, log=print):
+        if self.events:
+            log(f"Film events: {self.events} written to {self.path}")
+
+def read_events(path, run='latest'):
+    """Return the events in a JSONL file, only those of its last run unless run is 'all'."""
+    events = []
+    with open(path, encoding='utf-8') as file:
+        for line in file:
+            try:
+                events.append(json.loads(line))
+            except ValueError:
+                # A line cut short by a crash
+                continue
+    if run == 'latest' and events:
+        latest = max(event.get('run', '') for event in events)
+        events = [event for event in events if event.get('run', '') == latest]
+    return events
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an already sorted list."""
+    rank = max(math.ceil(q / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+def format_hours(seconds):
+    hours, remainder = divmod(int(seconds), 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}"
+
+def summarize(events, log=print):
+    """Log decision counts and per-stage latency percentiles for one script's events."""
+    total_seconds = sum(event.get('total_ms', 0) for event in events) / 1000
+    log(f"{len(events)} films, {format_hours(total_seconds)} handling them")
+    for decision, count in Counter(event.get('decision') for event in events).most_common():
+        log(f"  {decision}: {count}")
+    lookups = Counter(event['whitelist'] for event in events if event.get('whitelist'))
+    if lookups:
+        log(f"  Whitelist: {lookups['hit']} hits, {lookups['miss']} misses")
+    reasons = Counter(event['reason'] for event in events if event.get('decision') == 'rejected' and event.get('reason'))
+    if reasons:
+        log("  Most common rejections:")
+        for reason, count in reasons.most_common(5):
+            log(f"    {count:>6}  {reason}")
+
+    stage_ms = defaultdict(list)
+    # Only time the loop itself spent counts towards a stage's share; it waited on prefetched pages in page_wait
+    loop_ms = defaultdict(float)
+    for event in events:
+        for stage, ms in event.get('ms', {}).items():
+            stage_ms[stage].append(ms)
+            if not (event.get('prefetched') and stage in PREFETCHED_STAGES):
+                loop_ms[stage] += ms
+    if not stage_ms:
+        return
+    stages = [stage for stage in STAGES if stage in stage_ms] + sorted(set(stage_ms) - set(STAGES))
+    header = ''.join(f"{f'p{q}':>10}" for q in PERCENTILES)
+    log(f"{'Stage':<18}{'Films':>7}{header}{'Max':>10}{'Total':>11}{'Share':>8}")
+    for stage in stages:
+        values = sorted(stage_ms[stage])
+        stage_seconds = sum(values) / 1000
+        share = loop_ms[stage] / 1000 / total_seconds * 100 if total_seconds else 0.0
+        cells = ''.join(f"{percentile(values, q):>8.0f}ms" for q in PERCENTILES)
+        log(f"{stage:<18}{len(values):>7}{cells}{values[-1]:>8.0f}ms{format_hours(stage_seconds):>11}{share:>7.1f}%")
+    totals = sorted(event.get('total_ms', 0) for event in events)
+    cells = ''.join(f"{percentile(totals, q):>8.0f}ms" for q in PERCENTILES)
+    log(f"{'whole film':<18}{len(totals):>7}{cells}{totals[-1]:>8.0f}ms{format_hours(total_seconds):>11}")
+
+def main():
+    default_dir = os.path.join(get_os_specific_paths()['base_dir'], 'Outputs', EVENTS_DIRNAME)
+    parser = argparse.ArgumentParser(description="Summarize the per-film events the scrapers write.")
+    parser.add_argument('paths', nargs='*', default=[default_dir], help="Event files, or folders of them")
+    parser.add_argument('--run', choices=('latest', 'all'), default='latest',
+                        help="Summarize only the last run in each file, or every run it holds")
+    parser.add_argument('--script', help="Only summarize this scraper's events")
+    args = parser.parse_args()
+
+    by_script = defaultdict(list)
+    for path in args.paths:
+        files = sorted(glob.glob(os.path.join(path, '*.jsonl'))) if os.path.isdir(path) else [path]
+        for file_path in files:
+            for event in read_events(file_path, args.run):
+                by_script[event.get('script', os.path.basename(file_path))].append(event)
+    if args.script:
+        by_script = {args.script: by_script.get(args.script, [])}
+    if not any(by_script.values()):
+        print("No film events found")
+        return
+    for script, events in sorted(by_script.items()):
+        print(f"\n{f' {script} ':=^100}")
+        summarize(events)
+
+if __name__ == "__main__":
+    main()
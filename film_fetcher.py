@@ -0,0 +1,144 @@
+import time
+from collections import Counter, namedtuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from film_page_parser import FilmPage, FilmPageParser
+from http_cache import CachedSession, HttpCache
+from rate_controller import controller_for
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# Fields every scraper gates on; a page missing any of them is reloaded in the browser
+REQUIRED_FIELDS = ('release_year', 'tmdb_id', 'runtime')
+
+# page is None when the request failed or came back incomplete; reason says why.
+# rendered is set when a pooled driver already loaded the page after HTTP fell short.
+FetchResult = namedtuple('FetchResult', ['page', 'reason', 'seconds', 'rendered'], defaults=[False])
+
+def create_film_session(pool_size: int = 10, cache: HttpCache = None, max_age: float = 0) -> requests.Session:
+    """A keep-alive film page session: paced per host, revalidated against `cache` if given, retrying 429s and 5xx after backing off."""
+    session = CachedSession(cache, max_age)
+    retry_strategy = Retry(
+        total=3,
+        backoff_factor=1,
+        # 429s and 5xx go back to the session, whose rate controller backs off before retrying them
+        respect_retry_after_header=False
+    )
+    adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        'User-Agent': USER_AGENT
+    })
+    return session
+
+class FilmFetcher:
+    """Fetches film pages over HTTP and falls back to the WebDriver only when needed.
+
+    Letterboxd renders the og:title meta, the ratingCount JSON-LD and the
+    cast/genre/details tabs on the server, so a single GET usually carries
+    everything FilmPageParser reads. When the request fails or the parsed page
+    is missing one of required_fields, the page is loaded in the driver and
+    parsed from driver.page_source instead.
+    """
+
+    def __init__(self, driver, parser: FilmPageParser = None, session: requests.Session = None,
+                 required_fields=REQUIRED_FIELDS, timeout: int = 10):
+        self.driver = driver
+        self.parser = parser or FilmPageParser()
+        self.session = session or create_film_session()
+        self.required_fields = tuple(required_fields)
+        self.timeout = timeout
+        self.http_pages = 0
+        self.driver_pages = 0
+        self.http_seconds = 0.0
+        self.driver_seconds = 0.0
+        self.fallback_reasons = Counter()
+        # The FetchResult behind the page fetch() returned last, for per-film timings
+        self.last_result = None
+
+    def missing_fields(self, page: FilmPage):
+        return [name for name in self.required_fields if not getattr(page, name)]
+
+    def fetch_http(self, film_url: str) -> FetchResult:
+        """Fetch and parse a page over HTTP only. Safe to call from worker threads."""
+        start = time.perf_counter()
+        try:
+            response = self.session.get(film_url, timeout=self.timeout)
+        except requests.RequestException as e:
+            return FetchResult(None, f"request failed ({type(e).__name__})", time.perf_counter() - start)
+        if response.status_code != 200:
+            return FetchResult(None, f"HTTP {response.status_code}", time.perf_counter() - start)
+
+        page = self.parser.parse(response.text)
+        missing = self.missing_fields(page)
+        if missing:
+            return FetchResult(None, f"missing {', '.join(missing)}", time.perf_counter() - start)
+        return FetchResult(page, None, time.perf_counter() - start)
+
+    def fetch(self, film_url: str, prefetched: FetchResult = None) -> FilmPage:
+        """Return the parsed film page, loading it in the driver if HTTP falls short.
+
+        prefetched is the FetchResult for this URL when a pipeline already
+        made the request.
+        """
+        result = prefetched or self.fetch_http(film_url)
+        if result.page is None:
+            return self.fetch_with_driver(film_url, result.reason)
+        self.last_result = result
+        if result.rendered:
+            self.fallback_reasons[result.reason] += 1
+            self.driver_pages += 1
+            self.driver_seconds += result.seconds
+        else:
+            self.http_pages += 1
+            self.http_seconds += result.seconds
+        return result.page
+
+    def fetch_with_driver(self, film_url: str, reason: str) -> FilmPage:
+        """Load the page in the browser and parse what it rendered."""
+        self.fallback_reasons[reason] += 1
+        start = time.perf_counter()
+        page = self.render(self.driver, film_url)
+        seconds = time.perf_counter() - start
+        self.driver_pages += 1
+        self.driver_seconds += seconds
+        self.last_result = FetchResult(page, reason, seconds, True)
+        return page
+
+    def render(self, driver, film_url: str) -> FilmPage:
+        """Load a page in the given driver and parse it. Safe from worker threads that own the driver."""
+        controller = controller_for(urlsplit(film_url).hostname)
+        controller.wait()
+        start = time.perf_counter()
+        driver.get(film_url)
+        try:
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, 'meta[property="og:title"]'))
+            )
+            controller.success(time.perf_counter() - start)
+        except TimeoutException:
+            # Error pages have no og:title; parse whatever loaded and let the caller decide
+            controller.failure("film page timed out in the browser")
+        return self.parser.parse(driver.page_source)
+
+    def report(self, log=print):
+        """Log how many film pages each path served and why the driver was needed."""
+        total = self.http_pages + self.driver_pages
+        if not total:
+            return
+        log(f"Film pages fetched: {total} ({self.http_pages} over HTTP, {self.driver_pages} through the driver)")
+        if self.http_pages:
+            log(f"  HTTP: {self.http_seconds / self.http_pages * 1000:.0f} ms per film")
+        if self.driver_pages:
+            log(f"  Driver: {self.driver_seconds / self.driver_pages * 1000:.0f} ms per film")
+        for reason, count in self.fallback_reasons.most_common():
+            log(f"  Driver fallback, {reason}: {count}")
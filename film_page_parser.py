@@ -0,0 +1,296 @@
+import argparse
+import re
+import statistics
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from lxml import html as lxml_html
+
+LANGUAGE_HEADINGS = ["Language", "Primary Language", "Languages", "Primary Languages"]
+
+# Letterboxd certification labels for the USA release, mapped to MPAA ratings
+MPAA_RATING_MAP = {
+    'R': 'R',
+    'PG-13': 'PG-13',
+    'PG': 'PG',
+    'G': 'G',
+    'NC-17': 'NC-17',
+    'X': 'NC-17',  # Historical rating
+    'M': 'PG',     # Historical rating
+    'GP': 'PG',    # Historical rating
+}
+
+def has_class(name):
+    """XPath predicate matching one whole class name."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+OG_TITLE_XPATH = '//meta[@property="og:title"]/@content'
+TMDB_ID_XPATH = '//body/@data-tmdb-id'
+RUNTIME_XPATH = f'//p[{has_class("text-link")}][{has_class("text-footer")}]'
+CREATOR_XPATH = f'//span[{has_class("creatorlist")}]//a[{has_class("contributor")}]//span[{has_class("prettify")}]'
+DIRECTOR_XPATH = f'//span[{has_class("directorlist")}]//a[{has_class("contributor")}]'
+ACTOR_XPATH = f'//*[@id="tab-cast"]//*[{has_class("text-sluglist")}]//a[{has_class("text-slug")}][{has_class("tooltip")}]'
+GENRE_XPATH = f'//*[@id="tab-genres"]//*[{has_class("text-sluglist")}]//a[{has_class("text-slug")}][contains(@href, "/films/genre/")]'
+STUDIO_XPATH = f'//*[@id="tab-details"]//*[{has_class("text-sluglist")}]//a[{has_class("text-slug")}][contains(@href, "/studio/")]'
+COUNTRY_XPATH = f'//*[@id="tab-details"]//*[{has_class("text-sluglist")}]//a[{has_class("text-slug")}][contains(@href, "/films/country/")]'
+DETAIL_HEADING_XPATH = '//*[@id="tab-details"]//h3'
+LANGUAGE_XPATH = f'.//a[{has_class("text-slug")}][contains(@href, "/films/language/")]'
+RELEASE_COUNTRY_XPATH = f'//*[{has_class("release-country")}]'
+RELEASE_NAME_XPATH = f'.//*[{has_class("name")}]'
+RELEASE_LABEL_XPATH = f'.//*[{has_class("release-certification-badge")}]//*[{has_class("label")}]'
+
+RATING_COUNT_PATTERN = re.compile(r'ratingCount":(\d+)')
+RUNTIME_PATTERN = re.compile(r'(\d+)\s*min(?:s)?')
+
+@dataclass
+class FilmPage:
+    """Everything the scrapers read from a Letterboxd film page."""
+    og_title: Optional[str] = None
+    release_year: Optional[str] = None
+    tmdb_id: Optional[str] = None
+    rating_count: int = 0
+    runtime: Optional[int] = None
+    mpaa_rating: Optional[str] = None
+    directors: List[str] = field(default_factory=list)
+    actors: List[str] = field(default_factory=list)
+    genres: List[str] = field(default_factory=list)
+    studios: List[str] = field(default_factory=list)
+    languages: List[str] = field(default_factory=list)
+    countries: List[str] = field(default_factory=list)
+    # How long FilmPageParser.parse took to build this page
+    parse_seconds: float = field(default=0.0, compare=False, repr=False)
+
+    def to_movie_data(self, film_title: str, release_year: str = None, tmdb_id: str = None) -> Dict:
+        """Build the whitelist Information dict used by every scraper."""
+        release_year = release_year or self.release_year
+        return {
+            'Title': film_title,
+            'Year': release_year,
+            'tmdbID': tmdb_id or self.tmdb_id,
+            'MPAA': self.mpaa_rating,
+            'Runtime': self.runtime,
+            'RatingCount': self.rating_count,
+            'Languages': list(self.languages),
+            'Countries': list(self.countries),
+            'Decade': (int(release_year) // 10) * 10 if release_year else None,
+            'Directors': list(self.directors),
+            'Genres': list(self.genres),
+            'Studios': list(self.studios),
+            'Actors': list(self.actors)
+        }
+
+def text_of(element) -> str:
+    return element.text_content().strip()
+
+def is_displayed(element) -> bool:
+    """Approximate WebElement.text, which is blank for elements hidden with the 'hidden' class."""
+    while element is not None:
+        if element.get('id', '').startswith('tab-'):
+            return True
+        classes = element.get('class', '').split()
+        style = element.get('style', '').replace(' ', '')
+        if 'hidden' in classes or 'display:none' in style:
+            return False
+        element = element.getparent()
+    return True
+
+class FilmPageParser:
+    """Extracts a FilmPage from a film page's HTML in a single parse.
+
+    Accepts driver.page_source or an HTTP response body and mirrors the
+    selectors the scrapers used to query one WebDriver call at a time.
+    """
+
+    def parse(self, page_source: str) -> FilmPage:
+        start = time.perf_counter()
+        tree = lxml_html.fromstring(page_source)
+        page = FilmPage()
+
+        og_title = tree.xpath(OG_TITLE_XPATH)
+        if og_title:
+            page.og_title = og_title[0]
+            if '(' in page.og_title and ')' in page.og_title:
+                page.release_year = page.og_title.split('(')[-1].split(')')[0].strip()
+
+        tmdb_id = tree.xpath(TMDB_ID_XPATH)
+        if tmdb_id and tmdb_id[0]:
+            page.tmdb_id = tmdb_id[0]
+
+        match = RATING_COUNT_PATTERN.search(page_source)
+        if match:
+            page.rating_count = int(match.group(1))
+
+        for footer in tree.xpath(RUNTIME_XPATH):
+            match = RUNTIME_PATTERN.search(text_of(footer))
+            if match:
+                page.runtime = int(match.group(1))
+                break
+
+        # Newer pages wrap director names in creatorlist/prettify; older ones use directorlist
+        directors = tree.xpath(CREATOR_XPATH) or tree.xpath(DIRECTOR_XPATH)
+        page.directors = [text_of(d) for d in directors if is_displayed(d) and text_of(d)]
+        page.actors = [text_of(a) for a in tree.xpath(ACTOR_XPATH) if is_displayed(a) and text_of(a)]
+        page.genres = [
+            text_of(g) for g in tree.xpath(GENRE_XPATH)
+            if text_of(g) and not any(char in text_of(g) for char in ['…', 'Show All'])
+        ]
+        page.studios = [text_of(s) for s in tree.xpath(STUDIO_XPATH) if text_of(s)]
+        page.countries = [text_of(c) for c in tree.xpath(COUNTRY_XPATH) if text_of(c)]
+        page.languages = self.parse_languages(tree)
+        page.mpaa_rating = self.parse_mpaa_rating(tree)
+        page.parse_seconds = time.perf_counter() - start
+        return page
+
+    def parse_languages(self, tree) -> List[str]:
+        """Languages listed under the Language headings of the details tab."""
+        languages = []
+        for heading in tree.xpath(DETAIL_HEADING_XPATH):
+            spans = heading.xpath('.//span')
+            heading_text = text_of(spans[0]) if spans else text_of(heading)
+            if not any(lang in heading_text for lang in LANGUAGE_HEADINGS):
+                continue
+            sluglists = heading.xpath(f"following-sibling::div[{has_class('text-sluglist')}]")
+            if not sluglists:
+                continue
+            paragraphs = sluglists[0].xpath('.//p')
+            if not paragraphs:
+                continue
+            for language in paragraphs[0].xpath(LANGUAGE_XPATH):
+                language_name = text_of(language)
+                if language_name and language_name not in languages:
+                    languages.append(language_name)
+        return languages
+
+    def parse_mpaa_rating(self, tree) -> Optional[str]:
+        """The MPAA rating of the USA release, if it has one."""
+        for country in tree.xpath(RELEASE_COUNTRY_XPATH):
+            names = country.xpath(RELEASE_NAME_XPATH)
+            labels = country.xpath(RELEASE_LABEL_XPATH)
+            name = text_of(names[0]) if names else ''
+            rating = text_of(labels[0]) if labels else ''
+            if name == "USA" and rating:
+                if rating.upper() in ['NR', 'NOT RATED', 'UNRATED']:
+                    return 'NR'
+                if rating in MPAA_RATING_MAP:
+                    return MPAA_RATING_MAP[rating]
+        return None
+
+def extract_with_selenium(driver) -> FilmPage:
+    """The per-field WebDriver extraction the scrapers used before FilmPageParser.
+
+    Kept only so the benchmark can compare both paths on the same loaded page.
+    """
+    from selenium.webdriver.common.by import By
+
+    page = FilmPage()
+    content = driver.find_element(By.CSS_SELECTOR, 'meta[property="og:title"]').get_attribute('content')
+    page.og_title = content
+    if content and '(' in content and ')' in content:
+        page.release_year = content.split('(')[-1].split(')')[0].strip()
+    page.tmdb_id = driver.find_element(By.TAG_NAME, 'body').get_attribute('data-tmdb-id') or None
+    match = RATING_COUNT_PATTERN.search(driver.page_source)
+    if match:
+        page.rating_count = int(match.group(1))
+    try:
+        match = RUNTIME_PATTERN.search(driver.find_element(By.CSS_SELECTOR, 'p.text-link.text-footer').text)
+        if match:
+            page.runtime = int(match.group(1))
+    except Exception:
+        pass
+    directors = driver.find_elements(By.CSS_SELECTOR, 'span.creatorlist a.contributor span.prettify') or \
+        driver.find_elements(By.CSS_SELECTOR, 'span.directorlist a.contributor')
+    page.directors = [d.text.strip() for d in directors if d.text.strip()]
+    page.actors = [a.text.strip() for a in driver.find_elements(By.CSS_SELECTOR, '#tab-cast .text-sluglist a.text-slug.tooltip') if a.text.strip()]
+    page.genres = [
+        g.get_attribute('textContent').strip()
+        for g in driver.find_elements(By.CSS_SELECTOR, '#tab-genres .text-sluglist a.text-slug[href*="/films/genre/"]')
+        if g.get_attribute('textContent').strip() and not any(char in g.get_attribute('textContent').strip() for char in ['…', 'Show All'])
+    ]
+    page.studios = [s.get_attribute('textContent').strip() for s in driver.find_elements(By.CSS_SELECTOR, '#tab-details .text-sluglist a.text-slug[href*="/studio/"]') if s.get_attribute('textContent').strip()]
+    page.countries = [c.get_attribute('textContent').strip() for c in driver.find_elements(By.CSS_SELECTOR, '#tab-details .text-sluglist a.text-slug[href*="/films/country/"]') if c.get_attribute('textContent').strip()]
+    for heading in driver.find_elements(By.CSS_SELECTOR, '#tab-details h3'):
+        spans = heading.find_elements(By.TAG_NAME, 'span')
+        heading_text = spans[0].get_attribute('textContent').strip() if spans else heading.get_attribute('textContent').strip()
+        if any(lang in heading_text for lang in LANGUAGE_HEADINGS):
+            try:
+                sluglist = heading.find_element(By.XPATH, "following-sibling::div[contains(@class, 'text-sluglist')]")
+                p_tag = sluglist.find_element(By.TAG_NAME, 'p')
+                for language in p_tag.find_elements(By.CSS_SELECTOR, 'a.text-slug[href*="/films/language/"]'):
+                    language_name = language.get_attribute('textContent').strip()
+                    if language_name and language_name not in page.languages:
+                        page.languages.append(language_name)
+            except Exception:
+                pass
+    for country in driver.execute_script("""
+        return Array.from(document.querySelectorAll('.release-country')).map(country => ({
+            name: country.querySelector('.name')?.textContent?.trim() || '',
+            rating: country.querySelector('.release-certification-badge .label')?.textContent?.trim() || ''
+        }));
+    """):
+        if country['name'] == "USA" and country['rating']:
+            if country['rating'].upper() in ['NR', 'NOT RATED', 'UNRATED']:
+                page.mpaa_rating = 'NR'
+                break
+            if country['rating'] in MPAA_RATING_MAP:
+                page.mpaa_rating = MPAA_RATING_MAP[country['rating']]
+                break
+    return page
+
+def benchmark(urls: List[str], repeat: int = 3) -> None:
+    """Time per-film extraction on the Selenium path against FilmPageParser."""
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.firefox.options import Options
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    options = Options()
+    options.add_argument("--headless")
+    driver = webdriver.Firefox(options=options)
+    parser = FilmPageParser()
+    selenium_times, parser_times = [], []
+    try:
+        for url in urls:
+            driver.get(url)
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, 'meta[property="og:title"]'))
+            )
+            for _ in range(repeat):
+                start = time.perf_counter()
+                selenium_page = extract_with_selenium(driver)
+                selenium_times.append(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                parsed_page = parser.parse(driver.page_source)
+                parser_times.append(time.perf_counter() - start)
+
+            status = "match" if parsed_page == selenium_page else "MISMATCH"
+            print(f"{url}: selenium {selenium_times[-1] * 1000:.1f} ms, parser {parser_times[-1] * 1000:.1f} ms ({status})")
+            if parsed_page != selenium_page:
+                for name in FilmPage.__dataclass_fields__:
+                    if getattr(parsed_page, name) != getattr(selenium_page, name):
+                        print(f"  {name}: selenium={getattr(selenium_page, name)!r} parser={getattr(parsed_page, name)!r}")
+    finally:
+        driver.quit()
+
+    selenium_median = statistics.median(selenium_times)
+    parser_median = statistics.median(parser_times)
+    print(f"\nFilms: {len(urls)}, runs per film: {repeat}")
+    print(f"Selenium extraction: median {selenium_median * 1000:.1f} ms per film")
+    print(f"FilmPageParser:      median {parser_median * 1000:.1f} ms per film (includes page_source)")
+    print(f"Speedup: {selenium_median / parser_median:.1f}x")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark FilmPageParser against per-field Selenium extraction.")
+    parser.add_argument('urls', nargs='*', default=[
+        'https://letterboxd.com/film/parasite-2019/',
+        'https://letterboxd.com/film/the-godfather/',
+        'https://letterboxd.com/film/spirited-away/'
+    ], help="Letterboxd film URLs to load")
+    parser.add_argument('--repeat', type=int, default=3, help="Extraction runs per film")
+    args = parser.parse_args()
+    benchmark(args.urls, args.repeat)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+import asyncio
+import threading
+import time
+
+from film_fetcher import FetchResult, FilmFetcher
+from webdriver_pool import WebDriverPool
+
+DEFAULT_CONCURRENCY = 8
+
+class FilmPagePipeline:
+    """Fetches a listing page's film pages concurrently ahead of the scraper's serial loop.
+
+    submit() starts HTTP fetches on a background event loop, bounded by a
+    concurrency limit. Each request waits on its host's rate controller like
+    any other, so the pipeline adds no pacing of its own. The scraper keeps
+    walking the listing in order and take()s each page when it reaches that
+    film, so accept/reject decisions and the MAX_MOVIES cutoff are unchanged;
+    only the waiting overlaps. With a driver_pool, pages HTTP cannot serve are loaded
+    in one of the pooled browsers as well; otherwise (or if that fails) the
+    caller's own driver loads them through FilmFetcher.fetch(). on_page, if
+    given, is called on a worker thread with each page as soon as it is
+    parsed, so follow-up lookups can start early too.
+    """
+
+    def __init__(self, fetcher: FilmFetcher, concurrency: int = DEFAULT_CONCURRENCY,
+                 driver_pool: WebDriverPool = None, on_page=None):
+        self.fetcher = fetcher
+        self.driver_pool = driver_pool
+        self.on_page = on_page
+        self.concurrency = concurrency
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name='film-page-pipeline', daemon=True)
+        self.thread.start()
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.pending = {}
+        # Throughput: pages fetched while at least one request was in flight
+        self.fetched = 0
+        self.in_flight = 0
+        self.busy_since = 0.0
+        self.busy_seconds = 0.0
+        self.wait_seconds = 0.0
+
+    async def fetch(self, url: str) -> FetchResult:
+        async with self.semaphore:
+            if self.in_flight == 0:
+                self.busy_since = time.perf_counter()
+            self.in_flight += 1
+            try:
+                result = await asyncio.to_thread(self.fetcher.fetch_http, url)
+                if result.page is None and self.driver_pool is not None:
+                    result = await asyncio.to_thread(self.render, url, result.reason)
+                self.fetched += 1
+                if result.page is not None and self.on_page is not None:
+                    try:
+                        self.on_page(result.page)
+                    except Exception:
+                        # A failing hook must not cost the page itself
+                        pass
+                return result
+            finally:
+                self.in_flight -= 1
+                if self.in_flight == 0:
+                    self.busy_seconds += time.perf_counter() - self.busy_since
+
+    def render(self, url: str, reason: str) -> FetchResult:
+        """Load a page HTTP could not serve in a pooled driver."""
+        start = time.perf_counter()
+        with self.driver_pool.driver() as driver:
+            page = self.fetcher.render(driver, url)
+        return FetchResult(page, reason, time.perf_counter() - start, True)
+
+    def submit(self, urls):
+        """Start fetching urls, dropping anything left over from the previous listing page."""
+        self.cancel_pending()
+        for url in urls:
+            if url not in self.pending:
+                self.pending[url] = asyncio.run_coroutine_threadsafe(self.fetch(url), self.loop)
+
+    def take(self, url: str):
+        """Wait for a submitted URL and return its FetchResult, or None if it was never submitted."""
+        future = self.pending.pop(url, None)
+        if future is None:
+            return None
+        start = time.perf_counter()
+        try:
+            return future.result()
+        except Exception:
+            # Let the caller fetch it again on its own thread
+            return None
+        finally:
+            self.wait_seconds += time.perf_counter() - start
+
+    def cancel_pending(self):
+        for future in self.pending.values():
+            future.cancel()
+        self.pending.clear()
+
+    async def shutdown(self):
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self.loop.shutdown_default_executor()
+
+    def close(self):
+        """Cancel outstanding fetches and stop the background event loop."""
+        self.cancel_pending()
+        asyncio.run_coroutine_threadsafe(self.shutdown(), self.loop).result(timeout=30)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout=5)
+
+    def report(self, log=print):
+        """Log the prefetch throughput, to compare with the overall processing speed."""
+        if not self.fetched:
+            return
+        speed = self.fetched / self.busy_seconds if self.busy_seconds else 0.0
+        log(f"Film page pipeline: {self.fetched} pages fetched at {speed:.2f} films/second "
+            f"({self.concurrency} concurrent)")
+        log(f"  Time spent waiting on prefetched pages: {self.wait_seconds:.1f}s")
@@ -0,0 +1,297 @@
+import argparse
+import json
+import os
+import queue
+import sqlite3
+import threading
+import unicodedata
+from multiprocessing.managers import BaseManager
+
+import pandas as pd
+
+from credentials_loader import get_os_specific_paths
+
+STORE_FILENAME = 'film_store.db'
+
+# Table name -> (workbook filename, workbook columns, column stored in `value`)
+TABLES = {
+    'whitelist': ('whitelist.xlsx', ['Title', 'Year', 'Information', 'Link'], 'Information'),
+    'blacklist': ('blacklist.xlsx', ['Title', 'Year', 'Reason', 'Link'], 'Reason'),
+    'zero_reviews': ('Zero_Reviews.xlsx', ['Title', 'Year', 'Blank', 'Link'], 'Blank'),
+    'incomplete_stats': ('Incomplete_Stats_Whitelist.xlsx', ['Title', 'Year'], None),
+    'top_250_data': ('top_250_data.xlsx', ['Title', 'Year', 'Link'], None),
+}
+
+def normalize_title(text):
+    return unicodedata.normalize('NFKC', str(text)).strip()
+
+def clean_cell(value):
+    """Convert an Excel cell to the string stored in SQLite."""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return ''
+    return str(value).strip()
+
+def tmdb_id_from_information(information):
+    """Pull the tmdbID out of a whitelist Information cell, if present."""
+    if not information:
+        return None
+    try:
+        info = json.loads(information) if isinstance(information, str) else information
+    except (json.JSONDecodeError, TypeError):
+        return None
+    if isinstance(info, dict) and info.get('tmdbID'):
+        return str(info.get('tmdbID'))
+    return None
+
+class FilmStore:
+    """SQLite store backing the whitelist, blacklist, zero reviews and incomplete stats lists.
+
+    The Excel workbooks stay the human-editable source. sync_workbook imports a
+    workbook whenever it has changed since the last sync, and export_workbook
+    writes the table back at the end of a run. In between, every mutation is a
+    transactional, indexed point write instead of a full workbook rewrite.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.create_schema()
+
+    def create_schema(self):
+        with self.lock, self.conn:
+            for table in TABLES:
+                self.conn.execute(f'''
+                    CREATE TABLE IF NOT EXISTS {table} (
+                        id INTEGER PRIMARY KEY,
+                        title TEXT NOT NULL DEFAULT '',
+                        year TEXT NOT NULL DEFAULT '',
+                        title_key TEXT NOT NULL DEFAULT '',
+                        value TEXT NOT NULL DEFAULT '',
+                        link TEXT NOT NULL DEFAULT '',
+                        tmdb_id TEXT
+                    )''')
+                self.conn.execute(f'CREATE INDEX IF NOT EXISTS {table}_link ON {table}(link)')
+                self.conn.execute(f'CREATE INDEX IF NOT EXISTS {table}_title_year ON {table}(title_key, year)')
+                self.conn.execute(f'CREATE INDEX IF NOT EXISTS {table}_tmdb_id ON {table}(tmdb_id)')
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS sync_state (
+                    table_name TEXT PRIMARY KEY,
+                    mtime REAL,
+                    size INTEGER,
+                    dirty INTEGER NOT NULL DEFAULT 0
+                )''')
+
+    def close(self):
+        self.conn.close()
+
+    def _row_to_dict(self, table, row):
+        _, columns, value_column = TABLES[table]
+        record = {'id': row['id'], 'Title': row['title'], 'Year': row['year']}
+        if value_column:
+            record[value_column] = row['value']
+        if 'Link' in columns:
+            record['Link'] = row['link']
+        record['tmdbID'] = row['tmdb_id']
+        return record
+
+    def _mark_dirty(self, table):
+        self.conn.execute('''
+            INSERT INTO sync_state (table_name, dirty) VALUES (?, 1)
+            ON CONFLICT(table_name) DO UPDATE SET dirty = 1''', (table,))
+
+    def _find_row(self, table, link=None, title=None, year=None):
+        if link:
+            return self.conn.execute(f'SELECT * FROM {table} WHERE link = ? LIMIT 1', (link,)).fetchone()
+        if title is not None:
+            title_key = normalize_title(title).lower()
+            return self.conn.execute(f'SELECT * FROM {table} WHERE title_key = ? AND year = ? LIMIT 1',
+                                     (title_key, clean_cell(year))).fetchone()
+        return None
+
+    def find(self, table, link=None, title=None, year=None, tmdb_id=None):
+        """Indexed lookup by link, by title (and optionally year) or by tmdbID."""
+        with self.lock:
+            if link:
+                rows = self.conn.execute(f'SELECT * FROM {table} WHERE link = ?', (link,)).fetchall()
+            elif tmdb_id:
+                rows = self.conn.execute(f'SELECT * FROM {table} WHERE tmdb_id = ?', (str(tmdb_id),)).fetchall()
+            elif title is not None and year is not None:
+                rows = self.conn.execute(f'SELECT * FROM {table} WHERE title_key = ? AND year = ?',
+                                         (normalize_title(title).lower(), clean_cell(year))).fetchall()
+            elif title is not None:
+                rows = self.conn.execute(f'SELECT * FROM {table} WHERE title_key = ?',
+                                         (normalize_title(title).lower(),)).fetchall()
+            else:
+                rows = []
+        return [self._row_to_dict(table, row) for row in rows]
+
+    def upsert(self, table, film_title, release_year, value=None, film_url=None, match_on='title_year'):
+        """Insert or update one entry and return its row id.
+
+        match_on='title_year' matches on normalized title and year and only fills
+        in a link when the stored one is blank. match_on='link' matches on URL.
+        """
+        title = normalize_title(film_title)
+        year = clean_cell(release_year)
+        link = film_url or ''
+        tmdb_id = tmdb_id_from_information(value) if table == 'whitelist' else None
+        with self.lock, self.conn:
+            if match_on == 'link':
+                existing = self._find_row(table, link=link) if link else None
+            else:
+                existing = self._find_row(table, title=title, year=year)
+            if existing:
+                new_value = existing['value'] if value is None else value
+                new_link = existing['link'] if (existing['link'] or not link) else link
+                new_tmdb_id = tmdb_id or existing['tmdb_id']
+                self.conn.execute(f'UPDATE {table} SET value = ?, link = ?, tmdb_id = ? WHERE id = ?',
+                                  (new_value, new_link, new_tmdb_id, existing['id']))
+                if match_on == 'link':
+                    # The URL is the identity here, so refresh the title and year it maps to
+                    self.conn.execute(f'UPDATE {table} SET title = ?, year = ?, title_key = ? WHERE id = ?',
+                                      (title, year, title.lower(), existing['id']))
+                row_id = existing['id']
+            else:
+                cursor = self.conn.execute(
+                    f'INSERT INTO {table} (title, year, title_key, value, link, tmdb_id) VALUES (?, ?, ?, ?, ?, ?)',
+                    (title, year, title.lower(), value or '', link, tmdb_id))
+                row_id = cursor.lastrowid
+            self._mark_dirty(table)
+        return row_id
+
+    def set_link(self, table, row_id, film_url):
+        with self.lock, self.conn:
+            self.conn.execute(f'UPDATE {table} SET link = ? WHERE id = ?', (film_url, row_id))
+            self._mark_dirty(table)
+
+    def delete(self, table, row_id):
+        with self.lock, self.conn:
+            self.conn.execute(f'DELETE FROM {table} WHERE id = ?', (row_id,))
+            self._mark_dirty(table)
+
+    def count(self, table):
+        with self.lock:
+            return self.conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+
+    def load_frame(self, table):
+        """Return the table as a DataFrame with the workbook's columns, indexed by row id."""
+        _, columns, value_column = TABLES[table]
+        with self.lock:
+            rows = self.conn.execute(f'SELECT id, title, year, value, link FROM {table} ORDER BY id').fetchall()
+        data = {'Title': [row['title'] for row in rows], 'Year': [row['year'] for row in rows]}
+        if value_column:
+            data[value_column] = [row['value'] for row in rows]
+        if 'Link' in columns:
+            data['Link'] = [row['link'] for row in rows]
+        frame = pd.DataFrame(data, columns=columns, index=[row['id'] for row in rows])
+        return frame
+
+    def import_workbook(self, table, workbook_path, merge=False):
+        """Load a workbook into the table, replacing its contents unless merge is set."""
+        _, columns, value_column = TABLES[table]
+        frame = pd.read_excel(workbook_path, header=0, names=columns, usecols=list(range(len(columns))), dtype={'Year': str})
+        match_on = 'link' if table in ('zero_reviews', 'top_250_data') else 'title_year'
+        if merge:
+            for row in frame.itertuples(index=False):
+                record = dict(zip(columns, row))
+                self.upsert(table, clean_cell(record['Title']), record['Year'],
+                            clean_cell(record.get(value_column)) if value_column else None,
+                            clean_cell(record.get('Link')), match_on=match_on)
+        else:
+            rows = []
+            for row in frame.itertuples(index=False):
+                record = dict(zip(columns, row))
+                title = normalize_title(clean_cell(record['Title']))
+                value = clean_cell(record.get(value_column)) if value_column else ''
+                rows.append((title, clean_cell(record['Year']), title.lower(), value,
+                             clean_cell(record.get('Link')),
+                             tmdb_id_from_information(value) if table == 'whitelist' else None))
+            with self.lock, self.conn:
+                self.conn.execute(f'DELETE FROM {table}')
+                self.conn.executemany(
+                    f'INSERT INTO {table} (title, year, title_key, value, link, tmdb_id) VALUES (?, ?, ?, ?, ?, ?)', rows)
+        # A merge keeps store-only rows, so the workbook still needs a fresh export
+        self._record_sync(table, workbook_path, dirty=merge)
+        return len(frame)
+
+    def export_workbook(self, table, workbook_path):
+        """Write the table back to its workbook and record the workbook's new mtime."""
+        frame = self.load_frame(table)
+        temp_path = os.path.splitext(workbook_path)[0] + '.exporting.xlsx'
+        frame.to_excel(temp_path, index=False)
+        os.replace(temp_path, workbook_path)
+        self._record_sync(table, workbook_path)
+        return len(frame)
+
+    def _record_sync(self, table, workbook_path, dirty=False):
+        stat = os.stat(workbook_path)
+        with self.lock, self.conn:
+            self.conn.execute('''
+                INSERT INTO sync_state (table_name, mtime, size, dirty) VALUES (?, ?, ?, ?)
+                ON CONFLICT(table_name) DO UPDATE SET mtime = excluded.mtime, size = excluded.size, dirty = excluded.dirty''',
+                (table, stat.st_mtime, stat.st_size, int(dirty)))
+
+    def is_dirty(self, table):
+        with self.lock:
+            state = self.conn.execute('SELECT dirty FROM sync_state WHERE table_name = ?', (table,)).fetchone()
+        return bool(state and state['dirty'])
+
+    def sync_workbook(self, table, workbook_path):
+        """Import the workbook if it was edited since the last sync. Returns True if it imported."""
+        if not os.path.exists(workbook_path):
+            return False
+        stat = os.stat(workbook_path)
+        with self.lock:
+            state = self.conn.execute('SELECT mtime, size, dirty FROM sync_state WHERE table_name = ?', (table,)).fetchone()
+        if state and state['mtime'] == stat.st_mtime and state['size'] == stat.st_size:
+            return False
+        # If a crashed run left unexported changes, merge the edited workbook on top rather than discarding them
+        merge = bool(state and state['dirty'])
+        self.import_workbook(table, workbook_path, merge=merge)
+        return True
+
+    def export_if_dirty(self, table, workbook_path):
+        if self.is_dirty(table):
+            self.export_workbook(table, workbook_path)
+            return True
+        return False
+
+class StoreServer(BaseManager):
+    """Serves one FilmStore to scrapers running in several processes.
+
+    start() the server, create the store with server.FilmStore(db_path) and
+    hand the proxy to the workers. Every call runs in the server process under
+    the store's lock, so all the workers' writes go through one connection one
+    at a time and none of them is lost. server.Queue() gives the workers a
+    shared work queue.
+    """
+
+StoreServer.register('FilmStore', FilmStore)
+StoreServer.register('Queue', queue.Queue)
+
+def main():
+    parser = argparse.ArgumentParser(description="Import the list workbooks into the film store, or export them back out.")
+    parser.add_argument('command', choices=['import', 'export', 'status'])
+    parser.add_argument('--dir', default=get_os_specific_paths()['base_dir'], help="Folder containing the workbooks")
+    args = parser.parse_args()
+
+    store = FilmStore(os.path.join(args.dir, STORE_FILENAME))
+    for table, (workbook, _, _) in TABLES.items():
+        workbook_path = os.path.join(args.dir, workbook)
+        if args.command == 'import':
+            if os.path.exists(workbook_path):
+                print(f"Imported {store.import_workbook(table, workbook_path)} rows from {workbook}")
+            else:
+                print(f"Skipped {workbook} (not found)")
+        elif args.command == 'export':
+            print(f"Exported {store.export_workbook(table, workbook_path)} rows to {workbook}")
+        else:
+            print(f"{table}: {store.count(table)} rows{' (unexported changes)' if store.is_dirty(table) else ''}")
+    store.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+import time
+
+import pandas as pd
+
+from list_criteria import STAT_FIELDS
+from stats_accumulator import STAT_CATEGORIES
+
+# Whitelist Information keys holding a single value rather than a list
+SCALAR_FIELDS = {'Decade'}
+
+class FilmTable:
+    """Columnar record of which films joined which lists, for counting their stats at the end of a run.
+
+    The alternative to keeping a StatsAccumulator per list: add() only
+    appends a row (list name plus the film's metadata columns), and
+    summarize() explodes the list columns and counts every list's top values
+    in one groupby per category. Ties keep the order the values first
+    appeared in, so the results match StatsAccumulator.top(). Only New
+    Popular V2 counts its lists with StatsAccumulator, so its --table-stats
+    is the one user; Rating 5000 and Genre 250s V2 keep their own counters.
+    """
+
+    def __init__(self):
+        self.columns = {'List': [], **{field: [] for field in STAT_FIELDS.values()}}
+        self.summary = None
+        self.summary_k = None
+        self.summarize_seconds = 0.0
+
+    def __len__(self):
+        return len(self.columns['List'])
+
+    def add(self, list_name: str, movie_info: dict):
+        """Record that a film joined a list."""
+        self.columns['List'].append(list_name)
+        for field in STAT_FIELDS.values():
+            self.columns[field].append(movie_info.get(field))
+        self.summary = None
+
+    def stats_for(self, list_name: str) -> 'TableStats':
+        """Return a stand-in for a list's StatsAccumulator that records into this table."""
+        return TableStats(self, list_name)
+
+    def summarize(self, k: int = 10):
+        """Return {list name: {category: [(value, count), ...]}} with the top k values of every category."""
+        if self.summary is not None and self.summary_k == k:
+            return self.summary
+        start = time.perf_counter()
+        frame = pd.DataFrame(self.columns, dtype=object)
+        summary = {list_name: {category: [] for category in STAT_CATEGORIES} for list_name in dict.fromkeys(self.columns['List'])}
+        for category, field in STAT_FIELDS.items():
+            values = frame[['List', field]]
+            if field in SCALAR_FIELDS:
+                # StatsAccumulator skips a missing or zero decade
+                values = values[values[field].map(lambda value: bool(value) and not pd.isna(value))]
+            else:
+                values = values.explode(field).dropna(subset=[field])
+            if values.empty:
+                continue
+            # sort=False numbers the groups in order of first appearance, which the stable sort keeps for ties
+            counts = values.groupby(['List', field], sort=False).size().reset_index(name='Count')
+            counts = counts.sort_values('Count', ascending=False, kind='stable').groupby('List', sort=False).head(k)
+            for list_name, value, count in counts.itertuples(index=False):
+                summary[list_name][category].append((value, int(count)))
+        self.summary, self.summary_k = summary, k
+        self.summarize_seconds = time.perf_counter() - start
+        return summary
+
+    def report(self, log=print):
+        if len(self):
+            log(f"Film table: {len(self)} list entries, stats counted in {self.summarize_seconds * 1000:.0f} ms")
+
+class TableStats:
+    """The StatsAccumulator interface over one list's rows of a FilmTable."""
+
+    __slots__ = ('table', 'list_name')
+
+    def __init__(self, table: FilmTable, list_name: str):
+        self.table = table
+        self.list_name = list_name
+
+    def add(self, movie_info: dict):
+        self.table.add(self.list_name, movie_info)
+
+    def top(self, category: str, k: int = 10):
+        return self.table.summarize(k).get(self.list_name, {}).get(category, [])
+
+    def top_all(self, k: int = 10, categories=STAT_CATEGORIES):
+        for category in categories:
+            yield category, self.top(category, k)
@@ -0,0 +1,162 @@
+import argparse
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from credentials_loader import get_os_specific_paths
+from rate_controller import RateControlledSession
+
+HTTP_CACHE_FILENAME = 'http_cache.db'
+CACHED_HOSTS = ('letterboxd.com',)
+# Only these response headers are kept; the body is stored decoded, so no Content-Encoding
+STORED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified')
+
+class HttpCache:
+    """SQLite store of Letterboxd response bodies with their ETag and Last-Modified validators.
+
+    Bodies are zlib-compressed. hits, not_modified and misses count this run's
+    responses served straight from the cache, revalidated with a 304, and
+    downloaded in full. Safe to use from worker threads.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        with self.conn:
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS responses (
+                    url TEXT PRIMARY KEY,
+                    headers TEXT NOT NULL,
+                    body BLOB NOT NULL,
+                    stored_at REAL NOT NULL
+                )''')
+        self.hits = 0
+        self.not_modified = 0
+        self.misses = 0
+        self.bytes_saved = 0
+
+    def get(self, url):
+        """Return (headers, body, age in seconds) for a stored URL, or None."""
+        with self.lock:
+            row = self.conn.execute('SELECT headers, body, stored_at FROM responses WHERE url = ?', (url,)).fetchone()
+        if row is None:
+            return None
+        return CaseInsensitiveDict(json.loads(row[0])), zlib.decompress(row[1]), time.time() - row[2]
+
+    def put(self, url, headers, body):
+        kept = {name: headers[name] for name in STORED_HEADERS if name in headers}
+        with self.lock, self.conn:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO responses (url, headers, body, stored_at) VALUES (?, ?, ?, ?)',
+                (url, json.dumps(kept), zlib.compress(body), time.time())
+            )
+
+    def touch(self, url):
+        """Mark a stored response as fresh again after a 304."""
+        with self.lock, self.conn:
+            self.conn.execute('UPDATE responses SET stored_at = ? WHERE url = ?', (time.time(), url))
+
+    def tally(self, outcome: str, bytes_saved: int = 0):
+        """Count one response as a 'hits', 'not_modified' or 'misses' outcome."""
+        with self.lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+            self.bytes_saved += bytes_saved
+
+    def count(self):
+        with self.lock:
+            return self.conn.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    def clear(self):
+        with self.lock, self.conn:
+            self.conn.execute('DELETE FROM responses')
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+    def report(self, log=print):
+        """Log how this run's cacheable requests were answered."""
+        total = self.hits + self.not_modified + self.misses
+        if not total:
+            return
+        log(f"HTTP cache: {self.hits} served from cache, {self.not_modified} not modified (304), "
+            f"{self.misses} downloaded; {self.bytes_saved / 1_000_000:.1f} MB not re-downloaded")
+
+def build_response(url, headers, body):
+    response = requests.Response()
+    response.status_code = 200
+    response.headers = headers
+    response._content = body
+    response.url = url
+    response.encoding = requests.utils.get_encoding_from_headers(headers)
+    return response
+
+class CachedSession(RateControlledSession):
+    """A rate-controlled session that revalidates Letterboxd pages instead of re-downloading them.
+
+    A stored page younger than max_age seconds is returned without any
+    request. Older ones are requested with If-None-Match/If-Modified-Since,
+    and a 304 is answered from the stored body. Pages come back as ordinary
+    200 responses either way. Without a cache this is a RateControlledSession.
+    """
+
+    def __init__(self, cache: HttpCache = None, max_age: float = 0, log=None):
+        super().__init__(log)
+        self.cache = cache
+        self.max_age = max_age
+
+    def request(self, method, url, *args, **kwargs):
+        host = (urlsplit(url).hostname or '').lower()
+        if (self.cache is None or method.upper() != 'GET' or kwargs.get('params')
+                or not any(host == name or host.endswith('.' + name) for name in CACHED_HOSTS)):
+            return super().request(method, url, *args, **kwargs)
+
+        stored = self.cache.get(url)
+        if stored is not None:
+            stored_headers, body, age = stored
+            if age < self.max_age:
+                self.cache.tally('hits', len(body))
+                return build_response(url, stored_headers, body)
+            conditional = {}
+            if 'ETag' in stored_headers:
+                conditional['If-None-Match'] = stored_headers['ETag']
+            if 'Last-Modified' in stored_headers:
+                conditional['If-Modified-Since'] = stored_headers['Last-Modified']
+            kwargs['headers'] = {**(kwargs.get('headers') or {}), **conditional}
+
+        response = super().request(method, url, *args, **kwargs)
+        if response.status_code == 304 and stored is not None:
+            self.cache.touch(url)
+            self.cache.tally('not_modified', len(stored[1]))
+            return build_response(url, stored[0], stored[1])
+
+        self.cache.tally('misses')
+        if response.status_code == 200 and (self.max_age > 0 or 'ETag' in response.headers
+                                            or 'Last-Modified' in response.headers):
+            self.cache.put(url, response.headers, response.content)
+        return response
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or clear the shared Letterboxd HTTP cache.")
+    parser.add_argument('--dir', default=get_os_specific_paths()['base_dir'], help="Folder holding http_cache.db")
+    parser.add_argument('--clear', action='store_true', help="Delete every stored response")
+    args = parser.parse_args()
+
+    cache = HttpCache(os.path.join(args.dir, HTTP_CACHE_FILENAME))
+    if args.clear:
+        cache.clear()
+    print(f"{cache.count()} responses cached")
+    cache.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,387 @@
+import argparse
+import os
+from collections import Counter
+from datetime import datetime
+
+import pandas as pd
+
+from credentials_loader import get_os_specific_paths
+from film_catalog import CATALOG_FILENAME, LISTING_URLS, FilmCatalog
+from film_store import STORE_FILENAME, FilmStore, normalize_title
+from list_criteria import (CONTINENTS_COUNTRIES, FILTER_GENRES, FILTER_KEYWORDS, GENRES, MIN_RATING_COUNT, MIN_RUNTIME,
+                           MPAA_RATINGS, STAT_FIELDS, STAT_NAMES)
+from tmdb_cache import CACHE_FILENAME, DEFAULT_TTL_DAYS, TmdbCache
+from whitelist_lookup import WhitelistLookup
+
+CHUNK_SIZE = 1900
+DEFAULT_TOP_SIZE = 5000
+DEFAULT_BUCKET_SIZE = 250
+GENRE_LIST_SIZE = 250
+
+# Runtime category -> test on the runtime in minutes
+RUNTIME_CATEGORIES = {
+    '90_Minutes_or_Less': lambda runtime: runtime < 91,
+    '120_Minutes_or_Less': lambda runtime: runtime < 121,
+    '180_Minutes_or_Greater': lambda runtime: runtime > 179,
+    '240_Minutes_or_Greater': lambda runtime: runtime > 239,
+}
+
+# Per-listing file names, headings and bucket sizes, as the Popular and Rating scrapers write them
+LISTING_OUTPUTS = {
+    'popular': {
+        'top_prefix': 'popular_filtered',
+        'suffix': 'pop',
+        'heading': 'Most Popular',
+        'mpaa_limits': {'G': 200, 'NC-17': 25},
+        'runtime_limits': {'180_Minutes_or_Greater': 75, '240_Minutes_or_Greater': 5},
+        'continent_limits': {'Africa': 20, 'Oceania': 150, 'South America': 100},
+    },
+    'rating': {
+        'top_prefix': 'rating_filtered',
+        'suffix': 'top',
+        'heading': 'Highest Rated',
+        'mpaa_limits': {'G': 100, 'NC-17': 15},
+        'runtime_limits': {'180_Minutes_or_Greater': 150, '240_Minutes_or_Greater': 25},
+        'continent_limits': {'Africa': 100, 'Oceania': 75, 'South America': 250},
+    },
+}
+
+ELIGIBILITY_CRITERIA = [
+    "-- Must have a minimum of 1,000 reviews on Letterboxd.",
+    "-- Cannot be a short film (minimum 40 minutes).",
+    "-- Cannot be a television miniseries.",
+    "-- Cannot be a compilation of short serials.",
+    "-- Cannot be a documentary.",
+    "-- Cannot be a non-narrative project (paint drying for 10 hours, a timelapse of the construction of a building, abstract images, etc).",
+    "-- Cannot be a recording of a live performance (stand-up specials, recordings of live theater, concert films, etc).",
+    "-- Cannot be a television special episode, though feature film spin-offs from television shows are allowed.",
+    "-- Feature film spin-offs from television shows must contain original material, not just recap or compilation of existing material.",
+    "-- Entries that have scores inflated because they share a name with a popular television show are removed, as I notice them.",
+]
+CLOSING_LINE = "If you notice any movies you believe should/should not be included just let me know!"
+
+def get_ordinal(n):
+    if 10 <= n % 100 <= 20:
+        suffix = 'th'
+    else:
+        suffix = {1: 'st', 2: 'nd', 3: 'rd'}.get(n % 10, 'th')
+    return str(n) + suffix
+
+def continents_of(countries):
+    """Return the continents a film's countries belong to, each once, in country order."""
+    continents = []
+    for country in countries:
+        for continent, country_list in CONTINENTS_COUNTRIES.items():
+            if country in country_list:
+                if continent not in continents:
+                    continents.append(continent)
+                break
+    return continents
+
+def genre_name(genre_slug):
+    """Map a /films/genre/ slug to the genre name shown on film pages."""
+    return genre_slug.replace('-', ' ').title()
+
+def count_stats(films):
+    """Tally the stats blocks for a list of records."""
+    stats = {key: Counter() for key in STAT_FIELDS}
+    for film in films:
+        for key, field in STAT_FIELDS.items():
+            value = film.get(field)
+            if field == 'Decade':
+                if value:
+                    stats[key][value] += 1
+            else:
+                stats[key].update(value or [])
+    return stats
+
+class ListDeriver:
+    """Builds the scrapers' output lists from the film catalog without touching the network.
+
+    Each film in a listing's stored order goes through the scrapers' checks
+    once: blacklisted films are dropped, whitelisted ones are approved with
+    their whitelist Information, and the rest need enough ratings, a long
+    enough runtime, a tmdbID and cached TMDB keywords/genres that pass the
+    filters. A film with no cached TMDB details is left out and counted, since
+    fetching them would mean a network call. Lists are then cut from the
+    approved films in order.
+    """
+
+    def __init__(self, catalog: FilmCatalog, store: FilmStore, tmdb_cache: TmdbCache, output_dir: str,
+                 whitelist_path: str = None, blacklist_path: str = None, log=print):
+        self.catalog = catalog
+        self.tmdb_cache = tmdb_cache
+        self.output_dir = output_dir
+        self.log = log
+        if whitelist_path:
+            store.sync_workbook('whitelist', whitelist_path)
+        if blacklist_path:
+            store.sync_workbook('blacklist', blacklist_path)
+        whitelist = store.load_frame('whitelist')
+        self.whitelist_lookup = WhitelistLookup()
+        self.whitelist_url_index = {}
+        for title, year, information, link in zip(whitelist['Title'], whitelist['Year'],
+                                                  whitelist['Information'], whitelist['Link']):
+            key = f"{title.lower()}_{year}"
+            self.whitelist_lookup[key] = (information, None, link)
+            if link:
+                self.whitelist_url_index.setdefault(link, key)
+        blacklist = store.load_frame('blacklist')
+        self.blacklist_urls = {link for link in blacklist['Link'] if link}
+        self.blacklist_title_years = {(title.lower(), str(year)) for title, year in zip(blacklist['Title'], blacklist['Year'])}
+        self.decisions = {}
+        self.approved_by_listing = {}
+        # Listing -> how many approved films rank above its first film that was never scraped
+        self.approved_before_gap = {}
+        self.rejections = Counter()
+        self.unknown_continent_films = {}
+
+    def whitelist_info(self, record):
+        key = self.whitelist_url_index.get(record['Link']) or f"{normalize_title(record['Title']).lower()}_{record['Year']}"
+        entry = self.whitelist_lookup.get(key)
+        return entry[0] if entry else None
+
+    def check(self, record):
+        """Return (approved record or None, rejection reason or None) for one catalog record."""
+        title_key = (normalize_title(record['Title']).lower(), str(record['Year']))
+        if record['Link'] in self.blacklist_urls or title_key in self.blacklist_title_years:
+            return None, 'Blacklisted'
+
+        info = self.whitelist_info(record)
+        if info:
+            # Whitelist data wins where it has a value, as it does in the scrapers
+            merged = dict(record)
+            merged.update({key: value for key, value in info.items() if value not in (None, '', [])})
+            return merged, None
+
+        rating_count = record['RatingCount'] or 0
+        if rating_count == 0:
+            return None, 'Zero reviews'
+        if rating_count < MIN_RATING_COUNT:
+            return None, 'Insufficient ratings (< 1000)'
+        if record['Runtime'] is None:
+            return None, 'Missing runtime'
+        if record['Runtime'] < MIN_RUNTIME:
+            return None, 'Short runtime'
+        if not record['tmdbID']:
+            return None, 'Missing TMDB ID'
+
+        details = self.tmdb_cache.get(record['tmdbID'])
+        if details is None:
+            return None, 'No cached TMDB details'
+        keywords, genres = details
+        matching = [k for k in FILTER_KEYWORDS if k in keywords] + [g for g in FILTER_GENRES if g in genres]
+        if matching:
+            return None, f"due to being a {', '.join(matching)}."
+        return record, None
+
+    def decide(self, record):
+        """check() a record once per run; returns the approved record or None."""
+        url = record['Link']
+        if url not in self.decisions:
+            self.decisions[url] = self.check(record)
+            if self.decisions[url][1]:
+                self.rejections[self.decisions[url][1]] += 1
+        return self.decisions[url][0]
+
+    def approved_films(self, listing):
+        """Approved records for a listing, in the order it was last crawled."""
+        if listing not in self.approved_by_listing:
+            approved = []
+            for url, record in self.catalog.ranked(listing):
+                if record is None:
+                    self.rejections['Not scraped yet'] += 1
+                    self.approved_before_gap.setdefault(listing, len(approved))
+                    continue
+                film = self.decide(record)
+                if film is not None:
+                    approved.append(film)
+            self.approved_by_listing[listing] = approved
+        return self.approved_by_listing[listing]
+
+    def write_list(self, films, csv_name, chunked=False):
+        """Write Title/Year/tmdbID/Link rows, split into CHUNK_SIZE files named csv_name.format(n) if chunked."""
+        frame = pd.DataFrame(films, columns=['Title', 'Year', 'tmdbID', 'Link'])
+        if not chunked:
+            frame.to_csv(os.path.join(self.output_dir, csv_name), index=False, encoding='utf-8')
+            return
+        for i, start in enumerate(range(0, len(frame), CHUNK_SIZE)):
+            frame.iloc[start:start + CHUNK_SIZE].to_csv(
+                os.path.join(self.output_dir, csv_name.format(i + 1)), index=False, encoding='utf-8')
+
+    def write_stats(self, films, stats_name, heading_lines, stats=None, strong_closing=True):
+        """Write a stats file; stats defaults to count_stats(films), and each of its blocks gets a top 10."""
+        current_date = datetime.now()
+        formatted_date = current_date.strftime('%B ') + get_ordinal(current_date.day) + f", {current_date.year}"
+        if stats is None:
+            stats = count_stats(films)
+        with open(os.path.join(self.output_dir, stats_name), mode='w', encoding='utf-8') as file:
+            for line in heading_lines:
+                file.write(f"<strong>{line}</strong>\n\n")
+            file.write(f"<strong>Last updated: {formatted_date}</strong>\n\n")
+            file.write("<a href=https://letterboxd.com/bigbadraj/list/the-official-list-index/> Check out more of the lists I update regularly! </a>\n\n")
+            file.write("<strong>Film eligibility criteria:</strong>\n")
+            for line in ELIGIBILITY_CRITERIA:
+                file.write(f"{line}\n")
+            file.write("\n")
+            for key, counts in stats.items():
+                display_name = STAT_NAMES.get(key, key.replace('_counts', ''))
+                file.write(f"<strong>The ten most appearing {display_name}:</strong>\n")
+                for item, count in counts.most_common(10):
+                    file.write(f"{item}: {count}\n")
+                file.write("\n")
+            file.write(f"<strong>{CLOSING_LINE}</strong>" if strong_closing else CLOSING_LINE)
+
+    def derive_listing(self, listing, top_size=DEFAULT_TOP_SIZE, bucket_size=DEFAULT_BUCKET_SIZE):
+        """Write the top list and the MPAA, runtime and continent lists for one listing."""
+        spec = LISTING_OUTPUTS[listing]
+        suffix = spec['suffix']
+        heading = spec['heading']
+        approved = self.approved_films(listing)
+
+        top = approved[:top_size]
+        self.write_list(top, f"{spec['top_prefix']}_movie_titles{{}}.csv", chunked=True)
+        self.write_stats(top, f"{spec['top_prefix']}_titles.txt",
+                         [f"The Top {len(top)} {heading} Narrative Feature Films on Letterboxd."])
+        if len(top) < top_size:
+            self.log(f"⚠️ Only {len(top)} approved films in the {listing} crawl; crawl deeper for a full {top_size}")
+
+        mpaa = {rating: [] for rating in MPAA_RATINGS}
+        runtime = {category: [] for category in RUNTIME_CATEGORIES}
+        continents = {continent: [] for continent in CONTINENTS_COUNTRIES}
+        for film in approved:
+            if film.get('MPAA') in mpaa:
+                mpaa[film['MPAA']].append(film)
+            if film.get('Runtime'):
+                for category, matches in RUNTIME_CATEGORIES.items():
+                    if matches(int(film['Runtime'])):
+                        runtime[category].append(film)
+            film_continents = continents_of(film.get('Countries') or [])
+            for continent in film_continents:
+                continents[continent].append(film)
+            if film.get('Countries') and not film_continents:
+                self.unknown_continent_films[film['Link']] = {
+                    'Title': film['Title'], 'Year': film['Year'], 'Countries': ', '.join(film['Countries'])}
+
+        for rating, films in mpaa.items():
+            films = films[:spec['mpaa_limits'].get(rating, bucket_size)]
+            if films:
+                self.write_list(films, f'{rating.upper()}_{suffix}_movies.csv')
+                self.write_stats(films, f'stats_{rating.upper()}_{suffix}_movies.txt', [
+                    f"The Top {len(films)} {heading} {rating} Rated Movies On Letterboxd",
+                    "Rating defined by MPAA. Films released before November 1, 1968 are not eligible as they predate the current MPAA rating system. (Unless there was a subsequent re-rating.)"])
+        for category, films in runtime.items():
+            films = films[:spec['runtime_limits'].get(category, bucket_size)]
+            if films:
+                self.write_list(films, f'{category}_{suffix}_movies.csv')
+                self.write_stats(films, f'stats_{category}_{suffix}_movies.txt',
+                                 [f"The Top {len(films)} {heading} Films With a Runtime of {category.replace('_', ' ')}."])
+        for continent, films in continents.items():
+            films = films[:spec['continent_limits'].get(continent, bucket_size)]
+            if films:
+                name = continent.replace(' ', '_').lower()
+                self.write_list(films, f'{name}_{suffix}_movies.csv')
+                self.write_stats(films, f'stats_{name}_{suffix}_movies.txt',
+                                 [f"The Top {len(films)} {heading} Films from {'Australia' if continent == 'Oceania' else continent}"])
+        self.log(f"📋 Derived the {listing} lists from {len(approved)} approved films")
+
+    def genre_films(self, genre, sort_type, size=GENRE_LIST_SIZE):
+        """The first `size` approved films of a genre, from the matching global listing.
+
+        Both listings are sorted globally, so this matches the genre's own
+        listing as far as the global crawl reaches. A film the crawl never
+        scraped could be in the genre, so only films ranked above the first
+        such gap are taken; fewer than `size` means the caller has to crawl.
+        """
+        name = genre_name(genre)
+        approved = self.approved_films(sort_type)
+        if sort_type in self.approved_before_gap:
+            approved = approved[:self.approved_before_gap[sort_type]]
+        return [film for film in approved if name in (film.get('Genres') or [])][:size]
+
+    def count_genre_stats(self, films):
+        """Tally a genre list's stats as the genre scraper does, with the TMDB genres and keywords from the cache."""
+        stats = count_stats(films)
+        stats['genre_counts'] = Counter()
+        stats['keyword_counts'] = Counter()
+        for film in films:
+            details = self.tmdb_cache.get(film['tmdbID']) if film.get('tmdbID') else None
+            if details:
+                keywords, genres = details
+                stats['genre_counts'].update(genres)
+                stats['keyword_counts'].update(keywords)
+        return stats
+
+    def write_genre(self, genre, sort_type, films):
+        """Write one genre's top list and its stats in the genre scraper's format."""
+        frame = pd.DataFrame([(film['Title'], film['Year'], film['tmdbID']) for film in films],
+                             columns=['Title', 'Year', 'tmdbId'])
+        frame.to_csv(os.path.join(self.output_dir, f'top_250_{genre}_{sort_type}.csv'), index=False, encoding='utf-8')
+        name = genre_name(genre)
+        display = {'Science Fiction': 'Science Fiction', 'Animation': 'Animated'}.get(name, genre.capitalize())
+        heading = 'Most Popular' if sort_type == 'popular' else 'Highest Rated'
+        self.write_stats(films, f'stats_top_250_{genre}_{sort_type}.txt',
+                         [f"The Top {len(films)} {heading} {display} Narrative Feature Films on Letterboxd"],
+                         stats=self.count_genre_stats(films), strong_closing=False)
+
+    def derive_genre(self, genre, sort_type, size=GENRE_LIST_SIZE):
+        """Write one genre's top list from the matching global listing. Returns how many films it holds."""
+        films = self.genre_films(genre, sort_type, size)
+        self.write_genre(genre, sort_type, films)
+        return len(films)
+
+    def derive_genres(self, genres=GENRES, size=GENRE_LIST_SIZE):
+        for genre in genres:
+            for sort_type in ['rating', 'popular']:
+                count = self.derive_genre(genre, sort_type, size)
+                if count < size and sort_type in self.approved_before_gap:
+                    self.log(f"⚠️ Only {count} {genre} films in the {sort_type} crawl before a film it never scraped; "
+                             f"crawl again for a full {size}")
+                elif count < size:
+                    self.log(f"⚠️ Only {count} {genre} films in the {sort_type} crawl; crawl deeper for a full {size}")
+        self.log(f"📋 Derived {len(genres) * 2} genre lists")
+
+    def save_unknown_continent_films(self):
+        if self.unknown_continent_films:
+            output_path = os.path.join(self.output_dir, 'unknown_continent_films.csv')
+            pd.DataFrame(list(self.unknown_continent_films.values())).to_csv(output_path, index=False, encoding='utf-8')
+            self.log(f"Saved {len(self.unknown_continent_films)} films from unknown continents to {output_path}.")
+
+    def report(self):
+        """Log why films were left out of the derived lists."""
+        for reason, count in self.rejections.most_common():
+            self.log(f"  Not listed, {reason}: {count}")
+        if self.rejections.get('No cached TMDB details'):
+            self.log("  Crawl again to fetch the missing TMDB details")
+
+def derive_all(deriver: ListDeriver, top_size=DEFAULT_TOP_SIZE, genres=True):
+    """Write every list the catalog can produce."""
+    for listing in LISTING_URLS:
+        deriver.derive_listing(listing, top_size)
+    if genres:
+        deriver.derive_genres()
+    deriver.save_unknown_continent_films()
+    deriver.report()
+
+def main():
+    base_dir = get_os_specific_paths()['base_dir']
+    parser = argparse.ArgumentParser(description="Write every output list from the film catalog, without scraping.")
+    parser.add_argument('--dir', default=base_dir, help="Folder holding the catalog, film store and TMDB cache")
+    parser.add_argument('--out', default=os.path.join(base_dir, 'Outputs'), help="Folder to write the lists to")
+    parser.add_argument('--top', type=int, choices=[2500, 5000], default=DEFAULT_TOP_SIZE, help="Size of the popular and rating top lists")
+    parser.add_argument('--ttl-days', type=float, default=DEFAULT_TTL_DAYS, help="Oldest TMDB details to trust")
+    parser.add_argument('--no-genres', action='store_true', help="Skip the genre top 250s")
+    args = parser.parse_args()
+
+    catalog = FilmCatalog(os.path.join(args.dir, CATALOG_FILENAME))
+    store = FilmStore(os.path.join(args.dir, STORE_FILENAME))
+    tmdb_cache = TmdbCache(os.path.join(args.dir, CACHE_FILENAME), args.ttl_days)
+    os.makedirs(args.out, exist_ok=True)
+    deriver = ListDeriver(catalog, store, tmdb_cache, args.out,
+                          os.path.join(args.dir, 'whitelist.xlsx'), os.path.join(args.dir, 'blacklist.xlsx'))
+    derive_all(deriver, args.top, genres=not args.no_genres)
+    for closeable in (catalog, store, tmdb_cache):
+        closeable.close()
+
+if __name__ == "__main__":
+    main()
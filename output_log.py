@@ -0,0 +1,140 @@
+import atexit
+import csv
+import os
+import queue
+import sys
+import threading
+import time
+from multiprocessing import util as multiprocessing_util
+
+FLUSH_INTERVAL = 1.0  # Longest a message waits in memory before it is appended to the file
+MAX_PENDING = 10000  # Messages queued before print_to_csv waits for the writer to catch up
+
+_STOP = object()
+
+class OutputLog:
+    """Appends one-column rows to a CSV log (All_Outputs.csv) from a background thread.
+
+    write() only queues the message. The writer thread collects whatever
+    arrives within flush_interval of the first queued row and appends the
+    batch with a single open of the file, instead of one open per message.
+    The queue is bounded, so a stalled disk makes callers wait rather than
+    hold an unbounded backlog. flush() blocks until everything queued so far
+    is written; every log is closed, and so flushed, when the process exits.
+    """
+
+    def __init__(self, path: str, flush_interval: float = FLUSH_INTERVAL, max_pending: int = MAX_PENDING):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.max_batch = max_pending
+        self.queue = queue.Queue(maxsize=max_pending)
+        self.closed = False
+        self.rows_written = 0
+        self.batches = 0
+        self.write_seconds = 0.0
+        self.thread = threading.Thread(target=self.run, name='output-log', daemon=True)
+        self.thread.start()
+
+    def write(self, message: str):
+        if self.closed:
+            # Messages logged while the process shuts down are written straight away
+            self.append([[message]])
+        else:
+            self.queue.put(message)
+
+    def flush(self, timeout: float = None):
+        """Block until every message queued before the call has been written."""
+        if self.closed or not self.thread.is_alive():
+            return
+        written = threading.Event()
+        self.queue.put(written)
+        written.wait(timeout)
+
+    def close(self, timeout: float = 10):
+        """Write what is still queued and stop the writer thread."""
+        if self.closed:
+            return
+        self.closed = True
+        if self.thread.is_alive():
+            self.queue.put(_STOP)
+            self.thread.join(timeout)
+
+    def run(self):
+        while True:
+            item = self.queue.get()
+            rows = []
+            waiters = []
+            stop = False
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if item is _STOP:
+                    stop = True
+                    break
+                if isinstance(item, threading.Event):
+                    waiters.append(item)
+                    break
+                rows.append([item])
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or len(rows) >= self.max_batch:
+                    break
+                try:
+                    item = self.queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            if rows:
+                self.append(rows)
+            for waiter in waiters:
+                waiter.set()
+            if stop:
+                return
+
+    def append(self, rows):
+        start = time.perf_counter()
+        try:
+            with open(self.path, mode='a', newline='', encoding='utf-8') as file:
+                csv.writer(file).writerows(rows)
+        except OSError as e:
+            # The terminal already has the messages; losing the file copy must not stop the scraper
+            print(f"Could not append {len(rows)} messages to {self.path}: {e}", file=sys.stderr)
+            return
+        self.rows_written += len(rows)
+        self.batches += 1
+        self.write_seconds += time.perf_counter() - start
+
+_logs = {}
+_logs_lock = threading.Lock()
+_exit_hook_pid = None
+
+def output_log(path: str) -> OutputLog:
+    """Return the process's OutputLog for a file, starting its writer on first use."""
+    log = _logs.get(path)
+    if log is None:
+        with _logs_lock:
+            log = _logs.get(path)
+            if log is None:
+                _register_exit_hooks()
+                log = _logs[path] = OutputLog(path)
+    return log
+
+def close_output_logs():
+    for log in list(_logs.values()):
+        log.close()
+
+def _register_exit_hooks():
+    # Once per process: forked multiprocessing workers drop the parent's finalizers
+    # and leave through os._exit, which skips atexit but runs their own finalizers
+    global _exit_hook_pid
+    if _exit_hook_pid == os.getpid():
+        return
+    _exit_hook_pid = os.getpid()
+    atexit.register(close_output_logs)
+    multiprocessing_util.Finalize(None, close_output_logs, exitpriority=100)
+
+def _forget_logs_after_fork():
+    # A forked child does not inherit the writer threads; it starts its own on first use
+    global _logs_lock
+    _logs.clear()
+    _logs_lock = threading.Lock()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_forget_logs_after_fork)
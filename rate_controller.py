@@ -0,0 +1,175 @@
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+
+# Host -> (starting rate, minimum rate, maximum rate), in requests per second
+HOST_RATES = {
+    'letterboxd.com': (2.0, 0.25, 8.0),
+    'api.themoviedb.org': (20.0, 1.0, 40.0),
+}
+DEFAULT_RATES = (2.0, 0.25, 8.0)
+
+BACKOFF_STATUSES = {429, 500, 502, 503, 504}
+STATUS_RETRIES = 3  # Times a request answered with one of BACKOFF_STATUSES is sent again
+SLOW_RESPONSE_SECONDS = 5.0
+
+class AdaptiveRateController:
+    """Paces requests to one host and adapts the pace to how the host is coping.
+
+    Additive increase, multiplicative decrease: every healthy response raises
+    the rate by `increase` requests/second up to max_rate; a 429, a 5xx, a
+    connection error, a retry or a response slower than slow_seconds halves it
+    down to min_rate. Decreases within `cooldown` seconds of the last one are
+    ignored so a burst of concurrent failures counts once. A Retry-After header
+    pauses every caller for that long. Safe to share between threads.
+    """
+
+    def __init__(self, name: str, rate: float, min_rate: float, max_rate: float, increase: float = 0.1,
+                 decrease: float = 0.5, slow_seconds: float = SLOW_RESPONSE_SECONDS, cooldown: float = 1.0, log=print):
+        self.name = name
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.slow_seconds = slow_seconds
+        self.cooldown = cooldown
+        self.log = log
+        self.lock = threading.Lock()
+        self.next_time = 0.0
+        self.blocked_until = 0.0
+        self.last_decrease = 0.0
+        self.requests = 0
+        self.backoffs = 0
+        self.lowest_rate = rate
+        self.highest_rate = rate
+
+    def wait(self):
+        """Block until the next request to this host is allowed."""
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_time, self.blocked_until)
+            self.next_time = start + 1.0 / self.rate
+            self.requests += 1
+        if start > now:
+            time.sleep(start - now)
+
+    def success(self, seconds: float = None):
+        if seconds is not None and seconds > self.slow_seconds:
+            self.failure(f"slow response, {seconds:.1f}s")
+            return
+        with self.lock:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+            self.highest_rate = max(self.highest_rate, self.rate)
+
+    def failure(self, reason: str, retry_after: float = None):
+        with self.lock:
+            now = time.monotonic()
+            if retry_after:
+                self.blocked_until = max(self.blocked_until, now + retry_after)
+            if now - self.last_decrease < self.cooldown:
+                return
+            self.last_decrease = now
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            self.lowest_rate = min(self.lowest_rate, self.rate)
+            self.backoffs += 1
+            rate = self.rate
+        self.log(f"⏬ {self.name}: backing off to {rate:.2f} requests/second ({reason})")
+
+    def record(self, status_code: int, seconds: float = None, retry_after=None):
+        """Feed one HTTP response back into the controller."""
+        if status_code in BACKOFF_STATUSES:
+            self.failure(f"HTTP {status_code}", parse_retry_after(retry_after))
+        else:
+            self.success(seconds)
+
+    def backoff(self, reason: str):
+        """Count a retry as a failure and wait for the (now slower) next slot."""
+        self.failure(reason)
+        self.wait()
+
+    def report(self, log=None):
+        """Log where the rate ended up and how often it backed off."""
+        if not self.requests:
+            return
+        (log or self.log)(f"Rate for {self.name}: {self.rate:.2f} requests/second at the end "
+                          f"(range {self.lowest_rate:.2f}-{self.highest_rate:.2f}), "
+                          f"{self.backoffs} backoffs over {self.requests} requests")
+
+def parse_retry_after(value):
+    try:
+        return float(value) if value else None
+    except (TypeError, ValueError):
+        # HTTP-date form; the halved rate is enough of a pause
+        return None
+
+controllers = {}
+controllers_lock = threading.Lock()
+
+def controller_for(host: str, log=None) -> AdaptiveRateController:
+    """Return the process-wide controller for a host, creating it on first use."""
+    host = (host or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    with controllers_lock:
+        if host not in controllers:
+            rate, min_rate, max_rate = HOST_RATES.get(host, DEFAULT_RATES)
+            controllers[host] = AdaptiveRateController(host, rate, min_rate, max_rate, log=log or print)
+        elif log is not None:
+            controllers[host].log = log
+        return controllers[host]
+
+def split_rates(workers: int):
+    """Divide every host's rates between `workers` processes requesting at once.
+
+    Controllers are per process, so each worker process calls this to keep the
+    combined pace to a host where a single process would hold it.
+    """
+    global DEFAULT_RATES
+    for host, rates in HOST_RATES.items():
+        HOST_RATES[host] = tuple(rate / workers for rate in rates)
+    DEFAULT_RATES = tuple(rate / workers for rate in DEFAULT_RATES)
+    with controllers_lock:
+        for controller in controllers.values():
+            with controller.lock:
+                controller.rate /= workers
+                controller.min_rate /= workers
+                controller.max_rate /= workers
+
+def report_rates(log=print):
+    """Log every controller used in this process."""
+    with controllers_lock:
+        active = list(controllers.values())
+    for controller in active:
+        controller.report(log)
+
+class RateControlledSession(requests.Session):
+    """A requests session whose every request is paced by its host's controller.
+
+    A 429 or 5xx is fed to the controller and the request sent again, up to
+    `retries` times, once the slower pace (and any Retry-After) allows. The
+    controller is the only layer that waits, so mounted adapters should leave
+    these statuses alone.
+    """
+
+    def __init__(self, log=None, retries: int = STATUS_RETRIES):
+        super().__init__()
+        self.log = log
+        self.retries = retries
+
+    def request(self, method, url, *args, **kwargs):
+        controller = controller_for(urlsplit(url).hostname, self.log)
+        for attempt in range(self.retries + 1):
+            controller.wait()
+            start = time.perf_counter()
+            try:
+                response = super().request(method, url, *args, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                controller.failure(type(e).__name__)
+                raise
+            controller.record(response.status_code, time.perf_counter() - start, response.headers.get('Retry-After'))
+            if response.status_code not in BACKOFF_STATUSES or attempt == self.retries:
+                return response
+            response.close()
@@ -0,0 +1,73 @@
+import os
+import pickle
+import time
+
+# Bump this whenever the shape of a checkpointed state changes
+CHECKPOINT_VERSION = 4
+CHECKPOINT_DIRNAME = 'Checkpoints'
+
+def checkpoint_path_for(list_dir, name):
+    """Return the pickle file a scraper checkpoints to."""
+    return os.path.join(list_dir, CHECKPOINT_DIRNAME, f'{name}.pickle')
+
+class ScrapeCheckpoint:
+    """Saves a scraper's in-memory state after every listing page so a crashed run can resume.
+
+    save() writes the whole state atomically, so a crash mid-write leaves the
+    previous page's checkpoint in place. run identifies the scrape (its
+    listing URL and target); load() ignores a checkpoint written for a
+    different run or by an older version of the state.
+    """
+
+    def __init__(self, path, run):
+        self.path = path
+        self.run = run
+        self.saves = 0
+        self.save_seconds = 0.0
+
+    def save(self, state):
+        """Write the state. Failure to write only costs the ability to resume."""
+        start = time.perf_counter()
+        temp_path = self.path + '.tmp'
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(temp_path, 'wb') as file:
+                pickle.dump({
+                    'version': CHECKPOINT_VERSION,
+                    'run': self.run,
+                    'saved_at': time.time(),
+                    'state': state
+                }, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self.path)
+        except (OSError, pickle.PicklingError):
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return False
+        self.saves += 1
+        self.save_seconds += time.perf_counter() - start
+        return True
+
+    def load(self):
+        """Return (state, saved_at) from the last checkpoint of this run, or None."""
+        try:
+            with open(self.path, 'rb') as file:
+                payload = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # A torn or incompatible checkpoint means starting over
+            return None
+        if not isinstance(payload, dict):
+            return None
+        if payload.get('version') != CHECKPOINT_VERSION or payload.get('run') != self.run:
+            return None
+        return payload.get('state'), payload.get('saved_at')
+
+    def clear(self):
+        """Remove the checkpoint once the run has finished and saved its results."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def report(self, log=print):
+        if self.saves:
+            log(f"Checkpoints: {self.saves} written, {self.save_seconds / self.saves * 1000:.0f} ms each")
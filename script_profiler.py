@@ -0,0 +1,215 @@
+import argparse
+import cProfile
+import io
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime
+
+PROFILE_ENV = 'SCRAPER_PROFILE'  # cprofile or sample; how Run All Scrapers.py passes --profile on
+PROFILE_MEMORY_ENV = 'SCRAPER_PROFILE_MEMORY'  # Number of top allocations to dump
+PROFILE_MODES = ('cprofile', 'sample')
+PROFILE_DIRNAME = 'Profiles'
+SAMPLE_INTERVAL = 0.01  # Seconds between stack samples
+MEMORY_TOP = 25  # Allocations listed when --profile-memory is given without a number
+REPORT_LINES = 40  # Functions listed per table in the text reports
+
+# The profiler run_profiled is running, so a forked worker can switch off the copy it inherits
+active_profiler = None
+
+def add_profile_arguments(parser: argparse.ArgumentParser):
+    """Add --profile and --profile-memory, which run_profiled reads, to a script's own parser."""
+    parser.add_argument('--profile', nargs='?', const='cprofile', choices=PROFILE_MODES,
+                        help=f"Profile the run with cProfile (default) or by sampling stacks, writing the results to "
+                             f"Outputs/{PROFILE_DIRNAME}; also set by the {PROFILE_ENV} environment variable")
+    parser.add_argument('--profile-memory', nargs='?', type=int, const=MEMORY_TOP, default=0, metavar='N',
+                        help=f"Trace allocations and write the N largest (default {MEMORY_TOP}); "
+                             f"also set by {PROFILE_MEMORY_ENV}")
+
+def profile_options(argv=None):
+    """Return (mode, memory_top) from the command line, falling back to the environment."""
+    parser = argparse.ArgumentParser(add_help=False)
+    add_profile_arguments(parser)
+    args, _ = parser.parse_known_args(sys.argv[1:] if argv is None else argv)
+
+    mode = args.profile
+    if mode is None:
+        value = os.environ.get(PROFILE_ENV, '').strip().lower()
+        if value in PROFILE_MODES:
+            mode = value
+        elif value not in ('', '0', 'off', 'no', 'none', 'false'):
+            mode = 'cprofile'
+
+    memory_top = args.profile_memory
+    if not memory_top:
+        try:
+            memory_top = int(os.environ.get(PROFILE_MEMORY_ENV) or 0)
+        except ValueError:
+            memory_top = MEMORY_TOP
+    return mode, memory_top
+
+def thread_group(name: str) -> str:
+    """Fold numbered pool threads (ThreadPoolExecutor-0_3, Thread-7) into one entry."""
+    return re.sub(r'[-_]\d+( \(.*\))?$', '', name)
+
+def describe(code) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+class StackSampler:
+    """A sampling profiler: records every thread's stack from a background thread at a fixed interval.
+
+    Samples are wall-clock, so a thread blocked on a request, a lock or the
+    disk is counted where it waits, and the overhead stays flat however long
+    the run is. enable() and disable() mirror cProfile.Profile. Stacks are
+    kept as code objects and only formatted when written out.
+    """
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL):
+        self.interval = interval
+        self.stacks = Counter()
+        self.samples = 0
+        self.stopped = threading.Event()
+        self.thread = None
+
+    def enable(self):
+        self.stopped.clear()
+        self.thread = threading.Thread(target=self.run, name='stack-sampler', daemon=True)
+        self.thread.start()
+
+    def disable(self):
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join()
+
+    def run(self):
+        own = threading.get_ident()
+        while not self.stopped.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(frame.f_code)
+                    frame = frame.f_back
+                stack.reverse()
+                self.stacks[(thread_group(names.get(ident, str(ident))), *stack)] += 1
+            self.samples += 1
+
+    def write_folded(self, path):
+        """Write the stacks in the folded format flamegraph.pl and speedscope read."""
+        with open(path, 'w', encoding='utf-8') as file:
+            for (group, *stack), count in self.stacks.most_common():
+                file.write(';'.join([group] + [describe(code) for code in stack]) + f' {count}\n')
+
+    def write_report(self, path, lines: int = REPORT_LINES):
+        """Write each thread group's most sampled functions, by own time and including callees."""
+        by_group = {}
+        for (group, *stack), count in self.stacks.items():
+            own, inclusive, total = by_group.setdefault(group, (Counter(), Counter(), Counter()))
+            total['samples'] += count
+            if stack:
+                own[stack[-1]] += count
+            for code in set(stack):
+                inclusive[code] += count
+
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(f"{self.samples} samples every {self.interval * 1000:.0f} ms of wall-clock time\n")
+            # The main thread first, then the busiest pools
+            ordered = sorted(by_group.items(), key=lambda item: (item[0] != 'MainThread', -item[1][2]['samples']))
+            for group, (own, inclusive, total) in ordered:
+                samples = total['samples']
+                file.write(f"\n{f' {group} ({samples} samples) ':=^100}\n")
+                for title, counts in (("Own time", own), ("Including callees", inclusive)):
+                    file.write(f"{title}:\n")
+                    for code, count in counts.most_common(lines):
+                        file.write(f"{count / samples * 100:>7.1f}%  {count:>8}  {describe(code)}\n")
+
+def write_cprofile(profiler: cProfile.Profile, base_path):
+    profiler.dump_stats(base_path + '.prof')
+    with open(base_path + '.txt', 'w', encoding='utf-8') as file:
+        for sort in ('cumulative', 'tottime'):
+            stream = io.StringIO()
+            pstats.Stats(profiler, stream=stream).sort_stats(sort).print_stats(REPORT_LINES)
+            file.write(f"{f' Sorted by {sort} ':=^100}\n{stream.getvalue()}\n")
+    return [base_path + '.prof', base_path + '.txt']
+
+def write_allocations(base_path, memory_top: int):
+    snapshot = tracemalloc.take_snapshot().filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    ])
+    current, peak = tracemalloc.get_traced_memory()
+    path = base_path + ' memory.txt'
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(f"Traced memory at exit: {current / 2**20:.1f} MiB, peak {peak / 2**20:.1f} MiB\n\n")
+        for stat in snapshot.statistics('lineno')[:memory_top]:
+            file.write(f"{stat.size / 2**20:>9.2f} MiB  {stat.count:>9} blocks  {stat.traceback}\n")
+    return [path]
+
+def stop_inherited_profiling():
+    """Switch off the profiling a forked worker process inherited from run_profiled in its parent.
+
+    The worker never returns through run_profiled, so it would otherwise pay
+    for the profiler and the allocation tracing without writing either out.
+    """
+    global active_profiler
+    if active_profiler is not None:
+        active_profiler.disable()
+        active_profiler = None
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+def run_profiled(main, name: str, output_dir: str, log=print):
+    """Call main(), profiled if --profile, --profile-memory or their environment variables ask for it.
+
+    Profiles are written to <output_dir>/Profiles/<name> <timestamp>.* even
+    when main() raises or the run is interrupted. cProfile only sees the main
+    thread; the sampler covers every thread, so it suits the scripts that do
+    their work in thread pools.
+    """
+    global active_profiler
+    mode, memory_top = profile_options()
+    if mode is None and not memory_top:
+        return main()
+
+    base_path = os.path.join(output_dir, PROFILE_DIRNAME, f"{name} {datetime.now():%Y-%m-%d %H%M%S}")
+    if memory_top:
+        tracemalloc.start()
+    profiler = cProfile.Profile() if mode == 'cprofile' else StackSampler() if mode == 'sample' else None
+    start = time.perf_counter()
+    if profiler is not None:
+        profiler.enable()
+    active_profiler = profiler
+    try:
+        return main()
+    finally:
+        active_profiler = None
+        if profiler is not None:
+            profiler.disable()
+        seconds = time.perf_counter() - start
+        written = []
+        try:
+            os.makedirs(os.path.dirname(base_path), exist_ok=True)
+            if mode == 'cprofile':
+                written += write_cprofile(profiler, base_path)
+            elif mode == 'sample':
+                profiler.write_folded(base_path + '.folded')
+                profiler.write_report(base_path + ' samples.txt')
+                written += [base_path + '.folded', base_path + ' samples.txt']
+            if memory_top:
+                written += write_allocations(base_path, memory_top)
+        except OSError as e:
+            log(f"Could not write the profile to {os.path.dirname(base_path)}: {e}")
+        finally:
+            if memory_top:
+                tracemalloc.stop()
+        if written:
+            files = ', '.join(os.path.basename(path) for path in written)
+            log(f"Profiled {seconds:.0f}s ({mode or 'memory only'}): {files} in {os.path.dirname(base_path)}")
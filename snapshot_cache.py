@@ -0,0 +1,101 @@
+import os
+import pickle
+import time
+from contextlib import contextmanager
+
+# Bump this whenever the shape of a snapshotted structure changes
+SNAPSHOT_VERSION = 2
+SNAPSHOT_DIRNAME = 'Snapshots'
+
+def fingerprint(paths):
+    """Return (path, mtime, size) for each source file, or None for a missing file."""
+    result = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            result.append((os.path.abspath(path), stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            result.append((os.path.abspath(path), None, None))
+    return tuple(result)
+
+def snapshot_path_for(source_path, name):
+    """Return the pickle file kept for a snapshot next to its source workbook."""
+    return os.path.join(os.path.dirname(os.path.abspath(source_path)), SNAPSHOT_DIRNAME, f'{name}.pickle')
+
+def load_snapshot(sources, name):
+    """Return the snapshotted data if it was built from the current source files."""
+    path = snapshot_path_for(sources[0], name)
+    try:
+        with open(path, 'rb') as file:
+            payload = pickle.load(file)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        # A torn or incompatible snapshot is rebuilt from the workbook
+        return None
+    if not isinstance(payload, dict):
+        return None
+    if payload.get('version') != SNAPSHOT_VERSION or payload.get('fingerprint') != fingerprint(sources):
+        return None
+    return payload.get('data')
+
+def save_snapshot(sources, name, data):
+    """Write a snapshot atomically. Failure to write only costs the next startup."""
+    path = snapshot_path_for(sources[0], name)
+    temp_path = path + '.tmp'
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temp_path, 'wb') as file:
+            pickle.dump({
+                'version': SNAPSHOT_VERSION,
+                'fingerprint': fingerprint(sources),
+                'data': data
+            }, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+        return True
+    except (OSError, pickle.PicklingError):
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return False
+
+def cached_load(sources, name, build):
+    """Load parsed structures from a snapshot, falling back to build() when a source changed.
+
+    sources is a list of file paths whose mtime and size key the snapshot; the
+    first one is the workbook that build() reads. Returns (data, source) where
+    source is 'snapshot' or 'excel'.
+    """
+    if isinstance(sources, str):
+        sources = [sources]
+    data = load_snapshot(sources, name)
+    if data is not None:
+        return data, 'snapshot'
+    data = build()
+    save_snapshot(sources, name, data)
+    return data, 'excel'
+
+class StartupTimer:
+    """Collects how long each startup load took and where it was loaded from."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.timings = []
+
+    @contextmanager
+    def measure(self, label):
+        """Time a block. Set timing['source'] inside it to label the load path."""
+        timing = {'label': label, 'source': '', 'seconds': 0.0}
+        start = time.perf_counter()
+        try:
+            yield timing
+        finally:
+            timing['seconds'] = time.perf_counter() - start
+            self.timings.append(timing)
+
+    def report(self, log=print):
+        """Log one line per load plus the total startup time."""
+        log("Startup timing:")
+        for timing in self.timings:
+            source = f" ({timing['source']})" if timing['source'] else ''
+            log(f"  {timing['label']}: {timing['seconds']:.3f}s{source}")
+        log(f"  total: {time.perf_counter() - self.started:.3f}s")
@@ -0,0 +1,57 @@
+import heapq
+from collections import Counter
+from operator import itemgetter
+
+from list_criteria import STAT_FIELDS
+
+# Counter names, in the order the stats files list them
+STAT_CATEGORIES = tuple(STAT_FIELDS)
+
+def decade_of(year):
+    """Return the decade a release year falls in (1994 -> 1990), or None if the year is missing or not a number."""
+    try:
+        return int(year) // 10 * 10 if year else None
+    except (ValueError, TypeError):
+        return None
+
+class StatsAccumulator:
+    """Running director/actor/decade/genre/studio/language/country counts for one list.
+
+    add() folds a film's whitelist record into every counter at once, so a
+    film that lands in several lists is looked up once and added to each of
+    their accumulators. top() picks the most common values with
+    heapq.nlargest rather than sorting a whole counter; values with the same
+    count keep the order they were first counted in, as the full sort did.
+    """
+
+    __slots__ = STAT_CATEGORIES + ('films',)
+
+    def __init__(self):
+        for category in STAT_CATEGORIES:
+            setattr(self, category, Counter())
+        self.films = 0
+
+    def add(self, movie_info: dict):
+        """Count one film from its whitelist Information dict."""
+        self.director_counts.update(movie_info.get('Directors') or ())
+        self.actor_counts.update(movie_info.get('Actors') or ())
+        decade = movie_info.get('Decade')
+        if decade:
+            self.decade_counts[decade] += 1
+        self.genre_counts.update(movie_info.get('Genres') or ())
+        self.studio_counts.update(movie_info.get('Studios') or ())
+        self.language_counts.update(movie_info.get('Languages') or ())
+        self.country_counts.update(movie_info.get('Countries') or ())
+        self.films += 1
+
+    def counts(self, category: str) -> Counter:
+        return getattr(self, category)
+
+    def top(self, category: str, k: int = 10):
+        """Return the k most common (value, count) pairs of a category, most common first."""
+        return heapq.nlargest(k, getattr(self, category).items(), key=itemgetter(1))
+
+    def top_all(self, k: int = 10, categories=STAT_CATEGORIES):
+        """Yield (category, top k pairs) for each category, in the given order."""
+        for category in categories:
+            yield category, self.top(category, k)
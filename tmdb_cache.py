@@ -0,0 +1,100 @@
+import argparse
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from credentials_loader import get_os_specific_paths
+
+CACHE_FILENAME = 'tmdb_cache.db'
+DEFAULT_TTL_DAYS = 90
+
+class TmdbCache:
+    """SQLite cache of the keywords and genres TMDB returns for each tmdb ID.
+
+    Every scraper filters candidates on the same /movie/{id}?append_to_response=keywords
+    response, and those barely change, so one cache file next to the lists is
+    shared by all of them. Entries older than ttl_days count as misses and are
+    refreshed by the next fetch. Safe to use from worker threads.
+    """
+
+    def __init__(self, db_path, ttl_days: float = DEFAULT_TTL_DAYS):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_days * 86400
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        with self.conn:
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS tmdb_details (
+                    tmdb_id TEXT PRIMARY KEY,
+                    keywords TEXT NOT NULL,
+                    genres TEXT NOT NULL,
+                    fetched_at REAL NOT NULL
+                )''')
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+
+    def get(self, tmdb_id):
+        """Return (keywords, genres) for a cached, unexpired tmdb ID, otherwise None."""
+        with self.lock:
+            row = self.conn.execute(
+                'SELECT keywords, genres, fetched_at FROM tmdb_details WHERE tmdb_id = ?', (str(tmdb_id),)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            if time.time() - row[2] > self.ttl_seconds:
+                self.misses += 1
+                self.expired += 1
+                return None
+            self.hits += 1
+        return json.loads(row[0]), json.loads(row[1])
+
+    def put(self, tmdb_id, keywords, genres):
+        with self.lock, self.conn:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO tmdb_details (tmdb_id, keywords, genres, fetched_at) VALUES (?, ?, ?, ?)',
+                (str(tmdb_id), json.dumps(list(keywords)), json.dumps(list(genres)), time.time())
+            )
+
+    def purge_expired(self):
+        """Delete expired entries and return how many were removed."""
+        with self.lock, self.conn:
+            cursor = self.conn.execute('DELETE FROM tmdb_details WHERE fetched_at < ?', (time.time() - self.ttl_seconds,))
+            return cursor.rowcount
+
+    def count(self):
+        with self.lock:
+            return self.conn.execute('SELECT COUNT(*) FROM tmdb_details').fetchone()[0]
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+    def report(self, log=print):
+        """Log how many TMDB lookups the cache answered this run."""
+        lookups = self.hits + self.misses
+        if not lookups:
+            return
+        log(f"TMDB cache: {self.hits} hits, {self.misses} misses ({self.hits / lookups * 100:.1f}% hit rate)"
+            + (f", {self.expired} expired" if self.expired else ""))
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or prune the shared TMDB cache.")
+    parser.add_argument('--dir', default=get_os_specific_paths()['base_dir'], help="Folder holding tmdb_cache.db")
+    parser.add_argument('--ttl-days', type=float, default=DEFAULT_TTL_DAYS)
+    parser.add_argument('--purge-expired', action='store_true', help="Delete entries older than the TTL")
+    args = parser.parse_args()
+
+    cache = TmdbCache(os.path.join(args.dir, CACHE_FILENAME), args.ttl_days)
+    if args.purge_expired:
+        print(f"Removed {cache.purge_expired()} expired entries")
+    print(f"{cache.count()} tmdb IDs cached")
+    cache.close()
+
+if __name__ == "__main__":
+    main()
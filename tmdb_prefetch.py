@@ -0,0 +1,69 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_WORKERS = 4
+
+class TmdbPrefetcher:
+    """Runs TMDB lookups on a small thread pool ahead of the keyword/genre filter.
+
+    The film page pipeline submit()s a tmdb ID as soon as it has parsed a page
+    that will reach the filter, so the request overlaps with the films before
+    it. The filter then calls result(), which waits on that future, or runs the
+    lookup on the spot for a film that was never submitted. fetch makes its
+    request through a rate-controlled session, which paces the workers.
+    """
+
+    def __init__(self, fetch, workers: int = DEFAULT_WORKERS):
+        self.fetch = fetch
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='tmdb-prefetch')
+        self.lock = threading.Lock()
+        self.futures = {}
+        self.prefetched = 0
+        self.direct = 0
+        self.wait_seconds = 0.0
+
+    def submit(self, tmdb_id):
+        """Start the lookup for tmdb_id unless it is already queued. Safe from any thread."""
+        with self.lock:
+            if tmdb_id not in self.futures:
+                self.futures[tmdb_id] = self.executor.submit(self.fetch, tmdb_id)
+            return self.futures[tmdb_id]
+
+    def result(self, tmdb_id):
+        """Return what fetch(tmdb_id) returns, waiting for the prefetched lookup if there is one."""
+        with self.lock:
+            future = self.futures.pop(tmdb_id, None)
+        if future is None or future.cancelled():
+            self.direct += 1
+            return self.fetch(tmdb_id)
+        start = time.perf_counter()
+        try:
+            return future.result()
+        finally:
+            self.prefetched += 1
+            self.wait_seconds += time.perf_counter() - start
+
+    def cancel_pending(self):
+        """Drop every lookup no one has collected, such as those of films rejected before the filter.
+
+        Scrapers call this when they move on to the next listing page, so the
+        map only ever holds the current page's films. Finished lookups are
+        already in the TMDB cache.
+        """
+        with self.lock:
+            futures, self.futures = self.futures, {}
+        for future in futures.values():
+            future.cancel()
+
+    def close(self):
+        """Drop queued lookups and stop the workers."""
+        self.cancel_pending()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def report(self, log=print):
+        """Log how many filter lookups were already under way when the filter needed them."""
+        if not self.prefetched and not self.direct:
+            return
+        log(f"TMDB prefetch: {self.prefetched} lookups prefetched, {self.direct} made on the spot, "
+            f"{self.wait_seconds:.1f}s spent waiting on prefetched lookups")
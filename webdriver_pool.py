@@ -0,0 +1,124 @@
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+DEFAULT_POOL_SIZE = 3
+DEFAULT_RECYCLE_AFTER = 200  # pages per driver before it is restarted
+
+class WebDriverPool:
+    """A fixed number of browser drivers shared by worker threads.
+
+    Drivers are launched with `factory` (each script's setup_webdriver) the
+    first time they are needed, so a run that never falls back to the browser
+    never starts one. Each driver serves one thread at a time. A driver is
+    quit and replaced after `recycle_after` pages to keep Firefox's memory in
+    check, and straight away if it raises anything other than a page-load
+    timeout, which usually means the browser crashed.
+    """
+
+    def __init__(self, factory, size: int = DEFAULT_POOL_SIZE, recycle_after: int = DEFAULT_RECYCLE_AFTER):
+        self.factory = factory
+        self.size = size
+        self.recycle_after = recycle_after
+        self.available = threading.Condition()
+        self.idle = []
+        self.launched = 0
+        self.uses = {}
+        self.closed = False
+        self.pages = 0
+        self.busy_seconds = 0.0
+        self.restarts = Counter()
+
+    def acquire(self):
+        """Return an idle driver, launching one if the pool is not full yet, otherwise wait for one."""
+        with self.available:
+            while True:
+                if self.closed:
+                    raise RuntimeError("WebDriverPool is closed")
+                if self.idle:
+                    return self.idle.pop()
+                if self.launched < self.size:
+                    self.launched += 1
+                    break
+                self.available.wait()
+        try:
+            driver = self.factory()
+        except Exception:
+            with self.available:
+                self.launched -= 1
+                self.available.notify()
+            raise
+        with self.available:
+            self.uses[id(driver)] = 0
+        return driver
+
+    def release(self, driver, broken: bool = False):
+        """Hand a driver back, restarting it if it crashed or has served recycle_after pages."""
+        with self.available:
+            self.uses[id(driver)] += 1
+            if broken:
+                reason = 'crashed'
+            elif self.uses[id(driver)] >= self.recycle_after:
+                reason = 'recycled'
+            else:
+                reason = None
+            if reason is None and not self.closed:
+                self.idle.append(driver)
+                self.available.notify()
+                return
+            if reason:
+                self.restarts[reason] += 1
+            del self.uses[id(driver)]
+
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        with self.available:
+            # Frees a slot; the next acquire() launches a replacement
+            self.launched -= 1
+            self.available.notify()
+
+    @contextmanager
+    def driver(self):
+        """Borrow a driver for one page: `with pool.driver() as driver: ...`"""
+        driver = self.acquire()
+        start = time.perf_counter()
+        broken = False
+        try:
+            yield driver
+        except TimeoutException:
+            raise
+        except WebDriverException:
+            broken = True
+            raise
+        finally:
+            self.release(driver, broken)
+            with self.available:
+                self.pages += 1
+                self.busy_seconds += time.perf_counter() - start
+
+    def close(self):
+        """Quit every idle driver. Drivers still borrowed are quit when they are released."""
+        with self.available:
+            self.closed = True
+            drivers, self.idle = self.idle, []
+            self.launched -= len(drivers)
+            self.available.notify_all()
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+    def report(self, log=print):
+        """Log how much work the pooled drivers did."""
+        if not self.pages:
+            return
+        log(f"Driver pool: {self.pages} pages across up to {self.size} drivers, "
+            f"{self.busy_seconds / self.pages * 1000:.0f} ms per page")
+        for reason, count in self.restarts.most_common():
+            log(f"  Drivers {reason}: {count}")
@@ -0,0 +1,127 @@
+import json
+import os
+import time
+import unicodedata
+
+import pandas as pd
+
+# How often update_whitelist is allowed to fold the journal back into the workbook
+COMPACT_INTERVAL = 30 * 60  # seconds
+
+def journal_path_for(workbook_path):
+    """Return the journal file that sits next to a whitelist workbook."""
+    return os.path.splitext(workbook_path)[0] + '_journal.jsonl'
+
+def normalize_title(text):
+    return unicodedata.normalize('NFKC', str(text)).strip()
+
+class WhitelistJournal:
+    """Append-only log of whitelist upserts.
+
+    Each update_whitelist call appends one JSON line instead of rewriting the
+    workbook. The workbook is only regenerated by compact(), and any lines left
+    behind by a crash are replayed on the next load_whitelist.
+    """
+
+    def __init__(self, workbook_path, compact_interval=COMPACT_INTERVAL):
+        self.workbook_path = workbook_path
+        self.journal_path = journal_path_for(workbook_path)
+        self.compact_interval = compact_interval
+        self.last_compaction = time.time()
+        self.pending = 0
+
+    def append(self, film_title, release_year, movie_data, film_url=None):
+        """Record a single upsert. Opening in append mode keeps this O(1)."""
+        entry = {
+            'Title': film_title,
+            'Year': release_year,
+            'Information': movie_data,
+            'Link': film_url or ''
+        }
+        with open(self.journal_path, mode='a', encoding='utf-8') as file:
+            file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        self.pending += 1
+
+    def read_entries(self):
+        """Read all journalled upserts in the order they were written."""
+        entries = []
+        if not os.path.exists(self.journal_path):
+            return entries
+        with open(self.journal_path, mode='r', encoding='utf-8') as file:
+            for line in file:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # A crash mid-write can leave a truncated last line
+                    continue
+        return entries
+
+    def replay(self, whitelist, match_on='title_year'):
+        """Apply journalled upserts to a freshly loaded whitelist DataFrame.
+
+        match_on is 'title_year' for scrapers keyed on title and year, or 'link'
+        for scrapers keyed on the Letterboxd URL.
+        """
+        entries = self.read_entries()
+        if not entries:
+            return whitelist
+
+        def row_key(title, year, link):
+            if match_on == 'link':
+                return link
+            return f"{normalize_title(title).lower()}_{str(year).strip()}"
+
+        positions = {}
+        for idx, title, year, link in zip(whitelist.index, whitelist['Title'], whitelist['Year'], whitelist['Link']):
+            if match_on == 'link' and not link:
+                continue
+            positions[row_key(title, year, link)] = idx
+
+        new_rows = {}
+        for entry in entries:
+            link = entry.get('Link') or ''
+            key = row_key(entry.get('Title'), entry.get('Year'), link)
+            if match_on == 'link' and not key:
+                continue
+            information = json.dumps(entry.get('Information', {}))
+            if key in positions:
+                row_idx = positions[key]
+                whitelist.at[row_idx, 'Information'] = information
+                if link and not whitelist.at[row_idx, 'Link']:
+                    whitelist.at[row_idx, 'Link'] = link
+            elif key in new_rows:
+                new_rows[key]['Information'] = information
+                if link and not new_rows[key]['Link']:
+                    new_rows[key]['Link'] = link
+            else:
+                new_rows[key] = {
+                    'Title': normalize_title(entry.get('Title')),
+                    'Year': str(entry.get('Year')).strip(),
+                    'Information': information,
+                    'Link': link
+                }
+
+        if new_rows:
+            whitelist = pd.concat([whitelist, pd.DataFrame(list(new_rows.values()))], ignore_index=True)
+        self.pending = len(entries)
+        return whitelist
+
+    def compact(self, whitelist):
+        """Rewrite the workbook from the in-memory whitelist and truncate the journal."""
+        temp_path = os.path.splitext(self.workbook_path)[0] + '.compacting.xlsx'
+        whitelist.to_excel(temp_path, index=False)
+        os.replace(temp_path, self.workbook_path)
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+        self.pending = 0
+        self.last_compaction = time.time()
+
+    def compact_if_due(self, whitelist):
+        """Compact when there are pending upserts and the interval has elapsed."""
+        if self.pending and time.time() - self.last_compaction >= self.compact_interval:
+            self.compact(whitelist)
+            return True
+        return False
@@ -0,0 +1,35 @@
+import json
+import math
+
+def decode_information(raw):
+    """Decode a whitelist Information cell, treating blank or malformed cells as {}."""
+    if isinstance(raw, dict):
+        return raw
+    if raw is None or raw == '' or (isinstance(raw, float) and math.isnan(raw)):
+        return {}
+    try:
+        info = json.loads(raw)
+    except (json.JSONDecodeError, TypeError):
+        return {}
+    return info if isinstance(info, dict) else {}
+
+class WhitelistLookup(dict):
+    """Maps a whitelist key to (info, row index, link), decoding info on first access.
+
+    load_whitelist stores the raw Information string, so startup cost and memory
+    scale with the films a run actually looks up. Indexing a key decodes its
+    JSON once and memoizes the dict in place; items() and values() still expose
+    whatever is stored, so use them only for the index and link.
+    """
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        value = dict.__getitem__(self, key)
+        if isinstance(value[0], dict):
+            return value
+        value = (decode_information(value[0]),) + tuple(value[1:])
+        dict.__setitem__(self, key, value)
+        return value
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default